@@ -0,0 +1,33 @@
+"""add agent_messages (session_id, id) index
+
+Revision ID: a3f1c9d27e40
+Revises: b59418d33935
+Create Date: 2026-10-18 10:12:05.418233
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a3f1c9d27e40"
+down_revision: Union[str, Sequence[str], None] = "b59418d33935"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_agent_messages_session_id_id",
+        "agent_messages",
+        ["session_id", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_agent_messages_session_id_id", table_name="agent_messages")
@@ -0,0 +1,51 @@
+"""add partial indexes for the run queue
+
+Revision ID: c5a9f3e2d7b1
+Revises: b8d4e1a7c2f3
+Create Date: 2026-10-18 17:05:52.913604
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c5a9f3e2d7b1"
+down_revision: Union[str, Sequence[str], None] = "b8d4e1a7c2f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_agent_runs_queued_scheduled_at",
+        "agent_runs",
+        ["status", "scheduled_at", "created_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'queued'"),
+    )
+    op.create_index(
+        "ix_agent_runs_active_session_id",
+        "agent_runs",
+        ["session_id"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('claimed', 'running')"),
+    )
+    op.create_index(
+        "ix_agent_runs_claimed_lease_expires_at",
+        "agent_runs",
+        ["lease_expires_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'claimed'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_agent_runs_claimed_lease_expires_at", table_name="agent_runs")
+    op.drop_index("ix_agent_runs_active_session_id", table_name="agent_runs")
+    op.drop_index("ix_agent_runs_queued_scheduled_at", table_name="agent_runs")
@@ -0,0 +1,42 @@
+"""add runs and tool executions (session_id, message_id) indexes
+
+Revision ID: d6e2b7f4a9c1
+Revises: a3f1c9d27e40
+Create Date: 2026-10-18 14:03:41.271905
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d6e2b7f4a9c1"
+down_revision: Union[str, Sequence[str], None] = "a3f1c9d27e40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_agent_runs_session_id_user_message_id",
+        "agent_runs",
+        ["session_id", "user_message_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tool_executions_session_id_message_id",
+        "tool_executions",
+        ["session_id", "message_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_tool_executions_session_id_message_id", table_name="tool_executions"
+    )
+    op.drop_index("ix_agent_runs_session_id_user_message_id", table_name="agent_runs")
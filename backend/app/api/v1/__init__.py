@@ -5,9 +5,12 @@ from app.api.v1 import (
     callback,
     claude_md,
     env_vars,
+    events,
     internal_claude_md,
     internal_env_vars,
+    internal_execution_config,
     internal_plugin_config,
+    internal_runs,
     internal_slash_commands,
     internal_mcp_config,
     internal_scheduled_tasks,
@@ -44,6 +47,7 @@ api_v1_router.include_router(tasks.router)
 api_v1_router.include_router(runs.router)
 api_v1_router.include_router(schedules.router)
 api_v1_router.include_router(callback.router)
+api_v1_router.include_router(events.router)
 api_v1_router.include_router(messages.router)
 api_v1_router.include_router(projects.router)
 api_v1_router.include_router(tool_executions.router)
@@ -52,6 +56,7 @@ api_v1_router.include_router(env_vars.router)
 api_v1_router.include_router(claude_md.router)
 api_v1_router.include_router(internal_claude_md.router)
 api_v1_router.include_router(internal_env_vars.router)
+api_v1_router.include_router(internal_execution_config.router)
 api_v1_router.include_router(internal_mcp_config.router)
 api_v1_router.include_router(internal_skill_config.router)
 api_v1_router.include_router(internal_scheduled_tasks.router)
@@ -59,6 +64,7 @@ api_v1_router.include_router(internal_user_input_requests.router)
 api_v1_router.include_router(internal_slash_commands.router)
 api_v1_router.include_router(internal_subagents.router)
 api_v1_router.include_router(internal_plugin_config.router)
+api_v1_router.include_router(internal_runs.router)
 api_v1_router.include_router(mcp_servers.router)
 api_v1_router.include_router(user_mcp_installs.router)
 api_v1_router.include_router(skills.router)
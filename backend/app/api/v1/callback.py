@@ -5,7 +5,13 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app.core.deps import get_db
-from app.schemas.callback import AgentCallbackRequest, CallbackResponse
+from app.core.observability.metrics import CALLBACKS_RECEIVED
+from app.schemas.callback import (
+    AgentCallbackBatchRequest,
+    AgentCallbackRequest,
+    CallbackBatchResponse,
+    CallbackResponse,
+)
 from app.schemas.response import Response, ResponseSchema
 from app.services.callback_service import CallbackService
 
@@ -17,18 +23,34 @@ callback_service = CallbackService()
 
 
 @router.post("", response_model=ResponseSchema[CallbackResponse])
-async def receive_callback(
+def receive_callback(
     callback: AgentCallbackRequest,
     db: Session = Depends(get_db),
 ) -> JSONResponse:
     """Receives executor callback and updates session status."""
     result = callback_service.process_agent_callback(db, callback)
+    CALLBACKS_RECEIVED.labels(status=callback.status.value).inc()
     return Response.success(
         data=result,
         message="Callback processed successfully",
     )
 
 
+@router.post("/batch", response_model=ResponseSchema[CallbackBatchResponse])
+def receive_callback_batch(
+    batch: AgentCallbackBatchRequest,
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """Receives a batch of coalesced executor callbacks."""
+    result = callback_service.process_agent_callback_batch(db, batch)
+    for callback in batch.callbacks:
+        CALLBACKS_RECEIVED.labels(status=callback.status.value).inc()
+    return Response.success(
+        data=result,
+        message="Callbacks processed successfully",
+    )
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint."""
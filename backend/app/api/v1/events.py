@@ -0,0 +1,97 @@
+import json
+import uuid
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.core.database import SessionLocal
+from app.core.deps import get_current_user_id
+from app.core.errors.error_codes import ErrorCode
+from app.core.errors.exceptions import AppException
+from app.core.event_bus import event_bus
+from app.core.settings import get_settings
+from app.repositories.session_repository import SessionRepository
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+
+def _reset_frame(reason: str) -> str:
+    body = json.dumps({"type": "reset", "reason": reason})
+    return f"id: {event_bus.last_event_id}\nevent: reset\ndata: {body}\n\n"
+
+
+async def _event_stream(
+    request: Request,
+    *,
+    user_id: str,
+    session_ids: set[str] | None,
+    last_event_id: str | None,
+    heartbeat_seconds: float,
+) -> AsyncIterator[str]:
+    # Subscribe inside the generator so the subscription is always released.
+    subscription = event_bus.subscribe(
+        user_id=user_id, session_ids=session_ids, last_event_id=last_event_id
+    )
+    try:
+        yield "retry: 3000\n\n"
+        if subscription.needs_reset:
+            yield _reset_frame("resume_position_unavailable")
+        for item in subscription.replay:
+            yield item.to_sse()
+
+        while not await request.is_disconnected():
+            try:
+                item = await subscription.next_event(timeout=heartbeat_seconds)
+            except OverflowError:
+                yield _reset_frame("subscriber_overflow")
+                continue
+            if item is None:
+                yield ": keep-alive\n\n"
+                continue
+            yield item.to_sse()
+    finally:
+        subscription.close()
+
+
+@router.get("/stream")
+def stream_session_events(
+    request: Request,
+    session_id: list[uuid.UUID] | None = Query(
+        default=None, description="Only stream events of these sessions"
+    ),
+    last_event_id: str | None = Query(default=None),
+    last_event_id_header: str | None = Header(default=None, alias="Last-Event-ID"),
+    user_id: str = Depends(get_current_user_id),
+) -> StreamingResponse:
+    """Server-sent stream of session, run, message and user input events.
+
+    Reconnect with the Last-Event-ID header (or `last_event_id`) to resume. A
+    `reset` event means the position could not be resumed; resync via the REST
+    endpoints and continue from the reset event id.
+    """
+    session_ids: set[str] | None = None
+    if session_id:
+        db = SessionLocal()
+        try:
+            owned = SessionRepository.list_owned_ids(db, user_id, session_id)
+        finally:
+            db.close()
+        if len(owned) != len(set(session_id)):
+            raise AppException(
+                error_code=ErrorCode.FORBIDDEN,
+                message="Session does not belong to the user",
+            )
+        session_ids = {str(value) for value in owned}
+
+    return StreamingResponse(
+        _event_stream(
+            request,
+            user_id=user_id,
+            session_ids=session_ids,
+            last_event_id=last_event_id_header or last_event_id,
+            heartbeat_seconds=max(1, get_settings().event_stream_heartbeat_seconds),
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,67 @@
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from app.core.deps import get_current_user_id, get_db
+from app.core.errors.error_codes import ErrorCode
+from app.core.errors.exceptions import AppException
+from app.core.settings import get_settings
+from app.schemas.execution_config import (
+    ExecutionConfigResolveRequest,
+    ExecutionConfigResponse,
+    ExecutionConfigVersionResponse,
+)
+from app.schemas.response import Response, ResponseSchema
+from app.services.execution_config_service import ExecutionConfigService
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+service = ExecutionConfigService()
+
+
+def require_internal_token(
+    x_internal_token: str | None = Header(default=None, alias="X-Internal-Token"),
+) -> None:
+    settings = get_settings()
+    if not settings.internal_api_token:
+        raise AppException(
+            error_code=ErrorCode.FORBIDDEN,
+            message="Internal API token is not configured",
+        )
+    if not x_internal_token or x_internal_token != settings.internal_api_token:
+        raise AppException(
+            error_code=ErrorCode.FORBIDDEN,
+            message="Invalid internal token",
+        )
+
+
+@router.get(
+    "/execution-config/version",
+    response_model=ResponseSchema[ExecutionConfigVersionResponse],
+)
+def get_execution_config_version(
+    _: None = Depends(require_internal_token),
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """Change counter of the user's execution config, for manager-side caching."""
+    version = service.get_version(db, user_id)
+    return Response.success(
+        data=ExecutionConfigVersionResponse(version=version),
+        message="Execution config version retrieved",
+    )
+
+
+@router.post(
+    "/execution-config/resolve",
+    response_model=ResponseSchema[ExecutionConfigResponse],
+)
+def resolve_execution_config(
+    request: ExecutionConfigResolveRequest,
+    _: None = Depends(require_internal_token),
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """Resolve env map, MCP, skills, plugins, subagents, slash commands and CLAUDE.md."""
+    resolved = service.resolve(db, user_id, request)
+    return Response.success(data=resolved, message="Execution config resolved")
@@ -35,7 +35,7 @@ def require_internal_token(
     "/mcp-config/resolve",
     response_model=ResponseSchema[dict],
 )
-async def resolve_mcp_config(
+def resolve_mcp_config(
     request: McpConfigResolveRequest,
     _: None = Depends(require_internal_token),
     user_id: str = Depends(get_current_user_id),
@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from app.core.deps import get_db
+from app.core.errors.error_codes import ErrorCode
+from app.core.errors.exceptions import AppException
+from app.core.settings import get_settings
+from app.schemas.response import Response, ResponseSchema
+from app.schemas.run import RunLeaseReleaseResponse, RunQueueStatsResponse
+from app.services.run_service import RunService
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+run_service = RunService()
+
+
+def require_internal_token(
+    x_internal_token: str | None = Header(default=None, alias="X-Internal-Token"),
+) -> None:
+    settings = get_settings()
+    if not settings.internal_api_token:
+        raise AppException(
+            error_code=ErrorCode.FORBIDDEN,
+            message="Internal API token is not configured",
+        )
+    if not x_internal_token or x_internal_token != settings.internal_api_token:
+        raise AppException(
+            error_code=ErrorCode.FORBIDDEN,
+            message="Invalid internal token",
+        )
+
+
+@router.post(
+    "/runs/release-expired-claims",
+    response_model=ResponseSchema[RunLeaseReleaseResponse],
+)
+def release_expired_run_claims(
+    _: None = Depends(require_internal_token),
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """Return runs whose claim lease expired to the queue (periodic job)."""
+    released = run_service.release_expired_claims(db)
+    return Response.success(
+        data=RunLeaseReleaseResponse(released=released),
+        message="Expired run claims released",
+    )
+
+
+@router.get("/runs/queue-stats", response_model=ResponseSchema[RunQueueStatsResponse])
+def get_run_queue_stats(
+    schedule_modes: list[str] | None = Query(default=None),
+    _: None = Depends(require_internal_token),
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """Per-user queue depth and wait time (fair-share scheduling stats)."""
+    result = run_service.get_queue_stats(db, schedule_modes)
+    return Response.success(data=result, message="Run queue stats retrieved")
@@ -35,7 +35,7 @@ def require_internal_token(
     "/slash-commands/resolve",
     response_model=ResponseSchema[dict[str, str]],
 )
-async def resolve_slash_commands(
+def resolve_slash_commands(
     request: SlashCommandResolveRequest,
     _: None = Depends(require_internal_token),
     user_id: str = Depends(get_current_user_id),
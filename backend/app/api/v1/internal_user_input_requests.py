@@ -1,6 +1,6 @@
 import uuid
 
-from fastapi import APIRouter, Depends, Header
+from fastapi import APIRouter, Depends, Header, Query
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
@@ -13,7 +13,10 @@ from app.schemas.user_input_request import (
     UserInputRequestCreateRequest,
     UserInputRequestResponse,
 )
-from app.services.user_input_request_service import UserInputRequestService
+from app.services.user_input_request_service import (
+    MAX_WAIT_SECONDS,
+    UserInputRequestService,
+)
 
 router = APIRouter(prefix="/internal", tags=["internal"])
 
@@ -40,7 +43,7 @@ def require_internal_token(
     "/user-input-requests",
     response_model=ResponseSchema[UserInputRequestResponse],
 )
-async def create_user_input_request(
+def create_user_input_request(
     request: UserInputRequestCreateRequest,
     _: None = Depends(require_internal_token),
     db: Session = Depends(get_db),
@@ -53,10 +56,30 @@ async def create_user_input_request(
     "/user-input-requests/{request_id}",
     response_model=ResponseSchema[UserInputRequestResponse],
 )
-async def get_user_input_request(
+def get_user_input_request(
     request_id: uuid.UUID,
     _: None = Depends(require_internal_token),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
     result = user_input_service.get_request(db, request_id=str(request_id))
     return Response.success(data=result, message="User input request retrieved")
+
+
+@router.get(
+    "/user-input-requests/{request_id}/wait",
+    response_model=ResponseSchema[UserInputRequestResponse],
+)
+async def wait_user_input_request(
+    request_id: uuid.UUID,
+    timeout_seconds: float = Query(default=25.0, ge=0, le=MAX_WAIT_SECONDS),
+    _: None = Depends(require_internal_token),
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """Long-poll: returns as soon as the request is answered or expired.
+
+    Returns the request unchanged (status pending) when timeout_seconds elapse.
+    """
+    result = await user_input_service.wait_for_resolution(
+        db, request_id=str(request_id), timeout_seconds=timeout_seconds
+    )
+    return Response.success(data=result, message="User input request retrieved")
@@ -19,7 +19,7 @@ service = ProjectService()
 
 
 @router.get("", response_model=ResponseSchema[list[ProjectResponse]])
-async def list_projects(
+def list_projects(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -28,7 +28,7 @@ async def list_projects(
 
 
 @router.get("/{project_id}", response_model=ResponseSchema[ProjectResponse])
-async def get_project(
+def get_project(
     project_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -38,7 +38,7 @@ async def get_project(
 
 
 @router.post("", response_model=ResponseSchema[ProjectResponse])
-async def create_project(
+def create_project(
     request: ProjectCreateRequest,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -48,7 +48,7 @@ async def create_project(
 
 
 @router.patch("/{project_id}", response_model=ResponseSchema[ProjectResponse])
-async def update_project(
+def update_project(
     project_id: uuid.UUID,
     request: ProjectUpdateRequest,
     user_id: str = Depends(get_current_user_id),
@@ -59,7 +59,7 @@ async def update_project(
 
 
 @router.delete("/{project_id}", response_model=ResponseSchema[dict])
-async def delete_project(
+def delete_project(
     project_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
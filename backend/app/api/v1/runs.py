@@ -1,6 +1,6 @@
 import uuid
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
@@ -9,6 +9,7 @@ from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
 from app.schemas.response import Response, ResponseSchema
 from app.schemas.run import (
+    RunBatchClaimRequest,
     RunClaimRequest,
     RunClaimResponse,
     RunFailRequest,
@@ -25,7 +26,7 @@ session_service = SessionService()
 
 
 @router.post("/claim", response_model=ResponseSchema[RunClaimResponse | None])
-async def claim_next_run(
+def claim_next_run(
     request: RunClaimRequest,
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -34,8 +35,18 @@ async def claim_next_run(
     return Response.success(data=result, message="Run claimed" if result else "No runs")
 
 
+@router.post("/claim-batch", response_model=ResponseSchema[list[RunClaimResponse]])
+def claim_runs(
+    request: RunBatchClaimRequest,
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """Claim up to `limit` available runs (at most one per session)."""
+    result = run_service.claim_runs(db, request)
+    return Response.success(data=result, message=f"Claimed {len(result)} runs")
+
+
 @router.post("/{run_id}/start", response_model=ResponseSchema[RunResponse])
-async def start_run(
+def start_run(
     run_id: uuid.UUID,
     request: RunStartRequest,
     db: Session = Depends(get_db),
@@ -46,7 +57,7 @@ async def start_run(
 
 
 @router.post("/{run_id}/fail", response_model=ResponseSchema[RunResponse])
-async def fail_run(
+def fail_run(
     run_id: uuid.UUID,
     request: RunFailRequest,
     db: Session = Depends(get_db),
@@ -57,7 +68,7 @@ async def fail_run(
 
 
 @router.get("/{run_id}", response_model=ResponseSchema[RunResponse])
-async def get_run(
+def get_run(
     run_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -74,19 +85,32 @@ async def get_run(
 
 
 @router.get("/session/{session_id}", response_model=ResponseSchema[list[RunResponse]])
-async def list_runs_by_session(
+def list_runs_by_session(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     limit: int = 100,
     offset: int = 0,
+    after_message_id: int | None = Query(default=None, ge=0),
+    before_message_id: int | None = Query(default=None, ge=1),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
-    """List runs for a session."""
+    """List runs for a session.
+
+    With `after_message_id`/`before_message_id` only runs whose user message id
+    lies within those exclusive bounds are returned, ordered by message id.
+    """
     db_session = session_service.get_session(db, session_id)
     if db_session.user_id != user_id:
         raise AppException(
             error_code=ErrorCode.FORBIDDEN,
             message="Session does not belong to the user",
         )
-    runs = run_service.list_runs(db, session_id, limit=limit, offset=offset)
+    runs = run_service.list_runs(
+        db,
+        session_id,
+        limit=limit,
+        offset=offset,
+        after_message_id=after_message_id,
+        before_message_id=before_message_id,
+    )
     return Response.success(data=runs, message="Runs retrieved successfully")
@@ -27,7 +27,7 @@ usage_service = UsageService()
 
 
 @router.post("", response_model=ResponseSchema[ScheduledTaskResponse])
-async def create_scheduled_task(
+def create_scheduled_task(
     request: ScheduledTaskCreateRequest,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -37,7 +37,7 @@ async def create_scheduled_task(
 
 
 @router.get("", response_model=ResponseSchema[list[ScheduledTaskResponse]])
-async def list_scheduled_tasks(
+def list_scheduled_tasks(
     user_id: str = Depends(get_current_user_id),
     limit: int = 100,
     offset: int = 0,
@@ -48,7 +48,7 @@ async def list_scheduled_tasks(
 
 
 @router.get("/{task_id}", response_model=ResponseSchema[ScheduledTaskResponse])
-async def get_scheduled_task(
+def get_scheduled_task(
     task_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -58,7 +58,7 @@ async def get_scheduled_task(
 
 
 @router.patch("/{task_id}", response_model=ResponseSchema[ScheduledTaskResponse])
-async def update_scheduled_task(
+def update_scheduled_task(
     task_id: uuid.UUID,
     request: ScheduledTaskUpdateRequest,
     user_id: str = Depends(get_current_user_id),
@@ -69,7 +69,7 @@ async def update_scheduled_task(
 
 
 @router.delete("/{task_id}", response_model=ResponseSchema[dict])
-async def delete_scheduled_task(
+def delete_scheduled_task(
     task_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -81,7 +81,7 @@ async def delete_scheduled_task(
 @router.post(
     "/{task_id}/trigger", response_model=ResponseSchema[ScheduledTaskTriggerResponse]
 )
-async def trigger_scheduled_task(
+def trigger_scheduled_task(
     task_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -91,7 +91,7 @@ async def trigger_scheduled_task(
 
 
 @router.get("/{task_id}/runs", response_model=ResponseSchema[list[RunResponse]])
-async def list_scheduled_task_runs(
+def list_scheduled_task_runs(
     task_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     limit: int = Query(default=100, ge=1, le=500),
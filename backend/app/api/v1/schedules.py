@@ -8,6 +8,7 @@ from fastapi.responses import JSONResponse
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
 from app.core.observability.request_context import get_request_id, get_trace_id
+from app.core.observability.tracing import TRACEPARENT_HEADER, current_traceparent
 from app.core.settings import get_settings
 from app.schemas.response import Response, ResponseSchema
 
@@ -15,7 +16,7 @@ router = APIRouter(prefix="/schedules", tags=["schedules"])
 
 
 @router.get("", response_model=ResponseSchema[dict])
-async def get_schedules() -> JSONResponse:
+def get_schedules() -> JSONResponse:
     """Proxy schedules from Executor Manager for frontend display."""
     settings = get_settings()
     url = f"{settings.executor_manager_url}/api/v1/schedules"
@@ -28,6 +29,9 @@ async def get_schedules() -> JSONResponse:
         trace_id = get_trace_id()
         if trace_id:
             headers["X-Trace-ID"] = trace_id
+        traceparent = current_traceparent()
+        if traceparent:
+            headers[TRACEPARENT_HEADER] = traceparent
         request = Request(url, headers=headers)
         with urlopen(request, timeout=3) as resp:  # noqa: S310
             payload = json.loads(resp.read().decode("utf-8"))
@@ -1,6 +1,7 @@
 import uuid
 import json
 from urllib.error import HTTPError, URLError
+from urllib.parse import quote, urlencode
 from urllib.request import Request, urlopen
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -8,11 +9,17 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app.core.observability.request_context import get_request_id, get_trace_id
+from app.core.observability.tracing import TRACEPARENT_HEADER, current_traceparent
 from app.core.settings import get_settings
 from app.core.deps import get_current_user_id, get_db
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
-from app.schemas.message import MessageResponse, MessageWithFilesResponse
+from app.schemas.message import (
+    MessageFeedItem,
+    MessageFeedRequest,
+    MessageResponse,
+    MessageWithFilesResponse,
+)
 from app.schemas.response import Response, ResponseSchema
 from app.schemas.session import (
     SessionCancelRequest,
@@ -25,7 +32,12 @@ from app.schemas.session import (
 from app.schemas.computer import ComputerBrowserScreenshotResponse
 from app.schemas.tool_execution import ToolExecutionResponse
 from app.schemas.usage import UsageResponse
-from app.schemas.workspace import FileNode, WorkspaceArchiveResponse
+from app.repositories.run_repository import RunRepository
+from app.schemas.workspace import (
+    FileNode,
+    WorkspaceArchiveResponse,
+    WorkspaceFileDiffResponse,
+)
 from app.services.message_service import MessageService
 from app.services.session_service import SessionService
 from app.services.storage_service import S3StorageService
@@ -71,6 +83,9 @@ def _cancel_executor_manager(session_id: uuid.UUID, reason: str | None) -> bool:
     trace_id = get_trace_id()
     if trace_id:
         headers["X-Trace-ID"] = trace_id
+    traceparent = current_traceparent()
+    if traceparent:
+        headers[TRACEPARENT_HEADER] = traceparent
 
     try:
         req = Request(  # noqa: S310
@@ -91,8 +106,62 @@ def _cancel_executor_manager(session_id: uuid.UUID, reason: str | None) -> bool:
     return False
 
 
+def _fetch_executor_manager_file_diff(
+    user_id: str,
+    session_id: uuid.UUID,
+    path: str,
+    *,
+    run_id: uuid.UUID | None,
+    cached: bool,
+) -> dict | None:
+    """Fetch a full file diff from the session workspace held by Executor Manager.
+
+    Returns None when the workspace (or file diff) is not available there.
+    """
+    settings = get_settings()
+    query: dict[str, str] = {"path": path, "cached": "true" if cached else "false"}
+    if run_id is not None:
+        query["run_id"] = str(run_id)
+    url = (
+        f"{settings.executor_manager_url}/api/v1/workspace/diff/"
+        f"{quote(user_id, safe='')}/{session_id}?{urlencode(query)}"
+    )
+
+    headers = {"accept": "application/json"}
+    request_id = get_request_id()
+    if request_id:
+        headers["X-Request-ID"] = request_id
+    trace_id = get_trace_id()
+    if trace_id:
+        headers["X-Trace-ID"] = trace_id
+    traceparent = current_traceparent()
+    if traceparent:
+        headers[TRACEPARENT_HEADER] = traceparent
+
+    try:
+        req = Request(url, headers=headers, method="GET")  # noqa: S310
+        with urlopen(req, timeout=15) as resp:  # noqa: S310
+            raw = resp.read().decode("utf-8")
+    except HTTPError:
+        return None
+    except (URLError, TimeoutError) as exc:
+        raise AppException(
+            error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+            message=f"Executor Manager unavailable: {exc}",
+        ) from exc
+
+    try:
+        parsed = json.loads(raw) if raw else {}
+    except ValueError:
+        return None
+    if not isinstance(parsed, dict) or parsed.get("code") != 0:
+        return None
+    data = parsed.get("data")
+    return data if isinstance(data, dict) else None
+
+
 @router.post("", response_model=ResponseSchema[SessionResponse])
-async def create_session(
+def create_session(
     request: SessionCreateRequest,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -106,7 +175,7 @@ async def create_session(
 
 
 @router.get("", response_model=ResponseSchema[list[SessionResponse]])
-async def list_sessions(
+def list_sessions(
     user_id: str = Depends(get_current_user_id),
     limit: int = 100,
     offset: int = 0,
@@ -132,7 +201,7 @@ async def list_sessions(
 
 
 @router.get("/{session_id}", response_model=ResponseSchema[SessionResponse])
-async def get_session(
+def get_session(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -151,7 +220,7 @@ async def get_session(
 
 
 @router.get("/{session_id}/state", response_model=ResponseSchema[SessionStateResponse])
-async def get_session_state(
+def get_session_state(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -170,7 +239,7 @@ async def get_session_state(
 
 
 @router.patch("/{session_id}", response_model=ResponseSchema[SessionResponse])
-async def update_session(
+def update_session(
     session_id: uuid.UUID,
     request: SessionUpdateRequest,
     user_id: str = Depends(get_current_user_id),
@@ -193,7 +262,7 @@ async def update_session(
 @router.post(
     "/{session_id}/cancel", response_model=ResponseSchema[SessionCancelResponse]
 )
-async def cancel_session(
+def cancel_session(
     session_id: uuid.UUID,
     request: SessionCancelRequest,
     user_id: str = Depends(get_current_user_id),
@@ -218,7 +287,7 @@ async def cancel_session(
 
 
 @router.delete("/{session_id}", response_model=ResponseSchema[dict])
-async def delete_session(
+def delete_session(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -237,15 +306,52 @@ async def delete_session(
     )
 
 
+@router.post("/messages/feed", response_model=ResponseSchema[list[MessageFeedItem]])
+def get_messages_feed(
+    request: MessageFeedRequest,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """Gets new messages for many sessions after per-session cursors.
+
+    Sessions without new messages (or not owned by the user) are omitted.
+    """
+    items = message_service.get_message_feed(
+        db, user_id=user_id, cursors=request.cursors, limit=request.limit
+    )
+    return Response.success(
+        data=items,
+        message="Messages retrieved successfully",
+    )
+
+
 @router.get(
     "/{session_id}/messages", response_model=ResponseSchema[list[MessageResponse]]
 )
-async def get_session_messages(
+def get_session_messages(
     session_id: uuid.UUID,
+    after_id: int | None = Query(
+        default=None,
+        ge=0,
+        description="Only return messages with id > after_id (incremental polling)",
+    ),
+    before_id: int | None = Query(
+        default=None,
+        ge=1,
+        description="Return the newest page of messages with id < before_id",
+    ),
+    latest: bool = Query(
+        default=False, description="Return the newest page instead of the oldest"
+    ),
+    limit: int = Query(default=200, ge=1, le=1000),
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
-    """Gets all messages for a session."""
+    """Gets one page of messages for a session, ordered by id.
+
+    Page forward with `after_id` (last id seen) and backward with `before_id`
+    (first id seen); `latest=true` opens the session at its newest page.
+    """
     # Verify session exists
     db_session = session_service.get_session(db, session_id)
     if db_session.user_id != user_id:
@@ -253,7 +359,14 @@ async def get_session_messages(
             error_code=ErrorCode.FORBIDDEN,
             message="Session does not belong to the user",
         )
-    messages = message_service.get_messages(db, session_id)
+    messages = message_service.get_messages_page(
+        db,
+        session_id,
+        after_id=after_id,
+        before_id=before_id,
+        newest=latest or before_id is not None,
+        limit=limit,
+    )
     return Response.success(
         data=[MessageResponse.model_validate(m) for m in messages],
         message="Messages retrieved successfully",
@@ -264,12 +377,20 @@ async def get_session_messages(
     "/{session_id}/messages-with-files",
     response_model=ResponseSchema[list[MessageWithFilesResponse]],
 )
-async def get_session_messages_with_files(
+def get_session_messages_with_files(
     session_id: uuid.UUID,
+    after_id: int | None = Query(default=None, ge=0),
+    before_id: int | None = Query(default=None, ge=1),
+    latest: bool = Query(default=False),
+    limit: int = Query(default=1000, ge=1, le=1000),
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
-    """Gets all messages for a session with per-message attachments."""
+    """Gets one page of messages for a session with per-message attachments.
+
+    Paginates like `/{session_id}/messages`; attachment URLs are presigned for
+    the returned page only.
+    """
     db_session = session_service.get_session(db, session_id)
     if db_session.user_id != user_id:
         raise AppException(
@@ -277,7 +398,15 @@ async def get_session_messages_with_files(
             message="Session does not belong to the user",
         )
 
-    messages = message_service.get_messages_with_files(db, session_id, user_id=user_id)
+    messages = message_service.get_messages_with_files(
+        db,
+        session_id,
+        user_id=user_id,
+        after_id=after_id,
+        before_id=before_id,
+        newest=latest or before_id is not None,
+        limit=limit,
+    )
     return Response.success(
         data=messages,
         message="Messages retrieved successfully",
@@ -288,14 +417,20 @@ async def get_session_messages_with_files(
     "/{session_id}/tool-executions",
     response_model=ResponseSchema[list[ToolExecutionResponse]],
 )
-async def get_session_tool_executions(
+def get_session_tool_executions(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     limit: int = Query(default=500, ge=1, le=2000),
     offset: int = Query(default=0, ge=0),
+    after_message_id: int | None = Query(default=None, ge=0),
+    before_message_id: int | None = Query(default=None, ge=1),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
-    """Gets all tool executions for a session."""
+    """Gets tool executions for a session.
+
+    Pass the bounds of a message page as `after_message_id`/`before_message_id`
+    to load only the executions of those messages.
+    """
     # Verify session exists
     db_session = session_service.get_session(db, session_id)
     if db_session.user_id != user_id:
@@ -308,6 +443,8 @@ async def get_session_tool_executions(
         session_id,
         limit=limit,
         offset=offset,
+        after_message_id=after_message_id,
+        before_message_id=before_message_id,
     )
     return Response.success(
         data=[ToolExecutionResponse.model_validate(e) for e in executions],
@@ -319,7 +456,7 @@ async def get_session_tool_executions(
     "/{session_id}/computer/browser/{tool_use_id}",
     response_model=ResponseSchema[ComputerBrowserScreenshotResponse],
 )
-async def get_session_browser_screenshot(
+def get_session_browser_screenshot(
     session_id: uuid.UUID,
     tool_use_id: str,
     user_id: str = Depends(get_current_user_id),
@@ -353,7 +490,7 @@ async def get_session_browser_screenshot(
 
 
 @router.get("/{session_id}/usage", response_model=ResponseSchema[UsageResponse])
-async def get_session_usage(
+def get_session_usage(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -377,7 +514,7 @@ async def get_session_usage(
     "/{session_id}/workspace/files",
     response_model=ResponseSchema[list[FileNode]],
 )
-async def get_session_workspace_files(
+def get_session_workspace_files(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -430,11 +567,60 @@ async def get_session_workspace_files(
     return Response.success(data=nodes, message="Workspace files retrieved")
 
 
+@router.get(
+    "/{session_id}/workspace/diff",
+    response_model=ResponseSchema[WorkspaceFileDiffResponse],
+)
+def get_session_workspace_file_diff(
+    session_id: uuid.UUID,
+    path: str = Query(..., description="File path within the workspace"),
+    cached: bool = Query(default=False, description="Staged (index vs HEAD) diff"),
+    run_id: uuid.UUID | None = Query(default=None),
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """Get the full diff of one changed file.
+
+    Workspace state only carries a bounded diff preview (see FileChange.diff_truncated);
+    the UI calls this when a file is opened. Finished runs are diffed between their
+    snapshot tags, running ones against the live workspace.
+    """
+    db_session = session_service.get_session(db, session_id)
+    if db_session.user_id != user_id:
+        raise AppException(
+            error_code=ErrorCode.FORBIDDEN,
+            message="Session does not belong to the user",
+        )
+
+    if run_id is None:
+        latest_run = RunRepository.get_latest_started_by_session(db, session_id)
+        run_id = latest_run.id if latest_run else None
+
+    data = _fetch_executor_manager_file_diff(
+        db_session.user_id, session_id, path, run_id=run_id, cached=cached
+    )
+    if data is None:
+        raise AppException(
+            error_code=ErrorCode.NOT_FOUND,
+            message="Workspace diff not available",
+        )
+    return Response.success(
+        data=WorkspaceFileDiffResponse(
+            path=data.get("path") or path,
+            diff=data.get("diff") or "",
+            diff_hash=data.get("diff_hash"),
+            diff_size=int(data.get("diff_size") or 0),
+            run_id=str(run_id) if run_id else None,
+        ),
+        message="Workspace diff retrieved",
+    )
+
+
 @router.get(
     "/{session_id}/workspace/archive",
     response_model=ResponseSchema[WorkspaceArchiveResponse],
 )
-async def get_session_workspace_archive(
+def get_session_workspace_archive(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
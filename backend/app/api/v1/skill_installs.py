@@ -19,7 +19,7 @@ service = UserSkillInstallService()
 
 
 @router.get("", response_model=ResponseSchema[list[UserSkillInstallResponse]])
-async def list_skill_installs(
+def list_skill_installs(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -28,7 +28,7 @@ async def list_skill_installs(
 
 
 @router.post("", response_model=ResponseSchema[UserSkillInstallResponse])
-async def create_skill_install(
+def create_skill_install(
     request: UserSkillInstallCreateRequest,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -40,7 +40,7 @@ async def create_skill_install(
 @router.patch(
     "/bulk", response_model=ResponseSchema[UserSkillInstallBulkUpdateResponse]
 )
-async def bulk_update_skill_installs(
+def bulk_update_skill_installs(
     request: UserSkillInstallBulkUpdateRequest,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -50,7 +50,7 @@ async def bulk_update_skill_installs(
 
 
 @router.patch("/{install_id}", response_model=ResponseSchema[UserSkillInstallResponse])
-async def update_skill_install(
+def update_skill_install(
     install_id: int,
     request: UserSkillInstallUpdateRequest,
     user_id: str = Depends(get_current_user_id),
@@ -61,7 +61,7 @@ async def update_skill_install(
 
 
 @router.delete("/{install_id}", response_model=ResponseSchema[dict])
-async def delete_skill_install(
+def delete_skill_install(
     install_id: int,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -17,7 +17,7 @@ service = SubAgentService()
 
 
 @router.get("", response_model=ResponseSchema[list[SubAgentResponse]])
-async def list_subagents(
+def list_subagents(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -26,7 +26,7 @@ async def list_subagents(
 
 
 @router.get("/{subagent_id}", response_model=ResponseSchema[SubAgentResponse])
-async def get_subagent(
+def get_subagent(
     subagent_id: int,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -36,7 +36,7 @@ async def get_subagent(
 
 
 @router.post("", response_model=ResponseSchema[SubAgentResponse])
-async def create_subagent(
+def create_subagent(
     request: SubAgentCreateRequest,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -46,7 +46,7 @@ async def create_subagent(
 
 
 @router.patch("/{subagent_id}", response_model=ResponseSchema[SubAgentResponse])
-async def update_subagent(
+def update_subagent(
     subagent_id: int,
     request: SubAgentUpdateRequest,
     user_id: str = Depends(get_current_user_id),
@@ -62,7 +62,7 @@ async def update_subagent(
 
 
 @router.delete("/{subagent_id}", response_model=ResponseSchema[dict])
-async def delete_subagent(
+def delete_subagent(
     subagent_id: int,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
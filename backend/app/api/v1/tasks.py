@@ -15,7 +15,7 @@ title_service = SessionTitleService()
 
 
 @router.post("", response_model=ResponseSchema[TaskEnqueueResponse])
-async def enqueue_task(
+def enqueue_task(
     request: TaskEnqueueRequest,
     background_tasks: BackgroundTasks,
     user_id: str = Depends(get_current_user_id),
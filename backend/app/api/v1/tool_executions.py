@@ -19,7 +19,7 @@ session_service = SessionService()
 
 
 @router.get("/{execution_id}", response_model=ResponseSchema[ToolExecutionResponse])
-async def get_tool_execution(
+def get_tool_execution(
     execution_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
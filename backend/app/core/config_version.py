@@ -0,0 +1,72 @@
+import logging
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.claude_md import UserClaudeMdSetting
+from app.models.env_var import UserEnvVar
+from app.models.mcp_server import McpServer
+from app.models.plugin import Plugin
+from app.models.skill import Skill
+from app.models.slash_command import SlashCommand
+from app.models.sub_agent import SubAgent
+from app.models.user_mcp_install import UserMcpInstall
+from app.models.user_plugin_install import UserPluginInstall
+from app.models.user_skill_install import UserSkillInstall
+from app.repositories.user_config_version_repository import (
+    UserConfigVersionRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+# Counter row for system-scoped config (system env vars, skills, plugins, MCP servers).
+SYSTEM_SCOPE = "__system__"
+
+_USER_OWNED = (
+    UserEnvVar,
+    UserMcpInstall,
+    UserSkillInstall,
+    UserPluginInstall,
+    SubAgent,
+    SlashCommand,
+    UserClaudeMdSetting,
+)
+_SCOPED = (McpServer, Skill, Plugin)
+
+
+def _owner(instance: object) -> str | None:
+    if isinstance(instance, _USER_OWNED):
+        return instance.user_id
+    if isinstance(instance, _SCOPED):
+        return SYSTEM_SCOPE if instance.scope == "system" else instance.owner_user_id
+    return None
+
+
+def get_config_version(db: Session, user_id: str) -> int:
+    """Current execution config version of a user (user + system counters).
+
+    Both counters only grow, so their sum changes whenever either does.
+    """
+    versions = UserConfigVersionRepository.get_versions(db, [user_id, SYSTEM_SCOPE])
+    return sum(versions.values())
+
+
+def bump_config_version(db: Session, *user_ids: str) -> None:
+    """Bump counters for changes the ORM does not see (bulk UPDATE statements)."""
+    UserConfigVersionRepository.bump(db, user_ids)
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_changed_config(db: Session, flush_context) -> None:
+    # new/dirty/deleted still describe the flushed changes in after_flush.
+    owners: set[str] = set()
+    for instance in (*db.new, *db.deleted):
+        owner = _owner(instance)
+        if owner:
+            owners.add(owner)
+    for instance in db.dirty:
+        owner = _owner(instance)
+        if owner and db.is_modified(instance, include_collections=False):
+            owners.add(owner)
+    if owners:
+        UserConfigVersionRepository.bump(db, owners)
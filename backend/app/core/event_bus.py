@@ -0,0 +1,242 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.core.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+_PENDING_EVENTS_KEY = "pending_session_events"
+_SUBSCRIBER_QUEUE_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class SessionEvent:
+    """A change to a session, its runs, messages or user input requests."""
+
+    id: str
+    seq: int
+    type: str
+    user_id: str
+    session_id: str
+    data: dict[str, Any] = field(default_factory=dict)
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def to_sse(self) -> str:
+        payload = {
+            "id": self.id,
+            "type": self.type,
+            "session_id": self.session_id,
+            "data": self.data,
+            "created_at": self.created_at.isoformat(),
+        }
+        body = json.dumps(payload, ensure_ascii=False, default=str)
+        return f"id: {self.id}\nevent: {self.type}\ndata: {body}\n\n"
+
+
+class _Overflow:
+    """Queue marker: the subscriber fell behind and events were dropped."""
+
+
+_OVERFLOW = _Overflow()
+
+
+class Subscription:
+    """A filtered view of the event bus bound to one asyncio loop."""
+
+    def __init__(
+        self,
+        bus: "SessionEventBus",
+        *,
+        user_id: str,
+        session_ids: set[str] | None,
+    ) -> None:
+        self._bus = bus
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue[SessionEvent | _Overflow] = asyncio.Queue(
+            maxsize=_SUBSCRIBER_QUEUE_SIZE
+        )
+        self.user_id = user_id
+        self.session_ids = session_ids
+        # Events to send before live ones (resume), and whether the caller must
+        # resync from the REST API because the requested position is gone.
+        self.replay: list[SessionEvent] = []
+        self.needs_reset = False
+
+    def matches(self, item: SessionEvent) -> bool:
+        if item.user_id != self.user_id:
+            return False
+        return self.session_ids is None or item.session_id in self.session_ids
+
+    def deliver_threadsafe(self, item: SessionEvent) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._deliver, item)
+        except RuntimeError:
+            # Loop already closed; the subscription is going away.
+            pass
+
+    def _deliver(self, item: SessionEvent | _Overflow) -> None:
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            # Drop what is buffered and tell the consumer to resync.
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(_OVERFLOW)
+
+    async def next_event(self, timeout: float) -> SessionEvent | None:
+        """Wait for the next event; None on timeout.
+
+        Raises:
+            OverflowError: The subscriber fell behind and events were dropped.
+        """
+        try:
+            item = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+        if isinstance(item, _Overflow):
+            raise OverflowError("event subscriber fell behind")
+        return item
+
+    def close(self) -> None:
+        self._bus.unsubscribe(self)
+
+
+class SessionEventBus:
+    """In-process publish/subscribe bus for session events.
+
+    Publishing is thread-safe and never blocks; each subscriber gets a bounded
+    queue on its own event loop. The last `history_size` events are retained so
+    a reconnecting client can resume after its last seen event id. Event ids are
+    "<epoch>-<seq>" where epoch identifies this process, so ids from before a
+    restart are detected and answered with a reset.
+
+    The bus is per process: all subscribers and writers must share one backend
+    worker (the default deployment runs a single uvicorn worker).
+    """
+
+    def __init__(self, *, history_size: int = 2048) -> None:
+        self._lock = threading.Lock()
+        self._epoch = format(time.time_ns() // 1_000_000, "x")
+        self._seq = 0
+        self._history: deque[SessionEvent] = deque(maxlen=max(1, history_size))
+        self._subscribers: set[Subscription] = set()
+
+    def publish(
+        self,
+        event_type: str,
+        *,
+        user_id: str,
+        session_id: uuid.UUID | str,
+        data: dict[str, Any] | None = None,
+    ) -> SessionEvent:
+        with self._lock:
+            self._seq += 1
+            item = SessionEvent(
+                id=f"{self._epoch}-{self._seq}",
+                seq=self._seq,
+                type=event_type,
+                user_id=user_id,
+                session_id=str(session_id),
+                data=data or {},
+            )
+            self._history.append(item)
+            targets = [sub for sub in self._subscribers if sub.matches(item)]
+        for sub in targets:
+            sub.deliver_threadsafe(item)
+        return item
+
+    def subscribe(
+        self,
+        *,
+        user_id: str,
+        session_ids: set[str] | None = None,
+        last_event_id: str | None = None,
+    ) -> Subscription:
+        """Register a subscriber (must be called from its event loop).
+
+        With last_event_id, retained events after it are put in `replay`; if that
+        position is unknown or no longer retained, `needs_reset` is set instead.
+        """
+        sub = Subscription(self, user_id=user_id, session_ids=session_ids)
+        with self._lock:
+            if last_event_id:
+                after_seq = self._parse_seq(last_event_id)
+                oldest = self._history[0].seq if self._history else self._seq + 1
+                if after_seq is None or after_seq > self._seq or after_seq < oldest - 1:
+                    sub.needs_reset = True
+                else:
+                    sub.replay = [
+                        item
+                        for item in self._history
+                        if item.seq > after_seq and sub.matches(item)
+                    ]
+            self._subscribers.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(sub)
+
+    @property
+    def last_event_id(self) -> str:
+        with self._lock:
+            return f"{self._epoch}-{self._seq}"
+
+    def _parse_seq(self, event_id: str) -> int | None:
+        epoch, _, seq = event_id.strip().partition("-")
+        if epoch != self._epoch or not seq.isdigit():
+            return None
+        return int(seq)
+
+
+event_bus = SessionEventBus(history_size=get_settings().event_history_size)
+
+
+def queue_session_event(
+    db: Session,
+    event_type: str,
+    *,
+    user_id: str,
+    session_id: uuid.UUID | str,
+    data: dict[str, Any] | None = None,
+) -> None:
+    """Queue an event on the DB session; it is published when the transaction commits.
+
+    Events of rolled back transactions are dropped, so subscribers never see
+    changes that were not persisted.
+    """
+    db.info.setdefault(_PENDING_EVENTS_KEY, []).append(
+        (event_type, user_id, session_id, data)
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_events(db: Session) -> None:
+    pending = db.info.pop(_PENDING_EVENTS_KEY, None)
+    if not pending:
+        return
+    for event_type, user_id, session_id, data in pending:
+        try:
+            event_bus.publish(
+                event_type, user_id=user_id, session_id=session_id, data=data
+            )
+        except Exception:
+            logger.exception("session_event_publish_failed")
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_pending_events(db: Session, transaction: SessionTransaction) -> None:
+    # Runs after after_commit; anything still pending belongs to a rollback.
+    if transaction.parent is None:
+        db.info.pop(_PENDING_EVENTS_KEY, None)
@@ -1,9 +1,12 @@
 import logging
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
 from fastapi import FastAPI
 
 from app.core.database import engine
+from app.core.run_wakeup import install_run_wakeups, uninstall_run_wakeups
+from app.core.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -13,9 +16,21 @@ async def lifespan(app: FastAPI):
     """Application lifespan management for database connections."""
     # Startup
     logger.info("Starting application...")
+    settings = get_settings()
+    # Bound the threadpool that runs sync (database) route handlers.
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(1, settings.api_threadpool_size)
+    logger.info(
+        "API threadpool configured",
+        extra={"threads": limiter.total_tokens},
+    )
     logger.info("Database engine initialized")
+    if settings.run_wakeup_enabled:
+        install_run_wakeups()
+        logger.info("Run wake-ups enabled")
     yield
     # Shutdown
+    uninstall_run_wakeups()
     logger.info("Shutting down database engine...")
     engine.dispose()
     logger.info("Database engine disposed")
@@ -7,6 +7,7 @@ from app.core.middleware.request_context import (
     RequestContextMiddleware,
 )
 from app.core.middleware.request_logging import RequestLoggingMiddleware
+from app.core.middleware.tracing import TracingMiddleware
 from app.core.settings import get_settings
 
 
@@ -15,6 +16,7 @@ def setup_middleware(app: FastAPI) -> None:
 
     # Inner -> outer: add order matters (Starlette wraps last-added as the outermost).
     app.add_middleware(RequestLoggingMiddleware)
+    app.add_middleware(TracingMiddleware)
 
     app.add_middleware(
         CORSMiddleware,
@@ -0,0 +1,51 @@
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.observability.tracing import (
+    SPAN_KIND_SERVER,
+    TRACEPARENT_HEADER,
+    reset_remote_parent,
+    set_remote_parent,
+    span,
+    tracing_enabled,
+)
+
+
+class TracingMiddleware(BaseHTTPMiddleware):
+    """Record one server span per request, parented to the caller's `traceparent`."""
+
+    def __init__(self, app, *, skip_paths: set[str] | None = None) -> None:
+        super().__init__(app)
+        self._skip_paths = skip_paths or {
+            "/health",
+            "/docs",
+            "/openapi.json",
+            "/metrics",
+        }
+
+    async def dispatch(self, request: Request, call_next):
+        if not tracing_enabled() or request.url.path in self._skip_paths:
+            return await call_next(request)
+
+        parent_token = set_remote_parent(request.headers.get(TRACEPARENT_HEADER))
+        try:
+            with span(
+                f"{request.method} {request.url.path}",
+                kind=SPAN_KIND_SERVER,
+                **{"http.request.method": request.method, "url.path": request.url.path},
+            ) as current:
+                response = await call_next(request)
+                route = getattr(request.scope.get("route"), "path", None)
+                if current is not None:
+                    if route:
+                        # Route templates keep span names low-cardinality.
+                        current.name = f"{request.method} {route}"
+                        current.attributes["http.route"] = route
+                    current.attributes["http.response.status_code"] = (
+                        response.status_code
+                    )
+                    if response.status_code >= 500:
+                        current.error = f"HTTP {response.status_code}"
+                return response
+        finally:
+            reset_remote_parent(parent_token)
@@ -0,0 +1,184 @@
+import logging
+import time
+from collections.abc import Iterable
+from datetime import datetime, timezone
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    Counter,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+from starlette.requests import Request
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+
+# 5 ms .. 5 min: timed steps range from single queries to container starts.
+DURATION_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+
+TIMING_STEP_SECONDS = Histogram(
+    "poco_timing_step_seconds",
+    "Duration of timed steps, fed by `timing` log lines.",
+    ["step"],
+    buckets=DURATION_BUCKETS,
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "poco_http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route", "status"],
+    buckets=DURATION_BUCKETS,
+)
+CALLBACKS_RECEIVED = Counter(
+    "poco_callbacks_received_total",
+    "Executor callbacks applied, by callback status.",
+    ["status"],
+)
+RUN_CLAIM_SECONDS = Histogram(
+    "poco_run_claim_seconds",
+    "Latency of run claim transactions.",
+    buckets=DURATION_BUCKETS,
+)
+RUNS_CLAIMED = Counter(
+    "poco_runs_claimed_total",
+    "Runs handed to workers, by schedule mode.",
+    ["schedule_mode"],
+)
+
+
+class TimingMetricsHandler(logging.Handler):
+    """Turns INFO+ `timing` log records (step + duration_ms) into histogram samples.
+
+    Per-message steps log at DEBUG to keep INFO volume down; their call sites
+    call observe_timing_step directly, so DEBUG records are skipped here.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.msg != "timing" or record.levelno < logging.INFO:
+            return
+        step = getattr(record, "step", None)
+        duration_ms = getattr(record, "duration_ms", None)
+        if isinstance(step, str) and isinstance(duration_ms, int | float):
+            observe_timing_step(step, duration_ms)
+
+
+def observe_timing_step(step: str, duration_ms: float) -> None:
+    TIMING_STEP_SECONDS.labels(step=step).observe(duration_ms / 1000)
+
+
+def observe_http_request(request: Request, status: int, seconds: float) -> None:
+    # Route templates keep label cardinality bounded (no ids in paths).
+    route = getattr(request.scope.get("route"), "path", None) or "unmatched"
+    HTTP_REQUEST_SECONDS.labels(
+        method=request.method, route=route, status=str(status)
+    ).observe(seconds)
+
+
+def observe_run_claim(started: float, schedule_modes: Iterable[str]) -> None:
+    RUN_CLAIM_SECONDS.observe(time.perf_counter() - started)
+    for schedule_mode in schedule_modes:
+        RUNS_CLAIMED.labels(schedule_mode=schedule_mode).inc()
+
+
+class _DatabasePoolCollector(Collector):
+    """Connection pool utilization, read at scrape time."""
+
+    def describe(self) -> list[Metric]:
+        return []
+
+    def collect(self) -> Iterable[Metric]:
+        # Imported here so configuring logging does not create the engine.
+        from app.core.database import engine
+
+        pool = engine.pool
+        if not hasattr(pool, "checkedout"):
+            return
+        yield GaugeMetricFamily(
+            "poco_db_pool_size", "Configured connection pool size.", value=pool.size()
+        )
+        connections = GaugeMetricFamily(
+            "poco_db_pool_connections",
+            "Pooled connections by state.",
+            labels=["state"],
+        )
+        connections.add_metric(["checked_out"], pool.checkedout())
+        connections.add_metric(["idle"], pool.checkedin())
+        yield connections
+        yield GaugeMetricFamily(
+            "poco_db_pool_overflow",
+            "Connections opened beyond the pool size (negative while unused).",
+            value=pool.overflow(),
+        )
+
+
+class _RunQueueCollector(Collector):
+    """Run queue depth and oldest due wait, queried at scrape time."""
+
+    def describe(self) -> list[Metric]:
+        return []
+
+    def collect(self) -> Iterable[Metric]:
+        from app.core.database import SessionLocal
+        from app.repositories.run_repository import RunRepository
+
+        try:
+            db = SessionLocal()
+            try:
+                rows = RunRepository.queue_depth(db)
+            finally:
+                db.close()
+        except Exception:
+            logger.exception("run_queue_metrics_failed")
+            return
+
+        now = datetime.now(timezone.utc)
+        depth = GaugeMetricFamily(
+            "poco_run_queue_runs",
+            "Unfinished runs by status and schedule mode.",
+            labels=["status", "schedule_mode"],
+        )
+        wait = GaugeMetricFamily(
+            "poco_run_queue_oldest_wait_seconds",
+            "Age of the oldest due queued run, by schedule mode.",
+            labels=["schedule_mode"],
+        )
+        for status, schedule_mode, count, oldest_due_at in rows:
+            depth.add_metric([status, schedule_mode], count)
+            if oldest_due_at is not None:
+                wait.add_metric(
+                    [schedule_mode], max(0.0, (now - oldest_due_at).total_seconds())
+                )
+        yield depth
+        yield wait
+
+
+REGISTRY.register(_DatabasePoolCollector())
+REGISTRY.register(_RunQueueCollector())
+
+
+def metrics_endpoint() -> Response:
+    """Prometheus scrape endpoint.
+
+    Sync on purpose: the run queue collector queries the database, so scrapes run
+    in the threadpool like other database handlers.
+    """
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
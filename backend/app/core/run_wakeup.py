@@ -0,0 +1,160 @@
+import json
+import logging
+import threading
+from datetime import datetime, timezone
+from urllib.error import URLError
+from urllib.request import Request, urlopen
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.core.settings import get_settings
+from app.models.agent_run import AgentRun
+
+logger = logging.getLogger(__name__)
+
+_PENDING_WAKEUPS_KEY = "pending_run_wakeups"
+# Status changes that can make a queued run claimable: a new run entering the
+# queue, or a run leaving its session's active slot.
+_WAKE_STATUSES = frozenset({"queued", "completed", "failed", "canceled"})
+
+# (schedule_mode, run_at); None mode means "any queue", None run_at means now.
+Wakeup = tuple[str | None, datetime | None]
+
+
+class RunWakeupNotifier:
+    """Tells Executor Manager that queued runs are claimable.
+
+    Requests are best-effort and sent from one background thread, so commits
+    never wait on the manager. Wake-ups queued while a request is in flight are
+    coalesced into the next one; interval polling on the manager covers any
+    request that is lost.
+    """
+
+    def __init__(self, url: str, *, timeout: float = 2.0) -> None:
+        self._url = url
+        self._timeout = timeout
+        self._pending: set[Wakeup] = set()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    def notify(self, wakeups: set[Wakeup]) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._pending.update(wakeups)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="run-wakeup", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=self._timeout + 1)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                batch, self._pending = self._pending, set()
+            self._send(batch)
+
+    def _send(self, batch: set[Wakeup]) -> None:
+        payload = {
+            "wakeups": [
+                {
+                    "schedule_mode": mode,
+                    "run_at": run_at.isoformat() if run_at else None,
+                }
+                for mode, run_at in batch
+            ]
+        }
+        try:
+            req = Request(  # noqa: S310
+                self._url,
+                data=json.dumps(payload).encode("utf-8"),
+                headers={
+                    "accept": "application/json",
+                    "content-type": "application/json",
+                },
+                method="POST",
+            )
+            with urlopen(req, timeout=self._timeout) as resp:  # noqa: S310
+                resp.read()
+        except (URLError, OSError, ValueError) as exc:
+            logger.debug("run_wakeup_failed", extra={"error": str(exc)})
+
+
+_notifier: RunWakeupNotifier | None = None
+
+
+def _collect_wakeups(db: Session, flush_context) -> None:
+    # Attribute history is still available in after_flush.
+    now = datetime.now(timezone.utc)
+    wakeups: set[Wakeup] = set()
+    for instance in db.new:
+        if isinstance(instance, AgentRun) and instance.status == "queued":
+            # scheduled_at is a server default; read the loaded value only so the
+            # listener never triggers a refresh query.
+            run_at = inspect(instance).dict.get("scheduled_at")
+            if run_at is not None and run_at.tzinfo is None:
+                run_at = run_at.replace(tzinfo=timezone.utc)
+            wakeups.add(
+                (instance.schedule_mode, run_at if run_at and run_at > now else None)
+            )
+    for instance in db.dirty:
+        if not isinstance(instance, AgentRun):
+            continue
+        if instance.status not in _WAKE_STATUSES:
+            continue
+        if inspect(instance).attrs.status.history.has_changes():
+            wakeups.add((None, None))
+    if wakeups:
+        db.info.setdefault(_PENDING_WAKEUPS_KEY, set()).update(wakeups)
+
+
+def _send_wakeups(db: Session) -> None:
+    pending = db.info.pop(_PENDING_WAKEUPS_KEY, None)
+    if pending and _notifier is not None:
+        _notifier.notify(pending)
+
+
+def _drop_wakeups(db: Session, transaction: SessionTransaction) -> None:
+    # Runs after after_commit; anything still pending belongs to a rollback.
+    if transaction.parent is None:
+        db.info.pop(_PENDING_WAKEUPS_KEY, None)
+
+
+def install_run_wakeups() -> None:
+    """Send wake-ups to Executor Manager after commits that make runs claimable."""
+    global _notifier
+    if _notifier is not None:
+        return
+    settings = get_settings()
+    _notifier = RunWakeupNotifier(
+        f"{settings.executor_manager_url}/api/v1/runs/wake",
+        timeout=settings.run_wakeup_timeout_seconds,
+    )
+    event.listen(Session, "after_flush", _collect_wakeups)
+    event.listen(Session, "after_commit", _send_wakeups)
+    event.listen(Session, "after_transaction_end", _drop_wakeups)
+
+
+def uninstall_run_wakeups() -> None:
+    global _notifier
+    if _notifier is None:
+        return
+    event.remove(Session, "after_flush", _collect_wakeups)
+    event.remove(Session, "after_commit", _send_wakeups)
+    event.remove(Session, "after_transaction_end", _drop_wakeups)
+    _notifier.close()
+    _notifier = None
@@ -19,6 +19,9 @@ class Settings(BaseSettings):
     db_pool_size: int = Field(default=5)
     db_max_overflow: int = Field(default=10)
     db_pool_timeout_seconds: int = Field(default=30)
+    # Sync route handlers (all DB access) run in this many worker threads so a slow
+    # query never blocks the event loop. Keep it >= db_pool_size + db_max_overflow.
+    api_threadpool_size: int = Field(default=40, alias="API_THREADPOOL_SIZE")
 
     cors_origins: list[str] = Field(
         default=["http://localhost:3000", "http://127.0.0.1:3000"]
@@ -33,6 +36,11 @@ class Settings(BaseSettings):
     executor_manager_url: str = Field(
         default="http://localhost:8001", alias="EXECUTOR_MANAGER_URL"
     )
+    # Wake Executor Manager when runs become claimable instead of waiting for its poll.
+    run_wakeup_enabled: bool = Field(default=True, alias="RUN_WAKEUP_ENABLED")
+    run_wakeup_timeout_seconds: float = Field(
+        default=2.0, alias="RUN_WAKEUP_TIMEOUT_SECONDS"
+    )
     s3_endpoint: str | None = Field(default=None, alias="S3_ENDPOINT")
     s3_public_endpoint: str | None = Field(default=None, alias="S3_PUBLIC_ENDPOINT")
     s3_access_key: str | None = Field(default=None, alias="S3_ACCESS_KEY")
@@ -55,6 +63,12 @@ class Settings(BaseSettings):
     )
     max_upload_size_mb: int = Field(default=100, alias="MAX_UPLOAD_SIZE_MB")
 
+    # Session event stream (SSE)
+    event_history_size: int = Field(default=2048, alias="EVENT_HISTORY_SIZE")
+    event_stream_heartbeat_seconds: int = Field(
+        default=15, alias="EVENT_STREAM_HEARTBEAT_SECONDS"
+    )
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -5,6 +5,7 @@ from app.core.errors.exception_handlers import setup_exception_handlers
 from app.core.lifespan import lifespan
 from app.core.middleware import setup_middleware
 from app.core.observability.logging import configure_logging
+from app.core.observability.tracing import configure_tracing
 from app.core.settings import get_settings
 
 
@@ -16,6 +17,7 @@ def create_app() -> FastAPI:
         log_sql=settings.log_sql,
         access_log=settings.uvicorn_access_log,
     )
+    configure_tracing(service_name="backend")
 
     app = FastAPI(
         title=settings.app_name,
@@ -16,6 +16,7 @@ from app.models.slash_command import SlashCommand
 from app.models.sub_agent import SubAgent
 from app.models.tool_execution import ToolExecution
 from app.models.usage_log import UsageLog
+from app.models.user_config_version import UserConfigVersion
 from app.models.user_mcp_install import UserMcpInstall
 from app.models.user_plugin_install import UserPluginInstall
 from app.models.user_input_request import UserInputRequest
@@ -40,6 +41,7 @@ __all__ = [
     "SubAgent",
     "ToolExecution",
     "UsageLog",
+    "UserConfigVersion",
     "UserMcpInstall",
     "UserPluginInstall",
     "UserInputRequest",
@@ -6,6 +6,7 @@ from sqlalchemy import (
     BigInteger,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     String,
@@ -26,6 +27,31 @@ if TYPE_CHECKING:
 
 class AgentRun(Base, TimestampMixin):
     __tablename__ = "agent_runs"
+    __table_args__ = (
+        Index(
+            "ix_agent_runs_session_id_user_message_id",
+            "session_id",
+            "user_message_id",
+        ),
+        # Run queue: claim candidates, sessions with an active run, lease reaping.
+        Index(
+            "ix_agent_runs_queued_scheduled_at",
+            "status",
+            "scheduled_at",
+            "created_at",
+            postgresql_where=text("status = 'queued'"),
+        ),
+        Index(
+            "ix_agent_runs_active_session_id",
+            "session_id",
+            postgresql_where=text("status IN ('claimed', 'running')"),
+        ),
+        Index(
+            "ix_agent_runs_claimed_lease_expires_at",
+            "lease_expires_at",
+            postgresql_where=text("status = 'claimed'"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
@@ -5,6 +5,7 @@ from sqlalchemy import (
     JSON,
     Boolean,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
@@ -27,6 +28,7 @@ class ToolExecution(Base, TimestampMixin):
             "tool_use_id",
             name="uq_tool_executions_session_tool_use_id",
         ),
+        Index("ix_tool_executions_session_id_message_id", "session_id", "message_id"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -0,0 +1,19 @@
+from sqlalchemy import BigInteger, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base, TimestampMixin
+
+
+class UserConfigVersion(Base, TimestampMixin):
+    """Change counter of everything that feeds a user's execution config.
+
+    Bumped in the same transaction as the change (see app.core.config_version);
+    the `__system__` row counts changes to system-scoped config.
+    """
+
+    __tablename__ = "user_config_versions"
+
+    user_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    version: Mapped[int] = mapped_column(
+        BigInteger, default=0, server_default=text("0"), nullable=False
+    )
@@ -14,6 +14,12 @@ class McpServerRepository:
     def get_by_id(session_db: Session, server_id: int) -> McpServer | None:
         return session_db.query(McpServer).filter(McpServer.id == server_id).first()
 
+    @staticmethod
+    def list_by_ids(session_db: Session, server_ids: list[int]) -> list[McpServer]:
+        if not server_ids:
+            return []
+        return session_db.query(McpServer).filter(McpServer.id.in_(server_ids)).all()
+
     @staticmethod
     def get_by_name(session_db: Session, name: str, user_id: str) -> McpServer | None:
         """Get MCP server by name within a user's scope.
@@ -1,6 +1,7 @@
 import uuid
 from typing import Any
 
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.orm import Session
 
 from app.models.agent_message import AgentMessage
@@ -34,6 +35,17 @@ class MessageRepository:
             session_db.query(AgentMessage).filter(AgentMessage.id == message_id).first()
         )
 
+    @staticmethod
+    def list_by_ids(session_db: Session, message_ids: list[int]) -> list[AgentMessage]:
+        """Gets messages by ID."""
+        if not message_ids:
+            return []
+        return (
+            session_db.query(AgentMessage)
+            .filter(AgentMessage.id.in_(message_ids))
+            .all()
+        )
+
     @staticmethod
     def list_by_session(
         session_db: Session, session_id: uuid.UUID, limit: int = 100, offset: int = 0
@@ -48,6 +60,80 @@ class MessageRepository:
             .all()
         )
 
+    @staticmethod
+    def list_page(
+        session_db: Session,
+        session_id: uuid.UUID,
+        *,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        newest: bool = False,
+        limit: int = 200,
+    ) -> list[AgentMessage]:
+        """Lists one keyset page of a session's messages, oldest first.
+
+        Both bounds are exclusive. By default the page starts right after
+        after_id; with newest=True it is the newest page below before_id. Either
+        way the query is a range scan on (session_id, id).
+        """
+        query = session_db.query(AgentMessage).filter(
+            AgentMessage.session_id == session_id
+        )
+        if after_id is not None:
+            query = query.filter(AgentMessage.id > after_id)
+        if before_id is not None:
+            query = query.filter(AgentMessage.id < before_id)
+        if not newest:
+            return query.order_by(AgentMessage.id.asc()).limit(limit).all()
+        messages = query.order_by(AgentMessage.id.desc()).limit(limit).all()
+        messages.reverse()
+        return messages
+
+    @staticmethod
+    def list_after_for_sessions(
+        session_db: Session, cursors: dict[uuid.UUID, int], limit_per_session: int = 200
+    ) -> dict[uuid.UUID, list[AgentMessage]]:
+        """Lists messages after a per-session cursor for many sessions in one query.
+
+        At most limit_per_session messages are returned per session, oldest first.
+        """
+        if not cursors:
+            return {}
+        ranked = (
+            select(
+                AgentMessage.id.label("id"),
+                func.row_number()
+                .over(
+                    partition_by=AgentMessage.session_id,
+                    order_by=AgentMessage.id.asc(),
+                )
+                .label("rank"),
+            )
+            .where(
+                or_(
+                    *(
+                        and_(
+                            AgentMessage.session_id == session_id,
+                            AgentMessage.id > after_id,
+                        )
+                        for session_id, after_id in cursors.items()
+                    )
+                )
+            )
+            .subquery()
+        )
+        rows = (
+            session_db.query(AgentMessage)
+            .join(ranked, ranked.c.id == AgentMessage.id)
+            .filter(ranked.c.rank <= limit_per_session)
+            .order_by(AgentMessage.session_id, AgentMessage.id.asc())
+            .all()
+        )
+        result: dict[uuid.UUID, list[AgentMessage]] = {}
+        for row in rows:
+            result.setdefault(row.session_id, []).append(row)
+        return result
+
     @staticmethod
     def count_by_session(session_db: Session, session_id: uuid.UUID) -> int:
         """Counts messages for a session."""
@@ -14,6 +14,12 @@ class PluginRepository:
     def get_by_id(session_db: Session, plugin_id: int) -> Plugin | None:
         return session_db.query(Plugin).filter(Plugin.id == plugin_id).first()
 
+    @staticmethod
+    def list_by_ids(session_db: Session, plugin_ids: list[int]) -> list[Plugin]:
+        if not plugin_ids:
+            return []
+        return session_db.query(Plugin).filter(Plugin.id.in_(plugin_ids)).all()
+
     @staticmethod
     def get_by_name(session_db: Session, name: str, user_id: str) -> Plugin | None:
         """Get a user-owned plugin by name."""
@@ -1,10 +1,15 @@
 import uuid
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import exists, select, update
+from sqlalchemy import and_, case, func, select, update
 from sqlalchemy.orm import Session, aliased
 
 from app.models.agent_run import AgentRun
+from app.models.agent_session import AgentSession
+
+_CLAIM_OVERFETCH = 4
+# Transaction-level advisory lock serializing quota-limited claims ("poco").
+_CLAIM_QUOTA_LOCK_KEY = 0x706F636F
 
 
 class RunRepository:
@@ -62,6 +67,60 @@ class RunRepository:
             .all()
         )
 
+    @staticmethod
+    def list_by_session_message_range(
+        session_db: Session,
+        session_id: uuid.UUID,
+        *,
+        after_message_id: int | None = None,
+        before_message_id: int | None = None,
+        limit: int = 100,
+    ) -> list[AgentRun]:
+        """Lists runs of a session whose user message id is within exclusive bounds.
+
+        Ordered by user message id, so message pages map onto run pages.
+        """
+        query = session_db.query(AgentRun).filter(AgentRun.session_id == session_id)
+        if after_message_id is not None:
+            query = query.filter(AgentRun.user_message_id > after_message_id)
+        if before_message_id is not None:
+            query = query.filter(AgentRun.user_message_id < before_message_id)
+        return (
+            query.order_by(AgentRun.user_message_id.asc(), AgentRun.created_at.asc())
+            .limit(limit)
+            .all()
+        )
+
+    @staticmethod
+    def list_by_user_message_ids(
+        session_db: Session, session_id: uuid.UUID, message_ids: list[int]
+    ) -> list[AgentRun]:
+        """Lists the runs of a session started by the given user messages."""
+        if not message_ids:
+            return []
+        return (
+            session_db.query(AgentRun)
+            .filter(
+                AgentRun.session_id == session_id,
+                AgentRun.user_message_id.in_(message_ids),
+            )
+            .order_by(AgentRun.user_message_id.asc(), AgentRun.created_at.asc())
+            .all()
+        )
+
+    @staticmethod
+    def get_latest_started_by_session(
+        session_db: Session, session_id: uuid.UUID
+    ) -> AgentRun | None:
+        """Gets the most recently started run of a session."""
+        return (
+            session_db.query(AgentRun)
+            .filter(AgentRun.session_id == session_id)
+            .filter(AgentRun.started_at.isnot(None))
+            .order_by(AgentRun.started_at.desc())
+            .first()
+        )
+
     @staticmethod
     def list_by_scheduled_task(
         session_db: Session,
@@ -98,50 +157,218 @@ class RunRepository:
         return result.rowcount
 
     @staticmethod
-    def claim_next(
+    def claim_batch(
         session_db: Session,
         worker_id: str,
+        *,
+        limit: int = 1,
         lease_seconds: int = 30,
         schedule_modes: list[str] | None = None,
-    ) -> AgentRun | None:
-        """Claims the next available run for execution.
+        max_active_per_user: int | None = None,
+        max_active_per_mode: dict[str, int] | None = None,
+        user_weights: dict[str, float] | None = None,
+    ) -> list[AgentRun]:
+        """Claims up to `limit` available runs, at most one per session.
+
+        Uses SELECT ... FOR UPDATE SKIP LOCKED to support multiple workers, and skips
+        sessions that already have a claimed/running run. Expired leases are not
+        released here; release_expired_claims runs as a periodic job.
 
-        Uses SELECT ... FOR UPDATE SKIP LOCKED to support multiple workers.
-        Ensures only one claimed/running run per session at a time.
+        Runs are interleaved across users (weighted round-robin): a user's n-th
+        claimable run ranks (n - 1) / weight, so one user's backlog cannot starve
+        others. Quotas cap claimed/running runs per user and per schedule mode
+        across all workers: quota-limited claims hold an advisory lock until the
+        transaction ends, so concurrent claimers count each other's claims.
+
+        A session's runs are claimed strictly in order: if its oldest due run is
+        in a mode this worker does not serve or whose quota is exhausted, the
+        session waits rather than running a later run first.
         """
         if lease_seconds <= 0:
             lease_seconds = 30
-
-        _ = RunRepository.release_expired_claims(session_db)
+        limit = max(1, limit)
 
         now = datetime.now(timezone.utc)
         lease_until = now + timedelta(seconds=lease_seconds)
 
-        running_or_claimed = aliased(AgentRun)
-        has_active_run = exists(
-            select(1)
-            .select_from(running_or_claimed)
-            .where(running_or_claimed.session_id == AgentRun.session_id)
-            .where(running_or_claimed.status.in_(["claimed", "running"]))
+        # Served by the partial index on claimed/running runs; a hashed anti-join
+        # instead of a correlated subquery per candidate.
+        active = aliased(AgentRun)
+        active_session_ids = select(active.session_id).where(
+            active.status.in_(["claimed", "running"])
         )
 
-        stmt = (
-            select(AgentRun)
+        if max_active_per_user or max_active_per_mode:
+            # SKIP LOCKED alone lets two claimers fill the same quota from their
+            # own snapshots; the lock makes the counts below include the other
+            # claimer's committed claims (READ COMMITTED, one snapshot per query).
+            session_db.execute(
+                select(func.pg_advisory_xact_lock(_CLAIM_QUOTA_LOCK_KEY))
+            )
+
+        mode_slots: dict[str, int] = {}
+        if max_active_per_mode:
+            active_by_mode = dict(
+                session_db.execute(
+                    select(active.schedule_mode, func.count())
+                    .where(active.status.in_(["claimed", "running"]))
+                    .where(active.schedule_mode.in_(list(max_active_per_mode)))
+                    .group_by(active.schedule_mode)
+                ).all()
+            )
+            mode_slots = {
+                mode: max(0, quota - active_by_mode.get(mode, 0))
+                for mode, quota in max_active_per_mode.items()
+            }
+
+        run_order = (AgentRun.scheduled_at.asc(), AgentRun.created_at.asc())
+        # Window functions cannot share a query level with FOR UPDATE, so ranking
+        # happens in subqueries and only the outer select locks rows.
+        heads_stmt = (
+            select(
+                AgentRun.id,
+                AgentRun.scheduled_at,
+                AgentRun.created_at,
+                AgentRun.schedule_mode,
+                AgentSession.user_id,
+                func.row_number()
+                .over(partition_by=AgentRun.session_id, order_by=run_order)
+                .label("session_rank"),
+            )
+            .join(AgentSession, AgentSession.id == AgentRun.session_id)
             .where(AgentRun.status == "queued")
             .where(AgentRun.scheduled_at <= now)
-            .where(~has_active_run)
-            .order_by(AgentRun.scheduled_at.asc(), AgentRun.created_at.asc())
-            .with_for_update(skip_locked=True)
-            .limit(1)
+            .where(AgentRun.session_id.not_in(active_session_ids))
         )
+        heads = heads_stmt.subquery()
+
+        # Mode filters apply to session heads only, after ranking over every due
+        # run, so a later run never overtakes its session's blocked head.
+        ranked_stmt = select(
+            heads.c.id,
+            heads.c.user_id,
+            heads.c.scheduled_at,
+            heads.c.created_at,
+            func.row_number()
+            .over(
+                partition_by=heads.c.user_id,
+                order_by=(heads.c.scheduled_at.asc(), heads.c.created_at.asc()),
+            )
+            .label("user_rank"),
+        ).where(heads.c.session_rank == 1)
         if schedule_modes:
-            stmt = stmt.where(AgentRun.schedule_mode.in_(schedule_modes))
+            ranked_stmt = ranked_stmt.where(heads.c.schedule_mode.in_(schedule_modes))
+        exhausted_modes = [mode for mode, slots in mode_slots.items() if slots <= 0]
+        if exhausted_modes:
+            ranked_stmt = ranked_stmt.where(
+                heads.c.schedule_mode.not_in(exhausted_modes)
+            )
+        ranked = ranked_stmt.subquery()
 
-        run = session_db.execute(stmt).scalars().first()
-        if not run:
-            return None
+        weights = {
+            user_id: float(weight)
+            for user_id, weight in (user_weights or {}).items()
+            if weight and weight > 0
+        }
+        fair_rank = (ranked.c.user_rank - 1) * 1.0
+        if weights:
+            fair_rank = fair_rank / case(weights, value=ranked.c.user_id, else_=1.0)
 
-        run.status = "claimed"
-        run.claimed_by = worker_id
-        run.lease_expires_at = lease_until
-        return run
+        stmt = (
+            select(AgentRun)
+            .join(ranked, ranked.c.id == AgentRun.id)
+            # Re-checked on the locked row version if another worker claimed it.
+            .where(AgentRun.status == "queued")
+            .order_by(
+                fair_rank.asc(), ranked.c.scheduled_at.asc(), ranked.c.created_at.asc()
+            )
+            .with_for_update(skip_locked=True, of=AgentRun)
+            # Over-fetch: candidates may be skipped for mode quotas or races.
+            .limit(limit * _CLAIM_OVERFETCH)
+        )
+        if max_active_per_user:
+            active_session = aliased(AgentSession)
+            active_by_user = (
+                select(active_session.user_id, func.count().label("active"))
+                .select_from(active)
+                .join(active_session, active_session.id == active.session_id)
+                .where(active.status.in_(["claimed", "running"]))
+                .group_by(active_session.user_id)
+                .subquery()
+            )
+            stmt = stmt.outerjoin(
+                active_by_user, active_by_user.c.user_id == ranked.c.user_id
+            ).where(
+                ranked.c.user_rank + func.coalesce(active_by_user.c.active, 0)
+                <= max_active_per_user
+            )
+
+        claimed: list[AgentRun] = []
+        seen_sessions: set[uuid.UUID] = set()
+        for run in session_db.execute(stmt).scalars():
+            if run.session_id in seen_sessions:
+                continue
+            if run.schedule_mode in mode_slots:
+                if mode_slots[run.schedule_mode] <= 0:
+                    continue
+                mode_slots[run.schedule_mode] -= 1
+            seen_sessions.add(run.session_id)
+            run.status = "claimed"
+            run.claimed_by = worker_id
+            run.lease_expires_at = lease_until
+            claimed.append(run)
+            if len(claimed) >= limit:
+                break
+        return claimed
+
+    @staticmethod
+    def queue_depth(
+        session_db: Session,
+    ) -> list[tuple[str, str, int, datetime | None]]:
+        """Unfinished runs per (status, schedule_mode).
+
+        Returns (status, schedule_mode, count, oldest_due_scheduled_at) rows; the
+        oldest due time is only set for queued runs whose scheduled_at has passed.
+        """
+        now = datetime.now(timezone.utc)
+        due = and_(AgentRun.status == "queued", AgentRun.scheduled_at <= now)
+        stmt = (
+            select(
+                AgentRun.status,
+                AgentRun.schedule_mode,
+                func.count(),
+                func.min(AgentRun.scheduled_at).filter(due),
+            )
+            .where(AgentRun.status.in_(["queued", "claimed", "running"]))
+            .group_by(AgentRun.status, AgentRun.schedule_mode)
+        )
+        return [tuple(row) for row in session_db.execute(stmt).all()]
+
+    @staticmethod
+    def queue_stats_by_user(
+        session_db: Session, schedule_modes: list[str] | None = None
+    ) -> list[tuple[str, int, int, int, datetime | None]]:
+        """Per-user queue depth.
+
+        Returns (user_id, queued, due, active, oldest_due_scheduled_at) rows, where
+        due runs are queued runs whose scheduled_at has passed and active runs are
+        claimed or running.
+        """
+        now = datetime.now(timezone.utc)
+        queued = AgentRun.status == "queued"
+        due = and_(queued, AgentRun.scheduled_at <= now)
+        stmt = (
+            select(
+                AgentSession.user_id,
+                func.count().filter(queued),
+                func.count().filter(due),
+                func.count().filter(AgentRun.status.in_(["claimed", "running"])),
+                func.min(AgentRun.scheduled_at).filter(due),
+            )
+            .join(AgentSession, AgentSession.id == AgentRun.session_id)
+            .where(AgentRun.status.in_(["queued", "claimed", "running"]))
+            .group_by(AgentSession.user_id)
+        )
+        if schedule_modes:
+            stmt = stmt.where(AgentRun.schedule_mode.in_(schedule_modes))
+        return [tuple(row) for row in session_db.execute(stmt).all()]
@@ -44,6 +44,40 @@ class SessionRepository:
             .first()
         )
 
+    @staticmethod
+    def list_by_ids(
+        session_db: Session, session_ids: list[uuid.UUID]
+    ) -> list[AgentSession]:
+        """Gets sessions (not deleted) by ID."""
+        if not session_ids:
+            return []
+        return (
+            session_db.query(AgentSession)
+            .filter(
+                AgentSession.id.in_(session_ids),
+                AgentSession.is_deleted.is_(False),
+            )
+            .all()
+        )
+
+    @staticmethod
+    def list_owned_ids(
+        session_db: Session, user_id: str, session_ids: list[uuid.UUID]
+    ) -> set[uuid.UUID]:
+        """Returns the subset of session_ids that belong to the user (not deleted)."""
+        if not session_ids:
+            return set()
+        rows = (
+            session_db.query(AgentSession.id)
+            .filter(
+                AgentSession.id.in_(session_ids),
+                AgentSession.user_id == user_id,
+                AgentSession.is_deleted.is_(False),
+            )
+            .all()
+        )
+        return {row[0] for row in rows}
+
     @staticmethod
     def get_by_sdk_session_id(
         session_db: Session, sdk_session_id: str
@@ -1,6 +1,8 @@
 import uuid
+from collections.abc import Iterable
 from typing import Any
 
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
 
 from app.models.tool_execution import ToolExecution
@@ -62,6 +64,51 @@ class ToolExecutionRepository:
             .first()
         )
 
+    @staticmethod
+    def get_by_session_and_tool_use_ids(
+        session_db: Session,
+        session_id: uuid.UUID,
+        tool_use_ids: Iterable[str],
+    ) -> dict[str, ToolExecution]:
+        """Gets tool executions for many tool_use_ids of a session in one query."""
+        ids = set(tool_use_ids)
+        if not ids:
+            return {}
+        rows = (
+            session_db.query(ToolExecution)
+            .filter(
+                ToolExecution.session_id == session_id,
+                ToolExecution.tool_use_id.in_(ids),
+            )
+            .all()
+        )
+        return {row.tool_use_id: row for row in rows if row.tool_use_id}
+
+    @staticmethod
+    def insert_many(session_db: Session, rows: list[dict[str, Any]]) -> set[str]:
+        """Bulk inserts tool executions, skipping (session_id, tool_use_id) conflicts.
+
+        Rows must share the same keys. Returns the tool_use_ids actually inserted; a
+        missing id means a concurrent writer created that row first.
+
+        Note: Does not commit. Transaction handled by Service layer.
+        """
+        if not rows:
+            return set()
+
+        if session_db.get_bind().dialect.name != "postgresql":
+            for row in rows:
+                session_db.add(ToolExecution(**row))
+            return {row["tool_use_id"] for row in rows}
+
+        stmt = (
+            postgresql.insert(ToolExecution)
+            .values(rows)
+            .on_conflict_do_nothing(constraint="uq_tool_executions_session_tool_use_id")
+            .returning(ToolExecution.tool_use_id)
+        )
+        return set(session_db.execute(stmt).scalars())
+
     @staticmethod
     def list_by_session(
         session_db: Session, session_id: uuid.UUID, limit: int = 100, offset: int = 0
@@ -76,6 +123,34 @@ class ToolExecutionRepository:
             .all()
         )
 
+    @staticmethod
+    def list_by_session_message_range(
+        session_db: Session,
+        session_id: uuid.UUID,
+        *,
+        after_message_id: int | None = None,
+        before_message_id: int | None = None,
+        limit: int = 100,
+    ) -> list[ToolExecution]:
+        """Lists tool executions of a session whose message id is within exclusive bounds.
+
+        Ordered by message id, so message pages map onto tool execution pages.
+        """
+        query = session_db.query(ToolExecution).filter(
+            ToolExecution.session_id == session_id
+        )
+        if after_message_id is not None:
+            query = query.filter(ToolExecution.message_id > after_message_id)
+        if before_message_id is not None:
+            query = query.filter(ToolExecution.message_id < before_message_id)
+        return (
+            query.order_by(
+                ToolExecution.message_id.asc(), ToolExecution.created_at.asc()
+            )
+            .limit(limit)
+            .all()
+        )
+
     @staticmethod
     def list_unfinished_by_session(
         session_db: Session, session_id: uuid.UUID
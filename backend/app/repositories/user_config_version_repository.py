@@ -0,0 +1,54 @@
+from collections.abc import Iterable
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.models.user_config_version import UserConfigVersion
+
+
+class UserConfigVersionRepository:
+    @staticmethod
+    def get_versions(session_db: Session, user_ids: list[str]) -> dict[str, int]:
+        rows = session_db.execute(
+            select(UserConfigVersion.user_id, UserConfigVersion.version).where(
+                UserConfigVersion.user_id.in_(user_ids)
+            )
+        ).all()
+        return {row.user_id: int(row.version) for row in rows}
+
+    @staticmethod
+    def bump(session_db: Session, user_ids: Iterable[str]) -> None:
+        """Increments the counters of the given users, creating missing rows.
+
+        Note: Does not commit. Runs inside the caller's transaction.
+        """
+        ids = sorted(set(user_ids))
+        if not ids:
+            return
+
+        if session_db.get_bind().dialect.name != "postgresql":
+            for user_id in ids:
+                result = session_db.execute(
+                    update(UserConfigVersion)
+                    .where(UserConfigVersion.user_id == user_id)
+                    .values(version=UserConfigVersion.version + 1)
+                )
+                if result.rowcount == 0:
+                    session_db.execute(
+                        insert(UserConfigVersion).values(user_id=user_id, version=1)
+                    )
+            return
+
+        # Sorted ids keep row lock order stable across concurrent transactions.
+        stmt = postgresql.insert(UserConfigVersion).values(
+            [{"user_id": user_id, "version": 1} for user_id in ids]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserConfigVersion.user_id],
+            set_={
+                "version": UserConfigVersion.version + 1,
+                "updated_at": func.now(),
+            },
+        )
+        session_db.execute(stmt)
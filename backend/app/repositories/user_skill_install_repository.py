@@ -1,6 +1,7 @@
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from app.core.config_version import bump_config_version
 from app.models.user_skill_install import UserSkillInstall
 
 
@@ -55,13 +56,16 @@ class UserSkillInstallRepository:
             if not install_ids:
                 return 0
             query = query.filter(UserSkillInstall.id.in_(install_ids))
-        return query.update(
+        updated = query.update(
             {
                 UserSkillInstall.enabled: enabled,
                 UserSkillInstall.updated_at: func.now(),
             },
             synchronize_session=False,
         )
+        if updated:
+            bump_config_version(session_db, user_id)
+        return updated
 
     @staticmethod
     def delete(session_db: Session, install: UserSkillInstall) -> None:
@@ -38,6 +38,9 @@ class FileChange(BaseModel):
     added_lines: int = 0
     deleted_lines: int = 0
     diff: str | None = None
+    diff_truncated: bool = False
+    diff_hash: str | None = None  # sha256 of the full patch
+    diff_size: int = 0  # full patch size in bytes
     old_path: str | None = None
 
 
@@ -85,6 +88,19 @@ class AgentCallbackRequest(BaseModel):
     workspace_export_status: str | None = None
 
 
+class AgentCallbackBatchRequest(BaseModel):
+    """Coalesced executor callbacks.
+
+    `callbacks` are applied in order; `state_delta` holds only the top-level
+    AgentCurrentState fields that changed and is merged into the stored state_patch.
+    """
+
+    session_id: str
+    seq: int
+    callbacks: list[AgentCallbackRequest] = Field(default_factory=list)
+    state_delta: dict[str, Any] | None = None
+
+
 class CallbackResponse(BaseModel):
     """Callback response."""
 
@@ -92,3 +108,12 @@ class CallbackResponse(BaseModel):
     status: str
     callback_status: CallbackStatus | None = None
     message: str | None = None
+
+
+class CallbackBatchResponse(BaseModel):
+    """Callback batch response."""
+
+    session_id: str
+    seq: int
+    processed: int
+    status: str | None = None
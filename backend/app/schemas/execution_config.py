@@ -0,0 +1,37 @@
+from pydantic import BaseModel, Field
+
+from app.schemas.claude_md import ClaudeMdResponse
+from app.schemas.sub_agent import SubAgentResolveResponse
+
+
+class ExecutionConfigResolveRequest(BaseModel):
+    """Request to resolve everything a run needs from the user's config at once."""
+
+    mcp_server_ids: list[int] = Field(default_factory=list)
+    skill_ids: list[int] = Field(default_factory=list)
+    plugin_ids: list[int] = Field(default_factory=list)
+    # None means the user's enabled subagents; an empty list disables them all.
+    subagent_ids: list[int] | None = None
+    slash_command_names: list[str] = Field(default_factory=list)
+    include_claude_md: bool = False
+
+
+class ExecutionConfigVersionResponse(BaseModel):
+    version: int
+
+
+class ExecutionConfigResponse(BaseModel):
+    """Resolved execution config bundle.
+
+    `version` is read before resolution, so a bundle is never labeled newer than
+    its contents.
+    """
+
+    version: int
+    env_map: dict[str, str] = Field(default_factory=dict)
+    mcp_config: dict = Field(default_factory=dict)
+    skill_files: dict = Field(default_factory=dict)
+    plugin_files: dict = Field(default_factory=dict)
+    subagents: SubAgentResolveResponse = Field(default_factory=SubAgentResolveResponse)
+    slash_commands: dict[str, str] = Field(default_factory=dict)
+    claude_md: ClaudeMdResponse | None = None
@@ -1,7 +1,8 @@
 from datetime import datetime
 from typing import Any
+from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.schemas.input_file import InputFile
 
@@ -32,3 +33,22 @@ class MessageWithFilesResponse(MessageResponse):
     """
 
     attachments: list[InputFileWithUrl] | None = None
+
+
+class MessageFeedRequest(BaseModel):
+    """Incremental message feed request for many sessions.
+
+    cursors maps session_id to the last message id already seen (0 = from start).
+    """
+
+    cursors: dict[UUID, int] = Field(default_factory=dict, max_length=500)
+    limit: int = Field(default=200, ge=1, le=1000)
+
+
+class MessageFeedItem(BaseModel):
+    """New messages of one session since its cursor."""
+
+    session_id: UUID
+    messages: list[MessageResponse]
+    next_after_id: int
+    has_more: bool = False
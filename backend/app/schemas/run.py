@@ -50,6 +50,17 @@ class RunClaimRequest(BaseModel):
     worker_id: str
     lease_seconds: int = 30
     schedule_modes: list[str] | None = None
+    # Fair share: caps on claimed/running runs across all workers (None = no cap)
+    # and round-robin weights per user_id (unlisted users weigh 1).
+    max_active_per_user: int | None = Field(default=None, ge=1)
+    max_active_per_mode: dict[str, int] | None = None
+    user_weights: dict[str, float] | None = None
+
+
+class RunBatchClaimRequest(RunClaimRequest):
+    """Claim up to `limit` runs (at most one per session) in one transaction."""
+
+    limit: int = Field(default=10, ge=1, le=100)
 
 
 class RunClaimResponse(BaseModel):
@@ -62,6 +73,28 @@ class RunClaimResponse(BaseModel):
     sdk_session_id: str | None = None
 
 
+class RunQueueUserStats(BaseModel):
+    """Queue depth and wait of one user's runs."""
+
+    user_id: str
+    queued: int
+    due: int
+    active: int
+    oldest_wait_seconds: float | None = None
+
+
+class RunQueueStatsResponse(BaseModel):
+    """Per-user run queue stats."""
+
+    users: list[RunQueueUserStats]
+
+
+class RunLeaseReleaseResponse(BaseModel):
+    """Result of returning expired run claims to the queue."""
+
+    released: int
+
+
 class RunStartRequest(BaseModel):
     """Mark run as running request."""
 
@@ -22,3 +22,13 @@ class WorkspaceArchiveResponse(BaseModel):
 
     url: str | None = None
     filename: str
+
+
+class WorkspaceFileDiffResponse(BaseModel):
+    """Full diff of a single workspace file (state patches carry a bounded preview)."""
+
+    path: str
+    diff: str
+    diff_hash: str | None = None
+    diff_size: int = 0
+    run_id: str | None = None
@@ -1,17 +1,26 @@
 import logging
+import time
 import uuid
 from datetime import datetime, timezone
 from typing import Any
 
 from sqlalchemy.orm import Session
 
+from app.core.event_bus import queue_session_event
+from app.core.observability.metrics import observe_timing_step
+from app.core.observability.tracing import span
 from app.models.agent_run import AgentRun
+from app.models.agent_session import AgentSession
+from app.models.tool_execution import ToolExecution
 from app.repositories.scheduled_task_repository import ScheduledTaskRepository
 from app.repositories.message_repository import MessageRepository
 from app.repositories.tool_execution_repository import ToolExecutionRepository
 from app.repositories.usage_log_repository import UsageLogRepository
 from app.schemas.callback import (
+    AgentCallbackBatchRequest,
     AgentCallbackRequest,
+    AgentCurrentState,
+    CallbackBatchResponse,
     CallbackResponse,
     CallbackStatus,
 )
@@ -21,6 +30,11 @@ from app.services.session_service import SessionService
 logger = logging.getLogger(__name__)
 
 
+def _as_utc(value: datetime) -> datetime:
+    # Executor callback times are UTC; tolerate naive values.
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
 class CallbackService:
     """Service layer for processing executor callbacks."""
 
@@ -87,106 +101,152 @@ class CallbackService:
         )
         return "assistant"
 
-    def _extract_tool_executions(
-        self,
-        session_db: Session,
-        message: dict[str, Any],
-        session_id: uuid.UUID,
-        message_id: int,
-    ) -> None:
+    @staticmethod
+    def _iter_tool_ops(
+        message: dict[str, Any], message_id: int, at: datetime
+    ) -> list[tuple[str, str, dict[str, Any], int, datetime]]:
+        """Returns (kind, tool_use_id, block, message_id, at) for tool blocks in order.
+
+        `at` is the executor's callback time for the message.
+        """
         content = message.get("content", [])
         if not isinstance(content, list):
-            return
+            return []
 
+        ops: list[tuple[str, str, dict[str, Any], int, datetime]] = []
         for block in content:
             if not isinstance(block, dict):
                 continue
 
             block_type = block.get("_type", "")
-
             if "ToolUseBlock" in block_type:
-                tool_use_id = block.get("id")
-                tool_name = block.get("name")
-                tool_input = block.get("input")
+                if block.get("id") and block.get("name"):
+                    ops.append(("use", block["id"], block, message_id, at))
+            elif "ToolResultBlock" in block_type:
+                if block.get("tool_use_id"):
+                    ops.append(("result", block["tool_use_id"], block, message_id, at))
+        return ops
+
+    @staticmethod
+    def _apply_tool_op(
+        execution: ToolExecution,
+        kind: str,
+        block: dict[str, Any],
+        message_id: int,
+        at: datetime,
+    ) -> None:
+        if kind == "use":
+            execution.tool_name = block["name"]
+            execution.tool_input = block.get("input")
+            execution.message_id = message_id
+            return
 
-                if not tool_use_id or not tool_name:
-                    continue
+        # Persist an explicit tool_output payload even when the tool returns an empty/None content.
+        # This lets the UI reliably treat the tool step as "done" once a ToolResultBlock arrives.
+        execution.tool_output = {"content": block.get("content")}
+        execution.result_message_id = message_id
+        execution.is_error = bool(block.get("is_error", False))
 
-                existing = ToolExecutionRepository.get_by_session_and_tool_use_id(
-                    session_db=session_db,
-                    session_id=session_id,
-                    tool_use_id=tool_use_id,
-                )
-                if existing:
-                    existing.tool_name = tool_name
-                    existing.tool_input = tool_input
-                    existing.message_id = message_id
-                    logger.debug(
-                        f"Updated tool execution (tool_use_id={tool_use_id}) in message {message_id}"
-                    )
-                    continue
+        if execution.duration_ms is None and execution.created_at is not None:
+            duration = at - execution.created_at
+            execution.duration_ms = max(0, int(duration.total_seconds() * 1000))
 
-                ToolExecutionRepository.create(
-                    session_db=session_db,
-                    session_id=session_id,
-                    message_id=message_id,
-                    tool_use_id=tool_use_id,
-                    tool_name=tool_name,
-                    tool_input=tool_input,
-                )
-                logger.debug(
-                    f"Created tool execution (tool_use_id={tool_use_id}, tool={tool_name}) in message {message_id}"
-                )
+    def _persist_tool_executions(
+        self,
+        session_db: Session,
+        session_id: uuid.UUID,
+        ops: list[tuple[str, str, dict[str, Any], int, datetime]],
+    ) -> None:
+        """Upserts tool executions for a sequence of tool blocks.
 
-            elif "ToolResultBlock" in block_type:
-                tool_use_id = block.get("tool_use_id")
-                result_content = block.get("content")
-                is_error = block.get("is_error", False)
-
-                if not tool_use_id:
-                    continue
-
-                # Persist an explicit tool_output payload even when the tool returns an empty/None content.
-                # This lets the UI reliably treat the tool step as "done" once a ToolResultBlock arrives.
-                tool_output = {"content": result_content}
-                existing = ToolExecutionRepository.get_by_session_and_tool_use_id(
-                    session_db=session_db,
+        Existing rows are resolved with a single query and updated in place; new rows
+        are folded in memory and bulk inserted. Rows lost to a concurrent insert are
+        re-read and updated like existing ones. New rows take created_at from the
+        callback time of their first block, so a ToolUse and its ToolResult arriving
+        in one batch still get a duration.
+        """
+        if not ops:
+            return
+
+        existing = ToolExecutionRepository.get_by_session_and_tool_use_ids(
+            session_db, session_id, (op[1] for op in ops)
+        )
+
+        new_executions: dict[str, ToolExecution] = {}
+        for kind, tool_use_id, block, message_id, at in ops:
+            execution = existing.get(tool_use_id) or new_executions.get(tool_use_id)
+            if execution is None:
+                # Transient (never added to the session); turned into a bulk insert row.
+                execution = ToolExecution(
                     session_id=session_id,
+                    message_id=message_id,
                     tool_use_id=tool_use_id,
+                    tool_name="unknown",
+                    tool_input=None,
+                    tool_output=None,
+                    result_message_id=None,
+                    is_error=False,
+                    duration_ms=None,
+                    created_at=at,
                 )
-
-                if not existing:
-                    ToolExecutionRepository.create(
-                        session_db=session_db,
-                        session_id=session_id,
-                        message_id=message_id,
-                        tool_use_id=tool_use_id,
-                        tool_name="unknown",
-                        tool_output=tool_output,
-                        result_message_id=message_id,
-                        is_error=bool(is_error),
-                    )
-                    logger.debug(
-                        f"Created tool execution placeholder (tool_use_id={tool_use_id}) in message {message_id}"
+                new_executions[tool_use_id] = execution
+            self._apply_tool_op(execution, kind, block, message_id, at)
+
+        rows = [
+            {
+                "session_id": execution.session_id,
+                "message_id": execution.message_id,
+                "tool_use_id": execution.tool_use_id,
+                "tool_name": execution.tool_name,
+                "tool_input": execution.tool_input,
+                "tool_output": execution.tool_output,
+                "result_message_id": execution.result_message_id,
+                "is_error": execution.is_error,
+                "duration_ms": execution.duration_ms,
+                "created_at": execution.created_at,
+            }
+            for execution in new_executions.values()
+        ]
+        inserted = ToolExecutionRepository.insert_many(session_db, rows)
+
+        conflicted = set(new_executions) - inserted
+        if conflicted:
+            concurrent = ToolExecutionRepository.get_by_session_and_tool_use_ids(
+                session_db, session_id, conflicted
+            )
+            for kind, tool_use_id, block, message_id, at in ops:
+                if tool_use_id in concurrent:
+                    self._apply_tool_op(
+                        concurrent[tool_use_id], kind, block, message_id, at
                     )
-                    continue
 
-                existing.tool_output = tool_output
-                existing.result_message_id = message_id
-                existing.is_error = bool(is_error)
-
-                if existing.duration_ms is None and existing.created_at is not None:
-                    duration = datetime.now(timezone.utc) - existing.created_at
-                    existing.duration_ms = int(duration.total_seconds() * 1000)
+        logger.debug(
+            "tool_executions_persisted",
+            extra={
+                "session_id": str(session_id),
+                "updated": len(existing) + len(conflicted),
+                "inserted": len(inserted),
+            },
+        )
 
-                logger.debug(
-                    f"Updated tool execution result (tool_use_id={tool_use_id}) in message {message_id}"
-                )
+    @staticmethod
+    def _get_active_run(db: Session, session_id: uuid.UUID) -> AgentRun | None:
+        return (
+            db.query(AgentRun)
+            .filter(AgentRun.session_id == session_id)
+            .filter(AgentRun.status.in_(["claimed", "running"]))
+            .order_by(AgentRun.created_at.desc())
+            .first()
+        )
 
-    def _extract_and_persist_usage(
-        self, db: Session, session_id: uuid.UUID, message: dict[str, Any]
+    def _add_usage_log(
+        self,
+        db: Session,
+        session_id: uuid.UUID,
+        db_run: AgentRun | None,
+        message: dict[str, Any],
     ) -> None:
-        """Extracts and persists usage data from a ResultMessage."""
+        """Adds a usage log for a ResultMessage (committed with the callback)."""
         message_type = message.get("_type", "")
 
         if "ResultMessage" not in message_type:
@@ -200,14 +260,6 @@ class CallbackService:
         total_cost_usd = message.get("total_cost_usd")
         duration_ms = message.get("duration_ms")
 
-        db_run = (
-            db.query(AgentRun)
-            .filter(AgentRun.session_id == session_id)
-            .filter(AgentRun.status.in_(["claimed", "running"]))
-            .order_by(AgentRun.created_at.desc())
-            .first()
-        )
-
         UsageLogRepository.create(
             session_db=db,
             session_id=session_id,
@@ -216,7 +268,6 @@ class CallbackService:
             duration_ms=duration_ms,
             usage_json=usage_data,
         )
-        db.commit()
 
         input_tokens = usage_data.get("input_tokens")
         output_tokens = usage_data.get("output_tokens")
@@ -233,69 +284,63 @@ class CallbackService:
             },
         )
 
-    def _persist_message_and_tools(
-        self, db: Session, session_id: uuid.UUID, message: dict[str, Any]
-    ) -> None:
-        role = self._extract_role_from_message(message)
-
-        text_preview = None
-        content = message.get("content", [])
-        if isinstance(content, list) and len(content) > 0:
-            for block in content:
-                if isinstance(block, dict) and "TextBlock" in block.get("_type", ""):
-                    text_preview = block.get("text", "")[:500]
-                    break
+    def _persist_messages_and_tools(
+        self,
+        db: Session,
+        session_id: uuid.UUID,
+        messages: list[tuple[dict[str, Any], datetime]],
+    ) -> list[int]:
+        """Inserts messages with one flush, then upserts their tool executions.
 
-        db_message = MessageRepository.create(
-            session_db=db,
-            session_id=session_id,
-            role=role,
-            content=message,
-            text_preview=text_preview,
-        )
+        Takes (message, callback time) pairs; returns the new message ids in order.
+        """
+        db_messages = []
+        for message, _ in messages:
+            role = self._extract_role_from_message(message)
+
+            text_preview = None
+            content = message.get("content", [])
+            if isinstance(content, list) and len(content) > 0:
+                for block in content:
+                    if isinstance(block, dict) and "TextBlock" in block.get(
+                        "_type", ""
+                    ):
+                        text_preview = block.get("text", "")[:500]
+                        break
+
+            db_messages.append(
+                MessageRepository.create(
+                    session_db=db,
+                    session_id=session_id,
+                    role=role,
+                    content=message,
+                    text_preview=text_preview,
+                )
+            )
 
         db.flush()
 
-        self._extract_tool_executions(db, message, session_id, db_message.id)
-
-        db.commit()
-        logger.debug(
-            "message_persisted",
-            extra={
-                "session_id": str(session_id),
-                "message_id": db_message.id,
-                "role": role,
-            },
-        )
-
-    def process_agent_callback(
-        self, db: Session, callback: AgentCallbackRequest
-    ) -> CallbackResponse:
-        session_service = SessionService()
-        db_session = session_service.find_session_by_sdk_id_or_uuid(
-            db, callback.session_id
-        )
-
-        if not db_session:
-            logger.warning(
-                "callback_session_not_found",
-                extra={"callback_session_id": callback.session_id},
-            )
-            return CallbackResponse(
-                session_id=callback.session_id,
-                status="callback_received",
-                message="Session not found yet",
-            )
-
-        # Once a session is canceled, ignore subsequent callbacks so we don't keep
-        # persisting new messages/tool executions for a task that the user asked to stop.
-        if db_session.status == "canceled":
-            return CallbackResponse(
-                session_id=str(db_session.id),
-                status=db_session.status,
-                callback_status=callback.status,
+        ops = []
+        for (message, at), db_message in zip(messages, db_messages, strict=True):
+            ops.extend(self._iter_tool_ops(message, db_message.id, _as_utc(at)))
+            logger.debug(
+                "message_persisted",
+                extra={
+                    "session_id": str(session_id),
+                    "message_id": db_message.id,
+                    "role": db_message.role,
+                },
             )
+        self._persist_tool_executions(db, session_id, ops)
+        return [db_message.id for db_message in db_messages]
 
+    def _apply_session_update(
+        self,
+        db: Session,
+        session_service: SessionService,
+        db_session: AgentSession,
+        callback: AgentCallbackRequest,
+    ) -> AgentSession:
         derived_sdk_session_id = callback.sdk_session_id
         if (
             not derived_sdk_session_id
@@ -333,60 +378,167 @@ class CallbackService:
         if callback.workspace_export_status is not None:
             update_data["workspace_export_status"] = callback.workspace_export_status
 
-        if update_data:
-            db_session = session_service.update_session(
-                db, db_session.id, SessionUpdateRequest(**update_data)
+        if not update_data:
+            return db_session
+
+        db_session = session_service.update_session(
+            db, db_session.id, SessionUpdateRequest(**update_data), commit=False
+        )
+        if "sdk_session_id" in update_data:
+            logger.info(
+                "session_sdk_session_id_updated",
+                extra={
+                    "session_id": str(db_session.id),
+                    "sdk_session_id": derived_sdk_session_id,
+                },
+            )
+        if "status" in update_data:
+            logger.info(
+                "session_status_updated_via_callback",
+                extra={
+                    "session_id": str(db_session.id),
+                    "status": callback.status.value,
+                    "callback_session_id": callback.session_id,
+                },
+            )
+        return db_session
+
+    @staticmethod
+    def _apply_run_update(db_run: AgentRun, callback: AgentCallbackRequest) -> None:
+        db_run.progress = int(callback.progress or 0)
+
+        if callback.status == CallbackStatus.RUNNING and db_run.status == "claimed":
+            db_run.status = "running"
+            if db_run.started_at is None:
+                db_run.started_at = datetime.now(timezone.utc)
+
+        if callback.status in [CallbackStatus.COMPLETED, CallbackStatus.FAILED]:
+            db_run.status = callback.status.value
+            db_run.finished_at = datetime.now(timezone.utc)
+            if callback.status == CallbackStatus.COMPLETED:
+                db_run.progress = 100
+                db_run.last_error = None
+            elif callback.status == CallbackStatus.FAILED:
+                if callback.error_message:
+                    db_run.last_error = callback.error_message
+
+    def _apply_callbacks(
+        self,
+        db: Session,
+        session_service: SessionService,
+        db_session: AgentSession,
+        callbacks: list[AgentCallbackRequest],
+    ) -> AgentSession:
+        """Applies callbacks of one session in order without committing.
+
+        Messages are inserted with one flush and their tool executions with one bulk
+        upsert; the active run is loaded once and its updates replayed in memory.
+        """
+        db_run = self._get_active_run(db, db_session.id)
+        touched_run: AgentRun | None = None
+        messages: list[tuple[dict[str, Any], datetime]] = []
+        started = time.perf_counter()
+
+        for callback in callbacks:
+            db_session = self._apply_session_update(
+                db, session_service, db_session, callback
+            )
+
+            if callback.new_message:
+                messages.append((callback.new_message, callback.time))
+                if isinstance(callback.new_message, dict):
+                    # Extract and persist usage data if this is a ResultMessage
+                    self._add_usage_log(db, db_session.id, db_run, callback.new_message)
+
+            if db_run is not None:
+                self._apply_run_update(db_run, callback)
+                touched_run = db_run
+                if db_run.status not in ("claimed", "running"):
+                    # Finished: later callbacks no longer address this run.
+                    db_run = None
+
+        message_ids: list[int] = []
+        if messages:
+            message_ids = self._persist_messages_and_tools(db, db_session.id, messages)
+
+        if touched_run is not None:
+            self._sync_scheduled_task_last_status(db, touched_run)
+
+        # Published once the caller commits.
+        queue_session_event(
+            db,
+            "session.updated",
+            user_id=db_session.user_id,
+            session_id=db_session.id,
+            data={"status": db_session.status},
+        )
+        if message_ids:
+            queue_session_event(
+                db,
+                "message.created",
+                user_id=db_session.user_id,
+                session_id=db_session.id,
+                data={"message_ids": message_ids},
+            )
+        if touched_run is not None:
+            queue_session_event(
+                db,
+                "run.updated",
+                user_id=db_session.user_id,
+                session_id=db_session.id,
+                data={
+                    "run_id": str(touched_run.id),
+                    "status": touched_run.status,
+                    "progress": touched_run.progress,
+                },
             )
-            if "sdk_session_id" in update_data:
-                logger.info(
-                    "session_sdk_session_id_updated",
-                    extra={
-                        "session_id": str(db_session.id),
-                        "sdk_session_id": derived_sdk_session_id,
-                    },
-                )
-            if "status" in update_data:
-                logger.info(
-                    "session_status_updated_via_callback",
-                    extra={
-                        "session_id": str(db_session.id),
-                        "status": callback.status.value,
-                        "callback_session_id": callback.session_id,
-                    },
-                )
 
-        if callback.new_message:
-            self._persist_message_and_tools(db, db_session.id, callback.new_message)
-            # Extract and persist usage data if this is a ResultMessage
-            self._extract_and_persist_usage(db, db_session.id, callback.new_message)
+        duration_ms = int((time.perf_counter() - started) * 1000)
+        observe_timing_step("callback_persist", duration_ms)
+        logger.debug(
+            "timing",
+            extra={
+                "step": "callback_persist",
+                "duration_ms": duration_ms,
+                "session_id": str(db_session.id),
+                "callbacks": len(callbacks),
+                "messages": len(messages),
+            },
+        )
+        return db_session
 
-        db_run = (
-            db.query(AgentRun)
-            .filter(AgentRun.session_id == db_session.id)
-            .filter(AgentRun.status.in_(["claimed", "running"]))
-            .order_by(AgentRun.created_at.desc())
-            .first()
+    def process_agent_callback(
+        self, db: Session, callback: AgentCallbackRequest
+    ) -> CallbackResponse:
+        session_service = SessionService()
+        db_session = session_service.find_session_by_sdk_id_or_uuid(
+            db, callback.session_id
         )
 
-        if db_run:
-            db_run.progress = int(callback.progress or 0)
-
-            if callback.status == CallbackStatus.RUNNING and db_run.status == "claimed":
-                db_run.status = "running"
-                if db_run.started_at is None:
-                    db_run.started_at = datetime.now(timezone.utc)
-
-            if callback.status in [CallbackStatus.COMPLETED, CallbackStatus.FAILED]:
-                db_run.status = callback.status.value
-                db_run.finished_at = datetime.now(timezone.utc)
-                if callback.status == CallbackStatus.COMPLETED:
-                    db_run.progress = 100
-                    db_run.last_error = None
-                elif callback.status == CallbackStatus.FAILED:
-                    if callback.error_message:
-                        db_run.last_error = callback.error_message
-
-            self._sync_scheduled_task_last_status(db, db_run)
+        if not db_session:
+            logger.warning(
+                "callback_session_not_found",
+                extra={"callback_session_id": callback.session_id},
+            )
+            return CallbackResponse(
+                session_id=callback.session_id,
+                status="callback_received",
+                message="Session not found yet",
+            )
+
+        # Once a session is canceled, ignore subsequent callbacks so we don't keep
+        # persisting new messages/tool executions for a task that the user asked to stop.
+        if db_session.status == "canceled":
+            return CallbackResponse(
+                session_id=str(db_session.id),
+                status=db_session.status,
+                callback_status=callback.status,
+            )
+
+        with span("callback.persist", callbacks=1):
+            db_session = self._apply_callbacks(
+                db, session_service, db_session, [callback]
+            )
             db.commit()
 
         return CallbackResponse(
@@ -394,3 +546,53 @@ class CallbackService:
             status=db_session.status,
             callback_status=callback.status,
         )
+
+    def process_agent_callback_batch(
+        self, db: Session, batch: AgentCallbackBatchRequest
+    ) -> CallbackBatchResponse:
+        """Applies a coalesced callback batch in order, in a single transaction.
+
+        The state delta is merged into the stored state_patch (top-level fields
+        replace the stored ones), then every callback is applied as if it had been
+        sent on its own.
+        """
+        session_service = SessionService()
+        db_session = session_service.find_session_by_sdk_id_or_uuid(
+            db, batch.session_id
+        )
+
+        if not db_session:
+            logger.warning(
+                "callback_session_not_found",
+                extra={"callback_session_id": batch.session_id},
+            )
+            return CallbackBatchResponse(
+                session_id=batch.session_id,
+                seq=batch.seq,
+                processed=len(batch.callbacks),
+                status="callback_received",
+            )
+
+        # Canceled sessions ignore further callbacks (see process_agent_callback).
+        if db_session.status != "canceled":
+            if batch.state_delta:
+                merged = {**(db_session.state_patch or {}), **batch.state_delta}
+                state = AgentCurrentState.model_validate(merged).model_dump(mode="json")
+                db_session = session_service.update_session(
+                    db,
+                    db_session.id,
+                    SessionUpdateRequest(state_patch=state),
+                    commit=False,
+                )
+            with span("callback.persist", callbacks=len(batch.callbacks)):
+                db_session = self._apply_callbacks(
+                    db, session_service, db_session, batch.callbacks
+                )
+                db.commit()
+
+        return CallbackBatchResponse(
+            session_id=str(db_session.id),
+            seq=batch.seq,
+            processed=len(batch.callbacks),
+            status=db_session.status,
+        )
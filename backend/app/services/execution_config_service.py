@@ -0,0 +1,79 @@
+import logging
+
+from sqlalchemy.orm import Session
+
+from app.core.config_version import get_config_version
+from app.schemas.execution_config import (
+    ExecutionConfigResolveRequest,
+    ExecutionConfigResponse,
+)
+from app.schemas.sub_agent import SubAgentResolveResponse
+from app.services.claude_md_service import ClaudeMdService
+from app.services.env_var_service import EnvVarService
+from app.services.mcp_config_service import McpConfigService
+from app.services.plugin_config_service import PluginConfigService
+from app.services.skill_config_service import SkillConfigService
+from app.services.slash_command_config_service import SlashCommandConfigService
+from app.services.sub_agent_service import SubAgentService
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionConfigService:
+    """Resolves a user's full execution config bundle in one request."""
+
+    def __init__(self) -> None:
+        self.env_var_service = EnvVarService()
+        self.mcp_config_service = McpConfigService()
+        self.skill_config_service = SkillConfigService()
+        self.plugin_config_service = PluginConfigService()
+        self.sub_agent_service = SubAgentService()
+        self.slash_command_service = SlashCommandConfigService()
+        self.claude_md_service = ClaudeMdService()
+
+    def get_version(self, db: Session, user_id: str) -> int:
+        return get_config_version(db, user_id)
+
+    def resolve(
+        self, db: Session, user_id: str, request: ExecutionConfigResolveRequest
+    ) -> ExecutionConfigResponse:
+        # Read first: a change committed during resolution bumps the version past
+        # this one, so the manager's next version check refetches.
+        version = get_config_version(db, user_id)
+        response = ExecutionConfigResponse(
+            version=version,
+            env_map=self.env_var_service.get_env_map(db, user_id=user_id),
+            mcp_config=self.mcp_config_service.resolve_user_mcp_config(
+                db=db, user_id=user_id, server_ids=request.mcp_server_ids
+            ),
+            skill_files=self.skill_config_service.resolve_user_skill_files(
+                db=db, user_id=user_id, skill_ids=request.skill_ids
+            ),
+            plugin_files=self.plugin_config_service.resolve_user_plugin_files(
+                db=db, user_id=user_id, plugin_ids=request.plugin_ids
+            ),
+            slash_commands=self.slash_command_service.resolve_user_commands(
+                db, user_id=user_id, names=request.slash_command_names
+            ),
+            claude_md=(
+                self.claude_md_service.get_settings(db, user_id=user_id)
+                if request.include_claude_md
+                else None
+            ),
+        )
+        # Resolved last: a failure rolls back the read-only transaction.
+        response.subagents = self._resolve_subagents(db, user_id, request)
+        return response
+
+    def _resolve_subagents(
+        self, db: Session, user_id: str, request: ExecutionConfigResolveRequest
+    ) -> SubAgentResolveResponse:
+        """Best-effort: a broken subagent definition must not block the run."""
+        try:
+            return self.sub_agent_service.resolve_for_execution(
+                db, user_id=user_id, subagent_ids=request.subagent_ids
+            )
+        except Exception:
+            db.rollback()
+            logger.exception("Failed to resolve subagents for user %s", user_id)
+            return SubAgentResolveResponse()
@@ -39,11 +39,15 @@ class McpConfigService:
             seen.add(sid)
             ordered_ids.append(sid)
 
+        servers = {
+            s.id: s
+            for s in McpServerRepository.list_by_ids(
+                db, [sid for sid in ordered_ids if sid in installed_ids]
+            )
+        }
         resolved: dict = {}
         for server_id in ordered_ids:
-            if server_id not in installed_ids:
-                continue
-            server = McpServerRepository.get_by_id(db, server_id)
+            server = servers.get(server_id)
             if not server or not isinstance(server.server_config, dict):
                 continue
             server_mcp = server.server_config.get("mcpServers")
@@ -10,9 +10,11 @@ from app.core.errors.exceptions import AppException
 from app.models.agent_message import AgentMessage
 from app.repositories.message_repository import MessageRepository
 from app.repositories.run_repository import RunRepository
+from app.repositories.session_repository import SessionRepository
 from app.schemas.input_file import InputFile
 from app.schemas.message import (
     InputFileWithUrl,
+    MessageFeedItem,
     MessageResponse,
     MessageWithFilesResponse,
 )
@@ -38,6 +40,84 @@ class MessageService:
         logger.debug(f"Retrieved {len(messages)} messages for session {session_id}")
         return messages
 
+    def get_messages_page(
+        self,
+        db: Session,
+        session_id: uuid.UUID,
+        *,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        newest: bool = False,
+        limit: int = 200,
+    ) -> list[AgentMessage]:
+        """Gets one keyset page of a session's messages.
+
+        Args:
+            db: Database session
+            session_id: Session ID
+            after_id: Only messages with id > after_id (0 = from start)
+            before_id: Only messages with id < before_id
+            newest: Return the newest page within the bounds instead of the oldest
+            limit: Maximum number of messages to return
+
+        Returns:
+            List of messages ordered by id
+        """
+        return MessageRepository.list_page(
+            db,
+            session_id,
+            after_id=after_id,
+            before_id=before_id,
+            newest=newest,
+            limit=limit,
+        )
+
+    def get_message_feed(
+        self,
+        db: Session,
+        *,
+        user_id: str,
+        cursors: dict[uuid.UUID, int],
+        limit: int = 200,
+    ) -> list[MessageFeedItem]:
+        """Gets new messages for many sessions in one query.
+
+        Sessions that do not belong to the user are ignored. Sessions without new
+        messages are omitted from the result.
+
+        Args:
+            db: Database session
+            user_id: Requesting user
+            cursors: Mapping of session_id to the last message id already seen
+            limit: Maximum number of messages per session
+
+        Returns:
+            One feed item per session with new messages
+        """
+        owned = SessionRepository.list_owned_ids(db, user_id, list(cursors))
+        owned_cursors = {
+            session_id: max(0, after_id)
+            for session_id, after_id in cursors.items()
+            if session_id in owned
+        }
+        # Fetch one extra row per session to report has_more.
+        by_session = MessageRepository.list_after_for_sessions(
+            db, owned_cursors, limit_per_session=limit + 1
+        )
+
+        items: list[MessageFeedItem] = []
+        for session_id, messages in by_session.items():
+            page = messages[:limit]
+            items.append(
+                MessageFeedItem(
+                    session_id=session_id,
+                    messages=[MessageResponse.model_validate(m) for m in page],
+                    next_after_id=page[-1].id,
+                    has_more=len(messages) > limit,
+                )
+            )
+        return items
+
     def get_message(self, db: Session, message_id: int) -> AgentMessage:
         """Gets a message by ID.
 
@@ -60,19 +140,38 @@ class MessageService:
         return message
 
     def get_messages_with_files(
-        self, db: Session, session_id: uuid.UUID, *, user_id: str
+        self,
+        db: Session,
+        session_id: uuid.UUID,
+        *,
+        user_id: str,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        newest: bool = False,
+        limit: int = 1000,
     ) -> list[MessageWithFilesResponse]:
-        """Gets messages for a session and attaches per-run uploaded files.
+        """Gets one page of messages for a session with per-run uploaded files.
 
         Attachments are derived from the run snapshot to avoid coupling the
-        message content schema to any upstream agent SDK format.
+        message content schema to any upstream agent SDK format. Only the runs
+        of the page's user messages are loaded, and only their attachments are
+        presigned.
         """
 
         storage_service = S3StorageService()
         key_prefix = f"attachments/{user_id}/"
 
-        messages = MessageRepository.list_by_session(db, session_id, limit=1000)
-        runs = RunRepository.list_by_session(db, session_id, limit=1000)
+        messages = MessageRepository.list_page(
+            db,
+            session_id,
+            after_id=after_id,
+            before_id=before_id,
+            newest=newest,
+            limit=limit,
+        )
+        runs = RunRepository.list_by_user_message_ids(
+            db, session_id, [m.id for m in messages if m.role == "user"]
+        )
 
         message_id_to_attachments: dict[int, list[InputFile]] = {}
         for run in runs:
@@ -32,11 +32,15 @@ class PluginConfigService:
             seen.add(pid)
             ordered_ids.append(pid)
 
+        plugins = {
+            p.id: p
+            for p in PluginRepository.list_by_ids(
+                db, [pid for pid in ordered_ids if pid in installed_ids]
+            )
+        }
         selected: dict[str, tuple[str, dict, dict | None, str | None, str | None]] = {}
         for plugin_id in ordered_ids:
-            if plugin_id not in installed_ids:
-                continue
-            plugin = PluginRepository.get_by_id(db, plugin_id)
+            plugin = plugins.get(plugin_id)
             if not plugin or not isinstance(plugin.entry, dict):
                 continue
 
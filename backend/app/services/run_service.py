@@ -1,29 +1,65 @@
+import logging
+import time
 import uuid
 from datetime import datetime, timezone
 
 from sqlalchemy.orm import Session
 
+from app.core.event_bus import queue_session_event
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
+from app.core.observability.metrics import observe_run_claim
+from app.models.agent_run import AgentRun
+from app.models.agent_session import AgentSession
 from app.repositories.scheduled_task_repository import ScheduledTaskRepository
 from app.repositories.message_repository import MessageRepository
 from app.repositories.run_repository import RunRepository
 from app.repositories.session_repository import SessionRepository
 from app.schemas.run import (
+    RunBatchClaimRequest,
     RunClaimRequest,
     RunClaimResponse,
     RunFailRequest,
+    RunQueueStatsResponse,
+    RunQueueUserStats,
     RunResponse,
     RunStartRequest,
 )
 from app.services.usage_service import UsageService
 
+logger = logging.getLogger(__name__)
+
 usage_service = UsageService()
 
 
 class RunService:
     """Service layer for run queue operations."""
 
+    @staticmethod
+    def _queue_run_events(
+        db: Session,
+        db_session: AgentSession,
+        db_run: AgentRun,
+        *,
+        session_changed: bool = False,
+    ) -> None:
+        """Queue run (and session) status events, published on commit."""
+        queue_session_event(
+            db,
+            "run.updated",
+            user_id=db_session.user_id,
+            session_id=db_session.id,
+            data={"run_id": str(db_run.id), "status": db_run.status},
+        )
+        if session_changed:
+            queue_session_event(
+                db,
+                "session.updated",
+                user_id=db_session.user_id,
+                session_id=db_session.id,
+                data={"status": db_session.status},
+            )
+
     def _sync_scheduled_task_last_status(self, db: Session, run_id: uuid.UUID) -> None:
         """Sync AgentScheduledTask.last_run_status/last_error based on a run record."""
         db_run = RunRepository.get_by_id(db, run_id)
@@ -80,8 +116,22 @@ class RunService:
         session_id: uuid.UUID,
         limit: int = 100,
         offset: int = 0,
+        *,
+        after_message_id: int | None = None,
+        before_message_id: int | None = None,
     ) -> list[RunResponse]:
-        runs = RunRepository.list_by_session(db, session_id, limit=limit, offset=offset)
+        if after_message_id is None and before_message_id is None:
+            runs = RunRepository.list_by_session(
+                db, session_id, limit=limit, offset=offset
+            )
+        else:
+            runs = RunRepository.list_by_session_message_range(
+                db,
+                session_id,
+                after_message_id=after_message_id,
+                before_message_id=before_message_id,
+                limit=limit,
+            )
         responses = [RunResponse.model_validate(r) for r in runs]
         usage_by_run_id = usage_service.get_usage_summaries_by_run_ids(
             db, [r.id for r in runs]
@@ -93,6 +143,52 @@ class RunService:
     def claim_next_run(
         self, db: Session, request: RunClaimRequest
     ) -> RunClaimResponse | None:
+        claimed = self._claim(db, request, limit=1)
+        return claimed[0] if claimed else None
+
+    def claim_runs(
+        self, db: Session, request: RunBatchClaimRequest
+    ) -> list[RunClaimResponse]:
+        """Claim up to request.limit runs in one transaction."""
+        return self._claim(db, request, limit=request.limit)
+
+    def get_queue_stats(
+        self, db: Session, schedule_modes: list[str] | None = None
+    ) -> RunQueueStatsResponse:
+        """Per-user queue depth and wait of the oldest due run."""
+        now = datetime.now(timezone.utc)
+        users = [
+            RunQueueUserStats(
+                user_id=user_id,
+                queued=queued,
+                due=due,
+                active=active,
+                oldest_wait_seconds=(
+                    round((now - oldest_due_at).total_seconds(), 3)
+                    if oldest_due_at
+                    else None
+                ),
+            )
+            for user_id, queued, due, active, oldest_due_at in (
+                RunRepository.queue_stats_by_user(db, schedule_modes)
+            )
+        ]
+        users.sort(key=lambda u: (-u.due, u.user_id))
+        return RunQueueStatsResponse(users=users)
+
+    def release_expired_claims(self, db: Session) -> int:
+        """Return runs whose claim lease expired to the queue (periodic job)."""
+        released = RunRepository.release_expired_claims(db)
+        db.commit()
+        return released
+
+    def _claim(
+        self,
+        db: Session,
+        request: RunClaimRequest,
+        *,
+        limit: int,
+    ) -> list[RunClaimResponse]:
         worker_id = request.worker_id.strip()
         if not worker_id:
             raise AppException(
@@ -100,7 +196,8 @@ class RunService:
                 message="worker_id cannot be empty",
             )
 
-        schedule_modes = (
+        started = time.perf_counter()
+        modes = (
             [
                 m.strip()
                 for m in request.schedule_modes
@@ -110,52 +207,99 @@ class RunService:
             else None
         )
 
-        db_run = RunRepository.claim_next(
+        db_runs = RunRepository.claim_batch(
             session_db=db,
             worker_id=worker_id,
+            limit=limit,
             lease_seconds=request.lease_seconds,
-            schedule_modes=schedule_modes,
+            schedule_modes=modes,
+            max_active_per_user=request.max_active_per_user,
+            max_active_per_mode={
+                mode: quota
+                for mode, quota in (request.max_active_per_mode or {}).items()
+                if quota > 0
+            },
+            user_weights=request.user_weights,
         )
-
-        if not db_run:
+        if not db_runs:
             db.commit()
-            return None
-
-        db_session = SessionRepository.get_by_id(db, db_run.session_id)
-        if not db_session:
-            raise AppException(
-                error_code=ErrorCode.NOT_FOUND,
-                message=f"Session not found: {db_run.session_id}",
-            )
-
-        db_message = MessageRepository.get_by_id(db, db_run.user_message_id)
-        if not db_message:
-            raise AppException(
-                error_code=ErrorCode.NOT_FOUND,
-                message=f"Message not found: {db_run.user_message_id}",
+            observe_run_claim(started, [])
+            return []
+
+        sessions = {
+            s.id: s
+            for s in SessionRepository.list_by_ids(db, [r.session_id for r in db_runs])
+        }
+        messages = {
+            m.id: m
+            for m in MessageRepository.list_by_ids(
+                db, [r.user_message_id for r in db_runs]
             )
+        }
+
+        claimed: list[tuple[AgentRun, AgentSession, str]] = []
+        for db_run in db_runs:
+            db_session = sessions.get(db_run.session_id)
+            db_message = messages.get(db_run.user_message_id)
+            prompt = None
+            if db_message:
+                prompt = (
+                    self._extract_prompt_from_message(db_message.content)
+                    or db_message.text_preview
+                )
+            if db_session and prompt:
+                self._queue_run_events(db, db_session, db_run)
+                claimed.append((db_run, db_session, prompt))
+                continue
 
-        prompt = (
-            self._extract_prompt_from_message(db_message.content)
-            or db_message.text_preview
-        )
-
-        if not prompt:
-            raise AppException(
-                error_code=ErrorCode.BAD_REQUEST,
-                message="Unable to extract prompt from message",
-            )
+            # A run that can never be dispatched would otherwise be claimed again
+            # after every lease expiry; fail it instead of aborting the batch.
+            if not db_session:
+                error = f"Session not found: {db_run.session_id}"
+            elif not db_message:
+                error = f"Message not found: {db_run.user_message_id}"
+            else:
+                error = "Unable to extract prompt from message"
+            self._fail_unclaimable(db, db_run, db_session, error)
 
         db.commit()
-        db.refresh(db_run)
+        observe_run_claim(started, [db_run.schedule_mode for db_run, _, _ in claimed])
+
+        responses: list[RunClaimResponse] = []
+        for db_run, db_session, prompt in claimed:
+            db.refresh(db_run)
+            responses.append(
+                RunClaimResponse(
+                    run=RunResponse.model_validate(db_run),
+                    user_id=db_session.user_id,
+                    prompt=prompt,
+                    config_snapshot=db_run.config_snapshot
+                    or db_session.config_snapshot,
+                    sdk_session_id=db_session.sdk_session_id,
+                )
+            )
+        return responses
 
-        return RunClaimResponse(
-            run=RunResponse.model_validate(db_run),
-            user_id=db_session.user_id,
-            prompt=prompt,
-            config_snapshot=db_run.config_snapshot or db_session.config_snapshot,
-            sdk_session_id=db_session.sdk_session_id,
+    def _fail_unclaimable(
+        self,
+        db: Session,
+        db_run: AgentRun,
+        db_session: AgentSession | None,
+        error: str,
+    ) -> None:
+        logger.warning(
+            "run_unclaimable",
+            extra={"run_id": str(db_run.id), "error": error},
         )
+        db_run.status = "failed"
+        db_run.last_error = error
+        db_run.finished_at = datetime.now(timezone.utc)
+        db_run.claimed_by = None
+        db_run.lease_expires_at = None
+        if db_session:
+            db_session.status = "failed"
+            self._queue_run_events(db, db_session, db_run, session_changed=True)
+        self._sync_scheduled_task_last_status(db, db_run.id)
 
     def start_run(
         self, db: Session, run_id: uuid.UUID, request: RunStartRequest
@@ -212,6 +356,7 @@ class RunService:
         db_session.status = "running"
 
         self._sync_scheduled_task_last_status(db, db_run.id)
+        self._queue_run_events(db, db_session, db_run, session_changed=True)
         db.commit()
         db.refresh(db_run)
 
@@ -252,6 +397,7 @@ class RunService:
         db_session = SessionRepository.get_by_id(db, db_run.session_id)
         if db_session:
             db_session.status = "failed"
+            self._queue_run_events(db, db_session, db_run, session_changed=True)
 
         self._sync_scheduled_task_last_status(db, db_run.id)
         db.commit()
@@ -1,4 +1,5 @@
 import logging
+import time
 import uuid
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
@@ -8,6 +9,7 @@ from sqlalchemy.orm import Session
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
+from app.core.observability.tracing import record_run_enqueued
 from app.models.agent_run import AgentRun
 from app.models.agent_scheduled_task import AgentScheduledTask
 from app.repositories.message_repository import MessageRepository
@@ -384,6 +386,7 @@ class ScheduledTaskService:
         Returns:
             AgentRun instance when enqueued, or None when skipped.
         """
+        enqueue_started_ns = time.time_ns()
         prompt = self._normalize_prompt(task.prompt)
         if scheduled_at.tzinfo is None:
             scheduled_at = scheduled_at.replace(tzinfo=timezone.utc)
@@ -456,5 +459,12 @@ class ScheduledTaskService:
         )
         db_run.scheduled_task_id = task.id
         db.flush()
+        record_run_enqueued(
+            db_run.id,
+            enqueue_started_ns,
+            session_id=str(session_id),
+            schedule_mode="scheduled",
+            scheduled_task_id=str(task.id),
+        )
 
         return db_run
@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 
 from sqlalchemy.orm import Session
 
+from app.core.event_bus import queue_session_event
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
 from app.models.agent_session import AgentSession
@@ -64,9 +65,17 @@ class SessionService:
         return db_session
 
     def update_session(
-        self, db: Session, session_id: uuid.UUID, request: SessionUpdateRequest
+        self,
+        db: Session,
+        session_id: uuid.UUID,
+        request: SessionUpdateRequest,
+        *,
+        commit: bool = True,
     ) -> AgentSession:
-        """Updates session fields."""
+        """Updates session fields.
+
+        With commit=False the change is left in the caller's transaction.
+        """
         db_session = self.get_session(db, session_id)
         if "project_id" in request.model_fields_set:
             project_id = request.project_id
@@ -115,6 +124,9 @@ class SessionService:
         if request.workspace_export_status is not None:
             db_session.workspace_export_status = request.workspace_export_status
 
+        if not commit:
+            return db_session
+
         db.commit()
         db.refresh(db_session)
 
@@ -248,6 +260,13 @@ class SessionService:
                     execution.duration_ms = max(0, int(duration.total_seconds() * 1000))
 
         db_session.status = "canceled"
+        queue_session_event(
+            db,
+            "session.updated",
+            user_id=db_session.user_id,
+            session_id=db_session.id,
+            data={"status": db_session.status},
+        )
 
         db.commit()
         db.refresh(db_session)
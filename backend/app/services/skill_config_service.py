@@ -33,11 +33,15 @@ class SkillConfigService:
             seen.add(sid)
             ordered_ids.append(sid)
 
+        skills = {
+            s.id: s
+            for s in SkillRepository.list_by_ids(
+                db, [sid for sid in ordered_ids if sid in installed_ids]
+            )
+        }
         selected: dict[str, tuple[str, dict]] = {}
         for skill_id in ordered_ids:
-            if skill_id not in installed_ids:
-                continue
-            skill = SkillRepository.get_by_id(db, skill_id)
+            skill = skills.get(skill_id)
             if not skill or not isinstance(skill.entry, dict):
                 continue
 
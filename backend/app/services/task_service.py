@@ -1,3 +1,4 @@
+import time
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 
@@ -5,6 +6,7 @@ from sqlalchemy.orm import Session
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
+from app.core.observability.tracing import record_run_enqueued
 from app.repositories.message_repository import MessageRepository
 from app.repositories.project_repository import ProjectRepository
 from app.repositories.run_repository import RunRepository
@@ -133,6 +135,7 @@ class TaskService:
         self, db: Session, user_id: str, request: TaskEnqueueRequest
     ) -> TaskEnqueueResponse:
         """Enqueue a new run for a session (create session if needed)."""
+        enqueue_started_ns = time.time_ns()
         base_config: dict | None = None
         project_id = request.project_id
         project = None
@@ -249,6 +252,12 @@ class TaskService:
         db.commit()
         db.refresh(db_session)
         db.refresh(db_run)
+        record_run_enqueued(
+            db_run.id,
+            enqueue_started_ns,
+            session_id=str(db_session.id),
+            schedule_mode=schedule_mode,
+        )
 
         return TaskEnqueueResponse(
             session_id=db_session.id,
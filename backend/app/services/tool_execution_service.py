@@ -21,22 +21,36 @@ class ToolExecutionService:
         *,
         limit: int = 500,
         offset: int = 0,
+        after_message_id: int | None = None,
+        before_message_id: int | None = None,
     ) -> list[ToolExecution]:
-        """Gets all tool executions for a session.
+        """Gets tool executions for a session.
 
         Args:
             db: Database session
             session_id: Session ID
+            after_message_id: Only executions of messages with id > after_message_id
+            before_message_id: Only executions of messages with id < before_message_id
 
         Returns:
-            List of tool executions ordered by creation time
+            List of tool executions ordered by creation time, or by message id
+            when a message id bound is given (offset is then ignored)
         """
-        executions = ToolExecutionRepository.list_by_session(
-            db,
-            session_id,
-            limit=max(1, int(limit)),
-            offset=max(0, int(offset)),
-        )
+        if after_message_id is None and before_message_id is None:
+            executions = ToolExecutionRepository.list_by_session(
+                db,
+                session_id,
+                limit=max(1, int(limit)),
+                offset=max(0, int(offset)),
+            )
+        else:
+            executions = ToolExecutionRepository.list_by_session_message_range(
+                db,
+                session_id,
+                after_message_id=after_message_id,
+                before_message_id=before_message_id,
+                limit=max(1, int(limit)),
+            )
         logger.debug(
             f"Retrieved {len(executions)} tool executions for session {session_id}"
         )
@@ -1,8 +1,11 @@
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
 
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
+from app.core.event_bus import Subscription, event_bus, queue_session_event
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
 from app.models.user_input_request import UserInputRequest
@@ -15,6 +18,26 @@ from app.schemas.user_input_request import (
 )
 
 DEFAULT_EXPIRES_SECONDS = 60
+MAX_WAIT_SECONDS = 60
+# While waiting, re-read the request at least this often: the event bus is per
+# process, so an answer written by another worker is only seen by re-reading.
+_WAIT_RECHECK_SECONDS = 5.0
+
+
+def _queue_user_input_event(
+    db: Session, event_type: str, entry: UserInputRequest, user_id: str
+) -> None:
+    queue_session_event(
+        db,
+        event_type,
+        user_id=user_id,
+        session_id=entry.session_id,
+        data={
+            "request_id": str(entry.id),
+            "tool_name": entry.tool_name,
+            "status": entry.status,
+        },
+    )
 
 
 class UserInputRequestService:
@@ -40,6 +63,8 @@ class UserInputRequestService:
             expires_at=expires_at,
         )
         UserInputRequestRepository.create(db, entry)
+        db.flush()
+        _queue_user_input_event(db, "user_input.created", entry, db_session.user_id)
         db.commit()
         db.refresh(entry)
         return UserInputRequestResponse.model_validate(entry)
@@ -58,11 +83,86 @@ class UserInputRequestService:
             now = datetime.now(timezone.utc)
             if entry.expires_at and entry.expires_at <= now:
                 entry.status = "expired"
+                db_session = SessionRepository.get_by_id(db, entry.session_id)
+                if db_session:
+                    _queue_user_input_event(
+                        db, "user_input.updated", entry, db_session.user_id
+                    )
                 db.commit()
                 db.refresh(entry)
 
         return UserInputRequestResponse.model_validate(entry)
 
+    async def wait_for_resolution(
+        self, db: Session, request_id: str, timeout_seconds: float
+    ) -> UserInputRequestResponse:
+        """Return once the request is answered or expired, or when the timeout ends.
+
+        Wakes on the request's `user_input.updated` event. DB reads run in the
+        threadpool and the connection is released while blocked. A still-pending
+        request is returned on timeout.
+        """
+        deadline = time.monotonic() + min(max(0.0, timeout_seconds), MAX_WAIT_SECONDS)
+        result = await run_in_threadpool(self._read_and_release, db, request_id)
+        if result.status != "pending" or time.monotonic() >= deadline:
+            return result
+        db_session = await run_in_threadpool(
+            SessionRepository.get_by_id, db, result.session_id
+        )
+        if not db_session:
+            return result
+        user_id = db_session.user_id
+
+        subscription = event_bus.subscribe(
+            user_id=user_id, session_ids={str(result.session_id)}
+        )
+        try:
+            # Re-read after subscribing so an answer committed in between is seen.
+            result = await run_in_threadpool(self._read_and_release, db, request_id)
+            while result.status == "pending":
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                until_expiry = (
+                    result.expires_at - datetime.now(timezone.utc)
+                ).total_seconds()
+                await self._wait_for_update(
+                    subscription,
+                    request_id,
+                    max(0.0, min(remaining, _WAIT_RECHECK_SECONDS, until_expiry)),
+                )
+                result = await run_in_threadpool(self._read_and_release, db, request_id)
+        finally:
+            subscription.close()
+        return result
+
+    def _read_and_release(
+        self, db: Session, request_id: str
+    ) -> UserInputRequestResponse:
+        try:
+            return self.get_request(db, request_id)
+        finally:
+            # Return the pooled connection between reads of a long wait.
+            db.close()
+
+    @staticmethod
+    async def _wait_for_update(
+        subscription: Subscription, request_id: str, timeout: float
+    ) -> None:
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                item = await subscription.next_event(timeout=remaining)
+            except OverflowError:
+                return
+            if item is None:
+                return
+            if (
+                item.type == "user_input.updated"
+                and item.data.get("request_id") == request_id
+            ):
+                return
+
     def list_pending_for_user(
         self, db: Session, user_id: str, session_id: uuid.UUID | None = None
     ) -> list[UserInputRequestResponse]:
@@ -101,6 +201,7 @@ class UserInputRequestService:
         now = datetime.now(timezone.utc)
         if entry.expires_at and entry.expires_at <= now:
             entry.status = "expired"
+            _queue_user_input_event(db, "user_input.updated", entry, user_id)
             db.commit()
             db.refresh(entry)
             raise AppException(
@@ -111,6 +212,7 @@ class UserInputRequestService:
         entry.answers = answer_request.answers
         entry.status = "answered"
         entry.answered_at = now
+        _queue_user_input_event(db, "user_input.updated", entry, user_id)
         db.commit()
         db.refresh(entry)
         return UserInputRequestResponse.model_validate(entry)
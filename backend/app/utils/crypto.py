@@ -1,5 +1,6 @@
 import base64
 import hashlib
+from functools import lru_cache
 
 from cryptography.fernet import Fernet
 
@@ -9,11 +10,17 @@ def _derive_key(secret_key: str) -> bytes:
     return base64.urlsafe_b64encode(digest)
 
 
+@lru_cache(maxsize=4)
+def _get_fernet(secret_key: str) -> Fernet:
+    # Fernet instances are immutable and thread-safe; build one per key.
+    return Fernet(_derive_key(secret_key))
+
+
 def encrypt_value(value: str, secret_key: str) -> str:
-    fernet = Fernet(_derive_key(secret_key))
+    fernet = _get_fernet(secret_key)
     return fernet.encrypt(value.encode("utf-8")).decode("utf-8")
 
 
 def decrypt_value(token: str, secret_key: str) -> str:
-    fernet = Fernet(_derive_key(secret_key))
+    fernet = _get_fernet(secret_key)
     return fernet.decrypt(token.encode("utf-8")).decode("utf-8")
@@ -0,0 +1,205 @@
+"""Load benchmark: concurrent executor callbacks + message reads against a backend.
+
+Drives a running backend over HTTP with three concurrent classes of traffic and
+reports per-class latency percentiles:
+
+- callbacks: POST /api/v1/callback with assistant messages (DB writes)
+- reads: GET /api/v1/sessions/{id}/messages (DB reads, growing histories)
+- probe: GET /api/v1/health, which never touches the database; its p99 shows
+  whether DB work stalls the event loop
+
+Usage (from backend/, with the backend running):
+    uv run python -m scripts.bench_api_contention --duration 30
+    uv run python -m scripts.bench_api_contention --callback-workers 32 --readers 32
+"""
+
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.latencies: dict[str, list[float]] = {}
+        self.errors: dict[str, int] = {}
+
+    def add(self, kind: str, seconds: float, ok: bool) -> None:
+        with self._lock:
+            if ok:
+                self.latencies.setdefault(kind, []).append(seconds)
+            else:
+                self.errors[kind] = self.errors.get(kind, 0) + 1
+
+
+def _call(
+    base_url: str,
+    method: str,
+    path: str,
+    *,
+    user_id: str,
+    body: dict | None = None,
+    timeout: float = 30.0,
+) -> dict:
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    req = Request(
+        f"{base_url}{path}",
+        data=data,
+        method=method,
+        headers={"Content-Type": "application/json", "X-User-Id": user_id},
+    )
+    with urlopen(req, timeout=timeout) as resp:
+        return json.loads(resp.read().decode("utf-8") or "{}")
+
+
+def _timed(recorder: _Recorder, kind: str, fn) -> None:
+    started = time.perf_counter()
+    try:
+        fn()
+        ok = True
+    except (HTTPError, URLError, TimeoutError, OSError, ValueError):
+        ok = False
+    recorder.add(kind, time.perf_counter() - started, ok)
+
+
+def _callback_body(session_id: str, index: int) -> dict:
+    return {
+        "session_id": session_id,
+        "time": datetime.now(timezone.utc).isoformat(),
+        "status": "running",
+        "progress": min(99, index),
+        "new_message": {
+            "_type": "AssistantMessage",
+            "content": [{"_type": "TextBlock", "text": f"bench step {index}"}],
+        },
+    }
+
+
+def _percentiles(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(values)
+
+    def pick(pct: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * pct))] * 1000, 2)
+
+    return {
+        "p50": pick(0.5),
+        "p95": pick(0.95),
+        "p99": pick(0.99),
+        "max": round(ordered[-1] * 1000, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--user-id", default="bench-contention")
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--callback-workers", type=int, default=16)
+    parser.add_argument("--readers", type=int, default=16)
+    parser.add_argument("--probe-interval", type=float, default=0.05)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--keep", action="store_true", help="Keep generated sessions")
+    args = parser.parse_args()
+
+    base_url = args.base_url.rstrip("/")
+    session_ids: list[str] = []
+    for _ in range(args.sessions):
+        created = _call(
+            base_url, "POST", "/api/v1/sessions", user_id=args.user_id, body={}
+        )
+        session_ids.append(str(created["data"]["session_id"]))
+
+    recorder = _Recorder()
+    stop_at = time.monotonic() + args.duration
+    counter = iter(range(1 << 62))
+    counter_lock = threading.Lock()
+
+    def next_index() -> int:
+        with counter_lock:
+            return next(counter)
+
+    def callback_worker() -> None:
+        while time.monotonic() < stop_at:
+            index = next_index()
+            session_id = session_ids[index % len(session_ids)]
+            _timed(
+                recorder,
+                "callbacks",
+                lambda: _call(
+                    base_url,
+                    "POST",
+                    "/api/v1/callback",
+                    user_id=args.user_id,
+                    body=_callback_body(session_id, index),
+                ),
+            )
+
+    def reader() -> None:
+        while time.monotonic() < stop_at:
+            session_id = session_ids[next_index() % len(session_ids)]
+            _timed(
+                recorder,
+                "reads",
+                lambda: _call(
+                    base_url,
+                    "GET",
+                    f"/api/v1/sessions/{session_id}/messages",
+                    user_id=args.user_id,
+                ),
+            )
+
+    def probe() -> None:
+        while time.monotonic() < stop_at:
+            _timed(
+                recorder,
+                "probe",
+                lambda: _call(base_url, "GET", "/api/v1/health", user_id=args.user_id),
+            )
+            time.sleep(args.probe_interval)
+
+    workers = [callback_worker] * args.callback_workers + [reader] * args.readers
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(workers) + 1) as pool:
+        futures = [pool.submit(fn) for fn in workers + [probe]]
+        for future in futures:
+            future.result()
+    elapsed = time.perf_counter() - started
+
+    if not args.keep:
+        for session_id in session_ids:
+            try:
+                _call(
+                    base_url,
+                    "DELETE",
+                    f"/api/v1/sessions/{session_id}",
+                    user_id=args.user_id,
+                )
+            except (HTTPError, URLError, OSError):
+                pass
+
+    report = {
+        "sessions": args.sessions,
+        "callback_workers": args.callback_workers,
+        "readers": args.readers,
+        "elapsed_seconds": round(elapsed, 3),
+    }
+    for kind in ("callbacks", "reads", "probe"):
+        values = recorder.latencies.get(kind, [])
+        report[kind] = {
+            "requests": len(values),
+            "errors": recorder.errors.get(kind, 0),
+            "per_second": round(len(values) / elapsed, 1) if elapsed else None,
+            "latency_ms": _percentiles(values),
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""Synthetic callback storm against CallbackService persistence.
+
+Creates throwaway sessions/runs in the configured database (DATABASE_URL), replays
+executor callbacks carrying assistant tool-use messages, tool results and a final
+ResultMessage, and reports persisted rows/sec. Rows counted: messages, tool
+executions and usage logs.
+
+Usage (from backend/):
+    uv run python -m scripts.bench_callback_persistence --sessions 8 --callbacks 200
+    uv run python -m scripts.bench_callback_persistence --batch-size 20
+"""
+
+import argparse
+import json
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from sqlalchemy import delete
+
+from app.core.database import SessionLocal
+from app.models.agent_session import AgentSession
+from app.repositories.message_repository import MessageRepository
+from app.repositories.run_repository import RunRepository
+from app.schemas.callback import (
+    AgentCallbackBatchRequest,
+    AgentCallbackRequest,
+    CallbackStatus,
+)
+from app.services.callback_service import CallbackService
+
+
+def _create_session() -> uuid.UUID:
+    db = SessionLocal()
+    try:
+        db_session = AgentSession(user_id="bench-callback", status="running")
+        db.add(db_session)
+        db.flush()
+        user_message = MessageRepository.create(
+            session_db=db,
+            session_id=db_session.id,
+            role="user",
+            content={"_type": "UserMessage", "content": "bench"},
+        )
+        db.flush()
+        run = RunRepository.create(db, db_session.id, user_message.id)
+        run.status = "running"
+        db.commit()
+        return db_session.id
+    finally:
+        db.close()
+
+
+def _build_callbacks(
+    session_id: uuid.UUID, count: int, tools_per_message: int
+) -> list[AgentCallbackRequest]:
+    callbacks: list[AgentCallbackRequest] = []
+    for index in range(count):
+        tool_ids = [f"toolu_{index}_{n}" for n in range(tools_per_message)]
+        if index == count - 1:
+            message = {
+                "_type": "ResultMessage",
+                "session_id": f"sdk-{session_id}",
+                "usage": {"input_tokens": 1000, "output_tokens": 200},
+                "total_cost_usd": 0.01,
+                "duration_ms": 1234,
+            }
+        elif index % 2 == 0:
+            message = {
+                "_type": "AssistantMessage",
+                "content": [{"_type": "TextBlock", "text": f"step {index}"}]
+                + [
+                    {
+                        "_type": "ToolUseBlock",
+                        "id": tool_id,
+                        "name": "Bash",
+                        "input": {"command": f"echo {tool_id}"},
+                    }
+                    for tool_id in tool_ids
+                ],
+            }
+        else:
+            previous = [f"toolu_{index - 1}_{n}" for n in range(tools_per_message)]
+            message = {
+                "_type": "UserMessage",
+                "content": [
+                    {
+                        "_type": "ToolResultBlock",
+                        "tool_use_id": tool_id,
+                        "content": "ok",
+                        "is_error": False,
+                    }
+                    for tool_id in previous
+                ],
+            }
+        callbacks.append(
+            AgentCallbackRequest(
+                session_id=str(session_id),
+                time=datetime.now(timezone.utc),
+                status=CallbackStatus.RUNNING,
+                progress=min(99, index),
+                new_message=message,
+            )
+        )
+    return callbacks
+
+
+def _count_rows(callbacks: list[AgentCallbackRequest]) -> int:
+    rows = 0
+    for callback in callbacks:
+        message = callback.new_message or {}
+        rows += 1
+        if "ResultMessage" in message.get("_type", ""):
+            rows += 1
+        if "AssistantMessage" in message.get("_type", ""):
+            rows += sum(
+                1
+                for block in message.get("content", [])
+                if block.get("_type") == "ToolUseBlock"
+            )
+    return rows
+
+
+def _storm(
+    session_id: uuid.UUID, callbacks: list[AgentCallbackRequest], batch_size: int
+) -> list[float]:
+    service = CallbackService()
+    latencies: list[float] = []
+    db = SessionLocal()
+    try:
+        if batch_size <= 1:
+            for callback in callbacks:
+                started = time.perf_counter()
+                service.process_agent_callback(db, callback)
+                latencies.append(time.perf_counter() - started)
+            return latencies
+
+        for seq, offset in enumerate(range(0, len(callbacks), batch_size), start=1):
+            started = time.perf_counter()
+            service.process_agent_callback_batch(
+                db,
+                AgentCallbackBatchRequest(
+                    session_id=str(session_id),
+                    seq=seq,
+                    callbacks=callbacks[offset : offset + batch_size],
+                ),
+            )
+            latencies.append(time.perf_counter() - started)
+        return latencies
+    finally:
+        db.close()
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=4)
+    parser.add_argument("--callbacks", type=int, default=100)
+    parser.add_argument("--tools-per-message", type=int, default=3)
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Callbacks per process_agent_callback_batch call (1 = one by one)",
+    )
+    parser.add_argument("--keep", action="store_true", help="Keep generated rows")
+    args = parser.parse_args()
+
+    session_ids = [_create_session() for _ in range(args.sessions)]
+    storms = {
+        session_id: _build_callbacks(session_id, args.callbacks, args.tools_per_message)
+        for session_id in session_ids
+    }
+    total_rows = sum(_count_rows(callbacks) for callbacks in storms.values())
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.sessions) as pool:
+        results = list(
+            pool.map(
+                lambda item: _storm(item[0], item[1], args.batch_size),
+                storms.items(),
+            )
+        )
+    elapsed = time.perf_counter() - started
+    latencies = [value for result in results for value in result]
+
+    if not args.keep:
+        db = SessionLocal()
+        try:
+            db.execute(delete(AgentSession).where(AgentSession.id.in_(session_ids)))
+            db.commit()
+        finally:
+            db.close()
+
+    print(
+        json.dumps(
+            {
+                "sessions": args.sessions,
+                "callbacks": args.sessions * args.callbacks,
+                "batch_size": args.batch_size,
+                "rows": total_rows,
+                "elapsed_seconds": round(elapsed, 3),
+                "rows_per_second": round(total_rows / elapsed, 1) if elapsed else None,
+                "callbacks_per_second": (
+                    round(args.sessions * args.callbacks / elapsed, 1)
+                    if elapsed
+                    else None
+                ),
+                "call_latency_ms": {
+                    "p50": round(_percentile(latencies, 0.5) * 1000, 2),
+                    "p95": round(_percentile(latencies, 0.95) * 1000, 2),
+                    "p99": round(_percentile(latencies, 0.99) * 1000, 2),
+                },
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
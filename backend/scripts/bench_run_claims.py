@@ -0,0 +1,198 @@
+"""Run-queue claim throughput versus worker count.
+
+Seeds queued runs in the configured database (DATABASE_URL) under a dedicated
+schedule mode, so real queues are never touched, then drains them with N
+concurrent workers through RunService and reports claims/sec per
+(workers, batch size) combination.
+
+Usage (from backend/):
+    uv run python -m scripts.bench_run_claims --runs 2000 --workers 1,2,4,8,16
+    uv run python -m scripts.bench_run_claims --batch-sizes 1,10 --runs-per-session 2
+"""
+
+import argparse
+import json
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import delete
+
+from app.core.database import SessionLocal
+from app.models.agent_message import AgentMessage
+from app.models.agent_run import AgentRun
+from app.models.agent_session import AgentSession
+from app.schemas.run import RunBatchClaimRequest, RunClaimRequest
+from app.services.run_service import RunService
+
+_USER_ID = "bench-run-claims"
+
+
+def _seed(runs: int, runs_per_session: int, schedule_mode: str) -> list[uuid.UUID]:
+    db = SessionLocal()
+    try:
+        session_count = max(1, -(-runs // runs_per_session))
+        sessions = [
+            AgentSession(user_id=_USER_ID, status="pending")
+            for _ in range(session_count)
+        ]
+        db.add_all(sessions)
+        db.flush()
+        messages = [
+            AgentMessage(
+                session_id=sessions[index // runs_per_session].id,
+                role="user",
+                content={
+                    "_type": "UserMessage",
+                    "content": [{"_type": "TextBlock", "text": f"bench {index}"}],
+                },
+                text_preview=f"bench {index}",
+            )
+            for index in range(runs)
+        ]
+        db.add_all(messages)
+        db.flush()
+        db.add_all(
+            AgentRun(
+                session_id=message.session_id,
+                user_message_id=message.id,
+                status="queued",
+                schedule_mode=schedule_mode,
+                progress=0,
+                attempts=0,
+            )
+            for message in messages
+        )
+        db.commit()
+        return [s.id for s in sessions]
+    finally:
+        db.close()
+
+
+def _complete_claimed(session_ids: list[uuid.UUID]) -> None:
+    # Free the sessions so their next queued run becomes claimable.
+    db = SessionLocal()
+    try:
+        db.query(AgentRun).filter(
+            AgentRun.session_id.in_(session_ids), AgentRun.status == "claimed"
+        ).update({AgentRun.status: "completed"}, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _drain(
+    worker_index: int,
+    batch_size: int,
+    schedule_mode: str,
+    latencies: list[float],
+    lock: threading.Lock,
+) -> int:
+    service = RunService()
+    worker_id = f"bench-{worker_index}"
+    claimed = 0
+    db = SessionLocal()
+    try:
+        while True:
+            started = time.perf_counter()
+            if batch_size <= 1:
+                result = service.claim_next_run(
+                    db,
+                    RunClaimRequest(
+                        worker_id=worker_id, schedule_modes=[schedule_mode]
+                    ),
+                )
+                count = 1 if result else 0
+            else:
+                count = len(
+                    service.claim_runs(
+                        db,
+                        RunBatchClaimRequest(
+                            worker_id=worker_id,
+                            schedule_modes=[schedule_mode],
+                            limit=batch_size,
+                        ),
+                    )
+                )
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+            if not count:
+                return claimed
+            claimed += count
+    finally:
+        db.close()
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def _run_case(workers: int, batch_size: int, runs: int, runs_per_session: int) -> dict:
+    schedule_mode = f"bench-{uuid.uuid4().hex[:8]}"
+    session_ids = _seed(runs, runs_per_session, schedule_mode)
+    latencies: list[float] = []
+    lock = threading.Lock()
+    claimed = 0
+    started = time.perf_counter()
+    try:
+        # One pass per run slot of a session: a session only yields its next run
+        # after the previous one left the claimed/running state.
+        for _ in range(runs_per_session):
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                claimed += sum(
+                    pool.map(
+                        lambda index: _drain(
+                            index, batch_size, schedule_mode, latencies, lock
+                        ),
+                        range(workers),
+                    )
+                )
+            _complete_claimed(session_ids)
+        elapsed = time.perf_counter() - started
+    finally:
+        db = SessionLocal()
+        try:
+            db.execute(delete(AgentSession).where(AgentSession.id.in_(session_ids)))
+            db.commit()
+        finally:
+            db.close()
+
+    return {
+        "workers": workers,
+        "batch_size": batch_size,
+        "claimed": claimed,
+        "elapsed_seconds": round(elapsed, 3),
+        "claims_per_second": round(claimed / elapsed, 1) if elapsed else None,
+        "call_latency_ms": {
+            "p50": round(_percentile(latencies, 0.5) * 1000, 2),
+            "p95": round(_percentile(latencies, 0.95) * 1000, 2),
+            "p99": round(_percentile(latencies, 0.99) * 1000, 2),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--runs-per-session", type=int, default=1)
+    parser.add_argument("--workers", default="1,2,4,8,16")
+    parser.add_argument("--batch-sizes", default="1,10")
+    args = parser.parse_args()
+
+    worker_counts = [int(v) for v in args.workers.split(",") if v.strip()]
+    batch_sizes = [int(v) for v in args.batch_sizes.split(",") if v.strip()]
+    results = [
+        _run_case(workers, batch_size, args.runs, max(1, args.runs_per_session))
+        for batch_size in batch_sizes
+        for workers in worker_counts
+    ]
+    print(json.dumps({"runs": args.runs, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Executor with the Claude SDK replaced by a recorded message stream.
+
+Used by the pipeline benchmark (docker-compose.bench.yml): the real executor app
+runs unchanged (workspace, hooks, callback batching), but ClaudeSDKClient replays
+REPLAY_STREAM instead of calling the model. Each line of the stream is
+`{"delay_ms": <int>, "message": <serialized SDK message>}`, the same `_type`
+encoding the executor sends in callbacks, so streams can be recorded from stored
+session messages (`scripts.bench_run_pipeline record`).
+
+Environment:
+    REPLAY_STREAM: path of the JSON lines stream (default /app/streams/default.jsonl)
+    REPLAY_SPEED: multiplier for recorded delays (default 1.0, 0 = no delays)
+"""
+
+import asyncio
+import dataclasses
+import json
+import os
+import uuid
+from collections.abc import AsyncIterator
+from functools import lru_cache
+from typing import Any
+
+from claude_agent_sdk import types as sdk_types
+
+import app.core.engine as engine
+from app.main import app  # noqa: F401  (uvicorn replay:app)
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    type_name = value.get("_type")
+    cls = getattr(sdk_types, type_name, None) if isinstance(type_name, str) else None
+    if cls is None or not dataclasses.is_dataclass(cls):
+        return {k: _decode(v) for k, v in value.items()}
+    names = {f.name for f in dataclasses.fields(cls)}
+    return cls(**{k: _decode(v) for k, v in value.items() if k in names})
+
+
+@lru_cache(maxsize=1)
+def _load_stream() -> list[tuple[float, dict[str, Any]]]:
+    path = os.getenv("REPLAY_STREAM") or "/app/streams/default.jsonl"
+    entries: list[tuple[float, dict[str, Any]]] = []
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                entry = json.loads(line)
+                entries.append(
+                    (float(entry.get("delay_ms") or 0) / 1000, entry["message"])
+                )
+    return entries
+
+
+class ReplaySDKClient:
+    """Stand-in for ClaudeSDKClient that yields the recorded stream."""
+
+    def __init__(self, options: Any = None, **_: Any) -> None:
+        self.options = options
+        self._sdk_session_id = str(uuid.uuid4())
+        self._speed = max(0.0, float(os.getenv("REPLAY_SPEED") or "1.0"))
+
+    async def __aenter__(self) -> "ReplaySDKClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> bool:
+        return False
+
+    async def query(self, prompt: str, session_id: str = "default") -> None:
+        return None
+
+    async def receive_response(self) -> AsyncIterator[Any]:
+        for delay, message in _load_stream():
+            if delay and self._speed:
+                await asyncio.sleep(delay * self._speed)
+            yield _decode(self._with_session_id(message))
+
+    def _with_session_id(self, message: dict[str, Any]) -> dict[str, Any]:
+        # Recorded SDK session ids would make every replay resume the same session.
+        message = dict(message)
+        if "session_id" in message:
+            message["session_id"] = self._sdk_session_id
+        data = message.get("data")
+        if isinstance(data, dict) and "session_id" in data:
+            message["data"] = {**data, "session_id": self._sdk_session_id}
+        return message
+
+
+engine.ClaudeSDKClient = ReplaySDKClient
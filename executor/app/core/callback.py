@@ -1,30 +1,234 @@
+import asyncio
+import logging
+import os
+from typing import Any
+
 import httpx
 
-from app.schemas.callback import AgentCallbackRequest
+from app.core.http_client import get_http_client
+from app.core.observability.metrics import CALLBACKS_SENT
+from app.schemas.callback import AgentCallbackBatchRequest, AgentCallbackRequest
 from app.core.observability.request_context import (
     generate_request_id,
     generate_trace_id,
     get_request_id,
     get_trace_id,
 )
+from app.core.observability.tracing import (
+    SPAN_KIND_CLIENT,
+    TRACEPARENT_HEADER,
+    current_traceparent,
+    span,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class CallbackClient:
     def __init__(self, callback_url: str, timeout: float = 30.0):
         self.callback_url = callback_url
         self.timeout = timeout
+        # Flipped off when the receiver predates the batch endpoint.
+        self.batch_supported = True
+
+    @staticmethod
+    def _headers() -> dict[str, str]:
+        headers = {
+            "X-Request-ID": get_request_id() or generate_request_id(),
+            "X-Trace-ID": get_trace_id() or generate_trace_id(),
+        }
+        traceparent = current_traceparent()
+        if traceparent:
+            headers[TRACEPARENT_HEADER] = traceparent
+        return headers
 
     async def send(self, report: AgentCallbackRequest) -> bool:
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            client = get_http_client()
+            with span("callback.send", kind=SPAN_KIND_CLIENT, callbacks=1):
                 response = await client.post(
                     self.callback_url,
+                    timeout=self.timeout,
                     json=report.model_dump(mode="json"),
-                    headers={
-                        "X-Request-ID": get_request_id() or generate_request_id(),
-                        "X-Trace-ID": get_trace_id() or generate_trace_id(),
-                    },
+                    headers=self._headers(),
                 )
-                return response.is_success
         except httpx.RequestError:
+            CALLBACKS_SENT.labels(result="error").inc()
             return False
+        CALLBACKS_SENT.labels(result="ok" if response.is_success else "rejected").inc()
+        return response.is_success
+
+    async def send_batch(self, batch: AgentCallbackBatchRequest) -> bool:
+        try:
+            client = get_http_client()
+            with span(
+                "callback.send", kind=SPAN_KIND_CLIENT, callbacks=len(batch.callbacks)
+            ):
+                response = await client.post(
+                    f"{self.callback_url.rstrip('/')}/batch",
+                    timeout=self.timeout,
+                    json=batch.model_dump(mode="json"),
+                    headers=self._headers(),
+                )
+        except httpx.RequestError:
+            CALLBACKS_SENT.labels(result="error").inc(len(batch.callbacks))
+            return False
+        if response.status_code in (404, 405):
+            self.batch_supported = False
+        CALLBACKS_SENT.labels(result="ok" if response.is_success else "rejected").inc(
+            len(batch.callbacks)
+        )
+        return response.is_success
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in {"1", "true", "yes", "y", "on"}
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw.strip())
+    except Exception:
+        return default
+
+
+def _state_fields(report: AgentCallbackRequest) -> dict[str, Any] | None:
+    if report.state_patch is None:
+        return None
+    return report.state_patch.model_dump(mode="json")
+
+
+def _comparable(field: str, value: Any) -> Any:
+    # workspace_state.last_change is refreshed on every message; it alone is not a change.
+    if field == "workspace_state" and isinstance(value, dict):
+        return {k: v for k, v in value.items() if k != "last_change"}
+    return value
+
+
+class CallbackBatcher:
+    """Buffered callback sender that coalesces reports within a short window.
+
+    Reports are flushed in order by a single sender (one batch in flight at a time).
+    Only the newest state in a batch is sent, as a delta of the top-level state
+    fields that changed since the last acknowledged batch; a failed batch does not
+    advance the acknowledged state, so its changes are resent with the next one.
+    Falls back to one request per report when the receiver has no batch endpoint.
+    """
+
+    def __init__(
+        self,
+        client: CallbackClient,
+        *,
+        window_ms: int | None = None,
+        max_batch_size: int | None = None,
+    ) -> None:
+        self.client = client
+        self.window_seconds = (
+            max(
+                0,
+                _env_int("CALLBACK_BATCH_WINDOW_MS", 200)
+                if window_ms is None
+                else window_ms,
+            )
+            / 1000
+        )
+        self.max_batch_size = max(
+            1,
+            _env_int("CALLBACK_BATCH_MAX_SIZE", 50)
+            if max_batch_size is None
+            else max_batch_size,
+        )
+        self._pending: list[AgentCallbackRequest] = []
+        self._acked_state: dict[str, Any] = {}
+        self._seq = 0
+        self._send_lock = asyncio.Lock()
+        self._timer: asyncio.Task | None = None
+
+    @staticmethod
+    def enabled_by_env() -> bool:
+        return _env_bool("CALLBACK_BATCH_ENABLED", True)
+
+    async def enqueue(self, report: AgentCallbackRequest) -> None:
+        self._pending.append(report)
+        if len(self._pending) >= self.max_batch_size or self.window_seconds <= 0:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.window_seconds)
+        self._timer = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Send everything buffered so far (ordered after any batch in flight)."""
+        timer = self._timer
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+            self._timer = None
+
+        async with self._send_lock:
+            if not self._pending:
+                return
+            reports = self._pending
+            self._pending = []
+
+            if not self.client.batch_supported:
+                await self._send_individually(reports)
+                return
+
+            state = _state_fields(reports[-1])
+            delta = None
+            if state is not None:
+                delta = {
+                    field: value
+                    for field, value in state.items()
+                    if field not in self._acked_state
+                    or _comparable(field, self._acked_state[field])
+                    != _comparable(field, value)
+                }
+
+            self._seq += 1
+            batch = AgentCallbackBatchRequest(
+                session_id=reports[-1].session_id,
+                seq=self._seq,
+                callbacks=[
+                    report.model_copy(update={"state_patch": None})
+                    for report in reports
+                ],
+                state_delta=delta or None,
+            )
+            if await self.client.send_batch(batch):
+                if state is not None:
+                    self._acked_state = state
+                return
+
+            if not self.client.batch_supported:
+                await self._send_individually(reports)
+                return
+
+            logger.warning(
+                "callback_batch_send_failed",
+                extra={
+                    "session_id": batch.session_id,
+                    "seq": batch.seq,
+                    "callbacks": len(reports),
+                },
+            )
+
+    async def _send_individually(self, reports: list[AgentCallbackRequest]) -> None:
+        # Legacy receivers replace state wholesale; the last report carries full state.
+        for index, report in enumerate(reports):
+            if index < len(reports) - 1:
+                report = report.model_copy(update={"state_patch": None})
+            await self.client.send(report)
+
+    async def close(self) -> None:
+        """Final flush; call before sending the terminal callback."""
+        await self.flush()
@@ -2,6 +2,7 @@ import logging
 
 import httpx
 
+from app.core.http_client import get_http_client
 from app.core.observability.request_context import (
     generate_request_id,
     generate_trace_id,
@@ -27,31 +28,32 @@ class ComputerClient:
         png_bytes: bytes,
     ) -> bool:
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/v1/computer/screenshots",
-                    data={
+            client = get_http_client()
+            response = await client.post(
+                f"{self.base_url}/api/v1/computer/screenshots",
+                timeout=self.timeout,
+                data={
+                    "session_id": session_id,
+                    "tool_use_id": tool_use_id,
+                },
+                files={
+                    "file": ("screenshot.png", png_bytes, "image/png"),
+                },
+                headers={
+                    "X-Request-ID": get_request_id() or generate_request_id(),
+                    "X-Trace-ID": get_trace_id() or generate_trace_id(),
+                },
+            )
+            if not response.is_success:
+                logger.warning(
+                    "computer_screenshot_upload_failed",
+                    extra={
                         "session_id": session_id,
                         "tool_use_id": tool_use_id,
-                    },
-                    files={
-                        "file": ("screenshot.png", png_bytes, "image/png"),
-                    },
-                    headers={
-                        "X-Request-ID": get_request_id() or generate_request_id(),
-                        "X-Trace-ID": get_trace_id() or generate_trace_id(),
+                        "status_code": response.status_code,
+                        "response_text": response.text[:300],
                     },
                 )
-                if not response.is_success:
-                    logger.warning(
-                        "computer_screenshot_upload_failed",
-                        extra={
-                            "session_id": session_id,
-                            "tool_use_id": tool_use_id,
-                            "status_code": response.status_code,
-                            "response_text": response.text[:300],
-                        },
-                    )
-                return response.is_success
+            return response.is_success
         except httpx.RequestError:
             return False
@@ -31,6 +31,7 @@ from app.core.observability.request_context import (
     set_request_id,
     set_trace_id,
 )
+from app.core.observability.tracing import current_traceparent, record_span, span
 from app.schemas.request import TaskConfig
 from app.schemas.state import BrowserState
 from app.utils.browser import format_viewport_size, parse_viewport_size
@@ -58,6 +59,8 @@ class AgentExecutor:
         self.user_input_client = user_input_client
         self._request_id = request_id
         self._trace_id = trace_id
+        # Parent of `executor.run`; execute() runs after the request span ended.
+        self._traceparent = current_traceparent()
         self.workspace = WorkspaceManager(
             mount_path=os.environ.get("WORKSPACE_PATH", "/workspace")
         )
@@ -65,15 +68,24 @@ class AgentExecutor:
     async def execute(
         self, prompt: str, config: TaskConfig, *, permission_mode: str = "default"
     ):
+        request_id_token = set_request_id(self._request_id or generate_request_id())
+        trace_id_token = set_trace_id(self._trace_id or generate_trace_id())
+        try:
+            with span(
+                "executor.run", parent=self._traceparent, session_id=self.session_id
+            ):
+                await self._execute(prompt, config, permission_mode=permission_mode)
+        finally:
+            reset_request_id(request_id_token)
+            reset_trace_id(trace_id_token)
+
+    async def _execute(self, prompt: str, config: TaskConfig, *, permission_mode: str):
         # Initialize context early so we can always report failures via callbacks,
         # even if workspace preparation (e.g. repo clone) fails.
         ctx = ExecutionContext(self.session_id, str(self.workspace.root_path))
         if config.browser_enabled:
             ctx.current_state.browser = BrowserState(enabled=True)
 
-        request_id_token = set_request_id(self._request_id or generate_request_id())
-        trace_id_token = set_trace_id(self._trace_id or generate_trace_id())
-
         started = time.perf_counter()
         status = "completed"
         logger.info(
@@ -85,9 +97,10 @@ class AgentExecutor:
         )
 
         try:
-            await self.workspace.prepare(config)
-            ctx.cwd = str(self.workspace.work_path)
-            await self.hooks.run_on_setup(ctx)
+            with span("executor.prepare", session_id=self.session_id):
+                await self.workspace.prepare(config)
+                ctx.cwd = str(self.workspace.work_path)
+                await self.hooks.run_on_setup(ctx)
 
             # Slash commands must be sent as-is (no prefix text), otherwise the SDK may not
             # recognize them as commands.
@@ -289,10 +302,25 @@ class AgentExecutor:
                 plugins=plugins,
             )
 
+            connect_started = time.time_ns()
             async with ClaudeSDKClient(options=options) as client:
-                await client.query(prompt)
+                record_span("sdk.connect", connect_started)
+                with span("sdk.query"):
+                    await client.query(prompt)
+                # One span per SDK message, covering the wait for it; the first
+                # one is the time to first response.
+                turn = 0
+                turn_started = time.time_ns()
                 async for msg in client.receive_response():
+                    turn += 1
+                    record_span(
+                        "sdk.turn",
+                        turn_started,
+                        turn=turn,
+                        message_type=type(msg).__name__,
+                    )
                     await self.hooks.run_on_response(ctx, msg)
+                    turn_started = time.time_ns()
 
         except Exception as e:
             status = "failed"
@@ -317,8 +345,6 @@ class AgentExecutor:
                     "duration_ms": int((time.perf_counter() - started) * 1000),
                 },
             )
-            reset_request_id(request_id_token)
-            reset_trace_id(trace_id_token)
 
     def _build_input_hint(self, config: TaskConfig) -> str | None:
         inputs = config.input_files or []
@@ -0,0 +1,396 @@
+import atexit
+import hashlib
+import json
+import logging
+import os
+import queue
+import re
+import secrets
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.error import URLError
+from urllib.request import Request, urlopen
+
+from app.core.observability.request_context import (
+    generate_trace_id,
+    get_trace_id,
+    reset_trace_id,
+    set_trace_id,
+)
+
+logger = logging.getLogger(__name__)
+
+TRACEPARENT_HEADER = "traceparent"
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+_TRACE_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+_TRACEPARENT_RE = re.compile(r"^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+_SENSITIVE_KEYS = ("token", "secret", "password", "authorization", "api_key")
+_MAX_QUEUED_SPANS = 10000
+_MAX_BATCH_SPANS = 512
+
+_STANDARD_ATTRS: set[str] = set(
+    logging.LogRecord(
+        name="x",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg="x",
+        args=(),
+        exc_info=None,
+    ).__dict__.keys()
+) | {"service", "request_id", "trace_id", "step", "duration_ms"}
+
+
+@dataclass(slots=True)
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    start_ns: int
+    end_ns: int = 0
+    kind: int = SPAN_KIND_INTERNAL
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+# (trace_id, span_id) of the caller, taken from an incoming `traceparent` header.
+_remote_parent: ContextVar[tuple[str, str] | None] = ContextVar(
+    "remote_parent", default=None
+)
+_exporter: "_SpanExporter | None" = None
+
+
+def tracing_enabled() -> bool:
+    return _exporter is not None
+
+
+def otel_trace_id(value: str) -> str:
+    """Map a request-context trace id onto a W3C trace id (32 lowercase hex)."""
+    candidate = value.strip().lower()
+    if _TRACE_ID_RE.match(candidate) and candidate != "0" * 32:
+        return candidate
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def parse_traceparent(value: str | None) -> tuple[str, str] | None:
+    match = _TRACEPARENT_RE.match((value or "").strip().lower())
+    if not match:
+        return None
+    return match.group(1), match.group(2)
+
+
+def set_remote_parent(value: str | None) -> Token[tuple[str, str] | None]:
+    return _remote_parent.set(parse_traceparent(value))
+
+
+def reset_remote_parent(token: Token[tuple[str, str] | None]) -> None:
+    _remote_parent.reset(token)
+
+
+def current_traceparent() -> str | None:
+    """W3C `traceparent` for outgoing requests (None while tracing is off)."""
+    if _exporter is None:
+        return None
+    trace_id = get_trace_id()
+    if trace_id is None:
+        return None
+    otel_id = otel_trace_id(trace_id)
+    parent = _parent_span_id(otel_id)
+    if parent is None:
+        return None
+    return f"00-{otel_id}-{parent}-01"
+
+
+def _parent_span_id(trace_id: str) -> str | None:
+    current = _current_span.get()
+    if current is not None and current.trace_id == trace_id:
+        return current.span_id
+    remote = _remote_parent.get()
+    if remote is not None and remote[0] == trace_id:
+        return remote[1]
+    return None
+
+
+@contextmanager
+def span(
+    name: str,
+    *,
+    kind: int = SPAN_KIND_INTERNAL,
+    parent: str | None = None,
+    **attributes: Any,
+) -> Iterator[Span | None]:
+    """Record the enclosed block as a span of the current trace.
+
+    `parent` is a `traceparent` value that overrides the context; the block then
+    runs under that trace id, so logs and outgoing headers follow it too.
+    """
+    if _exporter is None:
+        yield None
+        return
+
+    trace_token = None
+    remote = parse_traceparent(parent)
+    if remote is not None:
+        trace_id = remote[0]
+        parent_span_id: str | None = remote[1]
+        if get_trace_id() != trace_id:
+            trace_token = set_trace_id(trace_id)
+    else:
+        context_trace_id = get_trace_id()
+        if context_trace_id is None:
+            context_trace_id = generate_trace_id()
+            trace_token = set_trace_id(context_trace_id)
+        trace_id = otel_trace_id(context_trace_id)
+        parent_span_id = _parent_span_id(trace_id)
+
+    current = Span(
+        name=name,
+        trace_id=trace_id,
+        span_id=secrets.token_hex(8),
+        parent_span_id=parent_span_id,
+        start_ns=time.time_ns(),
+        kind=kind,
+        attributes=attributes,
+    )
+    span_token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as exc:
+        current.error = f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        current.end_ns = time.time_ns()
+        _current_span.reset(span_token)
+        if trace_token is not None:
+            reset_trace_id(trace_token)
+        _exporter.export(current)
+
+
+def record_span(
+    name: str,
+    start_ns: int,
+    end_ns: int | None = None,
+    *,
+    parent: str | None = None,
+    error: str | None = None,
+    **attributes: Any,
+) -> None:
+    """Record an already finished span (e.g. one measured before it had a context)."""
+    if _exporter is None:
+        return
+    remote = parse_traceparent(parent)
+    if remote is not None:
+        trace_id, parent_span_id = remote
+    else:
+        context_trace_id = get_trace_id() or generate_trace_id()
+        trace_id = otel_trace_id(context_trace_id)
+        parent_span_id = _parent_span_id(trace_id)
+    _exporter.export(
+        Span(
+            name=name,
+            trace_id=trace_id,
+            span_id=secrets.token_hex(8),
+            parent_span_id=parent_span_id,
+            start_ns=start_ns,
+            end_ns=end_ns if end_ns is not None else time.time_ns(),
+            attributes=attributes,
+            error=error,
+        )
+    )
+
+
+class TimingSpanHandler(logging.Handler):
+    """Turns `timing` log records (step + duration_ms) into spans.
+
+    The record's own extras become span attributes. DEBUG timing lines are
+    per-message detail that explicit spans already cover, so they are skipped.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.msg != "timing" or record.levelno < logging.INFO:
+            return
+        step = getattr(record, "step", None)
+        duration_ms = getattr(record, "duration_ms", None)
+        if not isinstance(step, str) or not isinstance(duration_ms, int | float):
+            return
+        end_ns = int(record.created * 1e9)
+        attributes = {
+            k: v
+            for k, v in record.__dict__.items()
+            if k not in _STANDARD_ATTRS and not k.startswith("_")
+        }
+        record_span(step, end_ns - int(duration_ms * 1e6), end_ns, **attributes)
+
+
+def _attribute_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, str):
+        return {"stringValue": value}
+    return {
+        "stringValue": json.dumps(
+            value, ensure_ascii=False, separators=(",", ":"), default=str
+        )
+    }
+
+
+def _attributes(values: dict[str, Any]) -> list[dict[str, Any]]:
+    return [
+        {"key": key, "value": _attribute_value(value)}
+        for key, value in values.items()
+        if value is not None
+        and not any(token in key.lower() for token in _SENSITIVE_KEYS)
+    ]
+
+
+def _otlp_span(item: Span) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "traceId": item.trace_id,
+        "spanId": item.span_id,
+        "name": item.name,
+        "kind": item.kind,
+        "startTimeUnixNano": str(item.start_ns),
+        "endTimeUnixNano": str(item.end_ns),
+        "attributes": _attributes(item.attributes),
+        "status": {"code": 2, "message": item.error} if item.error else {},
+    }
+    if item.parent_span_id:
+        payload["parentSpanId"] = item.parent_span_id
+    return payload
+
+
+class _SpanExporter:
+    """Writes finished spans as OTLP/JSON from one background thread.
+
+    Each batch becomes one `ExportTraceServiceRequest`: appended as a line to a
+    file (readable by the collector's otlpjsonfile receiver) and/or POSTed to an
+    OTLP/HTTP endpoint. Spans are dropped rather than blocking callers when the
+    queue is full.
+    """
+
+    def __init__(
+        self, service_name: str, *, endpoint: str | None, file_path: str | None
+    ) -> None:
+        self._resource = {
+            "attributes": _attributes({"service.name": service_name}),
+        }
+        self._endpoint = f"{endpoint.rstrip('/')}/v1/traces" if endpoint else None
+        self._file_path = file_path
+        self._queue: queue.Queue[Span | None] = queue.Queue(_MAX_QUEUED_SPANS)
+        self._thread = threading.Thread(
+            target=self._run, name="span-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def export(self, item: Span) -> None:
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            pass
+
+    def close(self) -> None:
+        try:
+            self._queue.put(None, timeout=1)
+        except queue.Full:
+            return
+        self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            closing = item is None
+            batch = [] if closing else [item]
+            while not closing and len(batch) < _MAX_BATCH_SPANS:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    closing = True
+                else:
+                    batch.append(item)
+            if batch:
+                self._write(batch)
+            if closing:
+                return
+
+    def _write(self, batch: list[Span]) -> None:
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": self._resource,
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "poco"},
+                            "spans": [_otlp_span(item) for item in batch],
+                        }
+                    ],
+                }
+            ]
+        }
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        if self._file_path:
+            try:
+                with open(self._file_path, "a", encoding="utf-8") as fh:
+                    fh.write(body + "\n")
+            except OSError as exc:
+                logger.debug("trace_file_export_failed", extra={"error": str(exc)})
+        if self._endpoint:
+            try:
+                req = Request(  # noqa: S310
+                    self._endpoint,
+                    data=body.encode("utf-8"),
+                    headers={"content-type": "application/json"},
+                    method="POST",
+                )
+                with urlopen(req, timeout=5) as resp:  # noqa: S310
+                    resp.read()
+            except (URLError, OSError, ValueError) as exc:
+                logger.debug("trace_otlp_export_failed", extra={"error": str(exc)})
+
+
+def configure_tracing(*, service_name: str = "executor") -> None:
+    """Start exporting spans when TRACING_ENABLED is set (call after logging setup).
+
+    OTEL_EXPORTER_OTLP_ENDPOINT sends spans to a collector's OTLP/HTTP receiver;
+    TRACING_FILE appends them to a JSON lines file. With neither set, spans go to
+    `<LOG_DIR>/<service_name>.traces.jsonl`.
+    """
+    global _exporter
+    if _exporter is not None:
+        return
+    raw = (os.getenv("TRACING_ENABLED") or "").strip().lower()
+    if raw not in {"1", "true", "yes", "y", "on"}:
+        return
+
+    endpoint = (os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT") or "").strip() or None
+    file_path = (os.getenv("TRACING_FILE") or "").strip() or None
+    if endpoint is None and file_path is None:
+        log_dir = (os.getenv("LOG_DIR") or "./logs").strip() or "./logs"
+        file_path = str(Path(log_dir) / f"{service_name}.traces.jsonl")
+    if file_path:
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+
+    _exporter = _SpanExporter(service_name, endpoint=endpoint, file_path=file_path)
+    logging.getLogger().addHandler(TimingSpanHandler())
+    atexit.register(_exporter.close)
+    logger.info(
+        "tracing_enabled",
+        extra={"otlp_endpoint": endpoint, "trace_file": file_path},
+    )
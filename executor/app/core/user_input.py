@@ -4,6 +4,7 @@ from typing import Any
 
 import httpx
 
+from app.core.http_client import get_http_client
 from app.core.observability.request_context import (
     generate_request_id,
     generate_trace_id,
@@ -12,6 +13,10 @@ from app.core.observability.request_context import (
 )
 
 
+# Per long-poll request; the server caps a single wait at 60s.
+_LONG_POLL_SECONDS = 25.0
+
+
 class UserInputClient:
     def __init__(
         self,
@@ -22,6 +27,8 @@ class UserInputClient:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.poll_interval = poll_interval
+        # Cleared when the manager does not expose the long-poll endpoint.
+        self._long_poll_supported = True
 
     @staticmethod
     def resolve_base_url(callback_url: str, callback_base_url: str | None) -> str:
@@ -32,42 +39,77 @@ class UserInputClient:
         return callback_url.rstrip("/")
 
     async def create_request(self, payload: dict[str, Any]) -> dict[str, Any]:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/user-input-requests",
-                json=payload,
-                headers={
-                    "X-Request-ID": get_request_id() or generate_request_id(),
-                    "X-Trace-ID": get_trace_id() or generate_trace_id(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {})
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/user-input-requests",
+            timeout=self.timeout,
+            json=payload,
+            headers={
+                "X-Request-ID": get_request_id() or generate_request_id(),
+                "X-Trace-ID": get_trace_id() or generate_trace_id(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {})
 
     async def get_request(self, request_id: str) -> dict[str, Any]:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/user-input-requests/{request_id}",
-                headers={
-                    "X-Request-ID": get_request_id() or generate_request_id(),
-                    "X-Trace-ID": get_trace_id() or generate_trace_id(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {})
+        client = get_http_client()
+        response = await client.get(
+            f"{self.base_url}/api/v1/user-input-requests/{request_id}",
+            timeout=self.timeout,
+            headers={
+                "X-Request-ID": get_request_id() or generate_request_id(),
+                "X-Trace-ID": get_trace_id() or generate_trace_id(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {})
+
+    async def wait_request(
+        self, request_id: str, timeout_seconds: float
+    ) -> dict[str, Any]:
+        """Long-poll until the request is answered/expired or timeout_seconds pass."""
+        client = get_http_client()
+        response = await client.get(
+            f"{self.base_url}/api/v1/user-input-requests/{request_id}/wait",
+            params={"timeout_seconds": timeout_seconds},
+            timeout=timeout_seconds + self.timeout,
+            headers={
+                "X-Request-ID": get_request_id() or generate_request_id(),
+                "X-Trace-ID": get_trace_id() or generate_trace_id(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {})
 
     async def wait_for_answer(
         self, request_id: str, timeout_seconds: float = 60
     ) -> dict[str, Any] | None:
         deadline = datetime.now(timezone.utc).timestamp() + timeout_seconds
-        while datetime.now(timezone.utc).timestamp() < deadline:
-            payload = await self.get_request(request_id)
+        while True:
+            remaining = deadline - datetime.now(timezone.utc).timestamp()
+            if remaining <= 0:
+                return None
+            if self._long_poll_supported:
+                try:
+                    payload = await self.wait_request(
+                        request_id, min(remaining, _LONG_POLL_SECONDS)
+                    )
+                except httpx.HTTPStatusError as exc:
+                    if exc.response.status_code not in (404, 405):
+                        raise
+                    # Older manager without the wait endpoint: poll instead.
+                    self._long_poll_supported = False
+                    continue
+            else:
+                payload = await self.get_request(request_id)
             status = payload.get("status")
             if status == "answered":
                 return payload
             if status == "expired":
                 return None
-            await asyncio.sleep(self.poll_interval)
-        return None
+            if not self._long_poll_supported:
+                await asyncio.sleep(self.poll_interval)
@@ -7,15 +7,14 @@ from pathlib import Path
 from urllib.parse import urlparse
 
 from app.schemas.request import TaskConfig
-from app.utils.git.operations import (
-    GitCommandError,
-    GitError,
+from app.utils.git.async_operations import (
+    checkout,
     clone,
+    fetch,
     init_repository,
     is_repository,
-    checkout,
-    fetch,
 )
+from app.utils.git.operations import GitCommandError, GitError
 
 logger = logging.getLogger(__name__)
 
@@ -60,9 +59,9 @@ class WorkspaceManager:
             self.root_path.mkdir(parents=True, exist_ok=True)
 
         await self._setup_session_persistence()
-        self.work_path = self._prepare_repository(config)
+        self.work_path = await self._prepare_repository(config)
         self._ensure_inputs_dir(self.work_path)
-        self._ensure_git_excludes(self.work_path)
+        await self._ensure_git_excludes(self.work_path)
 
     async def _setup_session_persistence(self):
         self.persistent_claude_data.mkdir(exist_ok=True)
@@ -87,39 +86,51 @@ class WorkspaceManager:
                 pass
             self._git_askpass_path = None
 
-    def _prepare_repository(self, config: TaskConfig) -> Path:
+    async def _prepare_repository(self, config: TaskConfig) -> Path:
         repo_url = (config.repo_url or "").strip()
         if repo_url:
-            return self._ensure_cloned_repo(
+            return await self._ensure_cloned_repo(
                 repo_url,
                 config.git_branch,
                 git_token=(config.git_token or "").strip() or None,
+                clone_mode=config.git_clone_mode,
             )
 
-        self._ensure_git_repo(self.root_path)
+        await self._ensure_git_repo(self.root_path)
         return self.root_path
 
-    def _ensure_cloned_repo(
+    async def _ensure_cloned_repo(
         self,
         repo_url: str,
         branch: str | None,
         *,
         git_token: str | None,
+        clone_mode: str = "full",
     ) -> Path:
+        # The manager may already have seeded the repo from its host mirror cache;
+        # then only the branch is fetched and checked out.
         repo_path = self._derive_repo_path(repo_url)
         git_env = self._build_git_env(repo_url, git_token)
 
-        if repo_path.exists() and is_repository(repo_path):
-            self._checkout_branch(repo_path, branch, env=git_env)
+        is_repo = repo_path.exists() and await is_repository(repo_path)
+        if is_repo:
+            await self._checkout_branch(repo_path, branch, env=git_env)
             return repo_path
 
-        if repo_path.exists() and not is_repository(repo_path):
+        if repo_path.exists():
             raise RuntimeError(
                 f"Target path exists but is not a git repository: {repo_path}"
             )
 
         try:
-            return clone(repo_url, path=repo_path, branch=branch, env=git_env)
+            return await clone(
+                repo_url,
+                path=repo_path,
+                branch=branch,
+                env=git_env,
+                depth=1 if clone_mode == "shallow" else None,
+                filter_spec="blob:none" if clone_mode == "blobless" else None,
+            )
         except (GitCommandError, GitError, OSError) as exc:
             detail = str(exc)
             # Keep the error message compact for the UI.
@@ -193,23 +204,23 @@ esac
         return self.root_path / name
 
     @staticmethod
-    def _ensure_git_repo(path: Path) -> None:
-        if is_repository(path):
+    async def _ensure_git_repo(path: Path) -> None:
+        if await is_repository(path):
             return
         try:
-            init_repository(path)
+            await init_repository(path)
         except Exception as exc:
             logger.warning(f"Failed to init git repository at {path}: {exc}")
 
     @staticmethod
-    def _checkout_branch(
+    async def _checkout_branch(
         path: Path, branch: str | None, *, env: dict[str, str] | None = None
     ) -> None:
         if not branch:
             return
         try:
-            fetch(remote="origin", branch=branch, cwd=path, env=env)
-            checkout(branch, cwd=path)
+            await fetch(remote="origin", branch=branch, cwd=path, env=env)
+            await checkout(branch, cwd=path)
         except (GitCommandError, GitError, OSError) as exc:
             detail = str(exc)
             if len(detail) > 2000:
@@ -218,8 +229,8 @@ esac
                 f"Failed to checkout branch '{branch}' for repo at {path}. {detail}"
             ) from exc
 
-    def _ensure_git_excludes(self, repo_path: Path) -> None:
-        if not is_repository(repo_path):
+    async def _ensure_git_excludes(self, repo_path: Path) -> None:
+        if not await is_repository(repo_path):
             return
 
         extra = os.environ.get("WORKSPACE_GIT_IGNORE", "")
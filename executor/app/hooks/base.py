@@ -2,6 +2,10 @@ from abc import ABC
 from typing import Any
 
 from app.schemas.state import AgentCurrentState
+from app.utils.serializer import serialize_message
+
+# Background hooks may still be working on earlier messages; keep a few.
+_SERIALIZED_CACHE_SIZE = 32
 
 
 class ExecutionContext:
@@ -9,9 +13,31 @@ class ExecutionContext:
         self.session_id = session_id
         self.cwd = cwd
         self.current_state = AgentCurrentState()
+        # id(message) -> (message, payload); the message reference keeps ids unique.
+        self._serialized: dict[int, tuple[Any, Any]] = {}
+
+    def serialized(self, message: Any) -> Any:
+        """Return the serialized form of a message, computed once per message.
+
+        All hooks share the cached payload instead of re-walking the SDK
+        dataclasses; treat it as read-only.
+        """
+        cached = self._serialized.get(id(message))
+        if cached is not None and cached[0] is message:
+            return cached[1]
+        payload = serialize_message(message)
+        self._serialized[id(message)] = (message, payload)
+        if len(self._serialized) > _SERIALIZED_CACHE_SIZE:
+            del self._serialized[next(iter(self._serialized))]
+        return payload
 
 
 class AgentHook(ABC):
+    # Background hooks do not feed the state of the current message's callback.
+    # They run in their own ordered task so slow work (e.g. git scans) does not
+    # hold back the other hooks; the manager waits for them before teardown.
+    background: bool = False
+
     async def on_setup(self, context: ExecutionContext):
         pass
 
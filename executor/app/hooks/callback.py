@@ -2,16 +2,22 @@ from typing import Any, Optional
 
 from claude_agent_sdk.types import ResultMessage, SystemMessage
 
-from app.core.callback import CallbackClient
+from app.core.callback import CallbackBatcher, CallbackClient
 from app.hooks.base import AgentHook, ExecutionContext
 from app.schemas.callback import AgentCallbackRequest
 from app.schemas.enums import CallbackStatus, TodoStatus
-from app.utils.serializer import serialize_message
 
 
 class CallbackHook(AgentHook):
-    def __init__(self, client: CallbackClient):
+    def __init__(self, client: CallbackClient, *, batch: bool | None = None):
         self.client = client
+        # RUNNING reports are coalesced; the terminal report is always sent directly
+        # after a final flush so it cannot overtake buffered messages.
+        if batch is None:
+            batch = CallbackBatcher.enabled_by_env()
+        self.batcher: CallbackBatcher | None = (
+            CallbackBatcher(client) if batch else None
+        )
         self.execution_error: Optional[Exception] = None
         self.sdk_session_id: Optional[str] = None
 
@@ -28,7 +34,7 @@ class CallbackHook(AgentHook):
             status=status,
             progress=progress,
             error_message=error_message,
-            new_message=serialize_message(new_message),
+            new_message=new_message,
             state_patch=context.current_state,
             sdk_session_id=self.sdk_session_id,
         )
@@ -47,14 +53,16 @@ class CallbackHook(AgentHook):
         elif isinstance(message, ResultMessage):
             self.sdk_session_id = message.session_id
 
-        await self.client.send(
-            self._build_report(
-                context=context,
-                status=CallbackStatus.RUNNING,
-                progress=self._calculate_progress(context.current_state.todos),
-                new_message=message,
-            )
+        report = self._build_report(
+            context=context,
+            status=CallbackStatus.RUNNING,
+            progress=self._calculate_progress(context.current_state.todos),
+            new_message=context.serialized(message),
         )
+        if self.batcher is not None:
+            await self.batcher.enqueue(report)
+        else:
+            await self.client.send(report)
 
     async def on_teardown(self, context: ExecutionContext):
         status = (
@@ -71,6 +79,9 @@ class CallbackHook(AgentHook):
                 detail = detail[:2000] + "..."
             error_message = detail
 
+        if self.batcher is not None:
+            await self.batcher.close()
+
         await self.client.send(
             self._build_report(
                 context=context,
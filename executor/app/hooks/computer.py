@@ -11,7 +11,6 @@ import websockets
 from app.core.computer import ComputerClient
 from app.hooks.base import AgentHook, ExecutionContext
 from app.utils.browser import parse_viewport_size
-from app.utils.serializer import serialize_message
 
 POCO_PLAYWRIGHT_MCP_PREFIX = "mcp____poco_playwright__"
 logger = logging.getLogger(__name__)
@@ -61,7 +60,7 @@ class BrowserScreenshotHook(AgentHook):
             return
 
     async def on_agent_response(self, context: ExecutionContext, message: Any) -> None:
-        payload = serialize_message(message)
+        payload = context.serialized(message)
         if not isinstance(payload, dict):
             return
 
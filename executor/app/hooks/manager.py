@@ -1,24 +1,146 @@
+import asyncio
+import logging
+import time
 from typing import Any
 
+from app.core.observability.metrics import observe_timing_step
+from app.core.observability.tracing import span
 from app.hooks.base import AgentHook, ExecutionContext
 
+logger = logging.getLogger(__name__)
+
 
 class HookManager:
+    """Dispatch agent lifecycle events to hooks.
+
+    Each message is serialized once (via the execution context) and shared by all
+    hooks. Foreground hooks run in order because later hooks read state set by
+    earlier ones (todos feed the callback's progress). Background hooks get one
+    ordered task chain each and run concurrently with the foreground hooks and
+    each other; teardown waits for them so the final callback sees their state.
+    """
+
     def __init__(self, hooks: list[AgentHook]):
         self.hooks = hooks
+        self._foreground = [h for h in hooks if not h.background]
+        self._background = [h for h in hooks if h.background]
+        self._background_tails: dict[AgentHook, asyncio.Task[None]] = {}
+        # hook name -> [calls, total seconds, max seconds]
+        self._latency: dict[str, list[float]] = {}
 
     async def run_on_setup(self, context: ExecutionContext):
         for hook in self.hooks:
-            await hook.on_setup(context)
+            with span("hook.on_setup", hook=type(hook).__name__):
+                await hook.on_setup(context)
 
     async def run_on_response(self, context: ExecutionContext, message: Any):
-        for hook in self.hooks:
-            await hook.on_agent_response(context, message)
+        message_type = type(message).__name__
+        with span("hooks.on_response", message_type=message_type):
+            await self._run_on_response(context, message, message_type)
+
+    async def _run_on_response(
+        self, context: ExecutionContext, message: Any, message_type: str
+    ) -> None:
+        started = time.perf_counter()
+        context.serialized(message)
+        durations = {"serialize": self._record("serialize", started)}
+
+        for hook in self._background:
+            self._dispatch_background(hook, context, message)
+
+        for hook in self._foreground:
+            name = type(hook).__name__
+            hook_started = time.perf_counter()
+            with span("hook.on_agent_response", hook=name):
+                await hook.on_agent_response(context, message)
+            durations[name] = self._record(name, hook_started)
+
+        duration_ms = int((time.perf_counter() - started) * 1000)
+        observe_timing_step("hooks_on_response", duration_ms)
+        logger.debug(
+            "timing",
+            extra={
+                "step": "hooks_on_response",
+                "duration_ms": duration_ms,
+                "session_id": context.session_id,
+                "message_type": message_type,
+                "hooks_ms": {k: round(v * 1000, 2) for k, v in durations.items()},
+            },
+        )
 
     async def run_on_teardown(self, context: ExecutionContext):
+        await self.wait_background()
         for hook in reversed(self.hooks):
-            await hook.on_teardown(context)
+            with span("hook.on_teardown", hook=type(hook).__name__):
+                await hook.on_teardown(context)
+        self._log_latency_summary(context)
 
     async def run_on_error(self, context: ExecutionContext, error: Exception):
         for hook in self.hooks:
-            await hook.on_error(context, error)
+            with span("hook.on_error", hook=type(hook).__name__):
+                await hook.on_error(context, error)
+
+    async def wait_background(self) -> None:
+        """Wait until every dispatched background hook call has finished."""
+        tails = list(self._background_tails.values())
+        self._background_tails.clear()
+        if tails:
+            await asyncio.wait(tails)
+
+    def _dispatch_background(
+        self, hook: AgentHook, context: ExecutionContext, message: Any
+    ) -> None:
+        previous = self._background_tails.get(hook)
+        self._background_tails[hook] = asyncio.create_task(
+            self._run_background(hook, context, message, previous)
+        )
+
+    async def _run_background(
+        self,
+        hook: AgentHook,
+        context: ExecutionContext,
+        message: Any,
+        previous: asyncio.Task[None] | None,
+    ) -> None:
+        # Keep per-hook message order; asyncio.wait does not cancel `previous`
+        # if this task is cancelled.
+        if previous is not None:
+            await asyncio.wait([previous])
+        name = type(hook).__name__
+        started = time.perf_counter()
+        try:
+            with span("hook.on_agent_response", hook=name, background=True):
+                await hook.on_agent_response(context, message)
+        except Exception:
+            logger.exception(
+                "background_hook_failed",
+                extra={"session_id": context.session_id, "hook": name},
+            )
+        finally:
+            self._record(name, started)
+
+    def _record(self, name: str, started: float) -> float:
+        elapsed = time.perf_counter() - started
+        stats = self._latency.setdefault(name, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] = max(stats[2], elapsed)
+        return elapsed
+
+    def _log_latency_summary(self, context: ExecutionContext) -> None:
+        if not self._latency:
+            return
+        logger.info(
+            "hook_latency",
+            extra={
+                "session_id": context.session_id,
+                "hooks": {
+                    name: {
+                        "calls": int(calls),
+                        "avg_ms": round(total / calls * 1000, 2) if calls else 0.0,
+                        "max_ms": round(peak * 1000, 2),
+                    }
+                    for name, (calls, total, peak) in self._latency.items()
+                },
+            },
+        )
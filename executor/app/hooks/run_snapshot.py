@@ -4,9 +4,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from app.hooks.base import AgentHook, ExecutionContext
-from app.utils.git.operations import (
-    GitError,
-    GitNotRepositoryError,
+from app.utils.git.async_operations import (
     add_files,
     commit,
     has_commits,
@@ -15,6 +13,7 @@ from app.utils.git.operations import (
     set_config,
     tag_ref,
 )
+from app.utils.git.operations import GitError, GitNotRepositoryError
 
 logger = logging.getLogger(__name__)
 
@@ -60,23 +59,23 @@ class RunSnapshotHook(AgentHook):
         return self._resolved_run_id
 
     @staticmethod
-    def _ensure_git_ready(cwd: Path) -> None:
+    async def _ensure_git_ready(cwd: Path) -> None:
         """Ensure a git repository exists and is commit-ready."""
 
-        if not is_repository(cwd):
-            init_repository(cwd)
+        if not await is_repository(cwd):
+            await init_repository(cwd)
 
         # Make commits work reliably inside containers.
-        set_config("user.name", "poco", cwd=cwd)
-        set_config("user.email", "poco@local", cwd=cwd)
-        set_config("commit.gpgsign", "false", cwd=cwd)
+        await set_config("user.name", "poco", cwd=cwd)
+        await set_config("user.email", "poco@local", cwd=cwd)
+        await set_config("commit.gpgsign", "false", cwd=cwd)
 
     async def on_setup(self, context: ExecutionContext) -> None:
         run_id = self._resolve_run_id(context)
         cwd = Path(context.cwd)
 
         try:
-            self._ensure_git_ready(cwd)
+            await self._ensure_git_ready(cwd)
         except (GitNotRepositoryError, GitError, OSError) as exc:
             logger.warning(
                 "run_snapshot_setup_failed",
@@ -90,9 +89,9 @@ class RunSnapshotHook(AgentHook):
 
         # Ensure HEAD exists so subsequent status/diff are relative to a concrete baseline.
         try:
-            if not has_commits(cwd):
-                add_files(".", cwd=cwd, all_files=True)
-                commit(
+            if not await has_commits(cwd):
+                await add_files(".", cwd=cwd, all_files=True)
+                await commit(
                     message="poco:init",
                     cwd=cwd,
                     allow_empty=True,
@@ -111,7 +110,9 @@ class RunSnapshotHook(AgentHook):
 
         # Tag the baseline for this run (state before any agent modifications).
         try:
-            tag_ref(_build_run_ref(run_id, "base"), ref="HEAD", cwd=cwd, force=True)
+            await tag_ref(
+                _build_run_ref(run_id, "base"), ref="HEAD", cwd=cwd, force=True
+            )
         except Exception as exc:
             logger.warning(
                 "run_snapshot_base_tag_failed",
@@ -131,7 +132,7 @@ class RunSnapshotHook(AgentHook):
         cwd = Path(context.cwd)
 
         try:
-            self._ensure_git_ready(cwd)
+            await self._ensure_git_ready(cwd)
         except Exception as exc:
             logger.warning(
                 "run_snapshot_teardown_git_unavailable",
@@ -149,7 +150,7 @@ class RunSnapshotHook(AgentHook):
             message = f"{message} {self._error_type}"
 
         try:
-            add_files(".", cwd=cwd, all_files=True)
+            await add_files(".", cwd=cwd, all_files=True)
         except Exception as exc:
             logger.warning(
                 "run_snapshot_add_failed",
@@ -162,7 +163,7 @@ class RunSnapshotHook(AgentHook):
 
         commit_hash: str | None = None
         try:
-            commit_hash = commit(
+            commit_hash = await commit(
                 message=message,
                 cwd=cwd,
                 allow_empty=True,
@@ -180,7 +181,7 @@ class RunSnapshotHook(AgentHook):
             return
 
         try:
-            tag_ref(
+            await tag_ref(
                 _build_run_ref(run_id, "result"),
                 ref=commit_hash or "HEAD",
                 cwd=cwd,
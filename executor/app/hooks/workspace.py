@@ -1,38 +1,138 @@
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any
 
+from claude_agent_sdk.types import ResultMessage, UserMessage
+
+from app.core.observability.metrics import observe_timing_step
 from app.hooks.base import AgentHook, ExecutionContext
 from app.schemas.enums import FileStatus
 from app.schemas.state import FileChange, WorkspaceState
-from app.utils.git.operations import (
-    GitNotRepositoryError,
-    diff,
-    get_numstat,
+from app.utils.git.async_operations import (
+    diff_files,
+    get_git_dir,
     get_status,
     is_repository,
     list_remotes,
     remote_url,
 )
+from app.utils.git.operations import GitNotRepositoryError, count_patch_lines
+
+logger = logging.getLogger(__name__)
+
+# Files modified this close to the previous scan may change again within the same
+# mtime tick without a size change (git's "racy clean" problem); re-diff them.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw.strip())
+    except Exception:
+        return default
+
+
+# Diffs travel inside every callback state patch; keep them bounded. The full patch
+# is served on demand by the manager's workspace diff endpoint.
+_DIFF_MAX_BYTES = max(0, _env_int("WORKSPACE_DIFF_MAX_BYTES", 16 * 1024))
+_DIFF_TOTAL_MAX_BYTES = max(0, _env_int("WORKSPACE_DIFF_TOTAL_MAX_BYTES", 256 * 1024))
+
+
+def _bounded_diff(patch: str) -> tuple[str | None, bool]:
+    """Return (diff, truncated), cutting oversized patches at a line boundary."""
+    if not patch:
+        return None, False
+    encoded = patch.encode("utf-8")
+    if len(encoded) <= _DIFF_MAX_BYTES:
+        return patch, False
+    head = encoded[:_DIFF_MAX_BYTES].decode("utf-8", errors="ignore")
+    cut = head.rfind("\n")
+    head = head[: cut + 1] if cut >= 0 else ""
+    return head or None, True
+
+
+@dataclass
+class _CachedChange:
+    signature: tuple[int, int, int] | None
+    scanned_ns: int
+    change: FileChange
 
 
 class WorkspaceHook(AgentHook):
-    """Hook that monitors workspace file changes and updates state."""
+    """Hook that monitors workspace file changes and updates state.
+
+    Diffs are tracked incrementally: a rescan only happens at tool-use boundaries
+    (tool results and the final result message), and only files whose mtime/size
+    changed since the previous scan are re-diffed, in one batched `git diff` per
+    kind. A change to the index, HEAD or refs invalidates every cached entry.
+    Inline diffs are size-capped previews carrying the full patch's hash and size.
+
+    Scans run as a background hook on the async git layer, so callbacks are not
+    held back by git; the new state rides along with the next callback.
+    """
+
+    background = True
+
+    def __init__(self) -> None:
+        self._cache: dict[tuple[str, str], _CachedChange] = {}
+        self._repo_signature: tuple | None = None
+        self._git_dir: Path | None = None
+        self._repository: str | None = None
+        self._repository_signature: tuple | None = None
+        self._scanned_once = False
+
+    @staticmethod
+    def _is_tool_boundary(message: Any) -> bool:
+        if isinstance(message, ResultMessage):
+            return True
+        if isinstance(message, UserMessage) and isinstance(message.content, list):
+            return any(
+                type(block).__name__ == "ToolResultBlock" for block in message.content
+            )
+        return False
 
     async def on_agent_response(self, context: ExecutionContext, message: Any) -> None:
-        """Capture Git-tracked file changes after each agent response.
+        """Capture Git-tracked file changes at tool-use boundaries.
 
         Args:
             context: The execution context containing workspace state.
-            message: The agent response message (unused).
+            message: The agent response message; only tool results and the final
+                result trigger a rescan.
         """
+        if self._scanned_once and not self._is_tool_boundary(message):
+            return
+        self._scanned_once = True
+
+        started = time.perf_counter()
         try:
-            if not is_repository(context.cwd):
+            if self._git_dir is None and not await is_repository(context.cwd):
                 context.current_state.workspace_state = WorkspaceState()
                 return
 
-            git_status = get_status(context.cwd)
-            repository = self._get_repository_url(context.cwd)
-            file_changes = self._collect_file_changes(git_status, context.cwd)
+            git_status = await get_status(context.cwd)
+            await self._refresh_repo_signature(context.cwd)
+            repository = await self._get_repository_url(context.cwd)
+            file_changes, rediffed = await self._collect_file_changes(
+                git_status, context.cwd
+            )
+
+            previous = context.current_state.workspace_state
+            if (
+                previous is not None
+                and previous.file_changes == file_changes
+                and previous.branch == git_status.branch
+                and previous.repository == repository
+            ):
+                # Nothing changed: keep the same state (and last_change timestamp).
+                return
 
             total_added = sum(fc.added_lines for fc in file_changes)
             total_deleted = sum(fc.deleted_lines for fc in file_changes)
@@ -45,51 +145,143 @@ class WorkspaceHook(AgentHook):
                 file_changes=file_changes,
                 last_change=datetime.now(timezone.utc),
             )
+            duration_ms = int((time.perf_counter() - started) * 1000)
+            observe_timing_step("workspace_scan", duration_ms)
+            logger.debug(
+                "timing",
+                extra={
+                    "step": "workspace_scan",
+                    "duration_ms": duration_ms,
+                    "session_id": context.session_id,
+                    "file_changes": len(file_changes),
+                    "rediffed": rediffed,
+                },
+            )
         except GitNotRepositoryError:
+            self._reset()
             context.current_state.workspace_state = WorkspaceState()
         except Exception:
+            self._reset()
             context.current_state.workspace_state = WorkspaceState()
 
-    def _collect_file_changes(self, git_status, cwd: str) -> list[FileChange]:
-        """Collect file changes with diff information.
+    def _reset(self) -> None:
+        self._cache.clear()
+        self._repo_signature = None
+        self._git_dir = None
+        self._repository_signature = None
+
+    @staticmethod
+    def _stat_signature(path: Path) -> tuple[int, int, int] | None:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    async def _refresh_repo_signature(self, cwd: str) -> None:
+        """Drop cached diffs when the index, HEAD or refs changed (add/commit/checkout)."""
+        if self._git_dir is None:
+            self._git_dir = await get_git_dir(cwd)
+        git_dir = self._git_dir
+        head_ref = None
+        try:
+            head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+            if head.startswith("ref: "):
+                head_ref = git_dir / head[len("ref: ") :]
+        except OSError:
+            head = ""
+        signature = (
+            head,
+            self._stat_signature(git_dir / "index"),
+            self._stat_signature(head_ref) if head_ref else None,
+            self._stat_signature(git_dir / "packed-refs"),
+        )
+        if signature != self._repo_signature:
+            self._cache.clear()
+            self._repo_signature = signature
+
+    async def _collect_file_changes(
+        self, git_status, cwd: str
+    ) -> tuple[list[FileChange], int]:
+        """Collect file changes, re-diffing only files that changed since last scan.
 
         Args:
             git_status: The Git status object.
             cwd: Current working directory.
 
         Returns:
-            List of FileChange objects.
+            Tuple of (FileChange list, number of files re-diffed).
         """
-        file_changes = []
+        now_ns = time.time_ns()
+        root = Path(cwd)
+        current: dict[tuple[str, str], FileChange] = {}
+        dirty: dict[str, list[str]] = {"modified": [], "staged": []}
+        signatures: dict[tuple[str, str], tuple[int, int, int] | None] = {}
 
-        unstaged_numstat = get_numstat(cwd, cached=False)
-        staged_numstat = get_numstat(cwd, cached=True)
-
-        for file in git_status.modified:
-            added, deleted = unstaged_numstat.get(file, (0, 0))
-            diff_content = diff(file=file, cwd=cwd, cached=False)
-            file_changes.append(
-                FileChange(
-                    path=file,
-                    status=FileStatus.MODIFIED,
-                    added_lines=added,
-                    deleted_lines=deleted,
-                    diff=diff_content or None,
+        for kind, files in (
+            ("modified", git_status.modified),
+            ("staged", git_status.staged),
+        ):
+            for file in files:
+                key = (kind, file)
+                # Staged diffs only depend on the index/HEAD (covered by the repo
+                # signature); worktree diffs also depend on the file itself.
+                signature = (
+                    self._stat_signature(root / file) if kind == "modified" else None
                 )
-            )
+                signatures[key] = signature
+                cached = self._cache.get(key)
+                if (
+                    cached is not None
+                    and cached.signature == signature
+                    and (
+                        signature is None
+                        or signature[0] < cached.scanned_ns - _RACY_WINDOW_NS
+                    )
+                ):
+                    current[key] = cached.change
+                else:
+                    dirty[kind].append(file)
 
-        for file in git_status.staged:
-            added, deleted = staged_numstat.get(file, (0, 0))
-            diff_content = diff(file=file, cwd=cwd, cached=True)
-            file_changes.append(
-                FileChange(
+        for kind, status in (
+            ("modified", FileStatus.MODIFIED),
+            ("staged", FileStatus.STAGED),
+        ):
+            if not dirty[kind]:
+                continue
+            patches = await diff_files(dirty[kind], cached=kind == "staged", cwd=cwd)
+            for file in dirty[kind]:
+                patch = patches.get(file, "")
+                added, deleted = count_patch_lines(patch) if patch else (0, 0)
+                bounded, truncated = _bounded_diff(patch)
+                change = FileChange(
                     path=file,
-                    status=FileStatus.STAGED,
+                    status=status,
                     added_lines=added,
                     deleted_lines=deleted,
-                    diff=diff_content or None,
+                    diff=bounded,
+                    diff_truncated=truncated,
+                    diff_hash=(
+                        hashlib.sha256(patch.encode("utf-8")).hexdigest()
+                        if patch
+                        else None
+                    ),
+                    diff_size=len(patch.encode("utf-8")),
                 )
-            )
+                key = (kind, file)
+                current[key] = change
+                self._cache[key] = _CachedChange(
+                    signature=signatures[key], scanned_ns=now_ns, change=change
+                )
+
+        # Forget files that are no longer reported as changed.
+        for key in list(self._cache):
+            if key not in current:
+                del self._cache[key]
+
+        file_changes = [current[("modified", file)] for file in git_status.modified]
+        file_changes.extend(current[("staged", file)] for file in git_status.staged)
+        file_changes = self._apply_total_diff_budget(file_changes)
 
         for file in git_status.untracked:
             file_changes.append(
@@ -119,10 +311,27 @@ class WorkspaceHook(AgentHook):
                 )
             )
 
-        return file_changes
+        return file_changes, len(dirty["modified"]) + len(dirty["staged"])
 
-    def _get_repository_url(self, cwd: str) -> str | None:
-        """Get repository URL from Git remotes.
+    @staticmethod
+    def _apply_total_diff_budget(file_changes: list[FileChange]) -> list[FileChange]:
+        """Drop inline diffs once the per-state budget is spent (counts stay)."""
+        used = 0
+        bounded: list[FileChange] = []
+        for change in file_changes:
+            if change.diff:
+                size = len(change.diff.encode("utf-8"))
+                if used + size > _DIFF_TOTAL_MAX_BYTES:
+                    change = change.model_copy(
+                        update={"diff": None, "diff_truncated": True}
+                    )
+                else:
+                    used += size
+            bounded.append(change)
+        return bounded
+
+    async def _get_repository_url(self, cwd: str) -> str | None:
+        """Get repository URL from Git remotes (cached until .git/config changes).
 
         Tries 'origin', then 'upstream', then the first available remote.
 
@@ -132,17 +341,28 @@ class WorkspaceHook(AgentHook):
         Returns:
             Repository URL or None if not found.
         """
+        signature = (
+            self._stat_signature(self._git_dir / "config") if self._git_dir else None
+        )
+        if signature is not None and signature == self._repository_signature:
+            return self._repository
+
+        repository = None
         try:
             for remote_name in ["origin", "upstream"]:
                 try:
-                    return remote_url(remote_name, cwd)
+                    repository = await remote_url(remote_name, cwd)
+                    break
                 except Exception:
                     continue
 
-            remotes = list_remotes(cwd)
-            if remotes:
-                return remotes[0].fetch_url
+            if repository is None:
+                remotes = await list_remotes(cwd)
+                if remotes:
+                    repository = remotes[0].fetch_url
         except Exception:
             pass
 
-        return None
+        self._repository = repository
+        self._repository_signature = signature
+        return repository
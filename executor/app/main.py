@@ -1,27 +1,48 @@
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 
 from app.api import task_router
+from app.core.http_client import (
+    close_http_client,
+    get_http_pool_stats,
+    start_http_client,
+)
 from app.core.middleware import setup_middleware
+from app.core.observability.metrics import metrics_endpoint
 from app.core.observability.logging import configure_logging
+from app.core.observability.tracing import configure_tracing
 
 configure_logging(
     debug=os.getenv("DEBUG", "").strip().lower() in {"1", "true", "yes", "y", "on"},
     service_name="executor",
 )
+configure_tracing(service_name="executor")
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # Keep-alive pool shared by callback, user-input and computer clients.
+    start_http_client()
+    try:
+        yield
+    finally:
+        await close_http_client()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 setup_middleware(app)
 app.include_router(task_router)
+app.add_api_route("/metrics", metrics_endpoint, include_in_schema=False)
 
 
 @app.get("/health")
 async def health_check() -> JSONResponse:
     """Health check endpoint."""
-    return JSONResponse({"status": "ok"})
+    return JSONResponse({"status": "ok", "http_pool": get_http_pool_stats()})
 
 
 if __name__ == "__main__":
@@ -18,3 +18,17 @@ class AgentCallbackRequest(BaseModel):
     new_message: Optional[Any] = None
     state_patch: Optional[AgentCurrentState] = None
     sdk_session_id: Optional[str] = None
+
+
+class AgentCallbackBatchRequest(BaseModel):
+    """Coalesced callbacks sent by the buffered callback sender.
+
+    `callbacks` are in emission order and carry no `state_patch`; `state_delta` holds
+    only the top-level AgentCurrentState fields that changed since the last
+    acknowledged batch and is merged into the stored state by the receiver.
+    """
+
+    session_id: str
+    seq: int
+    callbacks: list[AgentCallbackRequest] = Field(default_factory=list)
+    state_delta: dict[str, Any] | None = None
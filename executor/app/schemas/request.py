@@ -34,6 +34,9 @@ class TaskConfig(BaseModel):
     git_token_env_key: str | None = None
     # Resolved GitHub token (secret) injected by Executor Manager at runtime.
     git_token: str | None = None
+    # Used when the repository was not seeded from the manager's mirror cache:
+    # full clone, blobless partial clone (--filter=blob:none) or shallow (--depth 1).
+    git_clone_mode: Literal["full", "blobless", "shallow"] = "full"
     # Built-in browser capability toggle (Playwright MCP is injected internally by the executor).
     browser_enabled: bool = False
     mcp_config: dict = Field(default_factory=dict)
@@ -29,7 +29,12 @@ class FileChange(BaseModel):
     status: FileStatus
     added_lines: int = 0
     deleted_lines: int = 0
+    # Possibly truncated patch; see diff_truncated. diff_hash/diff_size describe the
+    # full patch so consumers can detect changes and fetch it on demand.
     diff: str | None = None
+    diff_truncated: bool = False
+    diff_hash: str | None = None
+    diff_size: int = 0
     old_path: str | None = None
 
 
@@ -0,0 +1,430 @@
+"""
+Asyncio-native variants of the git operations used on the executor's hot paths.
+
+Same semantics and exceptions as `app.utils.git.operations`, but commands run via
+`asyncio.create_subprocess_exec` so a large `git add -A`, commit or clone does not
+freeze the event loop (SDK message consumption, callbacks). Every command has a
+timeout, and a process-wide semaphore bounds how many git processes run at once.
+"""
+
+import asyncio
+import os
+import shlex
+import subprocess
+from pathlib import Path
+
+from app.utils.git.operations import (
+    GitCommandError,
+    GitError,
+    GitNotRepositoryError,
+    GitRemote,
+    GitStatus,
+    _looks_like_not_a_repository,
+    _parse_numstat,
+    _parse_remotes,
+    _parse_status_porcelain_v1_z,
+    split_diff_by_file,
+)
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw.strip())
+    except Exception:
+        return default
+
+
+# Local commands (status/diff/add/commit) vs. commands that talk to a remote.
+GIT_COMMAND_TIMEOUT_SECONDS = max(1.0, _env_float("GIT_COMMAND_TIMEOUT_SECONDS", 120))
+GIT_NETWORK_TIMEOUT_SECONDS = max(1.0, _env_float("GIT_NETWORK_TIMEOUT_SECONDS", 900))
+GIT_MAX_CONCURRENCY = max(1, int(_env_float("GIT_MAX_CONCURRENCY", 4)))
+
+_semaphore: asyncio.Semaphore | None = None
+
+
+class GitTimeoutError(GitError):
+    """Exception raised when a git command exceeds its timeout."""
+
+    def __init__(self, command: str, timeout: float):
+        self.command = command
+        self.timeout = timeout
+        super().__init__(f"Git command '{command}' timed out after {timeout:g}s")
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(GIT_MAX_CONCURRENCY)
+    return _semaphore
+
+
+async def _run_git_command(
+    command: list[str],
+    cwd: str | Path | None = None,
+    check: bool = True,
+    env: dict[str, str] | None = None,
+    timeout: float | None = None,
+) -> subprocess.CompletedProcess[str]:
+    """
+    Run a git command without blocking the event loop.
+
+    Args:
+        command: The git command to execute (without 'git' prefix)
+        cwd: Working directory for the command
+        check: If True, raise exception on non-zero exit code
+        env: Environment variables for the command
+        timeout: Seconds before the process is killed (default: local timeout)
+
+    Returns:
+        subprocess.CompletedProcess: The completed process (text output)
+
+    Raises:
+        GitCommandError: If the command fails and check=True
+        GitTimeoutError: If the command does not finish in time
+    """
+    full_command = ["git", *command]
+    merged_env = {**os.environ, **(env or {})}
+    # Ensure git never blocks on interactive prompts inside the executor.
+    merged_env["GIT_TERMINAL_PROMPT"] = "0"
+    limit = timeout if timeout is not None else GIT_COMMAND_TIMEOUT_SECONDS
+
+    async with _get_semaphore():
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *full_command,
+                cwd=cwd,
+                env=merged_env,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError:
+            raise GitError("Git is not installed or not in PATH") from None
+
+        try:
+            stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                process.communicate(), timeout=limit
+            )
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise GitTimeoutError(shlex.join(full_command), limit) from None
+        except asyncio.CancelledError:
+            process.kill()
+            await process.wait()
+            raise
+
+    stdout = stdout_bytes.decode("utf-8", errors="replace")
+    stderr = stderr_bytes.decode("utf-8", errors="replace").strip()
+    returncode = process.returncode if process.returncode is not None else -1
+
+    if returncode != 0 and _looks_like_not_a_repository(stderr):
+        raise GitNotRepositoryError(stderr or "Not a git repository")
+
+    if check and returncode != 0:
+        raise GitCommandError(
+            command=shlex.join(full_command),
+            returncode=returncode,
+            stderr=stderr or None,
+        )
+
+    return subprocess.CompletedProcess(full_command, returncode, stdout, stderr)
+
+
+async def is_repository(cwd: str | Path | None = None) -> bool:
+    """Check if the directory is a git repository."""
+    try:
+        await _run_git_command(["rev-parse", "--git-dir"], cwd=cwd, check=True)
+        return True
+    except (GitCommandError, GitError):
+        return False
+
+
+async def has_commits(cwd: str | Path | None = None) -> bool:
+    """Check whether the repository has at least one commit (i.e., HEAD exists)."""
+    try:
+        result = await _run_git_command(
+            ["rev-parse", "--verify", "HEAD"], cwd=cwd, check=False
+        )
+        return result.returncode == 0
+    except (GitNotRepositoryError, GitError):
+        return False
+
+
+async def get_git_dir(cwd: str | Path | None = None) -> Path:
+    """Get the resolved .git directory path."""
+    result = await _run_git_command(["rev-parse", "--git-dir"], cwd=cwd, check=True)
+    git_path = Path(result.stdout.strip())
+    if cwd and not git_path.is_absolute():
+        git_path = Path(cwd) / git_path
+    return git_path.resolve()
+
+
+async def init_repository(path: str | Path | None = None, bare: bool = False) -> Path:
+    """Initialize a new git repository."""
+    repo_path = Path(path) if path else Path.cwd()
+    if path:
+        repo_path.mkdir(parents=True, exist_ok=True)
+
+    args = ["init"]
+    if bare:
+        args.append("--bare")
+
+    await _run_git_command(args, cwd=repo_path, check=True)
+    return repo_path.resolve()
+
+
+async def get_current_branch(cwd: str | Path | None = None) -> str:
+    """Get the current branch name (or commit hash when HEAD is detached)."""
+    try:
+        result = await _run_git_command(
+            ["symbolic-ref", "--short", "HEAD"], cwd=cwd, check=True
+        )
+        branch = result.stdout.strip()
+        if branch:
+            return branch
+    except GitCommandError:
+        pass
+
+    result = await _run_git_command(
+        ["rev-parse", "--abbrev-ref", "HEAD"], cwd=cwd, check=True
+    )
+    branch = result.stdout.strip()
+
+    if branch == "HEAD":
+        try:
+            result = await _run_git_command(["rev-parse", "HEAD"], cwd=cwd, check=True)
+            branch = result.stdout.strip()
+        except GitCommandError:
+            return "HEAD"
+
+    return branch
+
+
+async def get_current_commit(cwd: str | Path | None = None) -> str:
+    """Get the hash of the current commit (HEAD)."""
+    result = await _run_git_command(["rev-parse", "HEAD"], cwd=cwd, check=True)
+    return result.stdout.strip()
+
+
+async def get_status(cwd: str | Path | None = None) -> GitStatus:
+    """Get the current git status."""
+    branch = await get_current_branch(cwd)
+    result = await _run_git_command(
+        ["status", "--porcelain=v1", "--untracked-files=all", "-z"],
+        cwd=cwd,
+        check=True,
+    )
+    staged, modified, untracked, deleted, renamed = _parse_status_porcelain_v1_z(
+        result.stdout
+    )
+    return GitStatus(
+        branch=branch,
+        staged=staged,
+        modified=modified,
+        untracked=untracked,
+        deleted=deleted,
+        renamed=renamed,
+    )
+
+
+async def get_numstat(
+    cwd: str | Path | None = None, cached: bool = False
+) -> dict[str, tuple[int, int]]:
+    """Get (added_lines, deleted_lines) per changed file."""
+    args = ["diff", "--numstat"]
+    if cached:
+        args.append("--cached")
+    result = await _run_git_command(args, cwd=cwd, check=True)
+    return _parse_numstat(result.stdout)
+
+
+async def diff_files(
+    files: list[str],
+    cached: bool = False,
+    cwd: str | Path | None = None,
+    batch_size: int = 200,
+) -> dict[str, str]:
+    """Diff many files with one `git diff` invocation per batch of paths."""
+    patches: dict[str, str] = {}
+    for start in range(0, len(files), max(1, batch_size)):
+        chunk = files[start : start + max(1, batch_size)]
+        args = [
+            "diff",
+            "--no-color",
+            "--no-ext-diff",
+            "--src-prefix=a/",
+            "--dst-prefix=b/",
+        ]
+        if cached:
+            args.append("--cached")
+        args.append("--")
+        args.extend(f":(top,literal){path}" for path in chunk)
+        result = await _run_git_command(args, cwd=cwd, check=False)
+        patches.update(split_diff_by_file(result.stdout))
+    return patches
+
+
+async def add_files(
+    files: str | list[str],
+    cwd: str | Path | None = None,
+    update: bool = False,
+    all_files: bool = False,
+) -> None:
+    """Stage files for commit."""
+    args = ["add"]
+    if update:
+        args.append("-u")
+    if all_files:
+        args.append("-A")
+    if isinstance(files, str):
+        args.append(files)
+    else:
+        args.extend(files)
+    await _run_git_command(args, cwd=cwd, check=True)
+
+
+async def commit(
+    message: str,
+    cwd: str | Path | None = None,
+    allow_empty: bool = False,
+    amend: bool = False,
+    no_verify: bool = False,
+    sign_off: bool = False,
+) -> str:
+    """Create a commit and return its hash."""
+    args = ["commit", "-m", message]
+    if allow_empty:
+        args.append("--allow-empty")
+    if amend:
+        args.append("--amend")
+    if no_verify:
+        args.append("--no-verify")
+    if sign_off:
+        args.append("--signoff")
+    await _run_git_command(args, cwd=cwd, check=True)
+    return await get_current_commit(cwd)
+
+
+async def tag_ref(
+    name: str,
+    ref: str | None = None,
+    cwd: str | Path | None = None,
+    force: bool = False,
+) -> None:
+    """Create (or update) a lightweight tag."""
+    args = ["tag"]
+    if force:
+        args.append("-f")
+    args.append(name)
+    if ref:
+        args.append(ref)
+    await _run_git_command(args, cwd=cwd, check=True)
+
+
+async def set_config(
+    key: str,
+    value: str,
+    cwd: str | Path | None = None,
+    global_config: bool = False,
+) -> None:
+    """Set a git configuration value."""
+    args = ["config", "--global" if global_config else "--local", key, value]
+    await _run_git_command(args, cwd=cwd, check=True)
+
+
+async def list_remotes(cwd: str | Path | None = None) -> list[GitRemote]:
+    """List remote repositories."""
+    result = await _run_git_command(["remote", "-v"], cwd=cwd, check=True)
+    return _parse_remotes(result.stdout)
+
+
+async def remote_url(name: str = "origin", cwd: str | Path | None = None) -> str:
+    """Get the URL of a remote repository."""
+    try:
+        result = await _run_git_command(
+            ["remote", "get-url", name], cwd=cwd, check=True
+        )
+        return result.stdout.strip()
+    except GitCommandError as e:
+        raise GitError(f"Remote '{name}' not found") from e
+
+
+async def checkout(
+    ref: str,
+    cwd: str | Path | None = None,
+    create_branch: bool = False,
+    force: bool = False,
+) -> str:
+    """Checkout a branch or commit."""
+    args = ["checkout"]
+    if create_branch:
+        args.append("-b")
+    if force:
+        args.append("-f")
+    args.append(ref)
+    await _run_git_command(args, cwd=cwd, check=True)
+    return ref
+
+
+async def fetch(
+    remote: str | None = None,
+    branch: str | None = None,
+    cwd: str | Path | None = None,
+    all_branches: bool = False,
+    prune: bool = False,
+    env: dict[str, str] | None = None,
+) -> None:
+    """Fetch from a remote repository."""
+    args = ["fetch"]
+    if all_branches:
+        args.append("--all")
+    if prune:
+        args.append("--prune")
+    if remote:
+        args.append(remote)
+        if branch:
+            args.append(branch)
+    await _run_git_command(
+        args, cwd=cwd, check=True, env=env, timeout=GIT_NETWORK_TIMEOUT_SECONDS
+    )
+
+
+async def clone(
+    url: str,
+    path: str | Path | None = None,
+    branch: str | None = None,
+    depth: int | None = None,
+    single_branch: bool = False,
+    bare: bool = False,
+    env: dict[str, str] | None = None,
+    filter_spec: str | None = None,
+) -> Path:
+    """Clone a repository and return its resolved path.
+
+    filter_spec enables a partial clone, e.g. "blob:none".
+    """
+    args = ["clone"]
+    if branch:
+        args.extend(["--branch", branch])
+    if depth:
+        args.extend(["--depth", str(depth)])
+    if filter_spec:
+        args.append(f"--filter={filter_spec}")
+    if single_branch:
+        args.append("--single-branch")
+    if bare:
+        args.append("--bare")
+    args.append(url)
+    if path:
+        args.append(str(path))
+
+    await _run_git_command(
+        args, check=True, env=env, timeout=GIT_NETWORK_TIMEOUT_SECONDS
+    )
+
+    repo_path = Path(path) if path else Path(url.split("/")[-1].replace(".git", ""))
+    return repo_path.resolve()
@@ -6,6 +6,7 @@ completely decoupled from the executor project.
 All functions require explicit cwd parameter.
 """
 
+import codecs
 import os
 import shlex
 import subprocess
@@ -669,6 +670,90 @@ def diff(
     return result.stdout
 
 
+def _unquote_diff_path(raw: str) -> str:
+    """Undo git's C-style quoting of a path in diff headers."""
+    if len(raw) >= 2 and raw.startswith('"') and raw.endswith('"'):
+        body = raw[1:-1].encode("latin-1", "backslashreplace")
+        return codecs.escape_decode(body)[0].decode("utf-8", "replace")
+    return raw
+
+
+def _diff_header_path(header: str) -> str | None:
+    """Extract the (new) path from a `diff --git a/<path> b/<path>` header."""
+    rest = header[len("diff --git ") :]
+    if rest.startswith('"'):
+        # Quoted paths: `"a/x" "b/x"` (either side may be quoted independently).
+        end = rest.find('" ', 1)
+        if end == -1:
+            return None
+        new = rest[end + 2 :]
+    else:
+        # Unquoted paths may contain spaces; both sides are equal for non-renames.
+        if not rest.startswith("a/"):
+            return None
+        half = (len(rest) - 1) // 2
+        new = rest[half + 1 :]
+        if rest[:half] != "a/" + new[2:]:
+            marker = rest.rfind(" b/")
+            if marker == -1:
+                return None
+            new = rest[marker + 1 :]
+    new = _unquote_diff_path(new)
+    return new[2:] if new.startswith("b/") else None
+
+
+def split_diff_by_file(output: str) -> dict[str, str]:
+    """
+    Split a multi-file `git diff` patch into per-file patches.
+
+    Args:
+        output: Raw `git diff` output
+
+    Returns:
+        dict: Mapping of repository-relative path to that file's patch text
+    """
+    patches: dict[str, str] = {}
+    current_path: str | None = None
+    current: list[str] = []
+
+    for line in output.splitlines(keepends=True):
+        if line.startswith("diff --git "):
+            if current_path is not None:
+                patches[current_path] = "".join(current)
+            current_path = _diff_header_path(line.rstrip("\n"))
+            current = [line]
+        elif current_path is not None:
+            current.append(line)
+
+    if current_path is not None:
+        patches[current_path] = "".join(current)
+    return patches
+
+
+def count_patch_lines(patch: str) -> tuple[int, int]:
+    """
+    Count added and deleted lines in a single-file patch (binary patches count 0).
+
+    Args:
+        patch: Patch text for one file
+
+    Returns:
+        tuple: (added_lines, deleted_lines)
+    """
+    added = deleted = 0
+    in_hunk = False
+    for line in patch.splitlines():
+        if line.startswith("@@"):
+            in_hunk = True
+        elif not in_hunk:
+            continue
+        elif line.startswith("+"):
+            added += 1
+        elif line.startswith("-"):
+            deleted += 1
+    return added, deleted
+
+
 def get_numstat(
     cwd: str | Path | None = None, cached: bool = False
 ) -> dict[str, tuple[int, int]]:
@@ -690,9 +775,12 @@ def get_numstat(
         args.append("--cached")
 
     result = _run_git_command(args, cwd=cwd, check=True)
+    return _parse_numstat(result.stdout)
 
+
+def _parse_numstat(output: str) -> dict[str, tuple[int, int]]:
     numstat = {}
-    for line in result.stdout.strip().split("\n"):
+    for line in output.strip().split("\n"):
         if not line:
             continue
         parts = line.split("\t")
@@ -906,10 +994,13 @@ def list_remotes(cwd: str | Path | None = None) -> list[GitRemote]:
         GitNotRepositoryError: If not a git repository
     """
     result = _run_git_command(["remote", "-v"], cwd=cwd, check=True)
+    return _parse_remotes(result.stdout)
+
 
+def _parse_remotes(output: str) -> list[GitRemote]:
     remotes: dict[str, GitRemote] = {}
 
-    for line in result.stdout.splitlines():
+    for line in output.splitlines():
         parts = line.split()
         if len(parts) >= 3:
             name = parts[0]
@@ -4,11 +4,13 @@ from app.api.v1 import (
     callback,
     computer,
     executor,
+    runs,
     schedules,
     tasks,
     user_input_requests,
     workspace,
 )
+from app.core.http_client import get_http_pool_stats
 from app.core.settings import get_settings
 from app.schemas.response import Response
 from app.scheduler.scheduler_config import scheduler
@@ -17,6 +19,7 @@ api_v1_router = APIRouter()
 
 api_v1_router.include_router(tasks.router)
 api_v1_router.include_router(schedules.router)
+api_v1_router.include_router(runs.router)
 api_v1_router.include_router(callback.router)
 api_v1_router.include_router(computer.router)
 api_v1_router.include_router(executor.router)
@@ -46,5 +49,6 @@ async def health():
             "service": settings.app_name,
             "status": "healthy",
             "scheduler_running": scheduler.running,
+            "http_pool": get_http_pool_stats(),
         }
     )
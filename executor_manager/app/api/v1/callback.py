@@ -3,7 +3,13 @@ import logging
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 
-from app.schemas.callback import AgentCallbackRequest, CallbackReceiveResponse
+from app.core.observability.metrics import CALLBACKS_FORWARDED
+from app.schemas.callback import (
+    AgentCallbackBatchRequest,
+    AgentCallbackRequest,
+    CallbackBatchReceiveResponse,
+    CallbackReceiveResponse,
+)
 from app.schemas.response import Response, ResponseSchema
 from app.services.callback_service import CallbackService
 
@@ -17,4 +23,14 @@ callback_service = CallbackService()
 async def receive_callback(callback: AgentCallbackRequest) -> JSONResponse:
     """Receive callback from Executor and forward to Backend."""
     result = await callback_service.process_callback(callback)
+    CALLBACKS_FORWARDED.labels(status=callback.status.value).inc()
     return Response.success(data=result.model_dump(), message="Callback received")
+
+
+@router.post("/batch", response_model=ResponseSchema[CallbackBatchReceiveResponse])
+async def receive_callback_batch(batch: AgentCallbackBatchRequest) -> JSONResponse:
+    """Receive coalesced callbacks from Executor and forward them to Backend."""
+    result = await callback_service.process_callback_batch(batch)
+    for callback in batch.callbacks:
+        CALLBACKS_FORWARDED.labels(status=callback.status.value).inc()
+    return Response.success(data=result.model_dump(), message="Callbacks received")
@@ -0,0 +1,83 @@
+import logging
+from datetime import timezone
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.schemas.response import Response, ResponseSchema
+from app.schemas.run import RunWakeRequest
+from app.scheduler.pull_schedule_state import get_current_pull_service
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/runs", tags=["runs"])
+
+
+@router.post("/wake", response_model=ResponseSchema[dict])
+async def wake_run_pull(request: RunWakeRequest) -> JSONResponse:
+    """Poll the run queue now instead of waiting for the next pull job.
+
+    Args:
+        request: Queues that got claimable runs
+
+    Returns:
+        Success response with the number of polls started or scheduled
+    """
+    pull_service = get_current_pull_service()
+    if pull_service is None:
+        return Response.success(data={"woken": 0}, message="Run pulling disabled")
+
+    wakeups = [
+        (
+            w.schedule_mode,
+            (
+                w.run_at.replace(tzinfo=timezone.utc)
+                if w.run_at and w.run_at.tzinfo is None
+                else w.run_at
+            ),
+        )
+        for w in request.wakeups
+    ] or [(None, None)]
+    woken = pull_service.wake(wakeups)
+    return Response.success(data={"woken": woken}, message="Run pull woken")
+
+
+@router.get("/stats", response_model=ResponseSchema[dict])
+async def get_run_stats() -> JSONResponse:
+    """Fair-share stats: backend queue depth/wait and this manager's claims per user."""
+    pull_service = get_current_pull_service()
+    if pull_service is None:
+        return Response.success(
+            data={"fair_share": {}, "users": []}, message="Run pulling disabled"
+        )
+
+    local = pull_service.user_stats()
+    try:
+        queue = await pull_service.backend_client.get_run_queue_stats()
+    except Exception as e:
+        logger.warning(f"Failed to fetch run queue stats from backend: {e}")
+        queue = []
+
+    users: dict[str, dict] = {}
+    for item in queue:
+        user_id = str(item.get("user_id") or "")
+        if user_id:
+            users[user_id] = {
+                "user_id": user_id,
+                "queued": item.get("queued", 0),
+                "due": item.get("due", 0),
+                "active": item.get("active", 0),
+                "oldest_wait_seconds": item.get("oldest_wait_seconds"),
+            }
+    for user_id, stats in local.items():
+        users.setdefault(user_id, {"user_id": user_id}).update(stats)
+
+    return Response.success(
+        data={
+            "fair_share": pull_service.fair_share,
+            "users": sorted(
+                users.values(), key=lambda u: (-(u.get("due") or 0), u["user_id"])
+            ),
+        },
+        message="Run stats retrieved",
+    )
@@ -1,3 +1,6 @@
+import asyncio
+import hashlib
+
 from fastapi import APIRouter, Query
 from fastapi.responses import FileResponse
 from fastapi.responses import JSONResponse
@@ -5,7 +8,7 @@ from fastapi.responses import JSONResponse
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
 from app.schemas.response import Response, ResponseSchema
-from app.schemas.workspace import FileNode
+from app.schemas.workspace import FileNode, WorkspaceFileDiffResponse
 from app.services.workspace_manager import WorkspaceManager
 
 router = APIRouter(prefix="/workspace", tags=["workspace"])
@@ -100,3 +103,37 @@ async def get_workspace_file(
         filename=file_path.name,
         content_disposition_type="inline",
     )
+
+
+@router.get(
+    "/diff/{user_id}/{session_id}",
+    response_model=ResponseSchema[WorkspaceFileDiffResponse],
+)
+async def get_workspace_file_diff(
+    user_id: str,
+    session_id: str,
+    path: str = Query(..., description="File path within the workspace"),
+    run_id: str | None = Query(default=None),
+    cached: bool = Query(default=False, description="Staged (index vs HEAD) diff"),
+) -> JSONResponse:
+    """Return the full diff of one file (state patches only carry a bounded preview)."""
+    diff = await asyncio.to_thread(
+        workspace_manager.get_file_diff,
+        user_id,
+        session_id,
+        path,
+        run_id=run_id,
+        cached=cached,
+    )
+    if diff is None:
+        raise AppException(error_code=ErrorCode.WORKSPACE_NOT_FOUND)
+
+    encoded = diff.encode("utf-8")
+    return Response.success(
+        data=WorkspaceFileDiffResponse(
+            path=path,
+            diff=diff,
+            diff_hash=hashlib.sha256(encoded).hexdigest() if diff else None,
+            diff_size=len(encoded),
+        )
+    )
@@ -32,6 +32,7 @@ class ErrorCode(Enum):
         22004,
         "Cannot delete persistent workspace without force flag",
     )
+    WORKSPACE_DIFF_FAILED = (22005, "Failed to compute workspace diff")
 
     CONTAINER_START_FAILED = (31001, "Failed to start container")
     CONTAINER_NOT_FOUND = (31002, "Container not found")
@@ -0,0 +1,114 @@
+import importlib.util
+import logging
+
+import httpx
+
+from app.core.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class _InstrumentedTransport(httpx.AsyncHTTPTransport):
+    """Connection-pooling transport that keeps simple request counters."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.requests_total = 0
+        self.requests_in_flight = 0
+        self.request_errors_total = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests_total += 1
+        self.requests_in_flight += 1
+        try:
+            return await super().handle_async_request(request)
+        except Exception:
+            self.request_errors_total += 1
+            raise
+        finally:
+            self.requests_in_flight -= 1
+
+    def stats(self) -> dict:
+        connections = idle = http2 = 0
+        # httpcore does not expose pool stats publicly; inspect the pool best-effort.
+        for connection in list(getattr(self._pool, "connections", None) or []):
+            connections += 1
+            try:
+                if connection.is_idle():
+                    idle += 1
+                if "HTTP/2" in repr(connection):
+                    http2 += 1
+            except Exception:
+                continue
+        return {
+            "requests_total": self.requests_total,
+            "requests_in_flight": self.requests_in_flight,
+            "request_errors_total": self.request_errors_total,
+            "connections": connections,
+            "connections_idle": idle,
+            "connections_http2": http2,
+        }
+
+
+_client: httpx.AsyncClient | None = None
+_transport: _InstrumentedTransport | None = None
+
+
+def _http2_enabled(requested: bool) -> bool:
+    if not requested:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning(
+            "HTTP_CLIENT_HTTP2 is enabled but the 'h2' package is not installed; "
+            "falling back to HTTP/1.1"
+        )
+        return False
+    return True
+
+
+def start_http_client() -> httpx.AsyncClient:
+    """Create the shared HTTP client (called from lifespan)."""
+    global _client, _transport
+    if _client is not None and not _client.is_closed:
+        return _client
+
+    settings = get_settings()
+    _transport = _InstrumentedTransport(
+        limits=httpx.Limits(
+            max_connections=settings.http_client_max_connections,
+            max_keepalive_connections=settings.http_client_max_keepalive_connections,
+            keepalive_expiry=settings.http_client_keepalive_expiry_seconds,
+        ),
+        http2=_http2_enabled(settings.http_client_http2),
+    )
+    _client = httpx.AsyncClient(
+        transport=_transport,
+        timeout=httpx.Timeout(settings.http_client_timeout_seconds),
+    )
+    return _client
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared keep-alive HTTP client used for inter-service calls.
+
+    Created in lifespan; code paths running outside the app lifespan (scripts,
+    one-off jobs) get it lazily.
+    """
+    return start_http_client()
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and release pooled connections."""
+    global _client, _transport
+    client = _client
+    _client = None
+    _transport = None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def get_http_pool_stats() -> dict:
+    """Snapshot of the shared client's connection pool and request counters."""
+    if _client is None or _client.is_closed or _transport is None:
+        return {"open": False}
+    return {"open": True, **_transport.stats()}
@@ -3,6 +3,7 @@ from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 
+from app.core.http_client import close_http_client, start_http_client
 from app.core.settings import get_settings
 from app.scheduler.scheduler_config import scheduler
 
@@ -13,10 +14,31 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     settings = get_settings()
 
+    start_http_client()
+
     logger.info("Starting APScheduler...")
     scheduler.start()
     logger.info("APScheduler started")
 
+    container_pool = None
+    if settings.container_warm_pool_enabled:
+        from app.scheduler.task_dispatcher import TaskDispatcher
+
+        logger.info("Starting warm container pool...")
+        container_pool = TaskDispatcher.get_container_pool()
+        await container_pool.start_warm_pool()
+        replenish_interval = max(
+            5, int(settings.container_warm_pool_replenish_interval_seconds)
+        )
+        scheduler.add_job(
+            container_pool.replenish_warm_pool,
+            trigger="interval",
+            seconds=replenish_interval,
+            id="replenish-warm-containers",
+            replace_existing=True,
+        )
+        logger.info("Warm container pool started")
+
     pull_service = None
     pull_job_ids: list[str] = []
     if settings.task_pull_enabled:
@@ -37,6 +59,14 @@ async def lifespan(app: FastAPI):
             schedule_config = default_pull_schedule_config_from_settings(settings)
 
         pull_job_ids = register_pull_jobs(scheduler, pull_service, schedule_config)
+        scheduler.add_job(
+            pull_service.release_expired_claims,
+            trigger="interval",
+            seconds=max(5, int(settings.run_lease_reap_interval_seconds)),
+            id="release-expired-run-claims",
+            replace_existing=True,
+        )
+        pull_job_ids.append("release-expired-run-claims")
         logger.info(f"Run pull service started (jobs={pull_job_ids})")
 
     if settings.workspace_cleanup_enabled:
@@ -77,6 +107,16 @@ async def lifespan(app: FastAPI):
         await pull_service.shutdown()
         logger.info("Run pull service stopped")
 
+    if container_pool:
+        logger.info("Stopping warm container pool...")
+        with suppress(Exception):
+            scheduler.remove_job("replenish-warm-containers")
+        await container_pool.shutdown_warm_pool()
+        logger.info("Warm container pool stopped")
+
     logger.info("Shutting down APScheduler...")
     scheduler.shutdown()
     logger.info("APScheduler shut down")
+
+    await close_http_client()
+    logger.info("Shared HTTP client closed")
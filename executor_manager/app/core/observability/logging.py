@@ -7,6 +7,7 @@ from logging.handlers import TimedRotatingFileHandler
 from pathlib import Path
 from typing import Any
 
+from app.core.observability.metrics import TimingMetricsHandler
 from app.core.observability.request_context import get_request_id, get_trace_id
 
 _installed_record_factory = False
@@ -206,6 +207,8 @@ def configure_logging(
     root = logging.getLogger()
     root.handlers.clear()
     root.addHandler(handler)
+    # Feeds `timing` lines into the /metrics step histograms.
+    root.addHandler(TimingMetricsHandler())
     root.setLevel(level)
 
     file_handler = _build_file_handler(service_name=service_name, formatter=formatter)
@@ -0,0 +1,157 @@
+import logging
+import time
+from collections.abc import Iterable
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    Counter,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+from starlette.requests import Request
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+
+# 5 ms .. 5 min: timed steps range from single queries to container starts.
+DURATION_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+
+TIMING_STEP_SECONDS = Histogram(
+    "poco_timing_step_seconds",
+    "Duration of timed steps, fed by `timing` log lines.",
+    ["step"],
+    buckets=DURATION_BUCKETS,
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "poco_http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route", "status"],
+    buckets=DURATION_BUCKETS,
+)
+CALLBACKS_FORWARDED = Counter(
+    "poco_callbacks_forwarded_total",
+    "Executor callbacks received and forwarded to Backend, by callback status.",
+    ["status"],
+)
+RUN_CLAIM_SECONDS = Histogram(
+    "poco_run_claim_seconds",
+    "Latency of run claim round trips to Backend.",
+    buckets=DURATION_BUCKETS,
+)
+RUNS_CLAIMED = Counter(
+    "poco_runs_claimed_total",
+    "Runs claimed from Backend, by schedule mode.",
+    ["schedule_mode"],
+)
+
+
+class TimingMetricsHandler(logging.Handler):
+    """Turns INFO+ `timing` log records (step + duration_ms) into histogram samples.
+
+    Per-message steps log at DEBUG to keep INFO volume down; their call sites
+    call observe_timing_step directly, so DEBUG records are skipped here.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.msg != "timing" or record.levelno < logging.INFO:
+            return
+        step = getattr(record, "step", None)
+        duration_ms = getattr(record, "duration_ms", None)
+        if isinstance(step, str) and isinstance(duration_ms, int | float):
+            observe_timing_step(step, duration_ms)
+
+
+def observe_timing_step(step: str, duration_ms: float) -> None:
+    TIMING_STEP_SECONDS.labels(step=step).observe(duration_ms / 1000)
+
+
+def observe_http_request(request: Request, status: int, seconds: float) -> None:
+    # Route templates keep label cardinality bounded (no ids in paths).
+    route = getattr(request.scope.get("route"), "path", None) or "unmatched"
+    HTTP_REQUEST_SECONDS.labels(
+        method=request.method, route=route, status=str(status)
+    ).observe(seconds)
+
+
+def observe_run_claim(started: float, claims: Iterable[dict]) -> None:
+    RUN_CLAIM_SECONDS.observe(time.perf_counter() - started)
+    for claim in claims:
+        schedule_mode = (claim.get("run") or {}).get("schedule_mode") or "unknown"
+        RUNS_CLAIMED.labels(schedule_mode=str(schedule_mode)).inc()
+
+
+class _ExecutorManagerCollector(Collector):
+    """Container pool and run dispatch gauges, read at scrape time."""
+
+    def describe(self) -> list[Metric]:
+        return []
+
+    def collect(self) -> Iterable[Metric]:
+        # Imported here: these modules import the services that log through the
+        # handler above.
+        from app.scheduler.pull_schedule_state import get_current_pull_service
+        from app.scheduler.task_dispatcher import TaskDispatcher
+
+        # Never create the pool (and its Docker client) just to report on it.
+        container_pool = TaskDispatcher.container_pool
+        if container_pool is not None:
+            stats = container_pool.get_container_stats()
+            containers = GaugeMetricFamily(
+                "poco_containers",
+                "Active executor containers by mode.",
+                labels=["mode"],
+            )
+            containers.add_metric(["persistent"], stats["persistent_containers"])
+            containers.add_metric(["ephemeral"], stats["ephemeral_containers"])
+            yield containers
+
+            warm = GaugeMetricFamily(
+                "poco_warm_pool_containers",
+                "Warm pool containers by variant and state.",
+                labels=["variant", "state"],
+            )
+            for variant, pool in stats["warm_pool"].items():
+                warm.add_metric([variant, "idle"], pool["idle"])
+                warm.add_metric([variant, "booting"], pool["booting"])
+            yield warm
+
+        pull_service = get_current_pull_service()
+        if pull_service is not None:
+            dispatch = pull_service.dispatch_stats()
+            yield GaugeMetricFamily(
+                "poco_run_dispatch_inflight",
+                "Claimed runs being dispatched to executors.",
+                value=dispatch["inflight"],
+            )
+            yield GaugeMetricFamily(
+                "poco_run_dispatch_capacity",
+                "Maximum concurrent run dispatches.",
+                value=dispatch["capacity"],
+            )
+
+
+REGISTRY.register(_ExecutorManagerCollector())
+
+
+async def metrics_endpoint() -> Response:
+    """Prometheus scrape endpoint."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -20,6 +21,23 @@ class Settings(BaseSettings):
     executor_url: str = Field(default="http://localhost:8080")
     callback_base_url: str = Field(default="http://localhost:8001")
 
+    # Shared keep-alive HTTP client for calls to Backend and executors (created in
+    # lifespan). HTTP/2 requires the optional `h2` package and is only negotiated
+    # over TLS; plain http:// endpoints keep using pooled HTTP/1.1 connections.
+    http_client_timeout_seconds: float = Field(
+        default=5.0, alias="HTTP_CLIENT_TIMEOUT_SECONDS"
+    )
+    http_client_max_connections: int = Field(
+        default=100, alias="HTTP_CLIENT_MAX_CONNECTIONS"
+    )
+    http_client_max_keepalive_connections: int = Field(
+        default=20, alias="HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS"
+    )
+    http_client_keepalive_expiry_seconds: float = Field(
+        default=30.0, alias="HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS"
+    )
+    http_client_http2: bool = Field(default=False, alias="HTTP_CLIENT_HTTP2")
+
     # Scheduler configuration
     max_concurrent_tasks: int = Field(default=5)
     task_timeout_seconds: int = Field(default=3600)
@@ -38,6 +56,32 @@ class Settings(BaseSettings):
     # include staging skills/attachments + spawning the executor container, which may take
     # longer than 30s on slow networks or large repos.
     task_claim_lease_seconds: int = Field(default=180, alias="TASK_CLAIM_LEASE_SECONDS")
+    # Runs claimed per backend round trip (bounded by free dispatch slots).
+    task_claim_batch_size: int = Field(default=8, alias="TASK_CLAIM_BATCH_SIZE")
+    # Periodic job returning runs with expired claim leases to the queue.
+    run_lease_reap_interval_seconds: int = Field(
+        default=15, alias="RUN_LEASE_REAP_INTERVAL_SECONDS"
+    )
+    # Backend wakes the manager when runs become claimable (POST /api/v1/runs/wake).
+    # Pull jobs then only run as a safety net, at least this many seconds apart.
+    task_pull_wakeup_enabled: bool = Field(
+        default=True, alias="TASK_PULL_WAKEUP_ENABLED"
+    )
+    task_pull_fallback_interval_seconds: int = Field(
+        default=30, alias="TASK_PULL_FALLBACK_INTERVAL_SECONDS"
+    )
+    # Fair-share claiming, enforced by the backend across all managers: caps on
+    # claimed/running runs per user and per schedule mode (0 = no cap), and
+    # round-robin weights per user_id (unlisted users weigh 1). JSON objects.
+    task_max_active_runs_per_user: int = Field(
+        default=0, alias="TASK_MAX_ACTIVE_RUNS_PER_USER"
+    )
+    task_max_active_runs_per_mode: dict[str, int] = Field(
+        default_factory=dict, alias="TASK_MAX_ACTIVE_RUNS_PER_MODE"
+    )
+    task_user_weights: dict[str, float] = Field(
+        default_factory=dict, alias="TASK_USER_WEIGHTS"
+    )
 
     # Optional schedule config file (TOML/JSON). When provided, it becomes the source of truth.
     schedule_config_path: str | None = Field(default=None, alias="SCHEDULE_CONFIG_PATH")
@@ -93,6 +137,46 @@ class Settings(BaseSettings):
         default="claude-sonnet-4-20250514", alias="DEFAULT_MODEL"
     )
     max_executor_containers: int = Field(default=10, alias="MAX_EXECUTOR_CONTAINERS")
+    # docker-py is blocking; Docker API calls run on a bounded worker pool of this size so
+    # concurrent dispatches overlap without stalling the event loop.
+    docker_max_workers: int = Field(default=16, alias="DOCKER_MAX_WORKERS")
+    # Poll interval for container "running" and executor /health readiness probes.
+    container_ready_poll_interval_seconds: float = Field(
+        default=0.25, alias="CONTAINER_READY_POLL_INTERVAL_SECONDS"
+    )
+    # Warm pool: pre-started, health-checked executor containers that new sessions claim
+    # instead of paying the container boot + executor startup on the dispatch path.
+    # Sizes are per image variant (plain EXECUTOR_IMAGE vs EXECUTOR_BROWSER_IMAGE).
+    container_warm_pool_enabled: bool = Field(
+        default=False, alias="CONTAINER_WARM_POOL_ENABLED"
+    )
+    container_warm_pool_min_size: int = Field(
+        default=1, alias="CONTAINER_WARM_POOL_MIN_SIZE"
+    )
+    container_warm_pool_max_size: int = Field(
+        default=3, alias="CONTAINER_WARM_POOL_MAX_SIZE"
+    )
+    container_warm_pool_browser_min_size: int = Field(
+        default=0, alias="CONTAINER_WARM_POOL_BROWSER_MIN_SIZE"
+    )
+    container_warm_pool_browser_max_size: int = Field(
+        default=1, alias="CONTAINER_WARM_POOL_BROWSER_MAX_SIZE"
+    )
+    container_warm_pool_replenish_interval_seconds: int = Field(
+        default=15, alias="CONTAINER_WARM_POOL_REPLENISH_INTERVAL_SECONDS"
+    )
+    # Executor callback batching: RUNNING callbacks are coalesced within this window and
+    # sent with state deltas to /api/v1/callback/batch (passed to executor containers).
+    executor_callback_batch_enabled: bool = Field(
+        default=True, alias="EXECUTOR_CALLBACK_BATCH_ENABLED"
+    )
+    executor_callback_batch_window_ms: int = Field(
+        default=200, alias="EXECUTOR_CALLBACK_BATCH_WINDOW_MS"
+    )
+    # OTLP/HTTP collector for executor spans; empty leaves tracing off in executors.
+    executor_otlp_endpoint: str = Field(
+        default="", alias="EXECUTOR_OTEL_EXPORTER_OTLP_ENDPOINT"
+    )
     executor_image: str = Field(
         default="ghcr.io/poco-ai/poco-executor:lite", alias="EXECUTOR_IMAGE"
     )
@@ -129,6 +213,15 @@ class Settings(BaseSettings):
     workspace_ignore_dot_files: bool = Field(
         default=True, alias="WORKSPACE_IGNORE_DOT_FILES"
     )
+    # Workspace export to S3: files upload on a bounded pool and unchanged files (same
+    # sha256 as the previous manifest) are skipped; the archive is streamed via
+    # multipart upload in parts of this size.
+    workspace_export_max_workers: int = Field(
+        default=8, alias="WORKSPACE_EXPORT_MAX_WORKERS"
+    )
+    workspace_export_archive_part_size_mb: int = Field(
+        default=8, alias="WORKSPACE_EXPORT_ARCHIVE_PART_SIZE_MB"
+    )
     s3_endpoint: str | None = Field(default=None, alias="S3_ENDPOINT")
     s3_access_key: str | None = Field(default=None, alias="S3_ACCESS_KEY")
     s3_secret_key: str | None = Field(default=None, alias="S3_SECRET_KEY")
@@ -141,6 +234,44 @@ class Settings(BaseSettings):
     s3_read_timeout_seconds: int = Field(default=60, alias="S3_READ_TIMEOUT_SECONDS")
     s3_max_attempts: int = Field(default=3, alias="S3_MAX_ATTEMPTS")
 
+    # Host-level, content-addressed cache for staged skills/plugins (keyed by S3 key +
+    # ETag/version). Defaults to <WORKSPACE_ROOT>/cache/staging so staged directories can
+    # be materialized as reflinks where supported (same filesystem as the workspaces).
+    staging_cache_enabled: bool = Field(default=True, alias="STAGING_CACHE_ENABLED")
+    staging_cache_dir: str | None = Field(default=None, alias="STAGING_CACHE_DIR")
+    staging_cache_max_bytes: int = Field(
+        default=2 * 1024**3, alias="STAGING_CACHE_MAX_BYTES"
+    )
+    staging_download_max_workers: int = Field(
+        default=8, alias="STAGING_DOWNLOAD_MAX_WORKERS"
+    )
+
+    # Per-user cache of resolved execution config bundles, validated against the
+    # backend's config change counter before every reuse.
+    config_cache_enabled: bool = Field(default=True, alias="CONFIG_CACHE_ENABLED")
+    config_cache_max_entries: int = Field(default=512, alias="CONFIG_CACHE_MAX_ENTRIES")
+
+    # Host-shared bare mirrors of task repositories (keyed by repo URL, refreshed by
+    # fetch). Session repos are seeded with a local clone (hardlinked objects), so
+    # executors only fetch what changed since the last refresh.
+    git_mirror_cache_enabled: bool = Field(
+        default=True, alias="GIT_MIRROR_CACHE_ENABLED"
+    )
+    git_mirror_cache_dir: str | None = Field(default=None, alias="GIT_MIRROR_CACHE_DIR")
+    git_mirror_cache_max_bytes: int = Field(
+        default=20 * 1024**3, alias="GIT_MIRROR_CACHE_MAX_BYTES"
+    )
+    git_mirror_refresh_seconds: int = Field(
+        default=60, alias="GIT_MIRROR_REFRESH_SECONDS"
+    )
+    git_mirror_timeout_seconds: int = Field(
+        default=1800, alias="GIT_MIRROR_TIMEOUT_SECONDS"
+    )
+    # Executor clone mode: full | blobless (--filter=blob:none) | shallow (--depth 1).
+    git_clone_mode: Literal["full", "blobless", "shallow"] = Field(
+        default="full", alias="GIT_CLONE_MODE"
+    )
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -7,6 +7,7 @@ from app.core.errors.exception_handlers import setup_exception_handlers
 from app.core.lifespan import lifespan
 from app.core.middleware import setup_middleware
 from app.core.observability.logging import configure_logging
+from app.core.observability.tracing import configure_tracing
 from app.core.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -20,6 +21,7 @@ def create_app() -> FastAPI:
         service_name="executor_manager",
         access_log=settings.uvicorn_access_log,
     )
+    configure_tracing(service_name="executor_manager")
 
     app = FastAPI(
         title=settings.app_name,
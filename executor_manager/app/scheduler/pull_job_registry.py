@@ -3,12 +3,16 @@ from datetime import datetime, timezone
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
+from app.core.settings import get_settings
 from app.scheduler.pull_schedule_config import (
     IntervalPullRule,
     PullScheduleConfig,
     WindowPullRule,
 )
-from app.scheduler.pull_schedule_state import set_current_pull_schedule_config
+from app.scheduler.pull_schedule_state import (
+    set_current_pull_schedule_config,
+    set_current_pull_service,
+)
 from app.services.run_pull_service import RunPullService
 
 
@@ -23,6 +27,7 @@ def register_pull_jobs(
         A list of APScheduler job IDs registered by this call.
     """
     set_current_pull_schedule_config(config)
+    set_current_pull_service(pull_service)
 
     job_ids: list[str] = []
 
@@ -30,6 +35,13 @@ def register_pull_jobs(
         return job_ids
 
     now_utc = datetime.now(timezone.utc)
+    settings = get_settings()
+    # With backend wake-ups, interval polling is only a fallback for lost signals.
+    min_seconds = (
+        max(1, int(settings.task_pull_fallback_interval_seconds))
+        if settings.task_pull_wakeup_enabled
+        else 1
+    )
 
     for rule in config.rules:
         if not rule.enabled:
@@ -40,7 +52,7 @@ def register_pull_jobs(
             scheduler.add_job(
                 pull_service.poll,
                 trigger="interval",
-                seconds=max(1, int(rule.seconds)),
+                seconds=max(min_seconds, int(rule.seconds)),
                 id=job_id,
                 replace_existing=True,
                 kwargs={"schedule_modes": rule.schedule_modes},
@@ -74,7 +86,7 @@ def register_pull_jobs(
             scheduler.add_job(
                 pull_service.poll_window,
                 trigger="interval",
-                seconds=max(1, int(rule.poll_interval_seconds)),
+                seconds=max(min_seconds, int(rule.poll_interval_seconds)),
                 id=poll_job_id,
                 replace_existing=True,
                 next_run_time=now_utc,
@@ -89,6 +101,7 @@ def register_pull_jobs(
 
 
 def unregister_pull_jobs(scheduler: AsyncIOScheduler, job_ids: list[str]) -> None:
+    set_current_pull_service(None)
     for job_id in job_ids:
         try:
             scheduler.remove_job(job_id)
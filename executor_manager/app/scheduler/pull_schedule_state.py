@@ -1,6 +1,12 @@
+from typing import TYPE_CHECKING
+
 from app.scheduler.pull_schedule_config import PullScheduleConfig
 
+if TYPE_CHECKING:
+    from app.services.run_pull_service import RunPullService
+
 _CURRENT_CONFIG: PullScheduleConfig | None = None
+_CURRENT_PULL_SERVICE: "RunPullService | None" = None
 
 
 def set_current_pull_schedule_config(config: PullScheduleConfig | None) -> None:
@@ -10,3 +16,12 @@ def set_current_pull_schedule_config(config: PullScheduleConfig | None) -> None:
 
 def get_current_pull_schedule_config() -> PullScheduleConfig | None:
     return _CURRENT_CONFIG
+
+
+def set_current_pull_service(service: "RunPullService | None") -> None:
+    global _CURRENT_PULL_SERVICE
+    _CURRENT_PULL_SERVICE = service
+
+
+def get_current_pull_service() -> "RunPullService | None":
+    return _CURRENT_PULL_SERVICE
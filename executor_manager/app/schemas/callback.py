@@ -1,6 +1,8 @@
 from datetime import datetime, timezone
 from enum import Enum
 
+from typing import Any
+
 from pydantic import BaseModel, Field
 
 
@@ -37,6 +39,9 @@ class FileChange(BaseModel):
     added_lines: int = 0
     deleted_lines: int = 0
     diff: str | None = None
+    diff_truncated: bool = False
+    diff_hash: str | None = None  # sha256 of the full patch
+    diff_size: int = 0  # full patch size in bytes
     old_path: str | None = None
 
 
@@ -84,6 +89,19 @@ class AgentCallbackRequest(BaseModel):
     workspace_export_status: str | None = None
 
 
+class AgentCallbackBatchRequest(BaseModel):
+    """Coalesced executor callbacks.
+
+    `callbacks` are in emission order; `state_delta` holds only the top-level
+    AgentCurrentState fields that changed since the previous acknowledged batch.
+    """
+
+    session_id: str
+    seq: int
+    callbacks: list[AgentCallbackRequest] = Field(default_factory=list)
+    state_delta: dict[str, Any] | None = None
+
+
 class CallbackReceiveResponse(BaseModel):
     """Callback receive response."""
 
@@ -91,3 +109,12 @@ class CallbackReceiveResponse(BaseModel):
     session_id: str
     callback_status: CallbackStatus
     progress: int
+
+
+class CallbackBatchReceiveResponse(BaseModel):
+    """Callback batch receive response."""
+
+    status: str  # "received"
+    session_id: str
+    seq: int
+    received: int
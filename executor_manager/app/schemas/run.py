@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class RunWakeup(BaseModel):
+    """A queue that got claimable runs."""
+
+    # None wakes every queue the pull schedule currently polls.
+    schedule_mode: str | None = None
+    # When the run becomes claimable; None or past means now.
+    run_at: datetime | None = None
+
+
+class RunWakeRequest(BaseModel):
+    """Wake-ups sent by Backend after commits that make runs claimable."""
+
+    wakeups: list[RunWakeup] = Field(default_factory=list)
@@ -12,6 +12,13 @@ class FileNode(BaseModel):
     mimeType: str | None = None
 
 
+class WorkspaceFileDiffResponse(BaseModel):
+    path: str
+    diff: str
+    diff_hash: str | None = None
+    diff_size: int = 0
+
+
 class WorkspaceExportResult(BaseModel):
     workspace_files_prefix: str | None = None
     workspace_manifest_key: str | None = None
@@ -1,5 +1,4 @@
-import httpx
-
+from app.core.http_client import get_http_client
 from app.core.settings import get_settings
 from app.core.observability.request_context import (
     generate_request_id,
@@ -7,6 +6,7 @@ from app.core.observability.request_context import (
     get_request_id,
     get_trace_id,
 )
+from app.core.observability.tracing import TRACEPARENT_HEADER, current_traceparent
 
 
 class BackendClient:
@@ -19,42 +19,56 @@ class BackendClient:
     @staticmethod
     def _trace_headers() -> dict[str, str]:
         # When called from an HTTP request handler, these come from middleware context.
-        return {
+        headers = {
             "X-Request-ID": get_request_id() or generate_request_id(),
             "X-Trace-ID": get_trace_id() or generate_trace_id(),
         }
+        traceparent = current_traceparent()
+        if traceparent:
+            headers[TRACEPARENT_HEADER] = traceparent
+        return headers
 
     async def create_session(self, user_id: str, config: dict) -> dict:
         """Create a session, returns session info dict with session_id and sdk_session_id."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/sessions",
-                json={"user_id": user_id, "config": config},
-                headers=self._trace_headers(),
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["data"]
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/sessions",
+            json={"user_id": user_id, "config": config},
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["data"]
 
     async def update_session_status(self, session_id: str, status: str) -> None:
         """Update session status."""
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(
-                f"{self.base_url}/api/v1/sessions/{session_id}",
-                json={"status": status},
-                headers=self._trace_headers(),
-            )
-            response.raise_for_status()
+        client = get_http_client()
+        response = await client.patch(
+            f"{self.base_url}/api/v1/sessions/{session_id}",
+            json={"status": status},
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
 
     async def forward_callback(self, callback_data: dict) -> None:
         """Forward Executor callback to Backend."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/callback",
-                json=callback_data,
-                headers=self._trace_headers(),
-            )
-            response.raise_for_status()
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/callback",
+            json=callback_data,
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+
+    async def forward_callback_batch(self, batch_data: dict) -> None:
+        """Forward a batch of Executor callbacks to Backend."""
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/callback/batch",
+            json=batch_data,
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
 
     async def claim_run(
         self,
@@ -67,103 +81,198 @@ class BackendClient:
         if schedule_modes:
             payload["schedule_modes"] = schedule_modes
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/runs/claim",
-                json=payload,
-                headers=self._trace_headers(),
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data")
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/runs/claim",
+            json=payload,
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data")
+
+    async def claim_runs(
+        self,
+        worker_id: str,
+        limit: int,
+        lease_seconds: int = 30,
+        schedule_modes: list[str] | None = None,
+        fair_share: dict | None = None,
+    ) -> list[dict]:
+        """Claim up to `limit` runs from backend queue in one round trip.
+
+        `fair_share` holds the quota/weight fields of the claim request.
+        """
+        payload: dict = {
+            "worker_id": worker_id,
+            "lease_seconds": lease_seconds,
+            "limit": limit,
+            **(fair_share or {}),
+        }
+        if schedule_modes:
+            payload["schedule_modes"] = schedule_modes
+
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/runs/claim-batch",
+            json=payload,
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+        data = response.json()
+        claims = data.get("data") or []
+        return claims if isinstance(claims, list) else []
+
+    async def release_expired_run_claims(self) -> int:
+        """Return runs with expired claim leases to the queue."""
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/runs/release-expired-claims",
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return int((data.get("data") or {}).get("released", 0))
+
+    async def get_run_queue_stats(
+        self, schedule_modes: list[str] | None = None
+    ) -> list[dict]:
+        """Per-user queue depth and wait time of the backend run queue."""
+        client = get_http_client()
+        response = await client.get(
+            f"{self.base_url}/api/v1/internal/runs/queue-stats",
+            params={"schedule_modes": schedule_modes} if schedule_modes else None,
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        users = (data.get("data") or {}).get("users") or []
+        return users if isinstance(users, list) else []
 
     async def start_run(self, run_id: str, worker_id: str) -> dict:
         """Mark run as running."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/runs/{run_id}/start",
-                json={"worker_id": worker_id},
-                headers=self._trace_headers(),
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["data"]
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/runs/{run_id}/start",
+            json={"worker_id": worker_id},
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["data"]
 
     async def fail_run(
         self, run_id: str, worker_id: str, error_message: str | None = None
     ) -> dict:
         """Mark run as failed."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/runs/{run_id}/fail",
-                json={"worker_id": worker_id, "error_message": error_message},
-                headers=self._trace_headers(),
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["data"]
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/runs/{run_id}/fail",
+            json={"worker_id": worker_id, "error_message": error_message},
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["data"]
 
     async def get_env_map(self, user_id: str) -> dict[str, str]:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/internal/env-vars/map",
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    "X-User-Id": user_id,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {}) or {}
+        client = get_http_client()
+        response = await client.get(
+            f"{self.base_url}/api/v1/internal/env-vars/map",
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {}) or {}
+
+    async def get_execution_config_version(self, user_id: str) -> int:
+        """Fetch the change counter of the user's execution config."""
+        client = get_http_client()
+        response = await client.get(
+            f"{self.base_url}/api/v1/internal/execution-config/version",
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return int((data.get("data") or {}).get("version", 0))
+
+    async def resolve_execution_config(self, user_id: str, payload: dict) -> dict:
+        """Resolve a run's full execution config bundle in one round trip."""
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/execution-config/resolve",
+            json=payload,
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {}) or {}
 
     async def resolve_mcp_config(self, user_id: str, server_ids: list[int]) -> dict:
         """Resolve effective MCP config for execution based on selected server ids."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/internal/mcp-config/resolve",
-                json={"server_ids": server_ids},
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    "X-User-Id": user_id,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {}) or {}
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/mcp-config/resolve",
+            json={"server_ids": server_ids},
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {}) or {}
 
     async def resolve_skill_config(self, user_id: str, skill_ids: list[int]) -> dict:
         """Resolve effective skill config for execution based on selected skill ids."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/internal/skill-config/resolve",
-                json={"skill_ids": skill_ids},
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    "X-User-Id": user_id,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {}) or {}
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/skill-config/resolve",
+            json={"skill_ids": skill_ids},
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {}) or {}
 
     async def resolve_plugin_config(self, user_id: str, plugin_ids: list[int]) -> dict:
         """Resolve effective plugin config for execution based on selected plugin ids."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/internal/plugin-config/resolve",
-                json={"plugin_ids": plugin_ids},
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    "X-User-Id": user_id,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {}) or {}
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/plugin-config/resolve",
+            json={"plugin_ids": plugin_ids},
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {}) or {}
 
     async def resolve_subagents(
         self, user_id: str, subagent_ids: list[int] | None
@@ -176,97 +285,116 @@ class BackendClient:
         payload: dict = {}
         if subagent_ids is not None:
             payload["subagent_ids"] = subagent_ids
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/internal/subagents/resolve",
-                json=payload,
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    "X-User-Id": user_id,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {}) or {}
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/subagents/resolve",
+            json=payload,
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {}) or {}
 
     async def resolve_slash_commands(
         self, user_id: str, names: list[str] | None = None
     ) -> dict[str, str]:
         """Resolve enabled slash commands for execution (rendered markdown)."""
         payload: dict = {"names": names or []}
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/internal/slash-commands/resolve",
-                json=payload,
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    "X-User-Id": user_id,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            resolved = data.get("data", {}) or {}
-            if not isinstance(resolved, dict):
-                return {}
-            return {str(k): str(v) for k, v in resolved.items() if isinstance(v, str)}
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/slash-commands/resolve",
+            json=payload,
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        resolved = data.get("data", {}) or {}
+        if not isinstance(resolved, dict):
+            return {}
+        return {str(k): str(v) for k, v in resolved.items() if isinstance(v, str)}
 
     async def get_claude_md(self, user_id: str) -> dict:
         """Fetch user-level CLAUDE.md settings for execution staging."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/internal/claude-md",
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    "X-User-Id": user_id,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            result = data.get("data", {}) or {}
-            return result if isinstance(result, dict) else {}
+        client = get_http_client()
+        response = await client.get(
+            f"{self.base_url}/api/v1/internal/claude-md",
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        result = data.get("data", {}) or {}
+        return result if isinstance(result, dict) else {}
 
     async def dispatch_due_scheduled_tasks(self, limit: int = 50) -> dict:
         """Trigger backend to dispatch due scheduled tasks into the run queue."""
         payload = {"limit": max(1, int(limit))}
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/internal/scheduled-tasks/dispatch-due",
-                json=payload,
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {}) or {}
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/scheduled-tasks/dispatch-due",
+            json=payload,
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {}) or {}
 
     async def create_user_input_request(self, payload: dict) -> dict:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/internal/user-input-requests",
-                json=payload,
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["data"]
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/user-input-requests",
+            json=payload,
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["data"]
+
+    async def wait_user_input_request(
+        self, request_id: str, timeout_seconds: float
+    ) -> dict:
+        """Long-poll Backend until the request is answered/expired or the timeout ends."""
+        client = get_http_client()
+        response = await client.get(
+            f"{self.base_url}/api/v1/internal/user-input-requests/{request_id}/wait",
+            params={"timeout_seconds": timeout_seconds},
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                **self._trace_headers(),
+            },
+            # The Backend holds the request open for up to timeout_seconds.
+            timeout=timeout_seconds + 10.0,
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["data"]
 
     async def get_user_input_request(self, request_id: str) -> dict:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/internal/user-input-requests/{request_id}",
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["data"]
+        client = get_http_client()
+        response = await client.get(
+            f"{self.base_url}/api/v1/internal/user-input-requests/{request_id}",
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["data"]
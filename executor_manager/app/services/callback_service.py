@@ -1,8 +1,15 @@
 import asyncio
 import logging
 from datetime import datetime, timezone
-
-from app.schemas.callback import AgentCallbackRequest, CallbackReceiveResponse
+from typing import Any
+
+from app.schemas.callback import (
+    AgentCallbackBatchRequest,
+    AgentCallbackRequest,
+    AgentCurrentState,
+    CallbackBatchReceiveResponse,
+    CallbackReceiveResponse,
+)
 from app.services.backend_client import BackendClient
 from app.services.workspace_export_service import (
     WorkspaceExportService,
@@ -58,13 +65,7 @@ class CallbackService:
         return False
 
     @classmethod
-    def _filter_state_patch(
-        cls, callback: AgentCallbackRequest
-    ) -> AgentCallbackRequest:
-        state = callback.state_patch
-        if not state:
-            return callback
-
+    def _filter_state(cls, state: AgentCurrentState) -> AgentCurrentState:
         updated_state = state
 
         # Hide built-in/internal MCP servers from the UI. End users should only see
@@ -82,22 +83,14 @@ class CallbackService:
 
         workspace_state = updated_state.workspace_state
         if not workspace_state or not workspace_state.file_changes:
-            return (
-                callback
-                if updated_state is state
-                else callback.model_copy(update={"state_patch": updated_state})
-            )
+            return updated_state
         file_changes = workspace_state.file_changes
 
         filtered_changes = [
             fc for fc in file_changes if not cls._is_ignored_workspace_path(fc.path)
         ]
         if len(filtered_changes) == len(file_changes):
-            return (
-                callback
-                if updated_state is state
-                else callback.model_copy(update={"state_patch": updated_state})
-            )
+            return updated_state
 
         total_added = sum(fc.added_lines for fc in filtered_changes)
         total_deleted = sum(fc.deleted_lines for fc in filtered_changes)
@@ -109,11 +102,26 @@ class CallbackService:
                 "total_deleted_lines": total_deleted,
             }
         )
-        updated_state = updated_state.model_copy(
-            update={"workspace_state": new_workspace_state}
-        )
+        return updated_state.model_copy(update={"workspace_state": new_workspace_state})
+
+    @classmethod
+    def _filter_state_patch(
+        cls, callback: AgentCallbackRequest
+    ) -> AgentCallbackRequest:
+        state = callback.state_patch
+        if not state:
+            return callback
+        updated_state = cls._filter_state(state)
+        if updated_state is state:
+            return callback
         return callback.model_copy(update={"state_patch": updated_state})
 
+    @classmethod
+    def _filter_state_delta(cls, delta: dict[str, Any]) -> dict[str, Any]:
+        """Apply the state_patch filters to the fields present in a state delta."""
+        state = cls._filter_state(AgentCurrentState.model_validate(delta))
+        return state.model_dump(mode="json", include=set(delta))
+
     async def process_callback(
         self, callback: AgentCallbackRequest
     ) -> CallbackReceiveResponse:
@@ -208,6 +216,67 @@ class CallbackService:
                 message="Failed to forward callback to backend",
             )
 
+    async def process_callback_batch(
+        self, batch: AgentCallbackBatchRequest
+    ) -> CallbackBatchReceiveResponse:
+        """Process coalesced callbacks from executor.
+
+        RUNNING callbacks are forwarded to backend as one batch (state delta
+        included); terminal callbacks, if any, go through `process_callback` after it
+        so workspace export and task completion keep their usual ordering.
+        """
+        from app.core.errors.error_codes import ErrorCode
+        from app.core.errors.exceptions import AppException
+
+        running = [
+            c for c in batch.callbacks if c.status not in ["completed", "failed"]
+        ]
+        terminal = [c for c in batch.callbacks if c.status in ["completed", "failed"]]
+        logger.debug(
+            "callback_batch_received",
+            extra={
+                "session_id": batch.session_id,
+                "seq": batch.seq,
+                "callbacks": len(batch.callbacks),
+                "state_delta_fields": sorted(batch.state_delta or {}),
+            },
+        )
+
+        if running or batch.state_delta:
+            payload_model = batch.model_copy(
+                update={
+                    "callbacks": [self._filter_state_patch(c) for c in running],
+                    "state_delta": (
+                        self._filter_state_delta(batch.state_delta)
+                        if batch.state_delta
+                        else None
+                    ),
+                }
+            )
+            try:
+                await backend_client.forward_callback_batch(
+                    payload_model.model_dump(mode="json")
+                )
+            except Exception:
+                logger.exception(
+                    "callback_batch_forward_failed",
+                    extra={"session_id": batch.session_id, "seq": batch.seq},
+                )
+                raise AppException(
+                    error_code=ErrorCode.CALLBACK_FORWARD_FAILED,
+                    message="Failed to forward callback batch to backend",
+                )
+
+        for callback in terminal:
+            await self.process_callback(callback)
+
+        return CallbackBatchReceiveResponse(
+            status="received",
+            session_id=batch.session_id,
+            seq=batch.seq,
+            received=len(batch.callbacks),
+        )
+
     async def _export_and_forward(self, callback: AgentCallbackRequest) -> None:
         try:
             result = await asyncio.to_thread(
@@ -1,11 +1,15 @@
+import copy
+import json
 import logging
 import re
 import time
+from collections import OrderedDict
 from typing import Any
 from urllib.parse import urlparse
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
+from app.core.settings import get_settings
 from app.services.backend_client import BackendClient
 
 
@@ -48,9 +52,46 @@ def _resolve_env_value(value: Any, env_map: dict[str, str]) -> Any:
     return value
 
 
+class ExecutionConfigCache:
+    """LRU of resolved execution config bundles, keyed by user and request.
+
+    Entries carry the backend config version they were resolved at and are only
+    reused while the user's current version still matches.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max(0, int(max_entries))
+        self._entries: OrderedDict[tuple[str, str], tuple[int, dict]] = OrderedDict()
+
+    def get(self, user_id: str, request_key: str) -> tuple[int, dict] | None:
+        entry = self._entries.get((user_id, request_key))
+        if entry is not None:
+            self._entries.move_to_end((user_id, request_key))
+        return entry
+
+    def put(self, user_id: str, request_key: str, version: int, bundle: dict) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[(user_id, request_key)] = (version, bundle)
+        self._entries.move_to_end((user_id, request_key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+_settings = get_settings()
+_bundle_cache = ExecutionConfigCache(
+    _settings.config_cache_max_entries if _settings.config_cache_enabled else 0
+)
+
+
 class ConfigResolver:
-    def __init__(self, backend_client: BackendClient | None = None) -> None:
+    def __init__(
+        self,
+        backend_client: BackendClient | None = None,
+        cache: ExecutionConfigCache | None = None,
+    ) -> None:
         self.backend_client = backend_client or BackendClient()
+        self.cache = cache or _bundle_cache
 
     async def resolve(
         self,
@@ -60,7 +101,13 @@ class ConfigResolver:
         session_id: str | None = None,
         task_id: str | None = None,
         run_id: str | None = None,
+        include_claude_md: bool = False,
     ) -> dict:
+        """Resolve a config snapshot into the config sent to the executor.
+
+        Besides the executor config, the result carries `slash_commands` (always) and
+        `claude_md` (when include_claude_md) for the dispatch pipeline to stage.
+        """
         started = time.perf_counter()
         ctx = {
             "user_id": user_id,
@@ -70,65 +117,42 @@ class ConfigResolver:
         }
 
         step_started = time.perf_counter()
-        env_map = await self._get_env_map(user_id)
+        request = self._build_bundle_request(config_snapshot, include_claude_md)
+        bundle, cache_hit = await self._get_bundle(user_id, request)
         logger.info(
             "timing",
             extra={
-                "step": "config_resolve_env_map",
+                "step": "config_resolve_bundle",
                 "duration_ms": int((time.perf_counter() - step_started) * 1000),
+                "cache_hit": cache_hit,
+                "config_version": bundle.get("version"),
                 **ctx,
             },
         )
 
-        step_started = time.perf_counter()
-        mcp_config = await self._resolve_effective_mcp_config(user_id, config_snapshot)
-        logger.info(
-            "timing",
-            extra={
-                "step": "config_resolve_mcp_config",
-                "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                "mcp_servers": len(mcp_config) if isinstance(mcp_config, dict) else 0,
-                **ctx,
-            },
+        env_map = bundle.get("env_map") or {}
+        # Snapshots without ids are legacy and already carry the full configs.
+        mcp_config = (
+            bundle.get("mcp_config")
+            if self._selected_mcp_ids(config_snapshot) is not None
+            else config_snapshot.get("mcp_config")
         )
-
-        step_started = time.perf_counter()
-        skill_files = await self._resolve_effective_skill_files(
-            user_id, config_snapshot
+        skill_files = (
+            bundle.get("skill_files")
+            if request["skill_ids"]
+            else config_snapshot.get("skill_files")
         )
-        logger.info(
-            "timing",
-            extra={
-                "step": "config_resolve_skill_files",
-                "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                "skills": len(skill_files) if isinstance(skill_files, dict) else 0,
-                **ctx,
-            },
+        plugin_files = (
+            bundle.get("plugin_files")
+            if request["plugin_ids"]
+            else config_snapshot.get("plugin_files")
         )
+        mcp_config = mcp_config if isinstance(mcp_config, dict) else {}
+        skill_files = skill_files if isinstance(skill_files, dict) else {}
+        plugin_files = plugin_files if isinstance(plugin_files, dict) else {}
         input_files = config_snapshot.get("input_files") or []
 
-        step_started = time.perf_counter()
-        plugin_files = await self._resolve_effective_plugin_files(
-            user_id, config_snapshot
-        )
-        logger.info(
-            "timing",
-            extra={
-                "step": "config_resolve_plugin_files",
-                "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                "plugins": len(plugin_files) if isinstance(plugin_files, dict) else 0,
-                **ctx,
-            },
-        )
-
-        step_started = time.perf_counter()
-        try:
-            resolved_subagents = await self._resolve_effective_subagents(
-                user_id, config_snapshot
-            )
-        except Exception as exc:
-            logger.warning(f"Failed to resolve subagents for user {user_id}: {exc}")
-            resolved_subagents = {}
+        resolved_subagents = bundle.get("subagents")
         structured_agents = (
             resolved_subagents.get("structured_agents")
             if isinstance(resolved_subagents, dict)
@@ -139,20 +163,6 @@ class ConfigResolver:
             if isinstance(resolved_subagents, dict)
             else None
         )
-        structured_count = (
-            len(structured_agents) if isinstance(structured_agents, dict) else 0
-        )
-        raw_count = len(raw_agents) if isinstance(raw_agents, dict) else 0
-        logger.info(
-            "timing",
-            extra={
-                "step": "config_resolve_subagents",
-                "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                "subagents_structured": structured_count,
-                "subagents_raw": raw_count,
-                **ctx,
-            },
-        )
 
         step_started = time.perf_counter()
         resolved_mcp = self._resolve_mcp(mcp_config, env_map)
@@ -164,6 +174,13 @@ class ConfigResolver:
             extra={
                 "step": "config_resolve_render",
                 "duration_ms": int((time.perf_counter() - step_started) * 1000),
+                "mcp_servers": len(resolved_mcp),
+                "skills": len(resolved_skills),
+                "plugins": len(resolved_plugins),
+                "subagents_structured": len(structured_agents)
+                if isinstance(structured_agents, dict)
+                else 0,
+                "subagents_raw": len(raw_agents) if isinstance(raw_agents, dict) else 0,
                 "input_files": len(input_files) if isinstance(input_files, list) else 0,
                 **ctx,
             },
@@ -180,6 +197,15 @@ class ConfigResolver:
         if isinstance(raw_agents, dict):
             # Raw markdown agents are staged into the workspace by SubAgentStager.
             resolved["subagent_raw_agents"] = raw_agents
+        slash_commands = bundle.get("slash_commands")
+        resolved["slash_commands"] = (
+            {str(k): str(v) for k, v in slash_commands.items() if isinstance(v, str)}
+            if isinstance(slash_commands, dict)
+            else {}
+        )
+        if include_claude_md:
+            claude_md = bundle.get("claude_md")
+            resolved["claude_md"] = claude_md if isinstance(claude_md, dict) else {}
         resolved_git = self._resolve_git_token(resolved, env_map)
         if resolved_git:
             resolved.update(resolved_git)
@@ -228,81 +254,51 @@ class ConfigResolver:
 
         return {"git_token": token}
 
-    async def _get_env_map(self, user_id: str) -> dict[str, str]:
-        return await self.backend_client.get_env_map(user_id=user_id)
-
-    async def _resolve_effective_mcp_config(
-        self, user_id: str, config_snapshot: dict
-    ) -> dict:
-        """Resolve MCP config for execution.
-
-        Priority:
-        1) config_snapshot.mcp_server_ids -> fetch full mcp_config via backend internal API
-        2) config_snapshot.mcp_config toggles (server_id -> bool) -> fetch via backend internal API
-        3) legacy config_snapshot.mcp_config already contains full server configs
-        """
-        server_ids = self._normalize_ids(config_snapshot.get("mcp_server_ids"))
-        if server_ids:
-            return await self.backend_client.resolve_mcp_config(
-                user_id=user_id, server_ids=server_ids
-            )
-
-        mcp_config = config_snapshot.get("mcp_config")
-        toggle_ids = self._extract_enabled_ids_from_toggles(mcp_config)
-        if toggle_ids is not None:
-            return await self.backend_client.resolve_mcp_config(
-                user_id=user_id, server_ids=toggle_ids
-            )
-
-        return mcp_config if isinstance(mcp_config, dict) else {}
-
-    async def _resolve_effective_skill_files(
-        self, user_id: str, config_snapshot: dict
-    ) -> dict:
-        """Resolve skills for execution.
-
-        Priority:
-        1) config_snapshot.skill_ids -> fetch entries via backend internal API
-        2) legacy config_snapshot.skill_files already contains entry configs
-        """
-        skill_ids = self._normalize_ids(config_snapshot.get("skill_ids"))
-        if skill_ids:
-            return await self.backend_client.resolve_skill_config(
-                user_id=user_id, skill_ids=skill_ids
-            )
-
-        legacy = config_snapshot.get("skill_files")
-        return legacy if isinstance(legacy, dict) else {}
-
-    async def _resolve_effective_plugin_files(
-        self, user_id: str, config_snapshot: dict
+    def _build_bundle_request(
+        self, config_snapshot: dict, include_claude_md: bool
     ) -> dict:
-        """Resolve plugins for execution.
+        """Backend request for the ids selected by a config snapshot.
 
-        Priority:
-        1) config_snapshot.plugin_ids -> fetch entries via backend internal API
-        2) legacy config_snapshot.plugin_files already contains entry configs
+        MCP servers come from `mcp_server_ids`, else from `mcp_config` toggles
+        ({server_id: bool}). An absent `subagent_ids` selects the user's enabled
+        subagents; an explicit empty list disables them all.
         """
-        plugin_ids = self._normalize_ids(config_snapshot.get("plugin_ids"))
-        if plugin_ids:
-            return await self.backend_client.resolve_plugin_config(
-                user_id=user_id, plugin_ids=plugin_ids
+        request: dict = {
+            "mcp_server_ids": self._selected_mcp_ids(config_snapshot) or [],
+            "skill_ids": self._normalize_ids(config_snapshot.get("skill_ids")),
+            "plugin_ids": self._normalize_ids(config_snapshot.get("plugin_ids")),
+            "slash_command_names": [],
+            "include_claude_md": include_claude_md,
+        }
+        if "subagent_ids" in config_snapshot:
+            request["subagent_ids"] = self._normalize_ids(
+                config_snapshot.get("subagent_ids")
             )
-
-        legacy = config_snapshot.get("plugin_files")
-        return legacy if isinstance(legacy, dict) else {}
-
-    async def _resolve_effective_subagents(
-        self, user_id: str, config_snapshot: dict
-    ) -> dict:
-        subagent_ids: list[int] | None
-        if "subagent_ids" not in config_snapshot:
-            subagent_ids = None
-        else:
-            subagent_ids = self._normalize_ids(config_snapshot.get("subagent_ids"))
-        return await self.backend_client.resolve_subagents(
-            user_id=user_id, subagent_ids=subagent_ids
+        return request
+
+    async def _get_bundle(self, user_id: str, request: dict) -> tuple[dict, bool]:
+        """Return (bundle, cache_hit); a cached bundle needs a current version."""
+        request_key = json.dumps(request, sort_keys=True)
+        cached = self.cache.get(user_id, request_key)
+        if cached is not None:
+            cached_version, cached_bundle = cached
+            version = await self.backend_client.get_execution_config_version(user_id)
+            if version == cached_version:
+                # Callers mutate the resolved config; never hand out cached objects.
+                return copy.deepcopy(cached_bundle), True
+
+        bundle = await self.backend_client.resolve_execution_config(
+            user_id=user_id, payload=request
         )
+        self.cache.put(user_id, request_key, int(bundle.get("version", 0)), bundle)
+        return copy.deepcopy(bundle), False
+
+    def _selected_mcp_ids(self, config_snapshot: dict) -> list[int] | None:
+        """Selected MCP server ids, or None for legacy full `mcp_config` snapshots."""
+        server_ids = self._normalize_ids(config_snapshot.get("mcp_server_ids"))
+        if server_ids:
+            return server_ids
+        return self._extract_enabled_ids_from_toggles(config_snapshot.get("mcp_config"))
 
     @staticmethod
     def _normalize_ids(value: Any) -> list[int]:
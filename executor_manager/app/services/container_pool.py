@@ -1,6 +1,16 @@
+import asyncio
+import contextvars
+import functools
+import json
 import logging
+import os
+import shutil
 import time
-from typing import TYPE_CHECKING
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import docker
 import docker.errors
@@ -8,6 +18,7 @@ import httpx
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
+from app.core.http_client import get_http_client
 from app.core.settings import get_settings
 from app.services.workspace_manager import WorkspaceManager
 
@@ -16,17 +27,67 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+WARM_POOL_VARIANTS = ("plain", "browser")
+WARM_CONTAINER_PREFIX = "executor-warm-"
+# Labels every executor container carries; warm containers start with empty values.
+SESSION_LABELS = ("session_id", "container_id", "user", "container_mode")
+
+
+@dataclass(eq=False)
+class WarmContainer:
+    """A pre-started executor container waiting to be claimed by a session."""
+
+    container: "Container"
+    variant: str
+    executor_url: str
+    host_port: str
+    workspace: str
+    created_at: float = field(default_factory=time.time)
+
 
 class ContainerPool:
-    """Executor container pool with ephemeral and persistent modes."""
+    """Executor container pool with ephemeral and persistent modes.
+
+    docker-py is synchronous, so every Docker API call runs on a dedicated bounded
+    thread pool (see _docker) and readiness probes are async: booting one container
+    never blocks the event loop for other dispatches, callbacks or pull polls.
+
+    When the warm pool is enabled, new sessions claim a pre-started container of the
+    matching image variant and bind their workspace to it, falling back to a cold start
+    when the pool is empty.
+    """
 
     def __init__(self):
         self.docker_client = docker.from_env()
         self.settings = get_settings()
+        self._docker_executor = ThreadPoolExecutor(
+            max_workers=max(1, int(self.settings.docker_max_workers)),
+            thread_name_prefix="docker",
+        )
         self.workspace_manager = WorkspaceManager()
 
         self.containers: dict[str, "Container"] = {}
         self.session_to_container: dict[str, str] = {}
+        # Docker labels are immutable, so the session labels of claimed warm containers
+        # are kept here (by Docker id) and persisted to survive restarts.
+        self._warm_bindings_file = (
+            self.workspace_manager.base_dir / "warm_bindings.json"
+        )
+        self.warm_bindings: dict[str, dict[str, str]] = self._load_warm_bindings()
+
+        self.warm_containers: dict[str, list[WarmContainer]] = {
+            variant: [] for variant in WARM_POOL_VARIANTS
+        }
+        self._warm_booting: dict[str, int] = {
+            variant: 0 for variant in WARM_POOL_VARIANTS
+        }
+        self._warm_claims: dict[str, int] = {
+            variant: 0 for variant in WARM_POOL_VARIANTS
+        }
+        self._warm_replenish_lock = asyncio.Lock()
+        self._warm_background_tasks: set[asyncio.Task[None]] = set()
 
     async def get_or_create_container(
         self,
@@ -49,6 +110,37 @@ class ContainerPool:
         Returns:
             (executor_url, container_id)
         """
+        claimed = await self.claim_container(
+            session_id,
+            user_id,
+            browser_enabled=browser_enabled,
+            container_mode=container_mode,
+            container_id=container_id,
+        )
+        if claimed is not None:
+            return claimed
+        return await self.create_container(
+            session_id,
+            user_id,
+            browser_enabled=browser_enabled,
+            container_mode=container_mode,
+        )
+
+    async def claim_container(
+        self,
+        session_id: str,
+        user_id: str,
+        *,
+        browser_enabled: bool = False,
+        container_mode: str = "ephemeral",
+        container_id: str | None = None,
+    ) -> tuple[str, str] | None:
+        """Fast path: reuse a tracked container or claim a warm one.
+
+        Claiming a warm container moves the session workspace, so callers that stage
+        files concurrently must finish this step before staging starts. Returns None
+        when a cold start (create_container) is required.
+        """
         overall_started = time.perf_counter()
         published_host = (
             self.settings.executor_published_host or ""
@@ -62,7 +154,7 @@ class ContainerPool:
 
             # Best-effort refresh port mappings.
             try:
-                container.reload()
+                await self._docker(container.reload)
             except Exception:
                 pass
 
@@ -101,6 +193,34 @@ class ContainerPool:
                     container_id,
                 )
 
+        warm = await self._claim_warm_container(browser_enabled=browser_enabled)
+        if warm is not None:
+            return await self._bind_warm_container(
+                warm,
+                session_id=session_id,
+                user_id=user_id,
+                container_mode=container_mode,
+                overall_started=overall_started,
+            )
+        return None
+
+    async def create_container(
+        self,
+        session_id: str,
+        user_id: str,
+        *,
+        browser_enabled: bool = False,
+        container_mode: str = "ephemeral",
+    ) -> tuple[str, str]:
+        """Cold-start a new executor container for a session.
+
+        Safe to run concurrently with workspace staging: the workspace is bind-mounted
+        in place and never moved.
+        """
+        overall_started = time.perf_counter()
+        published_host = (
+            self.settings.executor_published_host or ""
+        ).strip() or "localhost"
         container_id = f"exec-{session_id[:8]}"
         container_name = f"executor-{session_id[:8]}"
 
@@ -108,9 +228,11 @@ class ContainerPool:
         step_started = time.perf_counter()
         removed_stale = False
         try:
-            old_container = self.docker_client.containers.get(container_name)
+            old_container = await self._docker(
+                self.docker_client.containers.get, container_name
+            )
             logger.warning(f"Removing stale container {container_name}")
-            old_container.remove(force=True)
+            await self._docker(old_container.remove, force=True)
             removed_stale = True
         except docker.errors.NotFound:
             pass
@@ -157,21 +279,13 @@ class ContainerPool:
         step_started = time.perf_counter()
         image = self._resolve_executor_image(browser_enabled=browser_enabled)
         ports = {"8000/tcp": None}
-        environment = {
-            "ANTHROPIC_BASE_URL": self.settings.anthropic_base_url,
-            "DEFAULT_MODEL": self.settings.default_model,
-            "WORKSPACE_PATH": "/workspace",
-            "USER_ID": user_id,
-            "SESSION_ID": session_id,
-        }
-        anthropic_api_key = (self.settings.anthropic_api_key or "").strip()
-        if anthropic_api_key:
-            environment["ANTHROPIC_API_KEY"] = anthropic_api_key
-        if browser_enabled:
-            environment["POCO_BROWSER_VIEWPORT_SIZE"] = (
-                self.settings.poco_browser_viewport_size
-            )
-        container = self.docker_client.containers.run(
+        environment = self._build_environment(
+            browser_enabled=browser_enabled,
+            user_id=user_id,
+            session_id=session_id,
+        )
+        container = await self._docker(
+            self.docker_client.containers.run,
             image=image,
             name=container_name,
             environment=environment,
@@ -199,10 +313,10 @@ class ContainerPool:
         self.containers[container_id] = container
         self.session_to_container[session_id] = container_id
 
-        self._wait_for_container_ready(container)
+        await self._wait_for_container_ready(container)
 
         step_started = time.perf_counter()
-        container.reload()
+        await self._docker(container.reload)
         port_info = container.ports.get("8000/tcp")
         if not port_info:
             raise AppException(
@@ -223,7 +337,7 @@ class ContainerPool:
         host_port = port_info[0]["HostPort"]
         executor_url = f"http://{published_host}:{host_port}"
 
-        self._wait_for_service_ready(executor_url)
+        await self._wait_for_service_ready(executor_url)
 
         logger.info(
             f"Container {container_id} started for session {session_id} on port {host_port}"
@@ -243,6 +357,46 @@ class ContainerPool:
         )
         return executor_url, container_id
 
+    def _build_environment(
+        self,
+        *,
+        browser_enabled: bool,
+        user_id: str | None = None,
+        session_id: str | None = None,
+    ) -> dict[str, str]:
+        """Build executor container environment.
+
+        Warm containers are started before a session exists, so user/session ids are
+        optional (the executor receives them per task in the execute request).
+        """
+        environment = {
+            "ANTHROPIC_BASE_URL": self.settings.anthropic_base_url,
+            "DEFAULT_MODEL": self.settings.default_model,
+            "WORKSPACE_PATH": "/workspace",
+            "CALLBACK_BATCH_ENABLED": str(
+                self.settings.executor_callback_batch_enabled
+            ).lower(),
+            "CALLBACK_BATCH_WINDOW_MS": str(
+                self.settings.executor_callback_batch_window_ms
+            ),
+        }
+        if user_id is not None:
+            environment["USER_ID"] = user_id
+        if session_id is not None:
+            environment["SESSION_ID"] = session_id
+        anthropic_api_key = (self.settings.anthropic_api_key or "").strip()
+        if anthropic_api_key:
+            environment["ANTHROPIC_API_KEY"] = anthropic_api_key
+        otlp_endpoint = (self.settings.executor_otlp_endpoint or "").strip()
+        if otlp_endpoint:
+            environment["TRACING_ENABLED"] = "true"
+            environment["OTEL_EXPORTER_OTLP_ENDPOINT"] = otlp_endpoint
+        if browser_enabled:
+            environment["POCO_BROWSER_VIEWPORT_SIZE"] = (
+                self.settings.poco_browser_viewport_size
+            )
+        return environment
+
     def _resolve_executor_image(self, *, browser_enabled: bool) -> str:
         """Pick executor image based on browser requirement."""
         if not browser_enabled:
@@ -263,7 +417,16 @@ class ContainerPool:
         raw = str(labels.get("browser_enabled", "")).strip().lower()
         return raw in {"true", "1", "yes"}
 
-    def _wait_for_container_ready(
+    async def _docker(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking docker-py call on the bounded Docker worker pool."""
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self._docker_executor,
+            functools.partial(ctx.run, fn, *args, **kwargs),
+        )
+
+    async def _wait_for_container_ready(
         self,
         container: "Container",
         timeout: int = 30,
@@ -271,10 +434,11 @@ class ContainerPool:
         """Wait for container to start."""
         started = time.perf_counter()
         attempts = 0
+        interval = max(0.05, float(self.settings.container_ready_poll_interval_seconds))
 
         while time.perf_counter() - started < timeout:
             attempts += 1
-            container.reload()
+            await self._docker(container.reload)
             if container.status == "running":
                 logger.info(
                     "timing",
@@ -287,7 +451,7 @@ class ContainerPool:
                     },
                 )
                 return
-            time.sleep(1)
+            await asyncio.sleep(interval)
 
         logger.warning(
             "timing",
@@ -304,7 +468,7 @@ class ContainerPool:
             message=f"Container {container.name} failed to start within {timeout}s",
         )
 
-    def _wait_for_service_ready(
+    async def _wait_for_service_ready(
         self,
         executor_url: str,
         timeout: int = 60,
@@ -313,29 +477,28 @@ class ContainerPool:
         started = time.perf_counter()
         attempts = 0
         health_url = f"{executor_url}/health"
+        interval = max(0.05, float(self.settings.container_ready_poll_interval_seconds))
 
+        client = get_http_client()
         while time.perf_counter() - started < timeout:
             attempts += 1
             try:
-                with httpx.Client(timeout=2.0) as client:
-                    response = client.get(health_url)
-                    if response.status_code == 200:
-                        logger.info(
-                            "timing",
-                            extra={
-                                "step": "container_wait_service_ready",
-                                "duration_ms": int(
-                                    (time.perf_counter() - started) * 1000
-                                ),
-                                "attempts": attempts,
-                                "executor_url": executor_url,
-                            },
-                        )
-                        logger.info(f"Executor service ready at {executor_url}")
-                        return
+                response = await client.get(health_url, timeout=2.0)
+                if response.status_code == 200:
+                    logger.info(
+                        "timing",
+                        extra={
+                            "step": "container_wait_service_ready",
+                            "duration_ms": int((time.perf_counter() - started) * 1000),
+                            "attempts": attempts,
+                            "executor_url": executor_url,
+                        },
+                    )
+                    logger.info(f"Executor service ready at {executor_url}")
+                    return
             except httpx.RequestError:
                 pass
-            time.sleep(1)
+            await asyncio.sleep(interval)
 
         logger.warning(
             "timing",
@@ -351,6 +514,410 @@ class ContainerPool:
             message=f"Executor service at {executor_url} not ready within {timeout}s",
         )
 
+    @staticmethod
+    def _warm_variant(browser_enabled: bool) -> str:
+        return "browser" if browser_enabled else "plain"
+
+    def _warm_pool_bounds(self, variant: str) -> tuple[int, int]:
+        """Return (min_size, max_size) for a warm pool variant."""
+        if variant == "browser":
+            min_size = self.settings.container_warm_pool_browser_min_size
+            max_size = self.settings.container_warm_pool_browser_max_size
+        else:
+            min_size = self.settings.container_warm_pool_min_size
+            max_size = self.settings.container_warm_pool_max_size
+        min_size = max(0, int(min_size))
+        return min_size, max(min_size, int(max_size))
+
+    def _warm_target_size(self, variant: str) -> int:
+        """Idle containers to keep for a variant.
+
+        Keeps at least min_size, grows by the number of claims seen since the last
+        replenish (recent demand), and never exceeds max_size.
+        """
+        min_size, max_size = self._warm_pool_bounds(variant)
+        claims = self._warm_claims.get(variant, 0)
+        self._warm_claims[variant] = 0
+        return min(max_size, min_size + claims)
+
+    async def _claim_warm_container(
+        self, *, browser_enabled: bool
+    ) -> WarmContainer | None:
+        """Pop a healthy idle warm container for the requested variant, if any."""
+        if not self.settings.container_warm_pool_enabled:
+            return None
+
+        variant = self._warm_variant(browser_enabled)
+        if (
+            variant == "browser"
+            and not (self.settings.executor_browser_image or "").strip()
+        ):
+            return None
+
+        idle = self.warm_containers[variant]
+        self._warm_claims[variant] += 1
+        claimed: WarmContainer | None = None
+        while idle:
+            candidate = idle.pop(0)
+            if await self._probe_executor_health(candidate.executor_url):
+                claimed = candidate
+                break
+            logger.warning(
+                "warm_container_unhealthy_discarded",
+                extra={
+                    "container_name": candidate.container.name,
+                    "variant": variant,
+                },
+            )
+            self._spawn_background(self._discard_warm_container(candidate))
+
+        # Refill in the background; claiming must never wait for a boot.
+        self._spawn_background(self.replenish_warm_pool())
+
+        if claimed is None:
+            logger.info(
+                "warm_pool_miss",
+                extra={"variant": variant, "booting": self._warm_booting[variant]},
+            )
+        return claimed
+
+    async def _bind_warm_container(
+        self,
+        warm: WarmContainer,
+        *,
+        session_id: str,
+        user_id: str,
+        container_mode: str,
+        overall_started: float,
+    ) -> tuple[str, str] | None:
+        """Attach a claimed warm container to a session and its workspace.
+
+        Returns None (cold start required) when the container cannot be renamed.
+        """
+        container = warm.container
+        container_id = f"exec-{session_id[:8]}"
+        container_name = f"executor-{session_id[:8]}"
+
+        # Record the binding before the rename so a restart in between never treats
+        # the container as an unclaimed orphan.
+        self._record_warm_binding(
+            container,
+            {
+                "session_id": session_id,
+                "container_id": container_id,
+                "user": user_id,
+                "container_mode": container_mode,
+            },
+        )
+
+        # Keep the deterministic name so cancel_task can still locate the container.
+        try:
+            try:
+                stale = await self._docker(
+                    self.docker_client.containers.get, container_name
+                )
+                if stale.id != container.id:
+                    logger.warning(f"Removing stale container {container_name}")
+                    await self._docker(stale.remove, force=True)
+            except docker.errors.NotFound:
+                pass
+            await self._docker(container.rename, container_name)
+        except Exception as e:
+            logger.warning(
+                "warm_container_rename_failed",
+                extra={
+                    "container_name": container.name,
+                    "target_name": container_name,
+                    "error": str(e),
+                },
+            )
+            self._forget_warm_binding(container.id)
+            self._spawn_background(self._discard_warm_container(warm))
+            return None
+
+        step_started = time.perf_counter()
+        self.workspace_manager.adopt_warm_workspace(
+            user_id=user_id,
+            session_id=session_id,
+            warm_workspace=warm.workspace,
+        )
+        logger.info(
+            "timing",
+            extra={
+                "step": "container_warm_bind_workspace",
+                "duration_ms": int((time.perf_counter() - step_started) * 1000),
+                "session_id": session_id,
+                "user_id": user_id,
+                "container_id": container_id,
+            },
+        )
+
+        self.containers[container_id] = container
+        self.session_to_container[session_id] = container_id
+
+        logger.info(
+            f"Claimed warm container {warm.container.name} as {container_id} for session {session_id}"
+        )
+        logger.info(
+            "timing",
+            extra={
+                "step": "container_claim_warm_total",
+                "duration_ms": int((time.perf_counter() - overall_started) * 1000),
+                "session_id": session_id,
+                "user_id": user_id,
+                "container_id": container_id,
+                "container_mode": container_mode,
+                "variant": warm.variant,
+                "warm_age_s": int(time.time() - warm.created_at),
+                "host_port": warm.host_port,
+            },
+        )
+        return warm.executor_url, container_id
+
+    async def _start_warm_container(self, variant: str) -> WarmContainer:
+        """Start one warm container and wait until its executor is healthy."""
+        browser_enabled = variant == "browser"
+        slot_name = f"{variant}-{uuid.uuid4().hex[:8]}"
+        container_name = f"{WARM_CONTAINER_PREFIX}{slot_name}"
+        workspace = self.workspace_manager.create_warm_workspace(slot_name)
+        published_host = (
+            self.settings.executor_published_host or ""
+        ).strip() or "localhost"
+
+        container: "Container | None" = None
+        try:
+            container = await self._docker(
+                self.docker_client.containers.run,
+                image=self._resolve_executor_image(browser_enabled=browser_enabled),
+                name=container_name,
+                environment=self._build_environment(browser_enabled=browser_enabled),
+                volumes={workspace: {"bind": "/workspace", "mode": "rw"}},
+                ports={"8000/tcp": None},
+                detach=True,
+                auto_remove=True,
+                labels={
+                    "owner": "executor_manager",
+                    **{label: "" for label in SESSION_LABELS},
+                    "warm_pool": "true",
+                    "warm_variant": variant,
+                    "browser_enabled": "true" if browser_enabled else "false",
+                },
+                extra_hosts={"host.docker.internal": "host-gateway"},
+            )
+            await self._wait_for_container_ready(container)
+            await self._docker(container.reload)
+            port_info = container.ports.get("8000/tcp")
+            if not port_info:
+                raise AppException(
+                    error_code=ErrorCode.CONTAINER_START_FAILED,
+                    message=f"Container {container_name} has no port mapping",
+                )
+            host_port = port_info[0]["HostPort"]
+            executor_url = f"http://{published_host}:{host_port}"
+            await self._wait_for_service_ready(executor_url)
+        except BaseException:
+            if container is not None:
+                try:
+                    await self._docker(container.remove, force=True)
+                except Exception:
+                    pass
+            self.workspace_manager.discard_warm_workspace(workspace)
+            raise
+
+        return WarmContainer(
+            container=container,
+            variant=variant,
+            executor_url=executor_url,
+            host_port=host_port,
+            workspace=workspace,
+        )
+
+    async def _boot_warm_container(self, variant: str) -> None:
+        self._warm_booting[variant] += 1
+        started = time.perf_counter()
+        try:
+            warm = await self._start_warm_container(variant)
+        except Exception as e:
+            logger.error(
+                "warm_container_boot_failed",
+                extra={"variant": variant, "error": str(e)},
+            )
+            return
+        finally:
+            self._warm_booting[variant] -= 1
+
+        self.warm_containers[variant].append(warm)
+        logger.info(
+            "timing",
+            extra={
+                "step": "container_warm_boot",
+                "duration_ms": int((time.perf_counter() - started) * 1000),
+                "container_name": warm.container.name,
+                "variant": variant,
+                "host_port": warm.host_port,
+            },
+        )
+
+    async def _discard_warm_container(self, warm: WarmContainer) -> None:
+        def _remove() -> None:
+            try:
+                warm.container.remove(force=True)
+            except Exception:
+                pass
+            self.workspace_manager.discard_warm_workspace(warm.workspace)
+
+        await self._docker(_remove)
+
+    @staticmethod
+    async def _probe_executor_health(executor_url: str) -> bool:
+        try:
+            client = get_http_client()
+            response = await client.get(f"{executor_url}/health", timeout=2.0)
+            return response.status_code == 200
+        except httpx.RequestError:
+            return False
+
+    def _spawn_background(self, coro: Any) -> None:
+        task = asyncio.create_task(coro)
+        self._warm_background_tasks.add(task)
+        task.add_done_callback(self._warm_background_tasks.discard)
+
+    async def replenish_warm_pool(self) -> None:
+        """Health-check idle warm containers and boot new ones up to the target size."""
+        if not self.settings.container_warm_pool_enabled:
+            return
+        if self._warm_replenish_lock.locked():
+            return
+
+        async with self._warm_replenish_lock:
+            boots = []
+            for variant in WARM_POOL_VARIANTS:
+                if (
+                    variant == "browser"
+                    and not (self.settings.executor_browser_image or "").strip()
+                ):
+                    continue
+
+                idle = self.warm_containers[variant]
+                for warm in list(idle):
+                    if await self._probe_executor_health(warm.executor_url):
+                        continue
+                    if warm not in idle:
+                        # Claimed by a session while we were probing.
+                        continue
+                    idle.remove(warm)
+                    logger.warning(
+                        "warm_container_unhealthy_discarded",
+                        extra={
+                            "container_name": warm.container.name,
+                            "variant": variant,
+                        },
+                    )
+                    await self._discard_warm_container(warm)
+
+                _, max_size = self._warm_pool_bounds(variant)
+                while len(idle) > max_size:
+                    await self._discard_warm_container(idle.pop())
+
+                target = self._warm_target_size(variant)
+                missing = target - len(idle) - self._warm_booting[variant]
+                boots.extend(self._boot_warm_container(variant) for _ in range(missing))
+
+            if boots:
+                await asyncio.gather(*boots)
+
+    async def start_warm_pool(self) -> None:
+        """Remove unclaimed warm containers left by a previous process and fill the pool.
+
+        Claimed warm containers still carry warm_pool=true (labels are immutable) but
+        were renamed and have a recorded binding; those belong to live sessions.
+        """
+
+        def _remove_orphans() -> int:
+            try:
+                containers = self.docker_client.containers.list(
+                    all=True, filters={"label": "owner=executor_manager"}
+                )
+            except Exception:
+                return 0
+            live = {c.id for c in containers}
+            for docker_id in [d for d in self.warm_bindings if d not in live]:
+                self._forget_warm_binding(docker_id)
+            if not self.settings.container_warm_pool_enabled:
+                return 0
+
+            removed = 0
+            for orphan in containers:
+                labels = getattr(orphan, "labels", None) or {}
+                if (
+                    labels.get("warm_pool") != "true"
+                    or orphan.id in self.warm_bindings
+                    or not (orphan.name or "").startswith(WARM_CONTAINER_PREFIX)
+                ):
+                    continue
+                try:
+                    orphan.remove(force=True)
+                    removed += 1
+                except Exception:
+                    pass
+            shutil.rmtree(self.workspace_manager.temp_dir / "warm", ignore_errors=True)
+            return removed
+
+        removed = await self._docker(_remove_orphans)
+        if not self.settings.container_warm_pool_enabled:
+            return
+        logger.info("warm_pool_started", extra={"orphans_removed": removed})
+        self._spawn_background(self.replenish_warm_pool())
+
+    async def shutdown_warm_pool(self) -> None:
+        """Stop all idle warm containers."""
+        for task in list(self._warm_background_tasks):
+            task.cancel()
+        await asyncio.gather(*self._warm_background_tasks, return_exceptions=True)
+
+        idle: list[WarmContainer] = []
+        for variant in WARM_POOL_VARIANTS:
+            idle.extend(self.warm_containers[variant])
+            self.warm_containers[variant].clear()
+        await asyncio.gather(
+            *(self._discard_warm_container(w) for w in idle), return_exceptions=True
+        )
+
+    def _load_warm_bindings(self) -> dict[str, dict[str, str]]:
+        try:
+            data = json.loads(self._warm_bindings_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save_warm_bindings(self) -> None:
+        path = self._warm_bindings_file
+        tmp_file = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}")
+        try:
+            tmp_file.write_text(json.dumps(self.warm_bindings), encoding="utf-8")
+            os.replace(tmp_file, path)
+        except OSError as e:
+            logger.error(f"Failed to persist warm container bindings: {e}")
+
+    def _record_warm_binding(
+        self, container: "Container", labels: dict[str, str]
+    ) -> None:
+        self.warm_bindings[container.id] = labels
+        self._save_warm_bindings()
+
+    def _forget_warm_binding(self, docker_id: str | None) -> None:
+        if docker_id and self.warm_bindings.pop(docker_id, None) is not None:
+            self._save_warm_bindings()
+
+    def _container_labels(self, container: "Container") -> dict[str, str]:
+        """Docker labels, with session labels of a claimed warm container filled in."""
+        labels = dict(getattr(container, "labels", None) or {})
+        labels.update(self.warm_bindings.get(getattr(container, "id", ""), {}))
+        return labels
+
+    def _container_mode(self, container: "Container") -> str:
+        return self._container_labels(container).get("container_mode") or "ephemeral"
+
     async def on_task_complete(self, session_id: str) -> None:
         """Handle task completion. Ephemeral containers are stopped."""
         container_id = self.session_to_container.pop(session_id, None)
@@ -370,12 +937,13 @@ class ContainerPool:
 
         if container_id in self.containers:
             container = self.containers.pop(container_id)
-            container_mode = container.labels.get("container_mode", "ephemeral")
+            container_mode = self._container_mode(container)
 
             if container_mode == "ephemeral":
                 logger.info(f"Container {container_id} is ephemeral, stopping")
+                self._forget_warm_binding(container.id)
                 try:
-                    container.stop(timeout=10)
+                    await self._docker(container.stop, timeout=10)
                 except Exception as e:
                     logger.error(f"Failed to stop container {container_id}: {e}")
 
@@ -398,14 +966,15 @@ class ContainerPool:
         container = self.containers.pop(cid, None)
         if not container:
             return
+        self._forget_warm_binding(container.id)
 
         try:
-            container.stop(timeout=10)
+            await self._docker(container.stop, timeout=10)
         except Exception as e:
             logger.error(f"Failed to stop container {cid}: {e}")
 
         try:
-            container.remove(force=True)
+            await self._docker(container.remove, force=True)
         except Exception:
             # Best-effort: the container might have already been removed.
             pass
@@ -442,8 +1011,10 @@ class ContainerPool:
 
         # Prefer exact match by full session_id label.
         try:
-            found = self.docker_client.containers.list(
-                all=True, filters={"label": f"session_id={session_id}"}
+            found = await self._docker(
+                self.docker_client.containers.list,
+                all=True,
+                filters={"label": f"session_id={session_id}"},
             )
             _extend_unique(found)
         except Exception:
@@ -452,17 +1023,31 @@ class ContainerPool:
         # Best-effort: if we know the logical container_id label, try to locate by that label too.
         if container_id:
             try:
-                found = self.docker_client.containers.list(
-                    all=True, filters={"label": f"container_id={container_id}"}
+                found = await self._docker(
+                    self.docker_client.containers.list,
+                    all=True,
+                    filters={"label": f"container_id={container_id}"},
                 )
                 _extend_unique(found)
             except Exception:
                 pass
 
+        # Claimed warm containers only carry placeholder labels; use their bindings.
+        for docker_id, binding in list(self.warm_bindings.items()):
+            if binding.get("session_id") != session_id:
+                continue
+            try:
+                found = await self._docker(self.docker_client.containers.get, docker_id)
+                _extend_unique([found])
+            except docker.errors.NotFound:
+                self._forget_warm_binding(docker_id)
+            except Exception:
+                pass
+
         # Fallback to deterministic name (used by get_or_create_container).
         try:
             name = f"executor-{session_id[:8]}"
-            found = self.docker_client.containers.get(name)
+            found = await self._docker(self.docker_client.containers.get, name)
             _extend_unique([found])
         except docker.errors.NotFound:
             pass
@@ -477,10 +1062,10 @@ class ContainerPool:
             return
 
         for container in containers_to_stop:
-            labels = getattr(container, "labels", None) or {}
-            logical_id = labels.get("container_id")
+            logical_id = self._container_labels(container).get("container_id")
+            self._forget_warm_binding(container.id)
             try:
-                container.stop(timeout=10)
+                await self._docker(container.stop, timeout=10)
                 logger.info(
                     "container_stopped",
                     extra={
@@ -516,13 +1101,13 @@ class ContainerPool:
                 for sid in bound_sessions:
                     self.session_to_container.pop(sid, None)
 
-    def get_container_stats(self) -> dict[str, int | list[dict]]:
+    def get_container_stats(self) -> dict[str, int | list[dict] | dict]:
         """Get container statistics."""
         persistent = 0
         ephemeral = 0
 
         for container in self.containers.values():
-            mode = container.labels.get("container_mode", "ephemeral")
+            mode = self._container_mode(container)
             if mode == "persistent":
                 persistent += 1
             else:
@@ -534,11 +1119,22 @@ class ContainerPool:
             "ephemeral_containers": ephemeral,
             "containers": [
                 {
-                    "container_id": c.labels.get("container_id", c.name),
+                    "container_id": self._container_labels(c).get("container_id")
+                    or cid,
                     "name": c.name,
                     "status": c.status,
-                    "mode": c.labels.get("container_mode", "ephemeral"),
+                    "mode": self._container_mode(c),
                 }
-                for c in self.containers.values()
+                for cid, c in self.containers.items()
             ],
+            "warm_pool": {
+                variant: {
+                    "enabled": self.settings.container_warm_pool_enabled,
+                    "idle": len(self.warm_containers[variant]),
+                    "booting": self._warm_booting[variant],
+                    "min_size": self._warm_pool_bounds(variant)[0],
+                    "max_size": self._warm_pool_bounds(variant)[1],
+                }
+                for variant in WARM_POOL_VARIANTS
+            },
         }
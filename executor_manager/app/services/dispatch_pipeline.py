@@ -0,0 +1,365 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from app.core.settings import get_settings
+from app.services.attachment_stager import AttachmentStager
+from app.services.backend_client import BackendClient
+from app.services.claude_md_stager import ClaudeMdStager
+from app.services.config_resolver import ConfigResolver
+from app.services.container_pool import ContainerPool
+from app.services.git_mirror_cache import GitMirrorCache, get_git_mirror_cache
+from app.services.plugin_stager import PluginStager
+from app.services.skill_stager import SkillStager
+from app.services.slash_command_stager import SlashCommandStager
+from app.services.sub_agent_stager import SubAgentStager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DispatchPreparation:
+    """Everything needed to call the executor once preparation has finished."""
+
+    resolved_config: dict
+    executor_url: str
+    container_id: str
+
+
+class DispatchPipeline:
+    """Dependency-aware preparation of a task/run before it is sent to an executor.
+
+    Stage graph:
+
+        resolve_config ── claim container (reuse / warm) ───┬─ stage skills
+                                                            ├─ stage plugins
+                                                            ├─ stage inputs
+                                                            ├─ stage slash commands
+                                                            ├─ stage CLAUDE.md (optional)
+                                                            ├─ stage subagents
+                                                            ├─ seed repo from git mirror
+                                                            └─ cold-start container
+
+    Claiming a warm container moves the session workspace, so it completes before any
+    stager writes to it; a cold start only bind-mounts the workspace and overlaps with
+    staging. Blocking stagers run in worker threads, so the critical path is the
+    slowest stage rather than the sum. Per-stage timing keeps the existing
+    `<step_prefix>_*` step names.
+
+    Config resolution fetches one bundle (including slash commands and CLAUDE.md)
+    and reuses the cached bundle while the user's config version is unchanged.
+    """
+
+    def __init__(
+        self,
+        *,
+        backend_client: BackendClient | None = None,
+        container_pool: ContainerPool | None = None,
+        config_resolver: ConfigResolver | None = None,
+        skill_stager: SkillStager | None = None,
+        plugin_stager: PluginStager | None = None,
+        attachment_stager: AttachmentStager | None = None,
+        claude_md_stager: ClaudeMdStager | None = None,
+        slash_command_stager: SlashCommandStager | None = None,
+        subagent_stager: SubAgentStager | None = None,
+        git_mirror_cache: GitMirrorCache | None = None,
+    ) -> None:
+        self.backend_client = backend_client or BackendClient()
+        self.container_pool = container_pool or ContainerPool()
+        self.config_resolver = config_resolver or ConfigResolver(self.backend_client)
+        self.skill_stager = skill_stager or SkillStager()
+        self.plugin_stager = plugin_stager or PluginStager()
+        self.attachment_stager = attachment_stager or AttachmentStager()
+        self.claude_md_stager = claude_md_stager or ClaudeMdStager()
+        self.slash_command_stager = slash_command_stager or SlashCommandStager()
+        self.subagent_stager = subagent_stager or SubAgentStager()
+        self.git_mirror_cache = git_mirror_cache or get_git_mirror_cache()
+
+    @staticmethod
+    def _log_timing(step: str, started: float, **fields: Any) -> None:
+        logger.info(
+            "timing",
+            extra={
+                "step": step,
+                "duration_ms": int((time.perf_counter() - started) * 1000),
+                **fields,
+            },
+        )
+
+    async def prepare(
+        self,
+        *,
+        step_prefix: str,
+        user_id: str,
+        session_id: str,
+        config_snapshot: dict,
+        container_mode: str,
+        container_id: str | None,
+        log_ctx: dict[str, Any],
+        task_id: str | None = None,
+        run_id: str | None = None,
+        stage_claude_md: bool = False,
+    ) -> DispatchPreparation:
+        """Resolve config, stage everything and acquire a container concurrently."""
+        log_ctx = {**log_ctx, "user_id": user_id, "session_id": session_id}
+        step_started = time.perf_counter()
+        resolved_config = await self.config_resolver.resolve(
+            user_id,
+            config_snapshot,
+            session_id=session_id,
+            task_id=task_id,
+            run_id=run_id,
+            include_claude_md=stage_claude_md,
+        )
+        self._log_timing(f"{step_prefix}_resolve_config", step_started, **log_ctx)
+        # Staged by the pipeline, not sent to the executor.
+        slash_commands = resolved_config.pop("slash_commands", None) or {}
+        claude_md = resolved_config.pop("claude_md", None)
+
+        browser_enabled = bool(resolved_config.get("browser_enabled"))
+        container_started = time.perf_counter()
+        claimed = await self.container_pool.claim_container(
+            session_id=session_id,
+            user_id=user_id,
+            browser_enabled=browser_enabled,
+            container_mode=container_mode,
+            container_id=container_id,
+        )
+
+        raw_agents_val = resolved_config.pop("subagent_raw_agents", None)
+        raw_agents = raw_agents_val if isinstance(raw_agents_val, dict) else {}
+
+        async def acquire_container() -> tuple[str, str]:
+            if claimed is not None:
+                acquired = claimed
+            else:
+                acquired = await self.container_pool.create_container(
+                    session_id=session_id,
+                    user_id=user_id,
+                    browser_enabled=browser_enabled,
+                    container_mode=container_mode,
+                )
+            self._log_timing(
+                f"{step_prefix}_get_or_create_container",
+                container_started,
+                container_mode=container_mode,
+                container_id=acquired[1],
+                browser_enabled=browser_enabled,
+                warm_or_reused=claimed is not None,
+                **log_ctx,
+            )
+            return acquired
+
+        stages = [
+            acquire_container(),
+            self._stage_skills(step_prefix, resolved_config, log_ctx),
+            self._stage_plugins(step_prefix, resolved_config, log_ctx),
+            self._stage_inputs(step_prefix, resolved_config, log_ctx),
+            self._stage_slash_commands(step_prefix, slash_commands, log_ctx),
+            self._stage_subagents(step_prefix, raw_agents, log_ctx),
+            self._stage_git_mirror(
+                step_prefix, user_id, session_id, resolved_config, log_ctx
+            ),
+        ]
+        if stage_claude_md:
+            stages.append(self._stage_claude_md(step_prefix, claude_md or {}, log_ctx))
+
+        step_started = time.perf_counter()
+        # Let every stage finish (a half-started container must be tracked before
+        # the caller's failure cleanup runs), then surface the first error.
+        results = await asyncio.gather(*stages, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        self._log_timing(
+            f"{step_prefix}_stages_concurrent",
+            step_started,
+            stages=len(stages),
+            **log_ctx,
+        )
+
+        executor_url, acquired_container_id = results[0]
+        return DispatchPreparation(
+            resolved_config=resolved_config,
+            executor_url=executor_url,
+            container_id=acquired_container_id,
+        )
+
+    async def _stage_git_mirror(
+        self,
+        step_prefix: str,
+        user_id: str,
+        session_id: str,
+        resolved_config: dict,
+        log_ctx: dict[str, Any],
+    ) -> None:
+        """Seed the task repository from the host mirror cache (best-effort)."""
+        repo_url = str(resolved_config.get("repo_url") or "").strip()
+        if not repo_url:
+            return
+        resolved_config["git_clone_mode"] = get_settings().git_clone_mode
+        if not self.git_mirror_cache.enabled:
+            return
+        workspace_dir = Path(
+            self.container_pool.workspace_manager.get_workspace_volume(
+                user_id, session_id
+            )
+        )
+        destination = workspace_dir / GitMirrorCache.repo_dir_name(repo_url)
+        if destination.exists():
+            return
+        step_started = time.perf_counter()
+        try:
+            action = await self.git_mirror_cache.materialize(
+                repo_url,
+                destination,
+                branch=str(resolved_config.get("git_branch") or "").strip() or None,
+                git_token=resolved_config.get("git_token"),
+            )
+        except Exception as exc:
+            # The executor falls back to cloning from the remote.
+            logger.warning(
+                "git_mirror_unavailable",
+                extra={**log_ctx, "error": str(exc)},
+            )
+            return
+        self._log_timing(
+            f"{step_prefix}_stage_git_mirror", step_started, action=action, **log_ctx
+        )
+
+    async def _stage_skills(
+        self, step_prefix: str, resolved_config: dict, log_ctx: dict[str, Any]
+    ) -> None:
+        step_started = time.perf_counter()
+        staged_skills = await asyncio.to_thread(
+            self.skill_stager.stage_skills,
+            user_id=log_ctx["user_id"],
+            session_id=log_ctx["session_id"],
+            skills=resolved_config.get("skill_files") or {},
+        )
+        resolved_config["skill_files"] = staged_skills
+        self._log_timing(
+            f"{step_prefix}_stage_skills",
+            step_started,
+            skills_staged=len(staged_skills),
+            **log_ctx,
+        )
+
+    async def _stage_plugins(
+        self, step_prefix: str, resolved_config: dict, log_ctx: dict[str, Any]
+    ) -> None:
+        step_started = time.perf_counter()
+        staged_plugins = await asyncio.to_thread(
+            self.plugin_stager.stage_plugins,
+            user_id=log_ctx["user_id"],
+            session_id=log_ctx["session_id"],
+            plugins=resolved_config.get("plugin_files") or {},
+        )
+        resolved_config["plugin_files"] = staged_plugins
+        self._log_timing(
+            f"{step_prefix}_stage_plugins",
+            step_started,
+            plugins_staged=len(staged_plugins),
+            **log_ctx,
+        )
+
+    async def _stage_inputs(
+        self, step_prefix: str, resolved_config: dict, log_ctx: dict[str, Any]
+    ) -> None:
+        step_started = time.perf_counter()
+        staged_inputs = await asyncio.to_thread(
+            self.attachment_stager.stage_inputs,
+            user_id=log_ctx["user_id"],
+            session_id=log_ctx["session_id"],
+            inputs=resolved_config.get("input_files") or [],
+        )
+        resolved_config["input_files"] = staged_inputs
+        self._log_timing(
+            f"{step_prefix}_stage_inputs",
+            step_started,
+            inputs_staged=len(staged_inputs),
+            **log_ctx,
+        )
+
+    async def _stage_slash_commands(
+        self,
+        step_prefix: str,
+        resolved_commands: dict[str, str],
+        log_ctx: dict[str, Any],
+    ) -> None:
+        step_started = time.perf_counter()
+        staged_commands = await asyncio.to_thread(
+            self.slash_command_stager.stage_commands,
+            user_id=log_ctx["user_id"],
+            session_id=log_ctx["session_id"],
+            commands=resolved_commands,
+        )
+        self._log_timing(
+            f"{step_prefix}_stage_slash_commands",
+            step_started,
+            commands_staged=len(staged_commands),
+            **log_ctx,
+        )
+
+    async def _stage_claude_md(
+        self,
+        step_prefix: str,
+        claude_md: dict,
+        log_ctx: dict[str, Any],
+    ) -> None:
+        # Stage user-level CLAUDE.md (persistent instructions) into ~/.claude.
+        step_started = time.perf_counter()
+        try:
+            enabled = bool(claude_md.get("enabled"))
+            content = (
+                claude_md.get("content")
+                if isinstance(claude_md.get("content"), str)
+                else ""
+            )
+            staged_md = await asyncio.to_thread(
+                self.claude_md_stager.stage,
+                user_id=log_ctx["user_id"],
+                session_id=log_ctx["session_id"],
+                enabled=enabled,
+                content=content,
+            )
+            bytes_val = staged_md.get("bytes", 0)
+            self._log_timing(
+                f"{step_prefix}_stage_claude_md",
+                step_started,
+                enabled=bool(staged_md.get("enabled")),
+                bytes=int(bytes_val) if isinstance(bytes_val, int) else 0,
+                **log_ctx,
+            )
+        except Exception as exc:
+            # Best-effort: don't block execution if CLAUDE.md staging fails.
+            logger.warning(
+                f"Failed to stage CLAUDE.md for session {log_ctx['session_id']}: {exc}"
+            )
+
+    async def _stage_subagents(
+        self, step_prefix: str, raw_agents: dict, log_ctx: dict[str, Any]
+    ) -> None:
+        step_started = time.perf_counter()
+        try:
+            staged_agents = await asyncio.to_thread(
+                self.subagent_stager.stage_raw_agents,
+                user_id=log_ctx["user_id"],
+                session_id=log_ctx["session_id"],
+                raw_agents=raw_agents,
+            )
+            self._log_timing(
+                f"{step_prefix}_stage_subagents",
+                step_started,
+                subagents_requested=len(raw_agents),
+                subagents_staged=len(staged_agents),
+                **log_ctx,
+            )
+        except Exception as exc:
+            # Best-effort: keep tasks running even if staging fails.
+            logger.warning(
+                f"Failed to stage subagents for session {log_ctx['session_id']}: {exc}"
+            )
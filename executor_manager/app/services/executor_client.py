@@ -1,5 +1,6 @@
 import httpx
 
+from app.core.http_client import get_http_client
 from app.core.settings import get_settings
 from app.core.observability.request_context import (
     generate_request_id,
@@ -7,6 +8,7 @@ from app.core.observability.request_context import (
     get_request_id,
     get_trace_id,
 )
+from app.core.observability.tracing import TRACEPARENT_HEADER, current_traceparent
 
 
 class ExecutorClient:
@@ -18,10 +20,14 @@ class ExecutorClient:
 
     @staticmethod
     def _trace_headers() -> dict[str, str]:
-        return {
+        headers = {
             "X-Request-ID": get_request_id() or generate_request_id(),
             "X-Trace-ID": get_trace_id() or generate_trace_id(),
         }
+        traceparent = current_traceparent()
+        if traceparent:
+            headers[TRACEPARENT_HEADER] = traceparent
+        return headers
 
     async def execute_task(
         self,
@@ -48,23 +54,23 @@ class ExecutorClient:
             callback_base_url: Base URL for callback-related APIs
             sdk_session_id: Claude SDK session ID for resuming conversations
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{executor_url}/v1/tasks/execute",
-                json={
-                    "session_id": session_id,
-                    "run_id": run_id,
-                    "prompt": prompt,
-                    "callback_url": callback_url,
-                    "callback_token": callback_token,
-                    "callback_base_url": callback_base_url,
-                    "config": config,
-                    "sdk_session_id": sdk_session_id,
-                    "permission_mode": permission_mode or "default",
-                },
-                headers=self._trace_headers(),
-                timeout=httpx.Timeout(30.0, connect=10.0),
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["session_id"]
+        client = get_http_client()
+        response = await client.post(
+            f"{executor_url}/v1/tasks/execute",
+            json={
+                "session_id": session_id,
+                "run_id": run_id,
+                "prompt": prompt,
+                "callback_url": callback_url,
+                "callback_token": callback_token,
+                "callback_base_url": callback_base_url,
+                "config": config,
+                "sdk_session_id": sdk_session_id,
+                "permission_mode": permission_mode or "default",
+            },
+            headers=self._trace_headers(),
+            timeout=httpx.Timeout(30.0, connect=10.0),
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["session_id"]
@@ -0,0 +1,391 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import shutil
+import stat
+import threading
+import time
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlparse, urlunparse
+
+from app.core.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# A materialization may still be hardlinking from a mirror; never evict mirrors
+# used this recently.
+_EVICT_MIN_IDLE_SECONDS = 3600
+
+_ASKPASS_SCRIPT = """#!/bin/sh
+prompt="$1"
+case "$prompt" in
+  *Username*) echo "${POCO_GIT_USERNAME:-x-access-token}" ;;
+  *) echo "${POCO_GIT_TOKEN:-}" ;;
+esac
+"""
+
+
+class GitMirrorError(Exception):
+    """Raised when a mirror cannot be created, refreshed or materialized."""
+
+
+class GitMirrorCache:
+    """Host-level cache of bare git mirrors used to seed session repositories.
+
+    Mirrors are keyed by the normalized repository URL (credentials stripped) and
+    refreshed with `git fetch --prune` at most once per GIT_MIRROR_REFRESH_SECONDS.
+    A session repository is materialized with `git clone --local` from the mirror
+    (objects are hardlinked when the cache shares a filesystem with WORKSPACE_ROOT)
+    and its origin is pointed back at the real URL, so the executor finds an
+    existing clone and only fetches what changed since the last refresh. Clones do
+    not depend on the mirror afterwards, so eviction (LRU once the cache exceeds
+    GIT_MIRROR_CACHE_MAX_BYTES) never breaks a workspace.
+
+    Mirrors are shared across users, so every use is authorized against the remote
+    with the caller's credentials: a refresh fetch, or an `ls-remote` when the
+    mirror is still fresh.
+
+    Layout:
+        <root>/mirrors/<key>.git              (bare mirror)
+        <root>/mirrors/<key>.json             (url, size_bytes, fetched_at; mtime = last use)
+        <root>/tmp/<key>-<nonce>.git          (in-flight clones)
+    """
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        *,
+        enabled: bool | None = None,
+        max_bytes: int | None = None,
+        refresh_seconds: int | None = None,
+        timeout_seconds: int | None = None,
+    ) -> None:
+        settings = get_settings()
+        self.root = root or Path(
+            settings.git_mirror_cache_dir
+            or Path(settings.workspace_root) / "cache" / "git"
+        )
+        self.mirrors_dir = self.root / "mirrors"
+        self.tmp_dir = self.root / "tmp"
+        self.enabled = (
+            settings.git_mirror_cache_enabled if enabled is None else bool(enabled)
+        )
+        self.max_bytes = int(
+            settings.git_mirror_cache_max_bytes if max_bytes is None else max_bytes
+        )
+        self.refresh_seconds = int(
+            settings.git_mirror_refresh_seconds
+            if refresh_seconds is None
+            else refresh_seconds
+        )
+        self.timeout_seconds = int(
+            settings.git_mirror_timeout_seconds
+            if timeout_seconds is None
+            else timeout_seconds
+        )
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._evict_lock = threading.Lock()
+
+        if self.enabled:
+            self.mirrors_dir.mkdir(parents=True, exist_ok=True)
+            self.tmp_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def strip_credentials(repo_url: str) -> str:
+        """Drop user info from a URL so tokens are never stored in a mirror."""
+        parsed = urlparse(repo_url.strip())
+        if parsed.scheme in ("http", "https", "ssh", "git") and parsed.hostname:
+            netloc = parsed.hostname
+            if parsed.port:
+                netloc = f"{netloc}:{parsed.port}"
+            return urlunparse(parsed._replace(netloc=netloc))
+        return repo_url.strip()
+
+    @classmethod
+    def normalize_url(cls, repo_url: str) -> str:
+        """Normalize a repository URL for keying (no credentials, no trailing .git)."""
+        url = cls.strip_credentials(repo_url).split("#", 1)[0].rstrip("/")
+        if url.endswith(".git"):
+            url = url[: -len(".git")]
+        parsed = urlparse(url)
+        if parsed.hostname:
+            host = parsed.hostname.lower()
+            if host == "www.github.com":
+                host = "github.com"
+            netloc = f"{host}:{parsed.port}" if parsed.port else host
+            url = urlunparse((parsed.scheme, netloc, parsed.path, "", "", ""))
+        return url
+
+    @staticmethod
+    def repo_dir_name(repo_url: str) -> str:
+        """Directory name of the clone inside /workspace.
+
+        Must match the executor's WorkspaceManager._derive_repo_path.
+        """
+        clean = repo_url.split("?", 1)[0].split("#", 1)[0].rstrip("/")
+        name = clean.split("/")[-1] if clean else "repo"
+        if name.endswith(".git"):
+            name = name[: -len(".git")]
+        if not name or name in (".", ".."):
+            name = "repo"
+        return name
+
+    @classmethod
+    def key_for(cls, repo_url: str) -> str:
+        return hashlib.sha256(cls.normalize_url(repo_url).encode()).hexdigest()[:32]
+
+    async def materialize(
+        self,
+        repo_url: str,
+        destination: Path,
+        *,
+        branch: str | None,
+        git_token: str | None,
+    ) -> str:
+        """Clone repo_url into destination from a fresh mirror; return the action.
+
+        The action is "hit" (mirror used as-is), "fetched" or "cloned".
+
+        Raises:
+            GitMirrorError: If the mirror is unavailable or the remote denies access.
+        """
+        if repo_url.strip().startswith("-"):
+            raise GitMirrorError("Repository URL must not start with '-'")
+        key = self.key_for(repo_url)
+        mirror_dir = self.mirrors_dir / f"{key}.git"
+        meta_path = self.mirrors_dir / f"{key}.json"
+        started = time.perf_counter()
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            meta = self._read_meta(meta_path)
+            if meta is None or not mirror_dir.is_dir():
+                await self._create(repo_url, key, mirror_dir, git_token)
+                action = "cloned"
+            elif time.time() - float(meta.get("fetched_at", 0)) >= self.refresh_seconds:
+                await self._run_git(
+                    ["fetch", "--prune", "--", repo_url, "+refs/*:refs/*"],
+                    cwd=mirror_dir,
+                    repo_url=repo_url,
+                    git_token=git_token,
+                )
+                action = "fetched"
+            else:
+                await self._run_git(
+                    ["ls-remote", "--heads", "--", repo_url],
+                    cwd=mirror_dir,
+                    repo_url=repo_url,
+                    git_token=git_token,
+                )
+                action = "hit"
+
+            if action != "hit":
+                size = await asyncio.to_thread(self._dir_size, mirror_dir)
+                meta = {
+                    "url": self.normalize_url(repo_url),
+                    "size_bytes": size,
+                    "fetched_at": time.time(),
+                }
+                meta_path.write_text(json.dumps(meta), encoding="utf-8")
+            else:
+                # LRU bookkeeping: the meta file mtime is the mirror's last use.
+                os.utime(meta_path)
+
+            await self._clone_local(mirror_dir, destination, repo_url, branch)
+
+        logger.info(
+            "timing",
+            extra={
+                "step": "git_mirror_materialize",
+                "duration_ms": int((time.perf_counter() - started) * 1000),
+                "mirror_key": key,
+                "action": action,
+                "size_bytes": meta.get("size_bytes"),
+            },
+        )
+        if action != "hit":
+            await asyncio.to_thread(self._evict, key)
+        return action
+
+    async def _create(
+        self, repo_url: str, key: str, mirror_dir: Path, git_token: str | None
+    ) -> None:
+        tmp_path = self.tmp_dir / f"{key}-{uuid.uuid4().hex[:8]}.git"
+        try:
+            await self._run_git(
+                ["clone", "--mirror", "--", repo_url, str(tmp_path)],
+                cwd=self.root,
+                repo_url=repo_url,
+                git_token=git_token,
+            )
+            await self._run_git(
+                ["remote", "set-url", "--", "origin", self.strip_credentials(repo_url)],
+                cwd=tmp_path,
+                repo_url=repo_url,
+                git_token=None,
+            )
+            if mirror_dir.exists():
+                shutil.rmtree(mirror_dir, ignore_errors=True)
+            tmp_path.rename(mirror_dir)
+        finally:
+            if tmp_path.exists():
+                shutil.rmtree(tmp_path, ignore_errors=True)
+
+    async def _clone_local(
+        self, mirror_dir: Path, destination: Path, repo_url: str, branch: str | None
+    ) -> None:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        args = ["clone", "--local"]
+        if branch:
+            args.extend(["--branch", branch])
+        try:
+            await self._run_git(
+                [*args, "--", str(mirror_dir), str(destination)],
+                cwd=self.root,
+                repo_url=repo_url,
+                git_token=None,
+            )
+            await self._run_git(
+                ["remote", "set-url", "--", "origin", repo_url],
+                cwd=destination,
+                repo_url=repo_url,
+                git_token=None,
+            )
+        except Exception:
+            shutil.rmtree(destination, ignore_errors=True)
+            raise
+
+    async def _run_git(
+        self,
+        args: list[str],
+        *,
+        cwd: Path,
+        repo_url: str,
+        git_token: str | None,
+    ) -> None:
+        env = {**os.environ, **self._git_env(repo_url, git_token)}
+        process = await asyncio.create_subprocess_exec(
+            "git",
+            *args,
+            cwd=str(cwd),
+            env=env,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            _, stderr = await asyncio.wait_for(
+                process.communicate(), timeout=self.timeout_seconds
+            )
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            process.kill()
+            await process.wait()
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            raise GitMirrorError(
+                f"git {args[0]} timed out after {self.timeout_seconds}s"
+            ) from None
+        if process.returncode != 0:
+            detail = stderr.decode("utf-8", errors="replace").strip()[:2000]
+            raise GitMirrorError(f"git {args[0]} failed: {detail}")
+
+    def _git_env(self, repo_url: str, git_token: str | None) -> dict[str, str]:
+        """Non-interactive git env; the token only goes to https://github.com URLs."""
+        env = {"GIT_TERMINAL_PROMPT": "0"}
+        if not git_token:
+            return env
+        parsed = urlparse(repo_url)
+        host = (parsed.hostname or "").lower()
+        if parsed.scheme not in ("http", "https") or host not in {
+            "github.com",
+            "www.github.com",
+        }:
+            return env
+        env.update(
+            {
+                "GIT_ASKPASS": str(self._ensure_askpass()),
+                "POCO_GIT_USERNAME": "x-access-token",
+                "POCO_GIT_TOKEN": git_token,
+            }
+        )
+        return env
+
+    def _ensure_askpass(self) -> Path:
+        path = self.root / "askpass.sh"
+        if not path.exists():
+            path.write_text(_ASKPASS_SCRIPT, encoding="utf-8")
+            path.chmod(stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR)
+        return path
+
+    @staticmethod
+    def _read_meta(meta_path: Path) -> dict | None:
+        try:
+            return json.loads(meta_path.read_text(encoding="utf-8"))
+        except Exception:
+            return None
+
+    @staticmethod
+    def _dir_size(path: Path) -> int:
+        total = 0
+        for dirpath, _, filenames in os.walk(path):
+            for name in filenames:
+                try:
+                    total += os.lstat(os.path.join(dirpath, name)).st_size
+                except OSError:
+                    continue
+        return total
+
+    def _evict(self, keep: str) -> None:
+        """Evict least recently used mirrors until the cache fits max_bytes."""
+        if self.max_bytes <= 0 or not self._evict_lock.acquire(blocking=False):
+            return
+        try:
+            entries: list[tuple[float, int, str]] = []
+            total = 0
+            for meta_path in self.mirrors_dir.glob("*.json"):
+                meta = self._read_meta(meta_path)
+                if meta is None:
+                    continue
+                try:
+                    last_used = meta_path.stat().st_mtime
+                except OSError:
+                    continue
+                size = int(meta.get("size_bytes", 0))
+                total += size
+                entries.append((last_used, size, meta_path.stem))
+
+            if total <= self.max_bytes:
+                return
+
+            evicted = 0
+            now = time.time()
+            for last_used, size, key in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                if key == keep or now - last_used < _EVICT_MIN_IDLE_SECONDS:
+                    continue
+                if key in self._locks and self._locks[key].locked():
+                    continue
+                (self.mirrors_dir / f"{key}.json").unlink(missing_ok=True)
+                shutil.rmtree(self.mirrors_dir / f"{key}.git", ignore_errors=True)
+                total -= size
+                evicted += 1
+            logger.info(
+                "git_mirror_cache_evicted",
+                extra={
+                    "evicted": evicted,
+                    "remaining_bytes": total,
+                    "max_bytes": self.max_bytes,
+                },
+            )
+        finally:
+            self._evict_lock.release()
+
+
+@lru_cache
+def get_git_mirror_cache() -> GitMirrorCache:
+    """Process-wide git mirror cache."""
+    return GitMirrorCache()
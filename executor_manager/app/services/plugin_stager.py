@@ -7,6 +7,12 @@ from typing import Any
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
+from app.services.staging_cache import (
+    StageItem,
+    StageItemError,
+    StagingCache,
+    get_staging_cache,
+)
 from app.services.storage_service import S3StorageService
 from app.services.workspace_manager import WorkspaceManager
 
@@ -18,8 +24,12 @@ class PluginStager:
         self,
         storage_service: S3StorageService | None = None,
         workspace_manager: WorkspaceManager | None = None,
+        staging_cache: StagingCache | None = None,
     ) -> None:
-        self.storage_service = storage_service or S3StorageService()
+        self.staging_cache = staging_cache or (
+            StagingCache(storage_service) if storage_service else get_staging_cache()
+        )
+        self.storage_service = self.staging_cache.storage_service
         self.workspace_manager = workspace_manager or WorkspaceManager()
 
     @staticmethod
@@ -74,6 +84,8 @@ class PluginStager:
         removed = self._clean_plugins_dir(plugins_root, enabled_names)
 
         staged: dict[str, dict[str, Any]] = {}
+        items: list[StageItem] = []
+        entries: dict[str, dict[str, Any]] = {}
         plugins_root_resolved = plugins_root.resolve()
         for name, spec in (plugins or {}).items():
             if not isinstance(spec, dict):
@@ -93,43 +105,49 @@ class PluginStager:
                     message=f"Invalid plugin path: {name}",
                 )
             target_dir.mkdir(parents=True, exist_ok=True)
-
-            try:
-                step_started = time.perf_counter()
-                if entry.get("is_prefix") or str(s3_key).endswith("/"):
-                    self.storage_service.download_prefix(
-                        prefix=str(s3_key), destination_dir=target_dir
-                    )
-                else:
-                    filename = Path(str(s3_key)).name
-                    destination = target_dir / filename
-                    self.storage_service.download_file(
-                        key=str(s3_key), destination=destination
-                    )
-                logger.info(
-                    "timing",
-                    extra={
-                        "step": "plugin_stage_download",
-                        "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                        "user_id": user_id,
-                        "session_id": session_id,
-                        "plugin_name": name,
-                        "s3_key": str(s3_key),
-                        "is_prefix": bool(entry.get("is_prefix"))
-                        or str(s3_key).endswith("/"),
-                    },
+            items.append(
+                StageItem(
+                    name=name,
+                    s3_key=str(s3_key),
+                    is_prefix=bool(entry.get("is_prefix")) or str(s3_key).endswith("/"),
+                    destination=target_dir,
                 )
-            except Exception as exc:
-                raise AppException(
-                    error_code=ErrorCode.PLUGIN_DOWNLOAD_FAILED,
-                    message=f"Failed to stage plugin {name}: {exc}",
-                ) from exc
+            )
+            entries[name] = entry
+
+        # Resolve versions and fetch cache misses concurrently on a bounded pool.
+        try:
+            results = self.staging_cache.stage(items)
+        except StageItemError as exc:
+            raise AppException(
+                error_code=ErrorCode.PLUGIN_DOWNLOAD_FAILED,
+                message=f"Failed to stage plugin {exc.item.name}: {exc}",
+            ) from exc
 
-            staged[name] = {
-                **spec,
+        cache_hits = 0
+        for item in items:
+            result = results.get(item.name) or {}
+            cache_hits += 1 if result.get("cache_hit") else 0
+            logger.info(
+                "timing",
+                extra={
+                    "step": "plugin_stage_download",
+                    "duration_ms": result.get("duration_ms", 0),
+                    "user_id": user_id,
+                    "session_id": session_id,
+                    "plugin_name": item.name,
+                    "s3_key": item.s3_key,
+                    "is_prefix": item.is_prefix,
+                    "cache_hit": bool(result.get("cache_hit")),
+                    "files": result.get("files", 0),
+                    "bytes": result.get("bytes", 0),
+                },
+            )
+            staged[item.name] = {
+                **plugins[item.name],
                 "enabled": True,
-                "local_path": str(target_dir),
-                "entry": entry,
+                "local_path": str(item.destination),
+                "entry": entries[item.name],
             }
 
         logger.info(
@@ -142,6 +160,7 @@ class PluginStager:
                 "plugins_requested": len(plugins or {}),
                 "plugins_staged": len(staged),
                 "plugins_removed": removed,
+                "plugins_cache_hits": cache_hits,
             },
         )
         return staged
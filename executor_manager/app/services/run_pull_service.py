@@ -6,11 +6,16 @@ import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+from app.core.observability.metrics import observe_run_claim
+from app.core.observability.tracing import record_span, run_traceparent, span
 from app.core.settings import get_settings
+from app.scheduler.pull_schedule_config import WindowPullRule
+from app.scheduler.pull_schedule_state import get_current_pull_schedule_config
 from app.scheduler.task_dispatcher import TaskDispatcher
 from app.services.backend_client import BackendClient
 from app.services.executor_client import ExecutorClient
 from app.services.config_resolver import ConfigResolver
+from app.services.dispatch_pipeline import DispatchPipeline
 from app.services.skill_stager import SkillStager
 from app.services.plugin_stager import PluginStager
 from app.services.attachment_stager import AttachmentStager
@@ -20,6 +25,12 @@ from app.services.sub_agent_stager import SubAgentStager
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on pending delayed wake-ups (future scheduled runs).
+_MAX_WAKE_TIMERS = 1024
+
+# Queues polled together, as configured by one pull rule.
+QueueGroup = tuple[str, ...]
+
 
 class RunPullService:
     """Background service that pulls queued runs from Backend and dispatches them."""
@@ -36,6 +47,17 @@ class RunPullService:
         self.claude_md_stager = ClaudeMdStager()
         self.slash_command_stager = SlashCommandStager()
         self.subagent_stager = SubAgentStager()
+        self.pipeline = DispatchPipeline(
+            backend_client=self.backend_client,
+            container_pool=self.container_pool,
+            config_resolver=self.config_resolver,
+            skill_stager=self.skill_stager,
+            plugin_stager=self.plugin_stager,
+            attachment_stager=self.attachment_stager,
+            claude_md_stager=self.claude_md_stager,
+            slash_command_stager=self.slash_command_stager,
+            subagent_stager=self.subagent_stager,
+        )
 
         self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
         self._semaphore = asyncio.Semaphore(self.settings.max_concurrent_tasks)
@@ -44,6 +66,19 @@ class RunPullService:
         self._logged_started = False
         self._windows_until: dict[str, datetime] = {}
         self._window_locks: dict[str, asyncio.Lock] = {}
+        # Wake-up polls: one in-flight poll per queue group; wake-ups arriving
+        # meanwhile make it poll once more instead of starting another.
+        self._wake_tasks: dict[QueueGroup, asyncio.Task[None]] = {}
+        self._wake_again: set[QueueGroup] = set()
+        self._wake_timers: dict[tuple[QueueGroup, int], asyncio.TimerHandle] = {}
+        # Queue groups whose last poll stopped for lack of free dispatch slots.
+        self._backlog: set[QueueGroup] = set()
+        self.fair_share = self._build_fair_share()
+        # Per-user claim stats: user_id -> [claims, total wait s, max wait s], where
+        # wait is claim time minus scheduled_at; plus in-flight dispatches per user.
+        self._user_claims: dict[str, list[float]] = {}
+        self._user_dispatching: dict[str, int] = {}
+        self._task_users: dict[asyncio.Task[None], str] = {}
 
     def _get_window_lock(self, window_id: str) -> asyncio.Lock:
         lock = self._window_locks.get(window_id)
@@ -121,17 +156,32 @@ class RunPullService:
             )
             self._logged_started = True
 
-        while not self._shutdown and not self._semaphore.locked():
-            await self._semaphore.acquire()
+        group: QueueGroup = tuple(schedule_modes or ())
+        batch_size = max(1, int(self.settings.task_claim_batch_size))
+        while not self._shutdown:
+            if self._semaphore.locked():
+                # Out of dispatch slots: poll again as soon as a dispatch finishes.
+                self._backlog.add(group)
+                return
+            # Reserve free dispatch slots (up to one batch), then claim that many
+            # runs in a single round trip.
+            reserved = 0
+            while reserved < batch_size and not self._semaphore.locked():
+                await self._semaphore.acquire()
+                reserved += 1
 
             try:
                 step_started = time.perf_counter()
-                claim = await self.backend_client.claim_run(
+                claim_started_ns = time.time_ns()
+                claims = await self.backend_client.claim_runs(
                     worker_id=self.worker_id,
+                    limit=reserved,
                     lease_seconds=lease_seconds,
                     schedule_modes=schedule_modes,
+                    fair_share=self.fair_share,
                 )
-                if claim:
+                observe_run_claim(step_started, claims)
+                if claims:
                     logger.info(
                         "timing",
                         extra={
@@ -142,29 +192,256 @@ class RunPullService:
                             "worker_id": self.worker_id,
                             "lease_seconds": lease_seconds,
                             "schedule_modes": schedule_modes,
+                            "requested": reserved,
+                            "claimed": len(claims),
                         },
                     )
             except Exception as e:
-                logger.error(f"Failed to claim run from backend: {e}")
-                self._semaphore.release()
+                logger.error(f"Failed to claim runs from backend: {e}")
+                for _ in range(reserved):
+                    self._semaphore.release()
                 return
 
-            if not claim:
+            for _ in range(reserved - len(claims)):
                 self._semaphore.release()
+            claimed_at = datetime.now(timezone.utc)
+            claimed_ns = time.time_ns()
+            for claim in claims:
+                self._record_claim_spans(
+                    claim, claim_started_ns, claimed_ns, batch_size=len(claims)
+                )
+                task = asyncio.create_task(self._handle_claim(claim))
+                self._tasks.add(task)
+                self._record_claim(task, claim, claimed_at)
+                task.add_done_callback(self._on_task_done)
+
+            if len(claims) < reserved:
+                self._backlog.discard(group)
+                # Slots this poll held were returned; queues that found none free
+                # meanwhile can use them.
+                self._resume_backlog()
                 return
 
-            task = asyncio.create_task(self._handle_claim(claim))
-            self._tasks.add(task)
-            task.add_done_callback(self._on_task_done)
+    def wake(self, wakeups: list[tuple[str | None, datetime | None]]) -> int:
+        """Poll queues that got claimable runs instead of waiting for the pull jobs.
+
+        Each wake-up names a schedule mode (None for every queue) and optionally the
+        time its run becomes claimable. Only queues the pull schedule currently polls
+        are woken, so window rules keep their hours. Returns the number of polls
+        started or scheduled.
+        """
+        if self._shutdown:
+            return 0
+        groups = self._pollable_groups()
+        now_utc = datetime.now(timezone.utc)
+        woken = 0
+        for schedule_mode, run_at in wakeups:
+            for group in groups:
+                if schedule_mode is not None and schedule_mode not in group:
+                    continue
+                if run_at is not None and run_at > now_utc:
+                    self._schedule_wake(group, run_at, now_utc)
+                else:
+                    self._request_poll(group)
+                woken += 1
+        return woken
+
+    async def release_expired_claims(self) -> None:
+        """Periodic job: return runs with expired claim leases to the queue."""
+        started = time.perf_counter()
+        try:
+            released = await self.backend_client.release_expired_run_claims()
+        except Exception as e:
+            logger.error(f"Failed to release expired run claims: {e}")
+            return
+        if released:
+            logger.info(
+                "run_claims_released",
+                extra={
+                    "duration_ms": int((time.perf_counter() - started) * 1000),
+                    "released": released,
+                },
+            )
+            self.wake([(None, None)])
 
     async def shutdown(self) -> None:
         """Request shutdown and cancel inflight dispatch tasks."""
         self._shutdown = True
         await self._drain_tasks()
 
+    def dispatch_stats(self) -> dict[str, int]:
+        """In-flight dispatches and the dispatch concurrency limit."""
+        return {
+            "inflight": len(self._tasks),
+            "capacity": int(self.settings.max_concurrent_tasks),
+        }
+
+    def user_stats(self) -> dict[str, dict[str, Any]]:
+        """Claims, claim wait and in-flight dispatches per user on this manager."""
+        users = set(self._user_claims) | set(self._user_dispatching)
+        stats: dict[str, dict[str, Any]] = {}
+        for user_id in users:
+            claims, total_wait, max_wait = self._user_claims.get(user_id, [0, 0.0, 0.0])
+            stats[user_id] = {
+                "claimed": int(claims),
+                "dispatching": self._user_dispatching.get(user_id, 0),
+                "avg_wait_seconds": round(total_wait / claims, 3) if claims else None,
+                "max_wait_seconds": round(max_wait, 3) if claims else None,
+            }
+        return stats
+
+    def _build_fair_share(self) -> dict[str, Any]:
+        fair_share: dict[str, Any] = {}
+        per_user = int(self.settings.task_max_active_runs_per_user)
+        if per_user > 0:
+            fair_share["max_active_per_user"] = per_user
+        per_mode = {
+            mode: int(quota)
+            for mode, quota in self.settings.task_max_active_runs_per_mode.items()
+            if int(quota) > 0
+        }
+        if per_mode:
+            fair_share["max_active_per_mode"] = per_mode
+        weights = {
+            user_id: float(weight)
+            for user_id, weight in self.settings.task_user_weights.items()
+            if float(weight) > 0
+        }
+        if weights:
+            fair_share["user_weights"] = weights
+        return fair_share
+
+    def _record_claim(
+        self, task: asyncio.Task[None], claim: dict[str, Any], claimed_at: datetime
+    ) -> None:
+        user_id = str(claim.get("user_id") or "")
+        if not user_id:
+            return
+        self._task_users[task] = user_id
+        self._user_dispatching[user_id] = self._user_dispatching.get(user_id, 0) + 1
+
+        stats = self._user_claims.setdefault(user_id, [0, 0.0, 0.0])
+        stats[0] += 1
+        scheduled_at = (claim.get("run") or {}).get("scheduled_at")
+        try:
+            scheduled = datetime.fromisoformat(str(scheduled_at))
+        except ValueError:
+            return
+        if scheduled.tzinfo is None:
+            scheduled = scheduled.replace(tzinfo=timezone.utc)
+        wait = max(0.0, (claimed_at - scheduled).total_seconds())
+        stats[1] += wait
+        stats[2] = max(stats[2], wait)
+
+    @staticmethod
+    def _record_claim_spans(
+        claim: dict[str, Any],
+        claim_started_ns: int,
+        claimed_ns: int,
+        *,
+        batch_size: int,
+    ) -> None:
+        """Record queue wait and the claim round trip in the run's own trace."""
+        run = claim.get("run") or {}
+        run_id = run.get("run_id")
+        if not run_id:
+            return
+        parent = run_traceparent(str(run_id))
+        try:
+            scheduled = datetime.fromisoformat(str(run.get("scheduled_at")))
+        except ValueError:
+            scheduled = None
+        if scheduled is not None:
+            if scheduled.tzinfo is None:
+                scheduled = scheduled.replace(tzinfo=timezone.utc)
+            scheduled_ns = int(scheduled.timestamp() * 1e9)
+            record_span(
+                "run.queued",
+                min(scheduled_ns, claim_started_ns),
+                claim_started_ns,
+                parent=parent,
+                schedule_mode=run.get("schedule_mode"),
+            )
+        record_span(
+            "run.claim",
+            claim_started_ns,
+            claimed_ns,
+            parent=parent,
+            batch_size=batch_size,
+        )
+
+    def _pollable_groups(self) -> list[QueueGroup]:
+        config = get_current_pull_schedule_config()
+        if not config or not config.enabled:
+            return []
+        now_utc = datetime.now(timezone.utc)
+        groups: list[QueueGroup] = []
+        for rule in config.rules:
+            if not rule.enabled:
+                continue
+            if isinstance(rule, WindowPullRule):
+                until_utc = self._windows_until.get(rule.id)
+                if not until_utc or now_utc >= until_utc:
+                    continue
+            groups.append(tuple(rule.schedule_modes))
+        return groups
+
+    def _request_poll(self, group: QueueGroup) -> None:
+        if self._shutdown:
+            return
+        if group in self._wake_tasks:
+            self._wake_again.add(group)
+            return
+        task = asyncio.create_task(self._wake_poll(group))
+        self._wake_tasks[group] = task
+
+    async def _wake_poll(self, group: QueueGroup) -> None:
+        try:
+            while not self._shutdown:
+                self._wake_again.discard(group)
+                await self.poll(schedule_modes=list(group) or None)
+                if group not in self._wake_again:
+                    return
+        finally:
+            self._wake_tasks.pop(group, None)
+
+    def _schedule_wake(
+        self, group: QueueGroup, run_at: datetime, now_utc: datetime
+    ) -> None:
+        key = (group, int(run_at.timestamp()))
+        if key in self._wake_timers or len(self._wake_timers) >= _MAX_WAKE_TIMERS:
+            return
+        delay = (run_at - now_utc).total_seconds()
+        self._wake_timers[key] = asyncio.get_running_loop().call_later(
+            delay, self._fire_wake_timer, key
+        )
+
+    def _fire_wake_timer(self, key: tuple[QueueGroup, int]) -> None:
+        self._wake_timers.pop(key, None)
+        group = key[0]
+        if group in self._pollable_groups():
+            self._request_poll(group)
+
+    def _resume_backlog(self) -> None:
+        if not self._backlog or self._shutdown:
+            return
+        pollable = self._pollable_groups()
+        for group in list(self._backlog):
+            if not group or group in pollable:
+                self._request_poll(group)
+        self._backlog.clear()
+
     def _on_task_done(self, task: asyncio.Task[None]) -> None:
         self._tasks.discard(task)
         self._semaphore.release()
+        user_id = self._task_users.pop(task, None)
+        if user_id:
+            remaining = self._user_dispatching.get(user_id, 0) - 1
+            if remaining > 0:
+                self._user_dispatching[user_id] = remaining
+            else:
+                self._user_dispatching.pop(user_id, None)
+        self._resume_backlog()
         try:
             exc = task.exception()
         except asyncio.CancelledError:
@@ -173,6 +450,14 @@ class RunPullService:
             logger.error(f"Run dispatch task failed: {exc}")
 
     async def _drain_tasks(self) -> None:
+        for handle in self._wake_timers.values():
+            handle.cancel()
+        self._wake_timers.clear()
+        wake_tasks = list(self._wake_tasks.values())
+        for t in wake_tasks:
+            t.cancel()
+        if wake_tasks:
+            await asyncio.gather(*wake_tasks, return_exceptions=True)
         if not self._tasks:
             return
         tasks = list(self._tasks)
@@ -207,242 +492,98 @@ class RunPullService:
             "user_id": user_id,
         }
 
-        try:
-            step_started = time.perf_counter()
-            resolved_config = await self.config_resolver.resolve(
-                user_id,
-                config_snapshot,
-                session_id=session_id,
-                run_id=str(run_id),
-            )
-            logger.info(
-                "timing",
-                extra={
-                    "step": "run_dispatch_resolve_config",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    **ctx,
-                },
-            )
-
-            step_started = time.perf_counter()
-            staged_skills = self.skill_stager.stage_skills(
-                user_id=user_id,
-                session_id=session_id,
-                skills=resolved_config.get("skill_files") or {},
-            )
-            resolved_config["skill_files"] = staged_skills
-            logger.info(
-                "timing",
-                extra={
-                    "step": "run_dispatch_stage_skills",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    "skills_staged": len(staged_skills),
-                    **ctx,
-                },
-            )
-
-            step_started = time.perf_counter()
-            staged_plugins = self.plugin_stager.stage_plugins(
-                user_id=user_id,
-                session_id=session_id,
-                plugins=resolved_config.get("plugin_files") or {},
-            )
-            resolved_config["plugin_files"] = staged_plugins
-            logger.info(
-                "timing",
-                extra={
-                    "step": "run_dispatch_stage_plugins",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    "plugins_staged": len(staged_plugins),
-                    **ctx,
-                },
-            )
-
-            step_started = time.perf_counter()
-            staged_inputs = self.attachment_stager.stage_inputs(
-                user_id=user_id,
-                session_id=session_id,
-                inputs=resolved_config.get("input_files") or [],
-            )
-            resolved_config["input_files"] = staged_inputs
-            logger.info(
-                "timing",
-                extra={
-                    "step": "run_dispatch_stage_inputs",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    "inputs_staged": len(staged_inputs),
-                    **ctx,
-                },
-            )
-
-            step_started = time.perf_counter()
-            resolved_commands = await self.backend_client.resolve_slash_commands(
-                user_id=user_id
-            )
-            staged_commands = self.slash_command_stager.stage_commands(
-                user_id=user_id,
-                session_id=session_id,
-                commands=resolved_commands,
-            )
-            logger.info(
-                "timing",
-                extra={
-                    "step": "run_dispatch_stage_slash_commands",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    "commands_staged": len(staged_commands),
-                    **ctx,
-                },
-            )
-
-            # Stage user-level CLAUDE.md (persistent instructions) into ~/.claude.
-            step_started = time.perf_counter()
+        with span(
+            "run.dispatch", parent=run_traceparent(str(run_id)), **ctx
+        ) as dispatch_span:
             try:
-                claude_md = await self.backend_client.get_claude_md(user_id=user_id)
-                enabled = bool(claude_md.get("enabled"))
-                content = (
-                    claude_md.get("content")
-                    if isinstance(claude_md.get("content"), str)
-                    else ""
-                )
-                staged_md = self.claude_md_stager.stage(
+                prepared = await self.pipeline.prepare(
+                    step_prefix="run_dispatch",
                     user_id=user_id,
                     session_id=session_id,
-                    enabled=enabled,
-                    content=content,
-                )
-                bytes_val = staged_md.get("bytes", 0)
-                logger.info(
-                    "timing",
-                    extra={
-                        "step": "run_dispatch_stage_claude_md",
-                        "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                        "enabled": bool(staged_md.get("enabled")),
-                        "bytes": int(bytes_val) if isinstance(bytes_val, int) else 0,
-                        **ctx,
-                    },
-                )
-            except Exception as exc:
-                # Best-effort: don't block execution if CLAUDE.md staging fails.
-                logger.warning(
-                    f"Failed to stage CLAUDE.md for session {session_id}: {exc}"
+                    config_snapshot=config_snapshot,
+                    container_mode=container_mode,
+                    container_id=container_id,
+                    log_ctx=ctx,
+                    run_id=str(run_id),
+                    stage_claude_md=True,
                 )
+                resolved_config = prepared.resolved_config
+                executor_url = prepared.executor_url
+                container_id = prepared.container_id
 
-            step_started = time.perf_counter()
-            raw_agents_val = resolved_config.pop("subagent_raw_agents", None)
-            raw_agents = raw_agents_val if isinstance(raw_agents_val, dict) else {}
-            try:
-                staged_agents = self.subagent_stager.stage_raw_agents(
-                    user_id=user_id,
+                step_started = time.perf_counter()
+                await self.executor_client.execute_task(
+                    executor_url=executor_url,
                     session_id=session_id,
-                    raw_agents=raw_agents,
+                    run_id=str(run_id),
+                    prompt=prompt,
+                    callback_url=callback_url,
+                    callback_token=self.settings.callback_token,
+                    config=resolved_config,
+                    callback_base_url=self.settings.callback_base_url,
+                    sdk_session_id=sdk_session_id,
+                    permission_mode=permission_mode,
                 )
                 logger.info(
                     "timing",
                     extra={
-                        "step": "run_dispatch_stage_subagents",
+                        "step": "run_dispatch_executor_execute_task",
                         "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                        "subagents_requested": len(raw_agents),
-                        "subagents_staged": len(staged_agents),
+                        "container_id": container_id,
                         **ctx,
                     },
                 )
-            except Exception as exc:
-                # Best-effort: keep tasks running even if staging fails.
-                logger.warning(
-                    f"Failed to stage subagents for session {session_id}: {exc}"
-                )
-
-            step_started = time.perf_counter()
-            browser_enabled = bool(resolved_config.get("browser_enabled"))
-            (
-                executor_url,
-                container_id,
-            ) = await self.container_pool.get_or_create_container(
-                session_id=session_id,
-                user_id=user_id,
-                browser_enabled=browser_enabled,
-                container_mode=container_mode,
-                container_id=container_id,
-            )
-            logger.info(
-                "timing",
-                extra={
-                    "step": "run_dispatch_get_or_create_container",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    "container_mode": container_mode,
-                    "container_id": container_id,
-                    "browser_enabled": browser_enabled,
-                    **ctx,
-                },
-            )
+                try:
+                    step_started = time.perf_counter()
+                    await self.backend_client.start_run(
+                        run_id=run_id, worker_id=self.worker_id
+                    )
+                    logger.info(
+                        "timing",
+                        extra={
+                            "step": "run_dispatch_backend_start_run",
+                            "duration_ms": int(
+                                (time.perf_counter() - step_started) * 1000
+                            ),
+                            "worker_id": self.worker_id,
+                            **ctx,
+                        },
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to mark run {run_id} as running: {e}")
 
-            step_started = time.perf_counter()
-            await self.executor_client.execute_task(
-                executor_url=executor_url,
-                session_id=session_id,
-                run_id=str(run_id),
-                prompt=prompt,
-                callback_url=callback_url,
-                callback_token=self.settings.callback_token,
-                config=resolved_config,
-                callback_base_url=self.settings.callback_base_url,
-                sdk_session_id=sdk_session_id,
-                permission_mode=permission_mode,
-            )
-            logger.info(
-                "timing",
-                extra={
-                    "step": "run_dispatch_executor_execute_task",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    "container_id": container_id,
-                    **ctx,
-                },
-            )
-            try:
-                step_started = time.perf_counter()
-                await self.backend_client.start_run(
-                    run_id=run_id, worker_id=self.worker_id
-                )
+                logger.info(f"Dispatched run {run_id} (session={session_id})")
                 logger.info(
                     "timing",
                     extra={
-                        "step": "run_dispatch_backend_start_run",
-                        "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                        "worker_id": self.worker_id,
+                        "step": "run_dispatch_total",
+                        "duration_ms": int(
+                            (time.perf_counter() - dispatch_started) * 1000
+                        ),
+                        "container_mode": container_mode,
+                        "container_id": container_id,
                         **ctx,
                     },
                 )
-            except Exception as e:
-                logger.error(f"Failed to mark run {run_id} as running: {e}")
-
-            logger.info(f"Dispatched run {run_id} (session={session_id})")
-            logger.info(
-                "timing",
-                extra={
-                    "step": "run_dispatch_total",
-                    "duration_ms": int((time.perf_counter() - dispatch_started) * 1000),
-                    "container_mode": container_mode,
-                    "container_id": container_id,
-                    **ctx,
-                },
-            )
 
-        except Exception as e:
-            logger.error(
-                f"Failed to dispatch run {run_id} (session={session_id}): "
-                f"{type(e).__name__}: {e}",
-                exc_info=True,
-            )
-            try:
-                await self.backend_client.fail_run(
-                    run_id=run_id, worker_id=self.worker_id, error_message=str(e)
-                )
-            except Exception as fail_err:
-                logger.error(f"Failed to mark run {run_id} as failed: {fail_err}")
-
-            try:
-                await self.container_pool.cancel_task(session_id)
-            except Exception as cancel_err:
+            except Exception as e:
+                if dispatch_span is not None:
+                    dispatch_span.error = f"{type(e).__name__}: {e}"
                 logger.error(
-                    f"Failed to cancel task for session {session_id}: {cancel_err}"
+                    f"Failed to dispatch run {run_id} (session={session_id}): "
+                    f"{type(e).__name__}: {e}",
+                    exc_info=True,
                 )
+                try:
+                    await self.backend_client.fail_run(
+                        run_id=run_id, worker_id=self.worker_id, error_message=str(e)
+                    )
+                except Exception as fail_err:
+                    logger.error(f"Failed to mark run {run_id} as failed: {fail_err}")
+
+                try:
+                    await self.container_pool.cancel_task(session_id)
+                except Exception as cancel_err:
+                    logger.error(
+                        f"Failed to cancel task for session {session_id}: {cancel_err}"
+                    )
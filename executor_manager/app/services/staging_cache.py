@@ -0,0 +1,385 @@
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from app.core.settings import get_settings
+from app.services.storage_service import S3StorageService
+
+# ioctl(FICLONE): share extents copy-on-write (btrfs, XFS with reflink=1).
+_FICLONE = 0x40049409
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StageItem:
+    """One skill/plugin to stage from S3 into a session directory."""
+
+    name: str
+    s3_key: str
+    is_prefix: bool
+    destination: Path
+
+
+@dataclass
+class _ResolvedItem:
+    item: StageItem
+    digest: str
+    # (object key, relative path, size)
+    objects: list[tuple[str, str, int]] = field(default_factory=list)
+    cache_hit: bool = False
+    started: float = 0.0
+
+
+class StageItemError(Exception):
+    """Raised when a single staged item cannot be fetched or materialized."""
+
+    def __init__(self, item: StageItem, cause: Exception) -> None:
+        self.item = item
+        super().__init__(str(cause))
+
+
+class StagingCache:
+    """Host-level content-addressed cache for staged skills and plugins.
+
+    Entries are keyed by S3 key + ETag/version (for prefixes, by the listing of every
+    object's ETag and size) and shared across sessions. Staged directories are
+    materialized as reflinks where the filesystem supports them and as copies
+    otherwise (never hardlinks: workspaces are writable by the agent), misses are
+    downloaded concurrently on a bounded worker pool, and the cache is evicted in LRU
+    order once it exceeds STAGING_CACHE_MAX_BYTES.
+
+    Layout:
+        <root>/entries/<digest>/meta.json
+        <root>/entries/<digest>/files/...
+        <root>/tmp/<digest>-<nonce>/...      (in-flight downloads)
+    """
+
+    def __init__(
+        self,
+        storage_service: S3StorageService | None = None,
+        root: Path | None = None,
+        *,
+        enabled: bool | None = None,
+        max_bytes: int | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        settings = get_settings()
+        self.storage_service = storage_service or S3StorageService()
+        self.root = root or Path(
+            settings.staging_cache_dir
+            or Path(settings.workspace_root) / "cache" / "staging"
+        )
+        self.entries_dir = self.root / "entries"
+        self.tmp_dir = self.root / "tmp"
+        self.enabled = (
+            settings.staging_cache_enabled if enabled is None else bool(enabled)
+        )
+        self.max_bytes = int(
+            settings.staging_cache_max_bytes if max_bytes is None else max_bytes
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(
+                1,
+                int(
+                    settings.staging_download_max_workers
+                    if max_workers is None
+                    else max_workers
+                ),
+            ),
+            thread_name_prefix="staging",
+        )
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._evict_lock = threading.Lock()
+
+        if self.enabled:
+            self.entries_dir.mkdir(parents=True, exist_ok=True)
+            self.tmp_dir.mkdir(parents=True, exist_ok=True)
+
+    def stage(self, items: list[StageItem]) -> dict[str, dict[str, Any]]:
+        """Stage all items into their destinations.
+
+        Returns per-item stats keyed by item name:
+        {"cache_hit": bool, "files": int, "bytes": int, "duration_ms": int}.
+        """
+        if not items:
+            return {}
+
+        resolved = self._map(self._resolve, items)
+
+        if not self.enabled:
+            self._download_objects(
+                [
+                    (key, r.item.destination, rel, r)
+                    for r in resolved
+                    for key, rel, _ in r.objects
+                ]
+            )
+        else:
+            self._fill_missing(resolved)
+            self._map(self._materialize, resolved)
+            self._evict(keep={r.digest for r in resolved})
+
+        now = time.perf_counter()
+        return {
+            r.item.name: {
+                "cache_hit": r.cache_hit,
+                "files": len(r.objects),
+                "bytes": sum(size for _, _, size in r.objects),
+                "duration_ms": int((now - r.started) * 1000),
+            }
+            for r in resolved
+        }
+
+    def _map(self, fn, values: list) -> list:
+        """Run fn over values on the worker pool, re-raising the first failure."""
+        futures = [self._executor.submit(fn, value) for value in values]
+        return [future.result() for future in futures]
+
+    def _resolve(self, item: StageItem) -> _ResolvedItem:
+        """Look up the current version of an item (one HEAD or LIST round trip)."""
+        started = time.perf_counter()
+        try:
+            if item.is_prefix:
+                objects = []
+                fingerprint_parts = []
+                for entry in self.storage_service.list_object_entries(item.s3_key):
+                    key = entry["key"]
+                    if key.endswith("/"):
+                        continue
+                    relative = key[len(item.s3_key) :].lstrip("/")
+                    if not relative:
+                        continue
+                    # Validate now so cached entries can never contain escaping paths.
+                    S3StorageService.safe_destination(item.destination, relative)
+                    objects.append((key, relative, entry["size"]))
+                    fingerprint_parts.append(
+                        f"{relative}\0{entry['etag']}\0{entry['size']}"
+                    )
+                fingerprint = "\n".join(sorted(fingerprint_parts))
+            else:
+                head = self.storage_service.head_object(item.s3_key)
+                relative = Path(item.s3_key).name
+                objects = [(item.s3_key, relative, head["size"])]
+                fingerprint = (
+                    f"{head['etag']}\0{head.get('version_id') or ''}\0{head['size']}"
+                )
+        except Exception as exc:
+            raise StageItemError(item, exc) from exc
+
+        digest = hashlib.sha256(
+            f"{item.s3_key}\0{int(item.is_prefix)}\0{fingerprint}".encode()
+        ).hexdigest()
+        return _ResolvedItem(item=item, digest=digest, objects=objects, started=started)
+
+    def _lock_for(self, digest: str) -> threading.Lock:
+        with self._locks_guard:
+            lock = self._locks.get(digest)
+            if lock is None:
+                lock = threading.Lock()
+                self._locks[digest] = lock
+            return lock
+
+    def _entry_is_intact(self, digest: str) -> bool:
+        """Check that an entry exists and none of its files changed since download.
+
+        Materialized files are independent copies, so this only guards against the
+        cache directory itself being modified; size/mtime drift invalidates the entry.
+        """
+        entry_dir = self.entries_dir / digest
+        meta_path = entry_dir / "meta.json"
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            for rel, size, mtime_ns in meta.get("files", []):
+                st = (entry_dir / "files" / rel).stat()
+                if st.st_size != size or st.st_mtime_ns != mtime_ns:
+                    return False
+        except Exception:
+            return False
+        return True
+
+    def _fill_missing(self, resolved: list[_ResolvedItem]) -> None:
+        """Download every missing entry; all files of all misses share the pool."""
+        misses: dict[str, _ResolvedItem] = {}
+        for r in resolved:
+            if r.digest in misses:
+                continue
+            if self._entry_is_intact(r.digest):
+                r.cache_hit = True
+                continue
+            misses[r.digest] = r
+
+        if not misses:
+            return
+
+        locks = [self._lock_for(digest) for digest in sorted(misses)]
+        for lock in locks:
+            lock.acquire()
+        try:
+            pending: dict[str, tuple[_ResolvedItem, Path]] = {}
+            for digest, r in misses.items():
+                # Another dispatch may have filled it while we waited for the lock.
+                if self._entry_is_intact(digest):
+                    r.cache_hit = True
+                    continue
+                staging_dir = self.tmp_dir / f"{digest}-{uuid.uuid4().hex[:8]}"
+                pending[digest] = (r, staging_dir)
+
+            try:
+                self._download_objects(
+                    [
+                        (key, staging_dir / "files", rel, r)
+                        for r, staging_dir in pending.values()
+                        for key, rel, _ in r.objects
+                    ]
+                )
+                for digest, (r, staging_dir) in pending.items():
+                    self._commit_entry(digest, r, staging_dir)
+            finally:
+                for _, staging_dir in pending.values():
+                    shutil.rmtree(staging_dir, ignore_errors=True)
+        finally:
+            for lock in locks:
+                lock.release()
+
+        for r in resolved:
+            if r.digest not in misses:
+                continue
+            r.cache_hit = r.cache_hit or misses[r.digest].cache_hit
+
+    def _download_objects(
+        self, downloads: list[tuple[str, Path, str, _ResolvedItem]]
+    ) -> None:
+        def _download(job: tuple[str, Path, str, _ResolvedItem]) -> None:
+            key, destination_dir, relative, r = job
+            try:
+                destination_dir.mkdir(parents=True, exist_ok=True)
+                target = S3StorageService.safe_destination(destination_dir, relative)
+                self.storage_service.download_file(key=key, destination=target)
+            except Exception as exc:
+                raise StageItemError(r.item, exc) from exc
+
+        self._map(_download, downloads)
+
+    def _commit_entry(self, digest: str, r: _ResolvedItem, staging_dir: Path) -> None:
+        files_dir = staging_dir / "files"
+        files_dir.mkdir(parents=True, exist_ok=True)
+        files: list[tuple[str, int, int]] = []
+        total = 0
+        for _, rel, _ in r.objects:
+            st = (files_dir / rel).stat()
+            files.append((rel, st.st_size, st.st_mtime_ns))
+            total += st.st_size
+        meta = {
+            "s3_key": r.item.s3_key,
+            "is_prefix": r.item.is_prefix,
+            "size_bytes": total,
+            "files": files,
+            "created_at": time.time(),
+        }
+        (staging_dir / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+
+        entry_dir = self.entries_dir / digest
+        if entry_dir.exists():
+            # Stale (modified) entry: replace it.
+            shutil.rmtree(entry_dir, ignore_errors=True)
+        try:
+            staging_dir.rename(entry_dir)
+        except OSError:
+            # Another process committed the same digest first.
+            if not self._entry_is_intact(digest):
+                raise
+
+    def _materialize(self, r: _ResolvedItem) -> None:
+        """Reflink (or copy) a cache entry's files into the item destination."""
+        entry_dir = self.entries_dir / r.digest
+        try:
+            r.item.destination.mkdir(parents=True, exist_ok=True)
+            for _, rel, _ in r.objects:
+                source = entry_dir / "files" / rel
+                target = S3StorageService.safe_destination(r.item.destination, rel)
+                if target.exists() or target.is_symlink():
+                    target.unlink()
+                target.parent.mkdir(parents=True, exist_ok=True)
+                _clone_file(source, target)
+            # LRU bookkeeping: meta.json mtime is the entry's last use.
+            os.utime(entry_dir / "meta.json")
+        except Exception as exc:
+            raise StageItemError(r.item, exc) from exc
+
+    def _evict(self, keep: set[str]) -> None:
+        """Evict least recently used entries until the cache fits max_bytes."""
+        if self.max_bytes <= 0 or not self._evict_lock.acquire(blocking=False):
+            return
+        try:
+            entries: list[tuple[float, int, Path]] = []
+            total = 0
+            for entry_dir in self.entries_dir.iterdir():
+                meta_path = entry_dir / "meta.json"
+                try:
+                    st = meta_path.stat()
+                    size = int(
+                        json.loads(meta_path.read_text(encoding="utf-8")).get(
+                            "size_bytes", 0
+                        )
+                    )
+                except Exception:
+                    continue
+                total += size
+                entries.append((st.st_mtime, size, entry_dir))
+
+            if total <= self.max_bytes:
+                return
+
+            evicted = 0
+            for _, size, entry_dir in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                if entry_dir.name in keep:
+                    continue
+                # Materialized copies do not depend on the entry.
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                total -= size
+                evicted += 1
+            logger.info(
+                "staging_cache_evicted",
+                extra={
+                    "evicted": evicted,
+                    "remaining_bytes": total,
+                    "max_bytes": self.max_bytes,
+                },
+            )
+        finally:
+            self._evict_lock.release()
+
+
+@lru_cache
+def get_staging_cache() -> StagingCache:
+    """Process-wide staging cache shared by all stagers."""
+    return StagingCache()
+
+
+def _clone_file(source: Path, target: Path) -> None:
+    """Copy one file, sharing extents copy-on-write when the filesystem allows it.
+
+    A session may edit its staged files in place, so the target must never share
+    an inode with the cache entry.
+    """
+    try:
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError:
+        shutil.copyfile(source, target)
+    shutil.copystat(source, target)
@@ -1,4 +1,7 @@
+import io
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path, PurePosixPath
 from typing import Any, Iterable
 
@@ -12,6 +15,147 @@ from app.core.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# S3 rejects multipart parts smaller than 5 MiB (except the last one).
+_MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+class S3MultipartWriter(io.RawIOBase):
+    """Write-only, non-seekable stream backed by an S3 multipart upload.
+
+    Data is cut into parts as it is written and parts are uploaded in the
+    background; at most `max_in_flight` parts are buffered, so memory stays bounded
+    and nothing is spooled to disk. Call complete() on success or abort() on
+    failure; closing without complete() aborts the upload.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        bucket: str,
+        key: str,
+        *,
+        content_type: str | None = None,
+        part_size: int = 8 * 1024 * 1024,
+        max_in_flight: int = 4,
+    ) -> None:
+        super().__init__()
+        self._client = client
+        self._bucket = bucket
+        self.key = key
+        self._part_size = max(_MIN_PART_SIZE, int(part_size))
+        kwargs: dict[str, Any] = {"Bucket": bucket, "Key": key}
+        if content_type:
+            kwargs["ContentType"] = content_type
+        try:
+            self._upload_id = client.create_multipart_upload(**kwargs)["UploadId"]
+        except (ClientError, BotoCoreError) as exc:
+            logger.error(f"Failed to start multipart upload {key}: {exc}")
+            raise AppException(
+                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                message="Failed to start multipart upload",
+                details={"key": key, "error": str(exc)},
+            ) from exc
+
+        self._buffer = bytearray()
+        self._position = 0
+        self._futures: list[Future] = []
+        self._slots = threading.BoundedSemaphore(max(1, max_in_flight))
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_in_flight), thread_name_prefix="s3-part"
+        )
+        self._completed = False
+        self.bytes_written = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def write(self, data) -> int:
+        if self.closed:
+            raise ValueError("write to closed multipart writer")
+        view = memoryview(data).cast("B")
+        self._buffer += view
+        self._position += len(view)
+        while len(self._buffer) >= self._part_size:
+            chunk = bytes(self._buffer[: self._part_size])
+            del self._buffer[: self._part_size]
+            self._submit(chunk)
+        return len(view)
+
+    def _submit(self, chunk: bytes) -> None:
+        # Fail fast instead of producing the rest of the stream for a dead upload.
+        for future in self._futures:
+            if future.done() and future.exception() is not None:
+                raise future.exception()
+        self._slots.acquire()
+        part_number = len(self._futures) + 1
+        future = self._executor.submit(self._upload_part, part_number, chunk)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+
+    def _upload_part(self, part_number: int, chunk: bytes) -> dict[str, Any]:
+        try:
+            response = self._client.upload_part(
+                Bucket=self._bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+                PartNumber=part_number,
+                Body=chunk,
+            )
+        except (ClientError, BotoCoreError) as exc:
+            raise AppException(
+                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                message="Failed to upload multipart part",
+                details={"key": self.key, "part": part_number, "error": str(exc)},
+            ) from exc
+        return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+    def complete(self) -> None:
+        """Upload the remaining buffer and complete the multipart upload."""
+        if self._buffer or not self._futures:
+            self._submit(bytes(self._buffer))
+            self._buffer.clear()
+        parts = [future.result() for future in self._futures]
+        try:
+            self._client.complete_multipart_upload(
+                Bucket=self._bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except (ClientError, BotoCoreError) as exc:
+            logger.error(f"Failed to complete multipart upload {self.key}: {exc}")
+            raise AppException(
+                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                message="Failed to complete multipart upload",
+                details={"key": self.key, "error": str(exc)},
+            ) from exc
+        self._completed = True
+        self.bytes_written = self._position
+        self._executor.shutdown(wait=True)
+        super().close()
+
+    def abort(self) -> None:
+        """Discard uploaded parts (best-effort)."""
+        if self._completed:
+            return
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        try:
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket, Key=self.key, UploadId=self._upload_id
+            )
+        except (ClientError, BotoCoreError) as exc:
+            logger.warning(f"Failed to abort multipart upload {self.key}: {exc}")
+        self._completed = True
+        super().close()
+
+    def close(self) -> None:
+        if not self.closed and not self._completed:
+            self.abort()
+        super().close()
+
 
 class S3StorageService:
     def __init__(self) -> None:
@@ -37,6 +181,13 @@ class S3StorageService:
         config_kwargs: dict[str, Any] = {
             "connect_timeout": settings.s3_connect_timeout_seconds,
             "read_timeout": settings.s3_read_timeout_seconds,
+            # Staging downloads and workspace exports run on worker pools; give each
+            # worker (plus in-flight archive parts) a connection.
+            "max_pool_connections": max(
+                10,
+                settings.staging_download_max_workers,
+                settings.workspace_export_max_workers + 4,
+            ),
             "retries": {
                 "max_attempts": settings.s3_max_attempts,
                 "mode": "standard",
@@ -96,14 +247,81 @@ class S3StorageService:
                 details={"key": key, "error": str(exc)},
             ) from exc
 
+    def get_object_bytes(self, key: str) -> bytes | None:
+        """Return an object's body, or None if it does not exist."""
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=key)
+            return response["Body"].read()
+        except ClientError as exc:
+            code = str(exc.response.get("Error", {}).get("Code") or "")
+            if code in {"NoSuchKey", "404", "NotFound"}:
+                return None
+            logger.error(f"Failed to get object {key}: {exc}")
+            raise AppException(
+                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                message="Failed to read object",
+                details={"key": key, "error": str(exc)},
+            ) from exc
+        except BotoCoreError as exc:
+            logger.error(f"Failed to get object {key}: {exc}")
+            raise AppException(
+                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                message="Failed to read object",
+                details={"key": key, "error": str(exc)},
+            ) from exc
+
+    def delete_objects(self, keys: list[str]) -> None:
+        """Delete objects in batches of 1000 (the S3 DeleteObjects limit)."""
+        for offset in range(0, len(keys), 1000):
+            chunk = keys[offset : offset + 1000]
+            try:
+                self.client.delete_objects(
+                    Bucket=self.bucket,
+                    Delete={"Objects": [{"Key": key} for key in chunk], "Quiet": True},
+                )
+            except (ClientError, BotoCoreError) as exc:
+                logger.error(f"Failed to delete {len(chunk)} objects: {exc}")
+                raise AppException(
+                    error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                    message="Failed to delete objects",
+                    details={"keys": chunk[:10], "error": str(exc)},
+                ) from exc
+
+    def open_multipart_writer(
+        self,
+        *,
+        key: str,
+        content_type: str | None = None,
+        part_size: int = 8 * 1024 * 1024,
+        max_in_flight: int = 4,
+    ) -> S3MultipartWriter:
+        """Open a stream that uploads to `key` via multipart upload as it is written."""
+        return S3MultipartWriter(
+            self.client,
+            self.bucket,
+            key,
+            content_type=content_type,
+            part_size=part_size,
+            max_in_flight=max_in_flight,
+        )
+
     def list_objects(self, prefix: str) -> Iterable[str]:
+        for item in self.list_object_entries(prefix):
+            yield item["key"]
+
+    def list_object_entries(self, prefix: str) -> Iterable[dict[str, Any]]:
+        """List objects under a prefix with their ETag and size."""
         try:
             paginator = self.client.get_paginator("list_objects_v2")
             for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
                 for item in page.get("Contents", []) or []:
                     key = item.get("Key")
                     if key:
-                        yield key
+                        yield {
+                            "key": key,
+                            "etag": str(item.get("ETag") or "").strip('"'),
+                            "size": int(item.get("Size") or 0),
+                        }
         except (ClientError, BotoCoreError) as exc:
             logger.error(f"Failed to list objects for {prefix}: {exc}")
             raise AppException(
@@ -112,6 +330,24 @@ class S3StorageService:
                 details={"prefix": prefix, "error": str(exc)},
             ) from exc
 
+    def head_object(self, key: str) -> dict[str, Any]:
+        """Return ETag/version/size metadata for a single object."""
+        try:
+            response = self.client.head_object(Bucket=self.bucket, Key=key)
+        except (ClientError, BotoCoreError) as exc:
+            logger.error(f"Failed to head object {key}: {exc}")
+            raise AppException(
+                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                message="Failed to read object metadata",
+                details={"key": key, "error": str(exc)},
+            ) from exc
+        return {
+            "key": key,
+            "etag": str(response.get("ETag") or "").strip('"'),
+            "version_id": response.get("VersionId"),
+            "size": int(response.get("ContentLength") or 0),
+        }
+
     def download_file(self, *, key: str, destination: Path) -> None:
         try:
             destination.parent.mkdir(parents=True, exist_ok=True)
@@ -134,6 +370,11 @@ class S3StorageService:
             target = self._safe_destination(destination_dir, relative)
             self.download_file(key=key, destination=target)
 
+    @staticmethod
+    def safe_destination(destination_dir: Path, relative: str) -> Path:
+        """Resolve an object-relative path under destination_dir, rejecting escapes."""
+        return S3StorageService._safe_destination(destination_dir, relative)
+
     @staticmethod
     def _safe_destination(destination_dir: Path, relative: str) -> Path:
         rel_path = PurePosixPath(relative)
@@ -6,6 +6,7 @@ import httpx
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
+from app.core.http_client import get_http_client
 from app.core.observability.request_context import get_request_id, get_trace_id
 from app.core.settings import get_settings
 from app.scheduler.scheduler_config import scheduler
@@ -231,13 +232,13 @@ class TaskService:
         backend_client = BackendClient()
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{backend_client.settings.backend_url}/api/v1/sessions/{session_id}",
-                    headers=backend_client._trace_headers(),
-                )
-                response.raise_for_status()
-                data = response.json()
+            client = get_http_client()
+            response = await client.get(
+                f"{backend_client.settings.backend_url}/api/v1/sessions/{session_id}",
+                headers=backend_client._trace_headers(),
+            )
+            response.raise_for_status()
+            data = response.json()
 
             # Parse backend response (backend returns wrapped ResponseSchema)
             session_data = data.get("data", data)
@@ -1,12 +1,18 @@
+import hashlib
 import json
 import logging
 import mimetypes
 import os
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 from app.core.errors.exceptions import AppException
+from app.core.settings import get_settings
 from app.schemas.workspace import WorkspaceExportResult
 from app.services.storage_service import S3StorageService
 from app.services.workspace_manager import WorkspaceManager
@@ -17,8 +23,54 @@ logger = logging.getLogger(__name__)
 workspace_manager = WorkspaceManager()
 storage_service = S3StorageService()
 
+MANIFEST_VERSION = 2
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class _ScannedFile:
+    path: Path
+    rel_path: str
+    size: int
+    mtime_ns: int
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 
 class WorkspaceExportService:
+    """Export a session workspace to S3 (per-file objects, manifest and ZIP archive).
+
+    Exports are incremental: a file is re-uploaded only when its sha256 differs
+    from the previous manifest (size + mtime unchanged reuses the recorded hash
+    without reading the file), objects of deleted files are removed, and the
+    archive is rebuilt only when something changed. Files upload concurrently on a
+    bounded pool; the archive is streamed to S3 via multipart upload without a
+    temp file.
+    """
+
+    def __init__(self, *, max_workers: int | None = None) -> None:
+        settings = get_settings()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(
+                1,
+                int(
+                    settings.workspace_export_max_workers
+                    if max_workers is None
+                    else max_workers
+                ),
+            ),
+            thread_name_prefix="workspace-export",
+        )
+        self._archive_part_size = (
+            max(5, settings.workspace_export_archive_part_size_mb) * 1024 * 1024
+        )
+
     def export_workspace(self, session_id: str) -> WorkspaceExportResult:
         user_id = workspace_manager.resolve_user_id(session_id)
         if not user_id:
@@ -41,60 +93,85 @@ class WorkspaceExportService:
         manifest_key = f"{prefix}/manifest.json"
         archive_key = f"{prefix}/archive.zip"
 
+        started = time.perf_counter()
         try:
-            files = self._collect_files(workspace_dir)
-            manifest = {
-                "version": 1,
-                "generated_at": datetime.now(timezone.utc).isoformat(),
-                "files": [],
+            previous = self._load_previous_manifest(manifest_key)
+            previous_files = {
+                entry["path"]: entry
+                for entry in previous.get("files", [])
+                if isinstance(entry, dict) and isinstance(entry.get("path"), str)
             }
 
-            for file_path in files:
-                rel_path = file_path.relative_to(workspace_dir).as_posix()
-                object_key = f"{files_prefix}/{rel_path}"
-                mime_type, _ = mimetypes.guess_type(file_path.name)
-
-                storage_service.upload_file(
-                    file_path=str(file_path),
-                    key=object_key,
-                    content_type=mime_type,
+            scanned = self._collect_files(workspace_dir)
+            results = list(
+                self._executor.map(
+                    lambda item: self._export_file(
+                        item, previous_files.get(item.rel_path), files_prefix
+                    ),
+                    scanned,
                 )
+            )
+            # Files removed while exporting are left out of manifest and archive.
+            scanned = [
+                item for item, result in zip(scanned, results) if result is not None
+            ]
+            entries = [result[0] for result in results if result is not None]
+            uploaded = sum(1 for result in results if result is not None and result[1])
 
-                manifest["files"].append(
-                    {
-                        "path": rel_path,
-                        "key": object_key,
-                        "size": file_path.stat().st_size,
-                        "mimeType": mime_type,
-                        "status": "uploaded",
-                        "last_modified": datetime.fromtimestamp(
-                            file_path.stat().st_mtime, tz=timezone.utc
-                        ).isoformat(),
-                    }
+            current_paths = {item.rel_path for item in scanned}
+            stale_keys = [
+                entry["key"]
+                for path, entry in previous_files.items()
+                if path not in current_paths and isinstance(entry.get("key"), str)
+            ]
+            if stale_keys:
+                storage_service.delete_objects(stale_keys)
+
+            previous_archive = previous.get("archive") or {}
+            archive_bytes = previous_archive.get("size")
+            rebuild_archive = (
+                uploaded > 0
+                or bool(stale_keys)
+                or previous_archive.get("key") != archive_key
+                or previous_archive.get("files") != len(entries)
+            )
+            if rebuild_archive:
+                archive_bytes = self._stream_archive(
+                    archive_key=archive_key, scanned=scanned
                 )
 
+            manifest = {
+                "version": MANIFEST_VERSION,
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "files": entries,
+                "archive": {
+                    "key": archive_key,
+                    "files": len(entries),
+                    "size": archive_bytes,
+                },
+            }
             storage_service.put_object(
                 key=manifest_key,
                 body=json.dumps(manifest, ensure_ascii=False).encode("utf-8"),
                 content_type="application/json",
             )
 
-            archive_path = self._create_archive(
-                workspace_dir=workspace_dir,
-                session_id=session_id,
-                files=files,
-            )
-            storage_service.upload_file(
-                file_path=str(archive_path),
-                key=archive_key,
-                content_type="application/zip",
+            logger.info(
+                "timing",
+                extra={
+                    "step": "workspace_export",
+                    "duration_ms": int((time.perf_counter() - started) * 1000),
+                    "session_id": session_id,
+                    "user_id": user_id,
+                    "files": len(entries),
+                    "uploaded": uploaded,
+                    "unchanged": len(entries) - uploaded,
+                    "deleted": len(stale_keys),
+                    "archive_rebuilt": rebuild_archive,
+                    "archive_bytes": archive_bytes,
+                },
             )
 
-            try:
-                archive_path.unlink(missing_ok=True)
-            except Exception:
-                logger.warning(f"Failed to cleanup archive temp file: {archive_path}")
-
             return WorkspaceExportResult(
                 workspace_files_prefix=files_prefix,
                 workspace_manifest_key=manifest_key,
@@ -112,59 +189,144 @@ class WorkspaceExportService:
                 error=str(exc), workspace_export_status="failed"
             )
 
-    def _collect_files(self, workspace_dir: Path) -> list[Path]:
-        files: list[Path] = []
+    def _load_previous_manifest(self, manifest_key: str) -> dict[str, Any]:
+        """Return the last exported manifest, or {} (full export) if unusable."""
+        try:
+            raw = storage_service.get_object_bytes(manifest_key)
+        except AppException:
+            return {}
+        if not raw:
+            return {}
+        try:
+            manifest = json.loads(raw)
+        except ValueError:
+            return {}
+        if not isinstance(manifest, dict):
+            return {}
+        if manifest.get("version") != MANIFEST_VERSION:
+            # Older manifests carry no content hashes; re-upload everything once.
+            return {}
+        return manifest
+
+    def _export_file(
+        self,
+        item: _ScannedFile,
+        previous: dict[str, Any] | None,
+        files_prefix: str,
+    ) -> tuple[dict[str, Any], bool] | None:
+        """Upload one file unless its content matches the previous export.
+
+        Returns (manifest entry, uploaded), or None if the file vanished.
+        """
+        object_key = f"{files_prefix}/{item.rel_path}"
+        mime_type, _ = mimetypes.guess_type(item.path.name)
+
+        previous_hash = previous.get("sha256") if previous else None
+        if (
+            previous_hash
+            and previous.get("key") == object_key
+            and previous.get("size") == item.size
+            and previous.get("mtime_ns") == item.mtime_ns
+        ):
+            digest = previous_hash
+        else:
+            try:
+                digest = _sha256_file(item.path)
+            except FileNotFoundError:
+                return None
+
+        uploaded = not (previous_hash == digest and previous.get("key") == object_key)
+        if uploaded:
+            if not item.path.is_file():
+                return None
+            storage_service.upload_file(
+                file_path=str(item.path),
+                key=object_key,
+                content_type=mime_type,
+            )
+
+        entry = {
+            "path": item.rel_path,
+            "key": object_key,
+            "size": item.size,
+            "mimeType": mime_type,
+            "status": "uploaded",
+            "last_modified": datetime.fromtimestamp(
+                item.mtime_ns / 1_000_000_000, tz=timezone.utc
+            ).isoformat(),
+            "mtime_ns": item.mtime_ns,
+            "sha256": digest,
+        }
+        return entry, uploaded
+
+    def _collect_files(self, workspace_dir: Path) -> list[_ScannedFile]:
+        """Walk the workspace with one lstat per entry (via os.scandir)."""
+        files: list[_ScannedFile] = []
         ignore_names = workspace_manager._ignore_names
         ignore_dot = workspace_manager.ignore_dot_files
 
-        for root, dirnames, filenames in os.walk(workspace_dir):
-            root_path = Path(root)
-            dirnames[:] = [
-                d
-                for d in dirnames
-                if not self._should_skip(root_path / d, ignore_names, ignore_dot)
-            ]
-            for filename in filenames:
-                file_path = root_path / filename
-                if self._should_skip(file_path, ignore_names, ignore_dot):
-                    continue
-                if file_path.is_symlink():
+        def walk(directory: Path, rel_prefix: str) -> None:
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                return
+
+            for entry in entries:
+                if self._should_skip(entry, ignore_names, ignore_dot):
                     continue
-                if not file_path.is_file():
+                rel_path = f"{rel_prefix}{entry.name}"
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        walk(Path(entry.path), f"{rel_path}/")
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
                     continue
-                files.append(file_path)
+                files.append(
+                    _ScannedFile(
+                        path=Path(entry.path),
+                        rel_path=rel_path,
+                        size=st.st_size,
+                        mtime_ns=st.st_mtime_ns,
+                    )
+                )
 
+        walk(workspace_dir, "")
         return files
 
-    def _create_archive(
-        self,
-        *,
-        workspace_dir: Path,
-        session_id: str,
-        files: list[Path],
-    ) -> Path:
-        temp_dir = workspace_manager.temp_dir
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        archive_path = temp_dir / f"{session_id}.zip"
-
-        with zipfile.ZipFile(
-            archive_path,
-            "w",
-            compression=zipfile.ZIP_DEFLATED,
-        ) as zipf:
-            for file_path in files:
-                rel_path = file_path.relative_to(workspace_dir).as_posix()
-                zipf.write(file_path, arcname=f"workspace/{rel_path}")
-
-        return archive_path
+    def _stream_archive(self, *, archive_key: str, scanned: list[_ScannedFile]) -> int:
+        """Stream a ZIP of the workspace straight into a multipart upload."""
+        writer = storage_service.open_multipart_writer(
+            key=archive_key,
+            content_type="application/zip",
+            part_size=self._archive_part_size,
+        )
+        try:
+            with zipfile.ZipFile(
+                writer,
+                "w",
+                compression=zipfile.ZIP_DEFLATED,
+            ) as zipf:
+                for item in scanned:
+                    zipf.write(item.path, arcname=f"workspace/{item.rel_path}")
+            writer.complete()
+        except BaseException:
+            writer.abort()
+            raise
+        return writer.bytes_written
 
     @staticmethod
-    def _should_skip(path: Path, ignore_names: set[str], ignore_dot: bool) -> bool:
-        name = path.name
+    def _should_skip(
+        entry: os.DirEntry, ignore_names: set[str], ignore_dot: bool
+    ) -> bool:
+        name = entry.name
         if name in ignore_names:
             return True
         if ignore_dot and name.startswith("."):
             return True
-        if path.is_symlink():
+        if entry.is_symlink():
             return True
         return False
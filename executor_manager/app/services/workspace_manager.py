@@ -1,17 +1,49 @@
 import json
 import logging
 import mimetypes
+import os
+import re
 import shutil
+import subprocess
 import tarfile
+import tempfile
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Literal
 
+from app.core.errors.error_codes import ErrorCode
+from app.core.errors.exceptions import AppException
 from app.core.settings import Settings, get_settings
 
 logger = logging.getLogger(__name__)
 
+_GIT_DIFF_TIMEOUT_SECONDS = 30
+# Defence in depth on top of the isolated git dir: nothing that can run a command.
+_GIT_SAFE_CONFIG = [
+    "-c",
+    "core.fsmonitor=false",
+    "-c",
+    "core.hooksPath=/dev/null",
+    "-c",
+    "diff.external=",
+    "-c",
+    "core.pager=cat",
+]
+# Workspace .git entries that are never used: config and hooks can name commands,
+# info/attributes and commondir/worktrees can pull in state from elsewhere.
+_GIT_DIR_SKIP = {"config", "config.worktree", "hooks", "info", "commondir", "worktrees"}
+
+
+def _run_snapshot_ref(run_id: str, kind: str) -> str:
+    """Tag name written by the executor's RunSnapshotHook (poco/run/<run_id>/<kind>)."""
+    token = re.sub(r"[^A-Za-z0-9._-]+", "_", (run_id or "").strip())
+    token = token.strip("._-") or "unknown"
+    return f"poco/run/{token}/{kind}"
+
 
 @dataclass
 class WorkspaceMeta:
@@ -220,6 +252,178 @@ class WorkspaceManager:
 
         return candidate
 
+    @staticmethod
+    def _git_env(git_dir: Path, work_tree: Path) -> dict[str, str]:
+        env = {k: v for k, v in os.environ.items() if not k.startswith("GIT_")}
+        env.update(
+            GIT_DIR=str(git_dir),
+            GIT_WORK_TREE=str(work_tree),
+            GIT_CONFIG_NOSYSTEM="1",
+            GIT_CONFIG_GLOBAL="/dev/null",
+            GIT_OPTIONAL_LOCKS="0",
+            GIT_TERMINAL_PROMPT="0",
+        )
+        return env
+
+    def _run_git(
+        self, git_dir: Path, work_tree: Path, args: list[str]
+    ) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [
+                "git",
+                # Workspaces are written by executor containers under another uid.
+                "-c",
+                f"safe.directory={work_tree}",
+                *_GIT_SAFE_CONFIG,
+                *args,
+            ],
+            cwd=work_tree,
+            env=self._git_env(git_dir, work_tree),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            timeout=_GIT_DIFF_TIMEOUT_SECONDS,
+            check=False,
+        )
+
+    @contextmanager
+    def _isolated_git_dir(self, work_tree: Path) -> Iterator[Path]:
+        """Yield a private git dir sharing the workspace's objects, refs and index.
+
+        The workspace .git is writable by the agent, so its config (fsmonitor,
+        filter and diff drivers, includes) and hooks must never be read here:
+        only the repository format is carried over.
+        """
+        source = work_tree / ".git"
+        with tempfile.TemporaryDirectory(prefix="poco-git-") as tmp:
+            git_dir = Path(tmp)
+            for entry in source.iterdir():
+                if entry.name in _GIT_DIR_SKIP:
+                    continue
+                if entry.name == "HEAD":
+                    # A symlinked HEAD is read as a symref into refs/, so copy it.
+                    shutil.copyfile(entry, git_dir / "HEAD")
+                else:
+                    (git_dir / entry.name).symlink_to(entry)
+            # `git config --file` only parses; it never runs anything.
+            result = self._run_git(
+                git_dir,
+                work_tree,
+                [
+                    "config",
+                    "--file",
+                    str(source / "config"),
+                    "--get-regexp",
+                    r"^(core\.repositoryformatversion|extensions\..+)$",
+                ],
+            )
+            lines = ["[core]", "\tbare = false"]
+            extensions: list[str] = []
+            for line in result.stdout.splitlines() if result.returncode == 0 else []:
+                key, _, value = line.partition(" ")
+                value = value.replace("\\", "\\\\").replace('"', '\\"')
+                if key == "core.repositoryformatversion":
+                    lines.append(f'\trepositoryformatversion = "{value}"')
+                else:
+                    extensions.append(f'\t{key.split(".", 1)[1]} = "{value}"')
+            if extensions:
+                lines += ["[extensions]", *extensions]
+            (git_dir / "config").write_text("\n".join(lines) + "\n", encoding="utf-8")
+            yield git_dir
+
+    def _git_ref_exists(self, git_dir: Path, work_tree: Path, ref: str) -> bool:
+        result = self._run_git(
+            git_dir,
+            work_tree,
+            ["rev-parse", "--verify", "--quiet", f"refs/tags/{ref}"],
+        )
+        return result.returncode == 0
+
+    def get_file_diff(
+        self,
+        user_id: str,
+        session_id: str,
+        file_path: str,
+        *,
+        run_id: str | None = None,
+        cached: bool = False,
+    ) -> str | None:
+        """Return the full git diff of one workspace file, or None if unavailable.
+
+        With a finished run (both RunSnapshotHook tags present) the diff is taken
+        between the run's base and result snapshots; otherwise it mirrors the
+        executor's live view (worktree vs index, or index vs HEAD when cached).
+        """
+        workspace_dir = self.get_session_workspace_dir(
+            user_id=user_id, session_id=session_id
+        )
+        if not workspace_dir:
+            return None
+        # A .git file or symlink could point the diff at another repository.
+        source = workspace_dir / ".git"
+        if source.is_symlink() or not source.is_dir():
+            return None
+
+        clean = (file_path or "").strip().lstrip("/")
+        if not clean:
+            return None
+        base = workspace_dir.resolve()
+        try:
+            (base / clean).resolve().relative_to(base)
+        except Exception:
+            return None
+
+        try:
+            with self._isolated_git_dir(base) as git_dir:
+                revisions = ["--cached"] if cached else []
+                if run_id:
+                    base_ref = _run_snapshot_ref(run_id, "base")
+                    result_ref = _run_snapshot_ref(run_id, "result")
+                    if self._git_ref_exists(
+                        git_dir, base, base_ref
+                    ) and self._git_ref_exists(git_dir, base, result_ref):
+                        revisions = [
+                            f"refs/tags/{base_ref}",
+                            f"refs/tags/{result_ref}",
+                        ]
+                result = self._run_git(
+                    git_dir,
+                    base,
+                    [
+                        "diff",
+                        "--no-color",
+                        "--no-ext-diff",
+                        "--no-textconv",
+                        "--src-prefix=a/",
+                        "--dst-prefix=b/",
+                        *revisions,
+                        "--",
+                        f":(top,literal){clean}",
+                    ],
+                )
+        except (OSError, subprocess.TimeoutExpired) as exc:
+            logger.warning(
+                "workspace_diff_failed",
+                extra={"session_id": session_id, "path": clean, "error": str(exc)},
+            )
+            raise AppException(
+                error_code=ErrorCode.WORKSPACE_DIFF_FAILED,
+                message=f"Failed to compute workspace diff: {exc}",
+            ) from exc
+        if result.returncode != 0:
+            logger.warning(
+                "workspace_diff_failed",
+                extra={
+                    "session_id": session_id,
+                    "path": clean,
+                    "error": result.stderr.strip(),
+                },
+            )
+            return None
+        return result.stdout
+
     def _write_meta(
         self,
         session_dir: Path,
@@ -240,7 +444,10 @@ class WorkspaceManager:
         )
 
         meta_file = session_dir / "meta.json"
-        _ = meta_file.write_text(json.dumps(meta.to_dict(), indent=2), encoding="utf-8")
+        # Stagers may run concurrently for one session; replace atomically.
+        tmp_file = session_dir / f".meta.json.{uuid.uuid4().hex[:8]}"
+        _ = tmp_file.write_text(json.dumps(meta.to_dict(), indent=2), encoding="utf-8")
+        os.replace(tmp_file, meta_file)
         logger.debug(
             "workspace_meta_written",
             extra={"session_id": session_id, "meta_file": str(meta_file)},
@@ -280,6 +487,59 @@ class WorkspaceManager:
         workspace_dir = self.get_workspace_path(user_id, session_id, create=True)
         return str(workspace_dir / "workspace")
 
+    def create_warm_workspace(self, slot_name: str) -> str:
+        """Create a placeholder workspace for a pre-started (warm) executor container.
+
+        The directory lives under temp_dir so it shares a filesystem with active_dir and
+        can later be renamed into place without copying.
+        """
+        warm_dir = self.temp_dir / "warm" / slot_name / "workspace"
+        warm_dir.mkdir(parents=True, exist_ok=True)
+        return str(warm_dir)
+
+    def discard_warm_workspace(self, warm_workspace: str) -> None:
+        """Remove a warm workspace placeholder that was never claimed."""
+        slot_dir = Path(warm_workspace).parent
+        try:
+            slot_dir.resolve().relative_to((self.temp_dir / "warm").resolve())
+        except Exception:
+            return
+        shutil.rmtree(slot_dir, ignore_errors=True)
+
+    def adopt_warm_workspace(
+        self,
+        user_id: str,
+        session_id: str,
+        warm_workspace: str,
+    ) -> str:
+        """Bind a warm container's workspace to a session.
+
+        The warm directory is already bind-mounted at /workspace inside the container.
+        Renaming it to the session workspace path keeps the mount intact, so the
+        container transparently sees the session workspace. Anything already staged in
+        the session workspace is moved into the warm directory first.
+        """
+        source = Path(warm_workspace)
+        session_dir = self.get_workspace_path(user_id, session_id, create=True)
+        target = session_dir / "workspace"
+
+        if target.exists():
+            for entry in target.iterdir():
+                destination = source / entry.name
+                if destination.is_dir() and not destination.is_symlink():
+                    shutil.rmtree(destination)
+                elif destination.exists() or destination.is_symlink():
+                    destination.unlink()
+                entry.rename(destination)
+            target.rmdir()
+
+        source.rename(target)
+        try:
+            source.parent.rmdir()
+        except OSError:
+            pass
+        return str(target)
+
     def archive_workspace(
         self,
         user_id: str,
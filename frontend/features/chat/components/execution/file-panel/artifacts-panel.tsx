@@ -75,6 +75,7 @@ export function ArtifactsPanel({
     return (
       <FileChangesList
         fileChanges={fileChanges}
+        sessionId={sessionId}
         sessionStatus={sessionStatus}
         onFileClick={(filePath) => {
           const findFileByPath = (
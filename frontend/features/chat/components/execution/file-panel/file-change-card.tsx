@@ -1,3 +1,4 @@
+import * as React from "react";
 import {
   FilePlus,
   FileEdit,
@@ -11,10 +12,12 @@ import {
 } from "lucide-react";
 import { Button } from "@/components/ui/button";
 import type { FileChange } from "@/features/chat/types";
+import { apiClient, API_ENDPOINTS } from "@/lib/api-client";
 import { useT } from "@/lib/i18n/client";
 
 interface FileChangeCardProps {
   change: FileChange;
+  sessionId?: string;
   sessionStatus?:
     | "running"
     | "accepted"
@@ -63,10 +66,49 @@ function getStatusConfig(status: FileChange["status"]) {
  */
 export function FileChangeCard({
   change,
+  sessionId,
   sessionStatus,
   onFileClick,
 }: FileChangeCardProps) {
   const { t } = useT("translation");
+  const [fullDiff, setFullDiff] = React.useState<string | null>(null);
+  const [isLoadingDiff, setIsLoadingDiff] = React.useState(false);
+
+  // Cached full diff is only valid for the patch it was fetched for.
+  React.useEffect(() => {
+    setFullDiff(null);
+  }, [change.diff_hash]);
+
+  // Workspace state only carries a bounded preview; fetch the full diff on open.
+  const handleDiffToggle = async (
+    e: React.SyntheticEvent<HTMLDetailsElement>,
+  ) => {
+    if (
+      !e.currentTarget.open ||
+      !change.diff_truncated ||
+      !sessionId ||
+      fullDiff !== null ||
+      isLoadingDiff
+    ) {
+      return;
+    }
+    setIsLoadingDiff(true);
+    try {
+      const response = await apiClient.get<{ diff?: string | null }>(
+        API_ENDPOINTS.sessionWorkspaceDiff(
+          sessionId,
+          change.path,
+          change.status === "staged",
+        ),
+      );
+      setFullDiff(response.diff ?? "");
+    } catch (error) {
+      console.error("[Artifacts] Failed to load full diff", error);
+    } finally {
+      setIsLoadingDiff(false);
+    }
+  };
+  const diffText = fullDiff || change.diff;
   const statusConfig = getStatusConfig(change.status);
   const StatusIcon = statusConfig.icon;
 
@@ -172,15 +214,20 @@ export function FileChangeCard({
       )}
 
       {/* Diff preview (if available) */}
-      {change.diff && (
+      {(change.diff || change.diff_truncated) && (
         <div className="px-4 py-3 border-t border-border">
-          <details className="group">
+          <details className="group" onToggle={handleDiffToggle}>
             <summary className="cursor-pointer text-xs font-medium text-muted-foreground hover:text-foreground transition-colors truncate">
               {t("fileChange.viewDiff")}
             </summary>
             <pre className="mt-2 text-xs font-mono bg-muted/50 rounded p-2 overflow-x-auto whitespace-pre max-h-40 overflow-y-auto">
-              <code className="block">{change.diff}</code>
+              <code className="block">{diffText}</code>
             </pre>
+            {isLoadingDiff && (
+              <p className="mt-1 text-xs text-muted-foreground">
+                {t("fileChange.diffTruncated")}
+              </p>
+            )}
           </details>
         </div>
       )}
@@ -7,6 +7,7 @@ import type { FileChange } from "@/features/chat/types";
 
 interface FileChangesListProps {
   fileChanges?: FileChange[];
+  sessionId?: string;
   sessionStatus?:
     | "running"
     | "accepted"
@@ -112,6 +113,7 @@ function FileChangesSummary({ fileChanges }: FileChangesSummaryProps) {
  */
 export function FileChangesList({
   fileChanges = [],
+  sessionId,
   sessionStatus,
   onFileClick,
 }: FileChangesListProps) {
@@ -136,6 +138,7 @@ export function FileChangesList({
             <FileChangeCard
               key={`${change.path}-${index}`}
               change={change}
+              sessionId={sessionId}
               sessionStatus={sessionStatus}
               onFileClick={() => onFileClick?.(change.path)}
             />
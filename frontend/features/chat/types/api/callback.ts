@@ -27,6 +27,9 @@ export interface FileChange {
   added_lines?: number;
   deleted_lines?: number;
   diff?: string | null;
+  diff_truncated?: boolean;
+  diff_hash?: string | null;
+  diff_size?: number;
   old_path?: string | null;
 }
 
@@ -22,6 +22,8 @@ export const API_ENDPOINTS = {
     `/sessions/${sessionId}/workspace/files`,
   sessionWorkspaceArchive: (sessionId: string) =>
     `/sessions/${sessionId}/workspace/archive`,
+  sessionWorkspaceDiff: (sessionId: string, path: string, cached = false) =>
+    `/sessions/${sessionId}/workspace/diff?path=${encodeURIComponent(path)}&cached=${cached}`,
 
   // User Input Requests (AskUserQuestion)
   userInputRequests: "/user-input-requests",
@@ -1,8 +1,10 @@
 from fastapi import FastAPI
 
 from app.api.v1 import api_v1_router
+from app.core.observability.metrics import metrics_endpoint
 
 
 def setup_routers(app: FastAPI) -> None:
     """Registers all API routers."""
     app.include_router(api_v1_router, prefix="/api/v1")
+    app.add_api_route("/metrics", metrics_endpoint, include_in_schema=False)
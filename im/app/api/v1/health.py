@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 
+from app.core.http_client import get_http_pool_stats
 from app.schemas.response import Response
 
 router = APIRouter(prefix="/health", tags=["health"])
@@ -7,4 +8,6 @@ router = APIRouter(prefix="/health", tags=["health"])
 
 @router.get("")
 async def health():
-    return Response.success(data={"status": "healthy"})
+    return Response.success(
+        data={"status": "healthy", "http_pool": get_http_pool_stats()}
+    )
@@ -5,6 +5,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from app.core.database import Base, engine
+from app.core.http_client import close_http_client, start_http_client
 import app.models  # noqa: F401
 from app.services.dingtalk_stream_service import DingTalkStreamService
 from app.services.poller_service import PollerService
@@ -17,6 +18,8 @@ async def lifespan(_: FastAPI):
     # Ensure tables exist. Migrations can be added later without changing service APIs.
     Base.metadata.create_all(bind=engine)
 
+    start_http_client()
+
     poller = PollerService()
     dingtalk_stream = DingTalkStreamService()
     tasks: list[asyncio.Task[None]] = []
@@ -26,6 +29,8 @@ async def lifespan(_: FastAPI):
         tasks.append(asyncio.create_task(poller.run_session_messages_loop()))
         tasks.append(asyncio.create_task(poller.run_sessions_recent_loop()))
         tasks.append(asyncio.create_task(poller.run_sessions_full_loop()))
+        if poller.settings.backend_event_stream_enabled:
+            tasks.append(asyncio.create_task(poller.run_event_stream_loop()))
         if dingtalk_stream.enabled:
             tasks.append(asyncio.create_task(dingtalk_stream.run_forever()))
         yield
@@ -33,3 +38,4 @@ async def lifespan(_: FastAPI):
         for t in tasks:
             t.cancel()
         await asyncio.gather(*tasks, return_exceptions=True)
+        await close_http_client()
@@ -4,6 +4,8 @@ import time
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.core.observability.metrics import observe_http_request
+
 logger = logging.getLogger("app.http")
 
 
@@ -12,7 +14,12 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
     def __init__(self, app, *, skip_paths: set[str] | None = None) -> None:
         super().__init__(app)
-        self._skip_paths = skip_paths or {"/api/v1/health", "/docs", "/openapi.json"}
+        self._skip_paths = skip_paths or {
+            "/api/v1/health",
+            "/docs",
+            "/openapi.json",
+            "/metrics",
+        }
 
     async def dispatch(self, request: Request, call_next):
         if request.url.path in self._skip_paths:
@@ -20,9 +27,11 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
         start = time.perf_counter()
         response = await call_next(request)
-        duration_ms = int((time.perf_counter() - start) * 1000)
+        elapsed = time.perf_counter() - start
+        duration_ms = int(elapsed * 1000)
 
         status = response.status_code
+        observe_http_request(request, status, elapsed)
         level = logging.INFO
         if status >= 500:
             level = logging.ERROR
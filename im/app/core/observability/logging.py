@@ -5,6 +5,7 @@ import os
 import sys
 from typing import Any
 
+from app.core.observability.metrics import TimingMetricsHandler
 from app.core.observability.request_context import get_request_id, get_trace_id
 
 _installed_record_factory = False
@@ -129,6 +130,8 @@ def configure_logging(
     root = logging.getLogger()
     root.handlers.clear()
     root.addHandler(handler)
+    # Feeds `timing` lines into the /metrics step histograms.
+    root.addHandler(TimingMetricsHandler())
     root.setLevel(level)
 
     # Uvicorn access logs are redundant once request logging middleware is enabled.
@@ -0,0 +1,112 @@
+import logging
+from collections.abc import Iterable
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+from starlette.requests import Request
+from starlette.responses import Response
+
+# 5 ms .. 5 min: steps range from single queries to IM platform API calls.
+DURATION_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+
+TIMING_STEP_SECONDS = Histogram(
+    "poco_timing_step_seconds",
+    "Duration of timed steps, fed by `timing` log lines.",
+    ["step"],
+    buckets=DURATION_BUCKETS,
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "poco_http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route", "status"],
+    buckets=DURATION_BUCKETS,
+)
+
+
+class TimingMetricsHandler(logging.Handler):
+    """Turns INFO+ `timing` log records (step + duration_ms) into histogram samples.
+
+    Per-message steps log at DEBUG to keep INFO volume down; their call sites
+    call observe_timing_step directly, so DEBUG records are skipped here.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.msg != "timing" or record.levelno < logging.INFO:
+            return
+        step = getattr(record, "step", None)
+        duration_ms = getattr(record, "duration_ms", None)
+        if isinstance(step, str) and isinstance(duration_ms, int | float):
+            observe_timing_step(step, duration_ms)
+
+
+def observe_timing_step(step: str, duration_ms: float) -> None:
+    TIMING_STEP_SECONDS.labels(step=step).observe(duration_ms / 1000)
+
+
+def observe_http_request(request: Request, status: int, seconds: float) -> None:
+    # Route templates keep label cardinality bounded (no ids in paths).
+    route = getattr(request.scope.get("route"), "path", None) or "unmatched"
+    HTTP_REQUEST_SECONDS.labels(
+        method=request.method, route=route, status=str(status)
+    ).observe(seconds)
+
+
+class _DatabasePoolCollector(Collector):
+    """Connection pool utilization, read at scrape time."""
+
+    def describe(self) -> list[Metric]:
+        return []
+
+    def collect(self) -> Iterable[Metric]:
+        # Imported here so configuring logging does not create the engine.
+        from app.core.database import engine
+
+        pool = engine.pool
+        if not hasattr(pool, "checkedout"):
+            return
+        yield GaugeMetricFamily(
+            "poco_db_pool_size", "Configured connection pool size.", value=pool.size()
+        )
+        connections = GaugeMetricFamily(
+            "poco_db_pool_connections",
+            "Pooled connections by state.",
+            labels=["state"],
+        )
+        connections.add_metric(["checked_out"], pool.checkedout())
+        connections.add_metric(["idle"], pool.checkedin())
+        yield connections
+        yield GaugeMetricFamily(
+            "poco_db_pool_overflow",
+            "Connections opened beyond the pool size (negative while unused).",
+            value=pool.overflow(),
+        )
+
+
+REGISTRY.register(_DatabasePoolCollector())
+
+
+def metrics_endpoint() -> Response:
+    """Prometheus scrape endpoint."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
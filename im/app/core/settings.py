@@ -39,6 +39,31 @@ class Settings(BaseSettings):
     poll_http_timeout_seconds: float = Field(
         default=10.0, alias="POLL_HTTP_TIMEOUT_SECONDS"
     )
+    # Backend session event stream (SSE). While connected, the polling loops run when
+    # an event arrives and otherwise only every POLL_FALLBACK_INTERVAL_SECONDS.
+    backend_event_stream_enabled: bool = Field(
+        default=True, alias="BACKEND_EVENT_STREAM_ENABLED"
+    )
+    poll_fallback_interval_seconds: float = Field(
+        default=30.0, alias="POLL_FALLBACK_INTERVAL_SECONDS"
+    )
+
+    # Shared keep-alive HTTP client for Backend polling and provider sends (created in
+    # lifespan). HTTP/2 requires the optional `h2` package and is only negotiated
+    # over TLS (e.g. Telegram / DingTalk APIs).
+    http_client_timeout_seconds: float = Field(
+        default=10.0, alias="HTTP_CLIENT_TIMEOUT_SECONDS"
+    )
+    http_client_max_connections: int = Field(
+        default=50, alias="HTTP_CLIENT_MAX_CONNECTIONS"
+    )
+    http_client_max_keepalive_connections: int = Field(
+        default=10, alias="HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS"
+    )
+    http_client_keepalive_expiry_seconds: float = Field(
+        default=30.0, alias="HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS"
+    )
+    http_client_http2: bool = Field(default=False, alias="HTTP_CLIENT_HTTP2")
 
     # Telegram bot integration
     telegram_bot_token: str = Field(default="", alias="TELEGRAM_BOT_TOKEN")
@@ -1,12 +1,18 @@
+import json
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
 
+from app.core.http_client import get_http_client
 from app.core.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# The Backend sends a keep-alive comment every ~15s; a silent stream is dead.
+_EVENT_STREAM_READ_TIMEOUT_SECONDS = 60.0
+
 
 class BackendClientError(RuntimeError):
     pass
@@ -33,14 +39,15 @@ class BackendClient:
         json: Any | None = None,
     ) -> Any:
         url = f"{self.base_url}/api/v1{path}"
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            resp = await client.request(
-                method,
-                url,
-                params=params,
-                json=json,
-                headers={"X-User-Id": self.backend_user_id},
-            )
+        client = get_http_client()
+        resp = await client.request(
+            method,
+            url,
+            params=params,
+            json=json,
+            headers={"X-User-Id": self.backend_user_id},
+            timeout=self.timeout,
+        )
 
         # Backend always returns JSON with {code,message,data} on success/error, but
         # still validate status code first for transport errors.
@@ -60,6 +67,60 @@ class BackendClient:
             )
         return payload.get("data")
 
+    async def stream_events(
+        self, *, last_event_id: str | None = None
+    ) -> AsyncIterator[tuple[str, str, dict[str, Any]]]:
+        """Subscribe to the Backend session event stream (SSE).
+
+        Yields (event_id, event_type, payload); an ("", "open", {}) item is
+        yielded once the stream is established.
+        """
+        url = f"{self.base_url}/api/v1/events/stream"
+        headers = {"X-User-Id": self.backend_user_id}
+        if last_event_id:
+            headers["Last-Event-ID"] = last_event_id
+        timeout = httpx.Timeout(
+            _EVENT_STREAM_READ_TIMEOUT_SECONDS,
+            connect=min(10.0, self.settings.poll_http_timeout_seconds),
+        )
+        client = get_http_client()
+        async with client.stream("GET", url, headers=headers, timeout=timeout) as resp:
+            if resp.status_code != 200:
+                await resp.aread()
+                raise BackendClientError(
+                    f"Backend HTTP {resp.status_code}: {resp.text[:300]}"
+                )
+            yield "", "open", {}
+
+            event_id = ""
+            event_type = "message"
+            data_lines: list[str] = []
+            async for line in resp.aiter_lines():
+                if line:
+                    if line.startswith(":"):
+                        continue
+                    name, _, value = line.partition(":")
+                    value = value.removeprefix(" ")
+                    if name == "id":
+                        event_id = value
+                    elif name == "event":
+                        event_type = value
+                    elif name == "data":
+                        data_lines.append(value)
+                    continue
+                if data_lines:
+                    try:
+                        payload = json.loads("\n".join(data_lines))
+                    except ValueError:
+                        payload = {}
+                    yield (
+                        event_id,
+                        event_type,
+                        payload if isinstance(payload, dict) else {},
+                    )
+                event_type = "message"
+                data_lines = []
+
     async def enqueue_task(
         self,
         *,
@@ -102,8 +163,31 @@ class BackendClient:
             return []
         return data
 
-    async def get_session_messages(self, *, session_id: str) -> list[dict[str, Any]]:
-        data = await self._request("GET", f"/sessions/{session_id}/messages")
+    async def get_session_messages(
+        self,
+        *,
+        session_id: str,
+        after_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if after_id is not None:
+            params["after_id"] = after_id
+        if limit is not None:
+            params["limit"] = limit
+        data = await self._request(
+            "GET", f"/sessions/{session_id}/messages", params=params or None
+        )
+        if not isinstance(data, list):
+            return []
+        return data
+
+    async def get_messages_feed(
+        self, *, cursors: dict[str, int], limit: int = 200
+    ) -> list[dict[str, Any]]:
+        """New messages for many sessions after per-session cursors (one call)."""
+        body = {"cursors": cursors, "limit": limit}
+        data = await self._request("POST", "/sessions/messages/feed", json=body)
         if not isinstance(data, list):
             return []
         return data
@@ -6,10 +6,13 @@ import time
 
 import httpx
 
+from app.core.http_client import get_http_client
 from app.core.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+_SEND_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
 
 class DingTalkClient:
     provider = "dingtalk"
@@ -47,10 +50,8 @@ class DingTalkClient:
             "appKey": self._client_id,
             "appSecret": self._client_secret,
         }
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(10.0, connect=5.0)
-        ) as client:
-            resp = await client.post(url, json=payload)
+        client = get_http_client()
+        resp = await client.post(url, json=payload, timeout=_SEND_TIMEOUT)
         if not resp.is_success:
             raise RuntimeError(f"DingTalk auth failed: HTTP {resp.status_code}")
 
@@ -91,10 +92,8 @@ class DingTalkClient:
             "msgtype": "text",
             "text": {"content": text},
         }
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(10.0, connect=5.0)
-        ) as client:
-            resp = await client.post(url, json=payload)
+        client = get_http_client()
+        resp = await client.post(url, json=payload, timeout=_SEND_TIMEOUT)
         if resp.is_success:
             return True
 
@@ -123,19 +122,21 @@ class DingTalkClient:
             "msgParam": msg_param,
         }
 
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(10.0, connect=5.0)
-        ) as client:
-            # Prefer group send; fallback to private chat send for 1:1 conversations.
-            group_url = f"{self._open_base_url}/v1.0/robot/groupMessages/send"
-            resp = await client.post(group_url, json=payload, headers=headers)
-            if resp.is_success:
-                return True
-
-            private_url = f"{self._open_base_url}/v1.0/robot/privateChatMessages/send"
-            resp2 = await client.post(private_url, json=payload, headers=headers)
-            if resp2.is_success:
-                return True
+        client = get_http_client()
+        # Prefer group send; fallback to private chat send for 1:1 conversations.
+        group_url = f"{self._open_base_url}/v1.0/robot/groupMessages/send"
+        resp = await client.post(
+            group_url, json=payload, headers=headers, timeout=_SEND_TIMEOUT
+        )
+        if resp.is_success:
+            return True
+
+        private_url = f"{self._open_base_url}/v1.0/robot/privateChatMessages/send"
+        resp2 = await client.post(
+            private_url, json=payload, headers=headers, timeout=_SEND_TIMEOUT
+        )
+        if resp2.is_success:
+            return True
 
         logger.warning(
             "dingtalk_openapi_send_failed",
@@ -16,6 +16,22 @@ from app.services.notification_gateway import NotificationGateway
 
 logger = logging.getLogger(__name__)
 
+_MESSAGE_PAGE_LIMIT = 200
+# Coalesce bursts of events (e.g. streamed assistant messages) into one poll.
+_WAKEUP_DEBOUNCE_SECONDS = 0.2
+_EVENT_STREAM_MAX_BACKOFF_SECONDS = 30.0
+
+# Backend event types -> polling loops they wake.
+_EVENT_WAKEUPS: dict[str, tuple[str, ...]] = {
+    "message.created": ("messages",),
+    "run.updated": ("messages", "sessions"),
+    "session.updated": ("messages", "sessions"),
+    "user_input.created": ("user_input",),
+    "user_input.updated": ("user_input",),
+}
+# Forgetting a cursor only costs one full re-read of that session (dedup keys stay).
+_MAX_MESSAGE_CURSORS = 5000
+
 
 class PollerService:
     """Background pollers for Backend state (sessions/runs/messages/user-input)."""
@@ -27,6 +43,65 @@ class PollerService:
         self.gateway = NotificationGateway()
         # Hint updated by the session-messages loop to gate user-input polling.
         self._has_non_terminal_targets = True
+        # Last message id seen per session; only newer messages are fetched.
+        self._message_cursors: dict[str, int] = {}
+        # Set by the Backend event stream to run a loop now instead of on its timer.
+        self._wakeups = {
+            name: asyncio.Event() for name in ("user_input", "messages", "sessions")
+        }
+        self._event_stream_connected = False
+
+    async def run_event_stream_loop(self) -> None:
+        """Follow the Backend event stream and wake the polling loops on changes.
+
+        Reconnects with Last-Event-ID; after (re)connecting or a reset every loop
+        runs once to catch up on anything missed.
+        """
+        last_event_id: str | None = None
+        backoff = 1.0
+        while True:
+            try:
+                async for event_id, event_type, _ in self.backend.stream_events(
+                    last_event_id=last_event_id
+                ):
+                    if event_type == "open":
+                        self._event_stream_connected = True
+                        backoff = 1.0
+                        self._wake(*self._wakeups)
+                        continue
+                    if event_id:
+                        last_event_id = event_id
+                    if event_type == "reset":
+                        self._wake(*self._wakeups)
+                    else:
+                        self._wake(*_EVENT_WAKEUPS.get(event_type, ()))
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("backend_event_stream_failed", extra={"error": str(exc)})
+            self._event_stream_connected = False
+            await asyncio.sleep(backoff)
+            backoff = min(_EVENT_STREAM_MAX_BACKOFF_SECONDS, backoff * 2)
+
+    def _wake(self, *names: str) -> None:
+        for name in names:
+            self._wakeups[name].set()
+
+    async def _wait_next_poll(self, name: str, interval: float) -> None:
+        """Sleep until the loop's interval elapses or an event wakes it.
+
+        While the event stream is connected the interval is stretched to the
+        fallback interval; events drive the loop instead.
+        """
+        wakeup = self._wakeups[name]
+        if self._event_stream_connected:
+            interval = max(interval, self.settings.poll_fallback_interval_seconds)
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=interval)
+            await asyncio.sleep(_WAKEUP_DEBOUNCE_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        wakeup.clear()
 
     async def run_user_input_loop(self) -> None:
         interval = max(0.2, float(self.settings.poll_user_input_interval_seconds))
@@ -38,7 +113,7 @@ class PollerService:
                 raise
             except Exception:
                 logger.exception("poll_user_input_failed")
-            await asyncio.sleep(interval)
+            await self._wait_next_poll("user_input", interval)
 
     async def run_sessions_recent_loop(self) -> None:
         interval = max(1.0, float(self.settings.poll_sessions_recent_interval_seconds))
@@ -49,7 +124,7 @@ class PollerService:
                 raise
             except Exception:
                 logger.exception("poll_sessions_recent_failed")
-            await asyncio.sleep(interval)
+            await self._wait_next_poll("sessions", interval)
 
     async def run_sessions_full_loop(self) -> None:
         interval = max(10.0, float(self.settings.poll_sessions_full_interval_seconds))
@@ -71,7 +146,7 @@ class PollerService:
                 raise
             except Exception:
                 logger.exception("poll_session_messages_failed")
-            await asyncio.sleep(interval)
+            await self._wait_next_poll("messages", interval)
 
     def _get_target_channel_ids(self, db: Session, *, session_id: str) -> set[int]:
         target: set[int] = set()
@@ -163,9 +238,9 @@ class PollerService:
             self._has_non_terminal_targets = False
             return
 
-        has_non_terminal_targets = False
         db = SessionLocal()
         try:
+            targets: list[tuple[str, str | None, set[int]]] = []
             for item in sessions:
                 session_id = str(item.get("session_id") or item.get("id") or "").strip()
                 if not session_id:
@@ -179,16 +254,43 @@ class PollerService:
                 )
                 if not target_channel_ids:
                     continue
-                has_non_terminal_targets = True
+                targets.append((session_id, title, target_channel_ids))
+
+            self._has_non_terminal_targets = bool(targets)
+            if not targets:
+                return
+
+            # Sessions with a cursor share one feed request; the rest bootstrap.
+            cursors = {
+                session_id: self._message_cursors[session_id]
+                for session_id, _, _ in targets
+                if session_id in self._message_cursors
+            }
+            feed: dict[str, tuple[list[dict], int]] = {}
+            if cursors:
+                try:
+                    feed = await self._fetch_messages_feed(cursors)
+                except BackendClientError as exc:
+                    logger.warning(
+                        "backend_messages_feed_failed", extra={"error": str(exc)}
+                    )
+                    return
+
+            for session_id, title, target_channel_ids in targets:
+                if session_id in cursors:
+                    # Sessions without new messages are omitted from the feed.
+                    fetched = feed.get(session_id, ([], cursors[session_id]))
+                else:
+                    fetched = None
                 await self._emit_assistant_text_updates(
                     db,
                     session_id=session_id,
                     title=title,
                     target_channel_ids=target_channel_ids,
+                    fetched=fetched,
                 )
         finally:
             db.close()
-        self._has_non_terminal_targets = has_non_terminal_targets
 
     async def _poll_sessions_page(self, *, limit: int, offset: int) -> int:
         try:
@@ -262,14 +364,23 @@ class PollerService:
         session_id: str,
         title: str | None,
         target_channel_ids: set[int],
+        fetched: tuple[list[dict], int] | None = None,
     ) -> None:
-        try:
-            messages = await self.backend.get_session_messages(session_id=session_id)
-        except BackendClientError:
-            return
+        """Send new assistant text to the target channels.
+
+        fetched is (new messages, next cursor) when already loaded by the caller;
+        otherwise the messages after the session cursor are fetched here.
+        """
+        if fetched is None:
+            try:
+                fetched = await self._fetch_new_messages(session_id)
+            except BackendClientError:
+                return
+        messages, next_cursor = fetched
 
         text_entries = _extract_assistant_text_entries(messages)
         if not text_entries:
+            self._set_message_cursor(session_id, next_cursor)
             return
 
         bootstrap_tail = 3
@@ -303,6 +414,65 @@ class PollerService:
                 await self._send_to_channel(db, channel_id=channel_id, text=rendered)
                 DedupRepository.put(db, key=key)
 
+        self._set_message_cursor(session_id, next_cursor)
+
+    async def _fetch_new_messages(
+        self, session_id: str, *, after_id: int | None = None
+    ) -> tuple[list[dict], int]:
+        """Fetch messages after the session cursor (all of them on first sight).
+
+        Returns (messages, next cursor); the caller commits the cursor once the
+        messages were handled so a failed send is retried on the next tick.
+        """
+        cursor = (
+            self._message_cursors.get(session_id, 0) if after_id is None else after_id
+        )
+        messages: list[dict] = []
+        while True:
+            page = await self.backend.get_session_messages(
+                session_id=session_id, after_id=cursor, limit=_MESSAGE_PAGE_LIMIT
+            )
+            messages.extend(page)
+            cursor = _max_message_id(page, default=cursor)
+            if len(page) < _MESSAGE_PAGE_LIMIT:
+                break
+        return messages, cursor
+
+    async def _fetch_messages_feed(
+        self, cursors: dict[str, int]
+    ) -> dict[str, tuple[list[dict], int]]:
+        """Fetch new messages for many sessions in one request."""
+        items = await self.backend.get_messages_feed(
+            cursors=cursors, limit=_MESSAGE_PAGE_LIMIT
+        )
+        feed: dict[str, tuple[list[dict], int]] = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            session_id = str(item.get("session_id") or "").strip()
+            messages = item.get("messages")
+            if session_id not in cursors or not isinstance(messages, list):
+                continue
+            cursor = max(
+                cursors[session_id],
+                _parse_message_id(item.get("next_after_id")) or 0,
+                _max_message_id(messages, default=0),
+            )
+            if item.get("has_more"):
+                # Rare backlog (e.g. after an outage): drain it with paged reads.
+                rest, cursor = await self._fetch_new_messages(
+                    session_id, after_id=cursor
+                )
+                messages = messages + rest
+            feed[session_id] = (messages, cursor)
+        return feed
+
+    def _set_message_cursor(self, session_id: str, cursor: int) -> None:
+        self._message_cursors.pop(session_id, None)
+        self._message_cursors[session_id] = cursor
+        while len(self._message_cursors) > _MAX_MESSAGE_CURSORS:
+            self._message_cursors.pop(next(iter(self._message_cursors)))
+
     async def _get_latest_run_detail(
         self, *, session_id: str
     ) -> tuple[str | None, str | None, str | None]:
@@ -381,6 +551,19 @@ def _extract_assistant_text_entries(
     return entries
 
 
+def _max_message_id(messages: list[dict], *, default: int) -> int:
+    ids = [
+        message_id
+        for message_id in (
+            _parse_message_id(msg.get("id"))
+            for msg in messages
+            if isinstance(msg, dict)
+        )
+        if message_id is not None
+    ]
+    return max(ids, default=default)
+
+
 def _parse_message_id(raw: object) -> int | None:
     if isinstance(raw, int):
         return raw
@@ -2,10 +2,13 @@ import logging
 
 import httpx
 
+from app.core.http_client import get_http_client
 from app.core.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+_SEND_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
 
 class TelegramClient:
     provider = "telegram"
@@ -30,10 +33,8 @@ class TelegramClient:
             "text": text,
             "disable_web_page_preview": True,
         }
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(10.0, connect=5.0)
-        ) as client:
-            resp = await client.post(url, json=payload)
+        client = get_http_client()
+        resp = await client.post(url, json=payload, timeout=_SEND_TIMEOUT)
         if not resp.is_success:
             logger.warning(
                 "telegram_send_failed",